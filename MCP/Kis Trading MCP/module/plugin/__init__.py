@@ -1,4 +1,8 @@
 from .kis import setup_kis_config
 from .environment import setup_environment, EnvironmentConfig
 from .master_file import MasterFileManager
-from .database import DatabaseEngine, Database
\ No newline at end of file
+from .master_search import MasterSearch
+from .master_refresh import MasterFileRefresher
+from .database import DatabaseEngine, Database
+from .api_code import ApiCodeCache
+from .api_worker import ApiWorkerPool
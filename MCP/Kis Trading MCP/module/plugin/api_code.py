@@ -0,0 +1,251 @@
+import json
+import logging
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import requests
+
+from module.decorator import singleton
+
+# 다운로드 원본 (raw.githubusercontent.com/{저장소}/{ref}/examples_llm/...)
+GITHUB_RAW_BASE = "https://raw.githubusercontent.com/koreainvestment/open-trading-api"
+# ref(브랜치/태그) → 커밋 SHA 해석
+GITHUB_COMMIT_API = "https://api.github.com/repos/koreainvestment/open-trading-api/commits"
+EXAMPLES_DIR_NAME = "examples_llm"
+
+DEFAULT_CACHE_DIR = os.path.join("configs", "api_code")
+DEFAULT_REF = "main"
+MANIFEST_FILE = "manifest.json"
+DOWNLOAD_TIMEOUT = 30
+_SHA_PATTERN = re.compile(r"^[0-9a-f]{40}$")
+
+
+@singleton
+class ApiCodeCache:
+    """API 코드(kis_auth.py, examples_llm/**/*.py) 로컬 버전 캐시
+
+    - 캐시 경로: {cache_dir}/{version}/kis_auth.py, {cache_dir}/{version}/{분류}/{api}/{api}.py
+    - 버전: 항상 커밋 SHA. KIS_API_CODE_REF(커밋/브랜치, 기본 main)를 처음 쓸 때 SHA로 해석해
+      manifest.json에 고정하고, 이후에는 브랜치가 움직여도 같은 SHA에서만 받음
+      (브랜치 최신화는 refresh_ref(), 해석된 SHA가 바뀌면 이전 버전 캐시는 삭제)
+    - 캐시에 없는 파일만 해당 버전(SHA)으로 GitHub에서 받아 저장 (이후 호출은 네트워크 불필요)
+    - refresh_from_local()로 저장소의 examples_llm/을 통째로 복사해 오프라인 갱신
+      (버전은 로컬 저장소의 git 커밋)
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, examples_dir: Optional[str] = None):
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.examples_dir = examples_dir or os.getenv("KIS_EXAMPLES_LLM_DIR") or self._find_examples_dir()
+        self._lock = threading.Lock()
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    # ========== 버전 ==========
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.cache_dir, MANIFEST_FILE)
+
+    def read_manifest(self) -> Dict[str, Any]:
+        """manifest.json 조회 (없으면 빈 dict)"""
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    @property
+    def version(self) -> str:
+        """현재 사용 중인 코드 버전 (커밋 SHA, 로컬 갱신 시 로컬 커밋)
+
+        manifest.json에 고정된 버전이 요청 ref(KIS_API_CODE_REF)와 맞으면 그대로 쓰고,
+        없거나 ref가 바뀌었으면 GitHub에서 SHA를 해석해 고정함
+        """
+        ref = os.getenv("KIS_API_CODE_REF")
+        manifest = self.read_manifest()
+        pinned = manifest.get("version")
+        if pinned and (ref is None or ref in (manifest.get("ref"), pinned)):
+            return pinned
+        return self.refresh_ref(ref)
+
+    @property
+    def code_root(self) -> str:
+        """현재 버전의 코드 루트 (kis_auth.py 위치)"""
+        return os.path.join(self.cache_dir, self.version)
+
+    # ========== 조회 ==========
+    @staticmethod
+    def relative_path(github_url: str, api_type: str) -> Optional[str]:
+        """설정의 github_url에서 examples_llm 기준 상대 경로 추출
+
+        예) .../tree/main/examples_llm/domestic_stock/inquire_price → domestic_stock/inquire_price/inquire_price.py
+        """
+        marker = f"/{EXAMPLES_DIR_NAME}/"
+        if marker not in github_url:
+            return None
+        api_dir = github_url.split(marker, 1)[1].strip("/")
+        return f"{api_dir}/{api_type}.py"
+
+    def get(self, relative_path: str) -> str:
+        """캐시된 파일 경로 반환 (없으면 현재 버전으로 다운로드 후 저장)"""
+        version = self.version
+        path = os.path.join(self.cache_dir, version, *relative_path.split("/"))
+        if os.path.isfile(path):
+            return path
+
+        with self._lock:
+            if os.path.isfile(path):
+                return path
+            url = f"{GITHUB_RAW_BASE}/{version}/{EXAMPLES_DIR_NAME}/{relative_path}"
+            response = requests.get(url, timeout=DOWNLOAD_TIMEOUT)
+            response.raise_for_status()
+            self._write(path, response.text)
+            logging.info(f"API 코드 캐시 저장: {version}/{relative_path}")
+        return path
+
+    def get_kis_auth(self) -> str:
+        """kis_auth.py 경로"""
+        return self.get("kis_auth.py")
+
+    def get_api_code(self, github_url: str, api_type: str) -> str:
+        """API 코드 파일 경로"""
+        relative_path = self.relative_path(github_url, api_type)
+        if relative_path is None:
+            raise ValueError(f"examples_llm 경로가 아닌 github_url: {github_url}")
+        return self.get(relative_path)
+
+    # ========== 갱신 ==========
+    def prepare(self) -> str:
+        """서버 시작 시 호출: 캐시가 비어 있고 로컬 examples_llm이 있으면 오프라인으로 채움"""
+        if not os.getenv("KIS_API_CODE_REF") and not self.read_manifest() and self.examples_dir:
+            self.refresh_from_local()
+        return self.version
+
+    def refresh_ref(self, ref: Optional[str] = None) -> str:
+        """ref를 커밋 SHA로 다시 해석해 현재 버전으로 고정 (브랜치 최신화)
+
+        해석된 SHA가 이전 버전과 다르면 이전 버전 캐시 디렉토리를 삭제함
+
+        Args:
+            ref: 브랜치/태그/커밋 (기본: KIS_API_CODE_REF 또는 main)
+
+        Returns:
+            고정된 커밋 SHA
+        """
+        ref = ref or os.getenv("KIS_API_CODE_REF") or DEFAULT_REF
+        sha = self._resolve_ref(ref)
+
+        with self._lock:
+            previous = self.read_manifest().get("version")
+            if previous == sha:
+                return sha
+            manifest = {
+                "version": sha,
+                "ref": ref,
+                "source": "github",
+                "updated_at": datetime.now().isoformat(timespec="seconds"),
+            }
+            self._write(self.manifest_path, json.dumps(manifest, ensure_ascii=False, indent=2))
+            if previous:
+                shutil.rmtree(os.path.join(self.cache_dir, previous), ignore_errors=True)
+
+        logging.info(f"✅ API 코드 버전 고정: {ref} → {sha}" + (f" (이전 {previous} 캐시 삭제)" if previous else ""))
+        return sha
+
+    def refresh_from_local(self, examples_dir: Optional[str] = None, version: Optional[str] = None) -> str:
+        """로컬 examples_llm/을 캐시에 복사하고 현재 버전으로 지정 (네트워크 불필요)
+
+        Args:
+            examples_dir: examples_llm 경로 (기본: 자동 탐색 또는 KIS_EXAMPLES_LLM_DIR)
+            version: 캐시 버전 이름 (기본: 로컬 저장소의 git 커밋, 없으면 "local")
+
+        Returns:
+            갱신된 버전
+        """
+        examples_dir = examples_dir or self.examples_dir
+        if not examples_dir or not os.path.isfile(os.path.join(examples_dir, "kis_auth.py")):
+            raise FileNotFoundError(f"examples_llm 디렉토리를 찾을 수 없습니다: {examples_dir}")
+
+        version = version or self._git_commit(examples_dir) or "local"
+        target = os.path.join(self.cache_dir, version)
+        staging = f"{target}.tmp"
+
+        with self._lock:
+            shutil.rmtree(staging, ignore_errors=True)
+            shutil.copytree(
+                examples_dir, staging,
+                ignore=shutil.ignore_patterns("__pycache__", "chk_*.py", "*.pyc"),
+            )
+            shutil.rmtree(target, ignore_errors=True)
+            os.replace(staging, target)
+
+            files = sum(len([f for f in names if f.endswith(".py")]) for _, _, names in os.walk(target))
+            manifest = {
+                "version": version,
+                "ref": version,
+                "source": os.path.abspath(examples_dir),
+                "files": files,
+                "updated_at": datetime.now().isoformat(timespec="seconds"),
+            }
+            self._write(self.manifest_path, json.dumps(manifest, ensure_ascii=False, indent=2))
+
+        logging.info(f"✅ API 코드 캐시 갱신: {version} ({files}개 파일, {examples_dir})")
+        return version
+
+    # ========== 내부 ==========
+    @staticmethod
+    def _write(path: str, text: str) -> None:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _resolve_ref(ref: str) -> str:
+        """브랜치/태그/커밋 → 40자리 커밋 SHA"""
+        if _SHA_PATTERN.match(ref):
+            return ref
+        response = requests.get(
+            f"{GITHUB_COMMIT_API}/{ref}",
+            headers={"Accept": "application/vnd.github.sha"},
+            timeout=DOWNLOAD_TIMEOUT,
+        )
+        response.raise_for_status()
+        sha = response.text.strip()
+        if not _SHA_PATTERN.match(sha):
+            raise ValueError(f"커밋 SHA 해석 실패: {ref} → {sha[:80]}")
+        return sha
+
+    @staticmethod
+    def _find_examples_dir() -> Optional[str]:
+        """저장소 내 실행 시(MCP/Kis Trading MCP) 상위의 examples_llm 탐색"""
+        current = os.getcwd()
+        for _ in range(3):
+            candidate = os.path.join(current, EXAMPLES_DIR_NAME)
+            if os.path.isfile(os.path.join(candidate, "kis_auth.py")):
+                return candidate
+            current = os.path.dirname(current)
+        return None
+
+    @staticmethod
+    def _git_commit(path: str) -> Optional[str]:
+        try:
+            result = subprocess.run(
+                ["git", "-C", path, "rev-parse", "HEAD"],
+                capture_output=True, text=True, timeout=5,
+            )
+        except Exception:
+            return None
+        commit = result.stdout.strip()
+        return commit if result.returncode == 0 and commit else None
+
+
+if __name__ == "__main__":
+    # 오프라인 갱신: python -m module.plugin.api_code [examples_llm 경로]
+    logging.basicConfig(level=logging.INFO)
+    ApiCodeCache().refresh_from_local(sys.argv[1] if len(sys.argv) > 1 else None)
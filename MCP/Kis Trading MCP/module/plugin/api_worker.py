@@ -0,0 +1,276 @@
+import contextlib
+import importlib.util
+import io
+import json
+import logging
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import traceback
+from typing import Any, Dict, Optional
+
+from module.decorator import singleton
+
+DEFAULT_WORKERS = 2
+DEFAULT_TIMEOUT = 15  # 호출당 실행 제한 (초)
+START_TIMEOUT = 60  # 워커 기동(kis_auth import) 제한 (초)
+
+
+# ========== 워커 프로세스 ==========
+def _print_result(result: Any) -> None:
+    """API 결과 출력 (API_RUNNER_TEMPLATE과 동일한 형식)"""
+    try:
+        if isinstance(result, tuple):
+            output = {}
+            for i, item in enumerate(result):
+                if hasattr(item, 'to_dict'):
+                    output[f"output{i+1}"] = item.to_dict('records') if not item.empty else []
+                else:
+                    output[f"output{i+1}"] = str(item)
+            print(json.dumps(output, ensure_ascii=False, indent=2))
+        elif hasattr(result, 'empty') and not result.empty:
+            print(result.to_json(orient='records', force_ascii=False))
+        elif isinstance(result, (dict, list)):
+            print(json.dumps(result, ensure_ascii=False))
+        else:
+            print(str(result))
+    except Exception as e:
+        print(f"오류 발생: {str(e)}")
+
+
+def _load_function(modules: Dict[str, Any], path: str, function_name: str):
+    """API 모듈을 경로로 import (파일이 바뀌지 않았으면 재사용)"""
+    mtime = os.path.getmtime(path)
+    cached = modules.get(path)
+    if cached is None or cached[0] != mtime:
+        spec = importlib.util.spec_from_file_location(f"kis_api_{len(modules)}", path)
+        api_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(api_module)
+        cached = modules[path] = (mtime, api_module)
+    return getattr(cached[1], function_name)
+
+
+def _call(ka, modules: Dict[str, Any], request: Dict[str, Any]) -> Dict[str, Any]:
+    """요청 1건 실행: 인증 → 파라미터 해석 → 함수 호출 → 결과 출력 (stdout을 결과로 반환)"""
+    cfg = request["payload"]
+    stdout = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(stdout):
+            func = _load_function(modules, request["module_path"], request["function_name"])
+
+            # 토큰은 kis_auth 메모리 캐시를 사용하므로 호출마다 환경만 다시 설정됨
+            if cfg["env_dv"] == "demo":
+                ka.auth("vps")
+            else:
+                ka.auth()
+
+            kwargs = {}
+            for key, value in cfg["params"].items():
+                if isinstance(value, dict) and "__expr__" in value:
+                    expr = value["__expr__"]
+                    if not expr.startswith("ka._TRENV."):
+                        raise ValueError(f"Invalid expression: {expr}")
+                    kwargs[key] = getattr(ka.getTREnv(), expr[len("ka._TRENV."):])
+                else:
+                    kwargs[key] = value
+
+            try:
+                result = func(**kwargs)
+            except TypeError as e:
+                print(f"TypeError: {str(e)}")
+                print()
+                if cfg.get("has_stock_name"):
+                    print("해결방법: find_stock_code로 종목을 검색하세요.")
+                else:
+                    print("해결방법: find_api_detail로 API 상세 정보를 확인하세요")
+                return {"success": False, "output": stdout.getvalue(), "error": stdout.getvalue()}
+
+            _print_result(result)
+    except Exception:
+        return {"success": False, "output": stdout.getvalue(), "error": traceback.format_exc()}
+    return {"success": True, "output": stdout.getvalue(), "error": ""}
+
+
+def _worker_main(conn, code_root: str) -> None:
+    """워커 프로세스 진입점: kis_auth를 한 번 import한 뒤 요청을 순서대로 실행"""
+    try:
+        sys.path.insert(0, code_root)
+        import kis_auth as ka
+    except BaseException:
+        conn.send({"ready": False, "error": traceback.format_exc()})
+        return
+    conn.send({"ready": True})
+
+    modules: Dict[str, Any] = {}
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            return
+        if request is None:
+            return
+        conn.send(_call(ka, modules, request))
+
+
+# ========== 워커 풀 ==========
+class _Worker:
+    """워커 프로세스 1개와 요청 파이프"""
+
+    def __init__(self, context, code_root: str):
+        self.code_root = code_root
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main, args=(child_conn, code_root), name="kis-api-worker", daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+
+        if not self.conn.poll(START_TIMEOUT):
+            self.kill()
+            raise RuntimeError(f"API 워커 기동 시간 초과 ({START_TIMEOUT}초)")
+        ready = self.conn.recv()
+        if not ready.get("ready"):
+            self.kill()
+            raise RuntimeError(f"API 워커 기동 실패: {ready.get('error')}")
+
+    @property
+    def alive(self) -> bool:
+        return self.process.is_alive()
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=1)
+        self.kill()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(timeout=1)
+        self.conn.close()
+
+
+@singleton
+class ApiWorkerPool:
+    """kis_auth를 미리 import해 둔 상주 워커 프로세스 풀
+
+    - 워커는 API 모듈을 한 번만 import하고 함수명 + 직렬화된 파라미터로 실행
+    - 동시 실행 수는 워커 수(KIS_API_WORKERS, 기본 2)로 제한, 초과 요청은 대기
+    - 실행 시간 초과/비정상 종료된 워커는 종료 후 필요할 때 새로 기동
+    - 코드 버전(code_root)이 바뀌면 기존 워커를 교체
+    """
+
+    def __init__(self, size: Optional[int] = None):
+        self.size = size or int(os.getenv("KIS_API_WORKERS", DEFAULT_WORKERS))
+        self._context = multiprocessing.get_context("spawn")
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._spawned = 0
+        self._code_root: Optional[str] = None
+
+    def warm_up(self, code_root: str) -> None:
+        """워커를 미리 기동 (서버 시작 시)"""
+        self._use_code_root(code_root)
+        while True:
+            with self._lock:
+                if self._spawned >= self.size:
+                    return
+                self._spawned += 1
+            try:
+                self._idle.put(_Worker(self._context, code_root))
+            except Exception:
+                with self._lock:
+                    self._spawned -= 1
+                raise
+
+    def run(
+        self,
+        code_root: str,
+        module_path: str,
+        function_name: str,
+        payload: Dict[str, Any],
+        timeout: int = DEFAULT_TIMEOUT,
+    ) -> Dict[str, Any]:
+        """API 함수 실행 (blocking)
+
+        Returns:
+            {"success": bool, "output": str, "error": str}
+
+        Raises:
+            RuntimeError: 워커 기동 실패 (호출측에서 subprocess 실행으로 대체)
+        """
+        self._use_code_root(code_root)
+        worker = self._acquire(code_root)
+        request = {"module_path": module_path, "function_name": function_name, "payload": payload}
+        try:
+            worker.conn.send(request)
+            if not worker.conn.poll(timeout):
+                self._discard(worker)
+                worker = None
+                return {"success": False, "error": f"실행 시간 초과 ({timeout}초)"}
+            return worker.conn.recv()
+        except (EOFError, OSError) as e:
+            self._discard(worker)
+            worker = None
+            return {"success": False, "error": f"API 워커 비정상 종료: {str(e)}"}
+        finally:
+            if worker is not None:
+                self._release(worker)
+
+    def shutdown(self) -> None:
+        """대기 중인 워커 모두 종료"""
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            with self._lock:
+                self._spawned -= 1
+            worker.stop()
+
+    # ========== 내부 ==========
+    def _use_code_root(self, code_root: str) -> None:
+        with self._lock:
+            changed = self._code_root is not None and self._code_root != code_root
+            self._code_root = code_root
+        if changed:
+            logging.info(f"API 코드 버전 변경으로 워커 교체: {code_root}")
+            self.shutdown()
+
+    def _acquire(self, code_root: str) -> _Worker:
+        while True:
+            with self._lock:
+                can_spawn = self._idle.empty() and self._spawned < self.size
+                if can_spawn:
+                    self._spawned += 1
+            if can_spawn:
+                try:
+                    return _Worker(self._context, code_root)
+                except Exception:
+                    with self._lock:
+                        self._spawned -= 1
+                    raise
+
+            # 폐기된 워커 자리가 생길 수 있으므로 주기적으로 다시 확인
+            try:
+                worker = self._idle.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            if worker.alive and worker.code_root == code_root:
+                return worker
+            self._discard(worker)
+
+    def _release(self, worker: _Worker) -> None:
+        if worker.alive and worker.code_root == self._code_root:
+            self._idle.put(worker)
+        else:
+            self._discard(worker)
+
+    def _discard(self, worker: _Worker) -> None:
+        with self._lock:
+            self._spawned -= 1
+        worker.kill()
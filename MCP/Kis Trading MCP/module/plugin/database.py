@@ -1,5 +1,6 @@
-from typing import Any, Dict, List, Optional, Type, Union
-from sqlalchemy import create_engine, Engine
+from contextlib import nullcontext
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Type, Union
+from sqlalchemy import create_engine, Engine, Connection
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.exc import SQLAlchemyError
 import logging
@@ -274,61 +275,39 @@ class DatabaseEngine:
         finally:
             session.close()
     
-    def bulk_replace_master_data(self, model_class: Type, data_list: List[Dict], master_name: str) -> int:
+    def replace_master_data(
+        self,
+        model_class: Type,
+        data_list: List[Dict],
+        load_context: Optional[Callable[[Connection, Type], ContextManager]] = None,
+    ) -> int:
         """
-        마스터 데이터 추가 (INSERT만) - 카테고리 레벨에서 이미 삭제됨
+        마스터 테이블 데이터 전체 교체 (단일 트랜잭션)
+        
+        기존 데이터 삭제와 새 데이터 INSERT(executemany)를 한 트랜잭션에서 수행하므로
+        다른 연결의 조회는 커밋 전까지 기존 데이터, 커밋 후에는 새 데이터만 보게 됩니다.
         
         Args:
             model_class: 마스터 데이터 모델 클래스
-            data_list: 삽입할 데이터 리스트 (딕셔너리 리스트)
-            master_name: 마스터파일명 (로깅용)
+            data_list: 삽입할 데이터 리스트 (딕셔너리 리스트, 모든 행이 같은 키를 가져야 함)
+            load_context: 같은 트랜잭션 안에서 교체 전후 처리를 할 컨텍스트 (예: 검색 인덱스 재색인)
             
         Returns:
             삽입된 레코드 수
         """
-        session = self.get_session()
+        table = model_class.__table__
         try:
-            # 새 데이터 배치 삽입 (카테고리 레벨에서 이미 삭제되었으므로 INSERT만)
-            if data_list:
-                # 배치 크기 설정 (메모리 효율성을 위해 1000개씩)
-                batch_size = 1000
-                total_inserted = 0
-                
-                for i in range(0, len(data_list), batch_size):
-                    batch = data_list[i:i + batch_size]
-                    batch_objects = []
-                    
-                    for data in batch:
-                        # 모든 값을 문자열로 강제 변환 (SQLAlchemy 타입 추론 방지)
-                        str_data = {key: str(value) if value is not None else None for key, value in data.items()}
-                        
-                        # 딕셔너리를 모델 인스턴스로 변환
-                        obj = model_class(**str_data)
-                        batch_objects.append(obj)
-                    
-                    # 배치 삽입
-                    session.bulk_save_objects(batch_objects)
-                    total_inserted += len(batch_objects)
-                    
-                    # 중간 커밋 (메모리 절약)
-                    if i + batch_size < len(data_list):
-                        session.commit()
-                        logger.info(f"Inserted batch {i//batch_size + 1}: {len(batch_objects)} records")
-                
-                # 최종 커밋
-                session.commit()
-                logger.info(f"Bulk replace completed: {total_inserted} records inserted into {model_class.__name__}")
-                return total_inserted
-            else:
-                logger.warning(f"No data to insert for {master_name}")
-                return 0
-                
+            with self.engine.begin() as conn:
+                with load_context(conn, model_class) if load_context else nullcontext():
+                    conn.execute(table.delete())
+                    if data_list:
+                        conn.execute(table.insert(), data_list)
+            logger.info(f"Master data replaced: {len(data_list)} records in {model_class.__name__}")
+            return len(data_list)
+            
         except SQLAlchemyError as e:
-            session.rollback()
-            logger.error(f"Failed to bulk replace master data for {master_name}: {e}")
+            logger.error(f"Failed to replace master data for {model_class.__name__}: {e}")
             raise
-        finally:
-            session.close()
     
     def update_master_timestamp(self, tool_name: str, record_count: int = None) -> bool:
         """
@@ -1,13 +1,21 @@
+import asyncio
 import logging
 import os
 import shutil
+import time
 import requests
 from datetime import datetime
 from typing import List
 from module.plugin.database import Database
+from module.plugin.master_search import MasterSearch
 from typing import Dict
 import pandas as pd
 
+# 마스터파일 디코딩 시도 순서
+MASTER_FILE_ENCODINGS = ['cp949', 'euc-kr', 'utf-8', 'utf-8-sig', 'iso-8859-1', 'latin1']
+# 빈 값으로 처리할 문자열
+NULL_STRINGS = ['nan', 'NaN', 'None', 'null']
+
 class MasterFileManager:
     """도구별 마스터파일 관리 클래스 (1:N 매핑 지원)"""
 
@@ -292,7 +300,8 @@ class MasterFileManager:
         elif level.lower() == "warning":
             self.error_logger.warning(log_msg)
         else:
-            self.error_logger.info(log_msg)
+            # 오류 로그 파일은 ERROR부터 기록하므로 처리 시간 등 정보성 로그는 일반 로그로 남김
+            logging.info(log_msg)
     
     @staticmethod
     def get_master_models_for_tool(tool_name: str) -> List:
@@ -335,19 +344,40 @@ class MasterFileManager:
                     await ctx.info(f"{self.tool_name} 툴의 마스터파일들이 최신 상태입니다.")
                     return
 
-            # 2. 카테고리 레벨에서 테이블 전체 삭제 (한 번만)
-            await self.__clear_category_tables(ctx)
-
-            # 2-1. 해당 폴더의 CSV 파일들 삭제
+            # 2. 해당 폴더의 CSV 파일들 삭제
             await self.__clear_category_csv_files(ctx)
 
-            # 3. 각 마스터파일별로 업데이트 (삭제 없이 추가만)
-            total_record_count = 0
+            # 3. 마스터파일 동시 다운로드
+            download_times = await self.__download_master_files(ctx)
+
+            # 4. 마스터파일별 가공 및 모델용 데이터 변환 (DB는 아직 변경하지 않음)
+            model_data: Dict[type, List[Dict]] = {}
             for master_name in self.required_masters:
-                record_count = await self.__ensure_single_master_updated(ctx, master_name, force_update)
+                model_class, records = await self.__prepare_single_master(ctx, master_name, download_times[master_name])
+                model_data.setdefault(model_class, []).extend(records)
+
+            # 5. 모델(테이블)별로 한 트랜잭션에서 교체 - 검색은 교체 직전까지 기존 데이터를 사용
+            total_record_count = 0
+            for model_class, records in model_data.items():
+                if not records:
+                    self._log("warning", model_class.__name__, "replace_master_data", "가공된 데이터가 없어 기존 데이터 유지")
+                    await ctx.warning(f"{model_class.__name__} 가공된 데이터가 없어 기존 데이터를 유지합니다.")
+                    continue
+                started = time.perf_counter()
+                try:
+                    record_count = self.db_engine.replace_master_data(
+                        model_class, records, load_context=MasterSearch().bulk_load
+                    )
+                except Exception as e:
+                    self._log("error", model_class.__name__, "replace_master_data", str(e))
+                    raise
+                self._log("info", model_class.__name__, "timing",
+                          f"db={time.perf_counter() - started:.2f}s, records={record_count}")
+                await ctx.info(f"데이터베이스 저장 완료: {model_class.__name__} ({record_count}개 레코드)")
                 total_record_count += record_count
 
-            # 4. 모든 마스터파일 처리 완료 후 툴 전체 업데이트 시간 기록
+            # 6. 모든 마스터파일 처리 완료 후 툴 전체 업데이트 시간 기록
+            MasterSearch().invalidate(self.tool_name)
             if total_record_count > 0:
                 self.db_engine.update_master_timestamp(self.tool_name, total_record_count)
                 await ctx.info(f"{self.tool_name} 툴의 모든 마스터파일 업데이트 완료 (총 {total_record_count}개 레코드)")
@@ -358,6 +388,13 @@ class MasterFileManager:
             await ctx.error(f"마스터파일 체크 실패: {str(e)}")
             raise
 
+    def needs_update(self) -> bool:
+        """마스터파일 갱신 필요 여부 (오늘 갱신 기록이 없으면 True)"""
+        if not self.required_masters:
+            return False
+        last_update = self.db_engine.get_master_update_time(self.tool_name)
+        return last_update is None or self.__should_update_from_db(last_update)
+
     def is_master_file_available(self) -> bool:
         """마스터파일들이 사용 가능한지 확인"""
         try:
@@ -384,37 +421,55 @@ class MasterFileManager:
     #     """마스터파일 경로 반환"""
     #     return os.path.join(self.master_dir, f"{master_name}.tmp")
 
-    async def __ensure_single_master_updated(self, ctx, master_name: str, force_update: bool = False) -> int:
-        """단일 마스터파일 체크 및 업데이트"""
-        # 마스터파일 다운로드 및 DB 저장
-        await ctx.info(f"{master_name} 마스터파일 업데이트 중...")
+    async def __download_master_files(self, ctx) -> Dict[str, float]:
+        """툴에 필요한 마스터파일 동시 다운로드
 
-        try:
-            # 1. URL 확인
+        Returns:
+            마스터파일별 다운로드 소요 시간 (초)
+        """
+        async def download(master_name: str):
             master_config = self.MASTER_FILE_PROCESS.get(master_name)
             if not master_config:
                 raise Exception(f"{master_name}에 대한 마스터파일 설정이 없습니다.")
-            
-            master_url = master_config["file"]
 
-            # 2. 임시 파일로 다운로드
             temp_file = os.path.join(self.master_dir, f"{master_name}.tmp")
             await ctx.info(f"마스터파일 다운로드 중: {master_name}")
 
-            success = await self.__download_file(master_url, temp_file)
+            started = time.perf_counter()
+            success = await asyncio.to_thread(self.__download_file, master_config["file"], temp_file)
             if not success:
                 raise Exception(f"{master_name} 마스터파일 다운로드 실패")
+            return master_name, time.perf_counter() - started
 
-            # 3. 파일 가공 (마스터파일별 특화 로직) - DataFrame 반환
-            import pandas as pd
+        try:
+            results = await asyncio.gather(*(download(master_name) for master_name in self.required_masters))
+        except Exception as e:
+            self._log("error", "all_masters", "download", str(e))
+            raise
+        return dict(results)
+
+    async def __prepare_single_master(self, ctx, master_name: str, download_time: float):
+        """다운로드된 단일 마스터파일 가공 → CSV 저장 → 모델용 데이터 변환
 
-            # MASTER_FILE_PROCESS에서 처리 함수명 가져오기
+        Returns:
+            (모델 클래스, 모델용 데이터 리스트)
+        """
+        await ctx.info(f"{master_name} 마스터파일 업데이트 중...")
+
+        try:
+            master_config = self.MASTER_FILE_PROCESS[master_name]
+            temp_file = os.path.join(self.master_dir, f"{master_name}.tmp")
+
+            model_class = self.__get_model_class(master_name)
+            if not model_class:
+                raise Exception(f"{master_name}에 대한 모델 클래스를 찾을 수 없습니다.")
+
+            # 1. 파일 가공 (마스터파일별 특화 로직) - DataFrame 반환
+            started = time.perf_counter()
             process_func_name = master_config.get("process")
             if process_func_name:
                 try:
-                    # 처리 함수 가져오기
                     process_func = getattr(self, process_func_name)
-                    # 가공 함수에서 DataFrame 반환받기
                     df = await process_func(temp_file, ctx)
                 except Exception as e:
                     # 오류 로그 기록
@@ -426,50 +481,28 @@ class MasterFileManager:
                 # 기본 처리 - 빈 DataFrame 반환
                 await ctx.warning(f"지원하지 않는 마스터파일: {master_name}")
                 df = pd.DataFrame()
+            process_time = time.perf_counter() - started
 
-            # 4. CSV 파일 저장
+            # 2. CSV 파일 저장
+            started = time.perf_counter()
             await ctx.info(f"CSV 파일 저장 중: {master_name} ({len(df)}개 레코드)")
-            csv_saved = await self.__save_csv_file(df, master_name, ctx)
-
-            # 5. 모델에 저장
-            await ctx.info(f"모델에 저장 중: {master_name} ({len(df)}개 레코드)")
+            await self.__save_csv_file(df, master_name, ctx)
+            csv_time = time.perf_counter() - started
 
-            # 5-1. 모델용 데이터 변환
+            # 3. 모델용 데이터 변환
+            started = time.perf_counter()
             model_data = self.__convert_to_model_data(df, master_name)
+            convert_time = time.perf_counter() - started
 
-            # 5-2. 모델에 저장
-            try:
-                model_class = self.__get_model_class(master_name)
-                if not model_class:
-                    raise Exception(f"{master_name}에 대한 모델 클래스를 찾을 수 없습니다.")
-                
-                # bulk_replace_master_data 사용 (카테고리 레벨에서 이미 삭제되었으므로 INSERT만)
-                record_count = self.db_engine.bulk_replace_master_data(
-                    model_class=model_class,
-                    data_list=model_data,
-                    master_name=master_name
-                )
-            except Exception as e:
-                # 에러 로깅 시스템에 기록
-                self._log("error", master_name, "bulk_replace_master_data", str(e))
-                raise
-
-            await ctx.info(f"데이터베이스 저장 완료: {master_name} ({record_count}개 레코드)")
-
-            # 6. 임시 파일 정리 (보존)
-            # if os.path.exists(temp_file):
-            #     os.remove(temp_file)
-
-            await ctx.info(f"{master_name} 마스터파일 업데이트 완료")
-            return record_count
+            self._log("info", master_name, "timing",
+                      f"download={download_time:.2f}s, process={process_time:.2f}s, csv={csv_time:.2f}s, "
+                      f"convert={convert_time:.2f}s, rows={len(df)}, records={len(model_data)}")
+            await ctx.info(f"{master_name} 마스터파일 가공 완료 ({len(model_data)}개 레코드)")
+            return model_class, model_data
 
         except Exception as e:
             # 오류 로그 기록
-            self._log("error", master_name, "download_and_save", str(e))
-            # 임시 파일 정리 (보존)
-            # temp_file = os.path.join(self.master_dir, f"{master_name}.tmp")
-            # if os.path.exists(temp_file):
-            #     os.remove(temp_file)
+            self._log("error", master_name, "prepare", str(e))
             raise
 
     def __should_update_from_db(self, last_update: datetime) -> bool:
@@ -479,41 +512,6 @@ class MasterFileManager:
         except (ValueError, AttributeError):
             return True  # 날짜 파싱 실패 시 업데이트
 
-    async def __clear_category_tables(self, ctx):
-        """카테고리 레벨에서 해당 툴의 모든 테이블 데이터 삭제"""
-        try:
-            # 툴별 모델 클래스들 가져오기
-            master_models = self.get_master_models_for_tool(self.tool_name)
-            
-            if not master_models:
-                await ctx.info(f"{self.tool_name} 툴에 해당하는 모델이 없습니다.")
-                return
-            
-            # 각 모델의 테이블 데이터 삭제
-            for model_class in master_models:
-                try:
-                    # 기존 데이터 개수 확인
-                    before_count = self.db_engine.count(model_class)
-                    
-                    # 테이블 전체 삭제
-                    session = self.db_engine.get_session()
-                    try:
-                        deleted_count = session.query(model_class).delete()
-                        session.commit()
-                        await ctx.info(f"{model_class.__name__} 테이블 데이터 삭제 완료: {deleted_count}개 레코드")
-                    finally:
-                        session.close()
-                        
-                except Exception as e:
-                    self._log("error", model_class.__name__, "clear_table", str(e))
-                    await ctx.error(f"{model_class.__name__} 테이블 삭제 실패: {str(e)}")
-                    raise
-                    
-        except Exception as e:
-            self._log("error", "all_models", "clear_category_tables", str(e))
-            await ctx.error(f"카테고리 테이블 삭제 실패: {str(e)}")
-            raise
-
     async def __clear_category_csv_files(self, ctx):
         """카테고리 레벨에서 해당 툴의 모든 CSV 파일 및 임시 파일 삭제"""
         try:
@@ -581,8 +579,8 @@ class MasterFileManager:
         # 마스터파일이 TOOL_MASTER_MAPPING에 없는 경우 None 반환
         return None
 
-    async def __download_file(self, url: str, file_path: str) -> bool:
-        """파일 다운로드 (ZIP 파일 지원)"""
+    def __download_file(self, url: str, file_path: str) -> bool:
+        """파일 다운로드 (ZIP 파일 지원, 동시 다운로드를 위해 스레드에서 실행)"""
         try:
             import zipfile
             import ssl
@@ -664,40 +662,59 @@ class MasterFileManager:
 
     # ========== 공통 유틸리티 메서드들 ==========
     
-    async def _read_file_with_encoding(self, file_path: str, ctx) -> str:
-        """여러 인코딩을 시도하여 파일 읽기"""
-        encodings = ['cp949', 'euc-kr', 'utf-8', 'utf-8-sig', 'iso-8859-1', 'latin1']
-        
-        for encoding in encodings:
+    async def _read_lines(self, file_path: str, ctx) -> List[str]:
+        """파일을 한 번에 읽어 여러 인코딩으로 디코딩 후 줄 단위 리스트로 반환"""
+        with open(file_path, mode="rb") as f:
+            raw = f.read()
+
+        for encoding in MASTER_FILE_ENCODINGS:
             try:
-                with open(file_path, mode="r", encoding=encoding) as f:
-                    content = f.read()
-                await ctx.info(f"파일을 {encoding} 인코딩으로 성공적으로 읽었습니다.")
-                return content
+                content = raw.decode(encoding)
             except UnicodeDecodeError:
                 continue
-            except Exception as e:
-                await ctx.warning(f"{encoding} 인코딩 시도 중 오류: {str(e)}")
-                continue
-        
+            await ctx.info(f"파일을 {encoding} 인코딩으로 성공적으로 읽었습니다.")
+            return content.splitlines()
+
         raise Exception("모든 인코딩 시도 실패")
-    
+
+    @staticmethod
+    def _slice_fields(lines: List[str], fields) -> pd.DataFrame:
+        """고정폭 필드를 컬럼 단위로 일괄 추출
+
+        Args:
+            lines: 줄 단위 문자열 리스트
+            fields: [(컬럼명, 시작, 끝, 정리)] - 시작/끝은 파이썬 슬라이스와 동일 (음수는 줄 끝 기준),
+                    정리는 'strip' / 'rstrip' / 'lstrip' / None
+        """
+        columns = {}
+        for name, start, stop, trim in fields:
+            if trim:
+                trim_func = getattr(str, trim)
+                columns[name] = [trim_func(row[start:stop]) for row in lines]
+            else:
+                columns[name] = [row[start:stop] for row in lines]
+        return pd.DataFrame(columns, columns=[field[0] for field in fields], dtype=object)
+
+    @staticmethod
+    def _width_fields(names, widths, trim='strip'):
+        """연속된 고정폭 필드 정의 생성 (read_fwf의 widths와 같은 배치, 앞뒤 공백 제거)"""
+        fields = []
+        start = 0
+        for name, width in zip(names, widths):
+            fields.append((name, start, start + width, trim))
+            start += width
+        return fields
+
     def _create_dataframe(self, data, columns):
         """DataFrame 생성 및 공통 처리"""
-        import pandas as pd
-        
         df = pd.DataFrame(data, columns=columns)
         df = df.astype(str)
-        df = df.replace(['nan', 'NaN', 'None', 'null'], '')
+        df = df.mask(df.isin(NULL_STRINGS), '')
         return df
     
     def _read_csv_with_encoding(self, file_path: str, **kwargs):
         """여러 인코딩을 시도하여 CSV 파일 읽기"""
-        import pandas as pd
-        
-        encodings = ['cp949', 'euc-kr', 'utf-8', 'utf-8-sig', 'iso-8859-1', 'latin1']
-        
-        for encoding in encodings:
+        for encoding in MASTER_FILE_ENCODINGS:
             try:
                 df = pd.read_csv(file_path, encoding=encoding, **kwargs)
                 return df
@@ -708,61 +725,32 @@ class MasterFileManager:
         
         raise Exception("모든 인코딩 시도 실패")
     
-    def _read_fwf_with_encoding(self, file_path: str, **kwargs):
-        """여러 인코딩을 시도하여 고정폭 파일 읽기"""
-        import pandas as pd
-        
-        encodings = ['cp949', 'euc-kr', 'utf-8', 'utf-8-sig', 'iso-8859-1', 'latin1']
-        
-        for encoding in encodings:
-            try:
-                df = pd.read_fwf(file_path, encoding=encoding, **kwargs)
-                return df
-            except UnicodeDecodeError:
-                continue
-            except Exception as e:
-                continue
-        
-        raise Exception("모든 인코딩 시도 실패")
-
     def __convert_to_model_data(self, df, master_name: str) -> List[Dict]:
         """DataFrame을 모델용 데이터로 변환 - MASTER_FILE_PROCESS의 name_key, code_key, ex_value 사용"""
         try:
-            model_data = []
-            
             # MASTER_FILE_PROCESS에서 name_key, code_key, ex_value 가져오기
             master_config = self.MASTER_FILE_PROCESS.get(master_name, {})
             name_key = master_config.get("name_key", "name")
             code_key = master_config.get("code_key", "code")
             ex_value = master_config.get("ex_value", "")
-            
-            for _, row in df.iterrows():
-                # 지정된 키로 종목명과 종목코드 추출
-                name = None
-                code = None
-                
-                # 종목명 추출 (띄어쓰기 제거)
-                if name_key in row and pd.notna(row[name_key]) and str(row[name_key]).strip():
-                    name_str = str(row[name_key]).strip()
-                    if name_str not in ['nan', 'NaN', 'None', 'null', '']:
-                        name = name_str.replace(" ", "")
-                
-                # 종목코드 추출
-                if code_key in row and pd.notna(row[code_key]) and str(row[code_key]).strip():
-                    code_str = str(row[code_key]).strip()
-                    if code_str not in ['nan', 'NaN', 'None', 'null', '']:
-                        code = code_str
-                
-                # 유효한 데이터만 추가
-                if name and code:
-                    model_data.append({
-                        'name': name,
-                        'code': code,
-                        'ex': ex_value
-                    })
-            
-            return model_data
-            
+
+            if name_key not in df.columns or code_key not in df.columns:
+                return []
+
+            def clean(column: pd.Series) -> pd.Series:
+                values = column.where(column.notna(), '').astype(str).str.strip()
+                return values.mask(values.isin(NULL_STRINGS), '')
+
+            # 종목명은 띄어쓰기 제거, 종목명/종목코드가 모두 유효한 행만 사용
+            names = clean(df[name_key]).str.replace(" ", "", regex=False)
+            codes = clean(df[code_key])
+            valid = (names != '') & (codes != '')
+
+            return [
+                {'name': name, 'code': code, 'ex': ex_value}
+                for name, code in zip(names[valid].tolist(), codes[valid].tolist())
+            ]
+
         except Exception as e:
             self._log("error", master_name, "convert_to_model_data", str(e))
             return []
@@ -776,7 +764,7 @@ class MasterFileManager:
             
             # CSV 저장 전 추가 nan 처리
             df_clean = df.copy()
-            df_clean = df_clean.replace(['nan', 'NaN', 'None', 'null'], '')
+            df_clean = df_clean.mask(df_clean.isin(NULL_STRINGS), '')
             
             # CSV 파일 경로 설정
             csv_file_path = os.path.join(self.master_dir, f"{master_name}.csv")
@@ -795,39 +783,22 @@ class MasterFileManager:
 
 
     # ========== 마스터파일별 특화 가공 메서드들 ==========
+    # 고정폭 마스터는 파일을 한 번 읽어 디코딩한 줄 목록에서 필드를 컬럼 단위로 일괄 추출
+    # (슬라이스 위치/정리 방식은 원본 코드와 동일, 임시 part 파일을 만들지 않음)
 
     async def __process_domestic_stock(self, raw_file: str, ctx) -> pd.DataFrame:
         """국내주식 마스터파일 가공 (원본 코드와 동일)"""
         await ctx.info("국내주식 마스터파일 가공 중...")
 
         try:
-            import pandas as pd
-            import os
-
-            # 파일 읽기 (공통 로직)
-            file_content = await self._read_file_with_encoding(raw_file, ctx)
-
-            # 원본 코드와 정확히 동일한 파싱
-            tmp_fil1 = raw_file.replace('.tmp', '_part1.tmp')
-            tmp_fil2 = raw_file.replace('.tmp', '_part2.tmp')
-            wf1 = open(tmp_fil1, mode="w")
-            wf2 = open(tmp_fil2, mode="w")
-
-            # 파일 내용을 라인별로 처리
-            for row in file_content.splitlines():
-                rf1 = row[0:len(row) - 222]
-                rf1_1 = rf1[0:9].rstrip()
-                rf1_2 = rf1[9:21].rstrip()
-                rf1_3 = rf1[21:].strip()
-                wf1.write(rf1_1 + ',' + rf1_2 + ',' + rf1_3 + '\n')
-                rf2 = row[-222:]
-                wf2.write(rf2)
-
-            wf1.close()
-            wf2.close()
+            lines = await self._read_lines(raw_file, ctx)
 
             part1_columns = ['short_code', 'standard_code', 'korean_name']
-            df1 = self._read_csv_with_encoding(tmp_fil1, header=None, names=part1_columns, dtype=str)
+            df1 = self._slice_fields([row[:-222] for row in lines], [
+                ('short_code', 0, 9, 'rstrip'),
+                ('standard_code', 9, 21, 'rstrip'),
+                ('korean_name', 21, None, 'strip'),
+            ])
 
             field_specs = [2, 1,
                            4, 4, 4, 1, 1,
@@ -861,19 +832,10 @@ class MasterFileManager:
                              'base_year_month', 'prev_day_market_cap_billion', 'group_company_code', 'company_credit_limit_exceed_yn', 'collateral_loan_yn', 'securities_lending_yn'
                              ]
 
-            df2 = self._read_fwf_with_encoding(tmp_fil2, widths=field_specs, names=part2_columns)
+            df2 = self._slice_fields([row[-222:] for row in lines], self._width_fields(part2_columns, field_specs))
 
-            df = pd.merge(df1, df2, how='outer', left_index=True, right_index=True)
-            
             # 공통 DataFrame 처리
-            df = df.astype(str)
-            df = df.replace(['nan', 'NaN', 'None', 'null'], '')
-
-            # clean temporary file and dataframe
-            del (df1)
-            del (df2)
-            os.remove(tmp_fil1)
-            os.remove(tmp_fil2)
+            df = self._create_dataframe(pd.concat([df1, df2], axis=1), part1_columns + part2_columns)
 
             await ctx.info(f"국내주식 마스터파일 가공 완료: {len(df)}개 종목")
             return df
@@ -888,33 +850,14 @@ class MasterFileManager:
         await ctx.info("국내주식 마스터파일 가공 중...")
 
         try:
-            import pandas as pd
-            import os
-
-            # 파일 읽기 (공통 로직)
-            file_content = await self._read_file_with_encoding(raw_file, ctx)
-
-            # 원본 코드와 정확히 동일한 파싱
-            tmp_fil1 = raw_file.replace('.tmp', '_part1.tmp')
-            tmp_fil2 = raw_file.replace('.tmp', '_part2.tmp')
-            wf1 = open(tmp_fil1, mode="w")
-            wf2 = open(tmp_fil2, mode="w")
-
-            # 파일 내용을 라인별로 처리
-            for row in file_content.splitlines():
-                rf1 = row[0:len(row) - 228]
-                rf1_1 = rf1[0:9].rstrip()
-                rf1_2 = rf1[9:21].rstrip()
-                rf1_3 = rf1[21:].strip()
-                wf1.write(rf1_1 + ',' + rf1_2 + ',' + rf1_3 + '\n')
-                rf2 = row[-228:]
-                wf2.write(rf2)
-
-            wf1.close()
-            wf2.close()
+            lines = await self._read_lines(raw_file, ctx)
 
             part1_columns = ['short_code', 'standard_code', 'korean_name']
-            df1 = self._read_csv_with_encoding(tmp_fil1, header=None, names=part1_columns, dtype=str)
+            df1 = self._slice_fields([row[:-228] for row in lines], [
+                ('short_code', 0, 9, 'rstrip'),
+                ('standard_code', 9, 21, 'rstrip'),
+                ('korean_name', 21, None, 'strip'),
+            ])
 
             field_specs = [2, 1, 4, 4, 4,
                            1, 1, 1, 1, 1,
@@ -948,19 +891,10 @@ class MasterFileManager:
                              'market_cap', 'group_company_code', 'company_credit_limit_exceed', 'collateral_loan_available', 'securities_lending_available'
                              ]
 
-            df2 = self._read_fwf_with_encoding(tmp_fil2, widths=field_specs, names=part2_columns)
+            df2 = self._slice_fields([row[-228:] for row in lines], self._width_fields(part2_columns, field_specs))
 
-            df = pd.merge(df1, df2, how='outer', left_index=True, right_index=True)
-            
             # 공통 DataFrame 처리
-            df = df.astype(str)
-            df = df.replace(['nan', 'NaN', 'None', 'null'], '')
-
-            # clean temporary file and dataframe
-            del (df1)
-            del (df2)
-            os.remove(tmp_fil1)
-            os.remove(tmp_fil2)
+            df = self._create_dataframe(pd.concat([df1, df2], axis=1), part1_columns + part2_columns)
 
             await ctx.info(f"국내주식 마스터파일 가공 완료: {len(df)}개 종목")
             return df
@@ -975,83 +909,33 @@ class MasterFileManager:
         await ctx.info("국내주식 마스터파일 가공 중...")
 
         try:
-            import pandas as pd
-
-            # 원본 코드와 정확히 동일한 파싱
             await ctx.info("복잡한 고정폭 텍스트 파일 파싱 중...")
-            
-            # 파일 읽기 (공통 로직)
-            file_content = await self._read_file_with_encoding(raw_file, ctx)
-            lines = file_content.splitlines()
 
-            data = []
-            for row in lines:
-                row = row.strip()
-                mksc_shrn_iscd = row[0:9].strip()
-                stnd_iscd = row[9:21].strip()
-                scrt_grp_cls_code = row[-184:-182].strip()
-                stck_sdpr = row[-182:-173].strip()
-                frml_mrkt_deal_qty_unit = row[-173:-168].strip()
-                ovtm_mrkt_deal_qty_unit = row[-168:-163].strip()
-                trht_yn = row[-163:-162].strip()
-                sltr_yn = row[-162:-161].strip()
-                mang_issu_yn = row[-161:-160].strip()
-                mrkt_alrm_cls_code = row[-160:-158].strip()
-                mrkt_alrm_risk_adnt_yn = row[-158:-157].strip()
-                insn_pbnt_yn = row[-157:-156].strip()
-                byps_lstn_yn = row[-156:-155].strip()
-                flng_cls_code = row[-155:-153].strip()
-                fcam_mod_cls_code = row[-153:-151].strip()
-                icic_cls_code = row[-151:-149].strip()
-                marg_rate = row[-149:-146].strip()
-                crdt_able = row[-146:-145].strip()
-                crdt_days = row[-145:-142].strip()
-                prdy_vol = row[-142:-130].strip()
-                stck_fcam = row[-130:-118].strip()
-                stck_lstn_date = row[-118:-110].strip()
-                lstn_stcn = row[-110:-95].strip()
-                cpfn = row[-95:-74].strip()
-                stac_month = row[-74:-72].strip()
-                po_prc = row[-72:-65].strip()
-                prst_cls_code = row[-65:-64].strip()
-                ssts_hot_yn = row[-64:-63].strip()
-                stange_runup_yn = row[-63:-62].strip()
-                krx300_issu_yn = row[-62:-61].strip()
-                sale_account = row[-61:-52].strip()
-                bsop_prfi = row[-52:-43].strip()
-                op_prfi = row[-43:-34].strip()
-                thtr_ntin = row[-34:-29].strip()
-                roe = row[-29:-20].strip()
-                base_date = row[-20:-12].strip()
-                prdy_avls_scal = row[-12:-3].strip()
-                co_crdt_limt_over_yn = row[-3:-2].strip()
-                secu_lend_able_yn = row[-2:-1].strip()
-                stln_able_yn = row[-1:].strip()
-                hts_kor_isnm = row[21:-184].strip()
-
-                data.append([mksc_shrn_iscd, stnd_iscd, hts_kor_isnm, scrt_grp_cls_code,
-                             stck_sdpr, frml_mrkt_deal_qty_unit, ovtm_mrkt_deal_qty_unit,
-                             trht_yn, sltr_yn, mang_issu_yn, mrkt_alrm_cls_code,
-                             mrkt_alrm_risk_adnt_yn, insn_pbnt_yn, byps_lstn_yn,
-                             flng_cls_code, fcam_mod_cls_code, icic_cls_code, marg_rate,
-                             crdt_able, crdt_days, prdy_vol, stck_fcam, stck_lstn_date,
-                             lstn_stcn, cpfn, stac_month, po_prc, prst_cls_code, ssts_hot_yn,
-                             stange_runup_yn, krx300_issu_yn, sale_account, bsop_prfi,
-                             op_prfi, thtr_ntin, roe, base_date, prdy_avls_scal,
-                             co_crdt_limt_over_yn, secu_lend_able_yn, stln_able_yn])
-
-            columns = ['short_code', 'standard_code', 'stock_name', 'security_group_code', 'stock_base_price',
-                       'regular_market_unit', 'after_hours_market_unit', 'trading_halt_yn',
-                       'liquidation_yn', 'management_stock_yn', 'market_warning_code', 'market_warning_risk_yn',
-                       'dishonest_disclosure_yn', 'bypass_listing_yn', 'lock_division_code', 'par_value_change_code',
-                       'capital_increase_code', 'margin_rate', 'credit_order_yn', 'credit_period', 'prev_day_volume',
-                       'stock_par_value', 'stock_listing_date', 'listed_shares_thousand', 'capital', 'settlement_month', 'public_offering_price',
-                       'preferred_stock_code', 'short_sale_overheat_yn', 'unusual_rise_yn', 'krx300_stock_yn',
-                       'sales', 'operating_profit', 'ordinary_profit', 'net_income', 'roe', 'base_year_month', 'prev_day_market_cap_billion',
-                       'company_credit_limit_exceed_yn', 'collateral_loan_yn', 'securities_lending_yn']
-            
+            lines = await self._read_lines(raw_file, ctx)
+
+            # 각 줄의 앞뒤 공백 제거 후 앞(코드)/뒤(고정폭 항목)에서 추출, 종목명은 나머지 가운데 부분
+            fields = [
+                ('short_code', 0, 9), ('standard_code', 9, 21), ('stock_name', 21, -184),
+                ('security_group_code', -184, -182), ('stock_base_price', -182, -173),
+                ('regular_market_unit', -173, -168), ('after_hours_market_unit', -168, -163),
+                ('trading_halt_yn', -163, -162), ('liquidation_yn', -162, -161), ('management_stock_yn', -161, -160),
+                ('market_warning_code', -160, -158), ('market_warning_risk_yn', -158, -157),
+                ('dishonest_disclosure_yn', -157, -156), ('bypass_listing_yn', -156, -155),
+                ('lock_division_code', -155, -153), ('par_value_change_code', -153, -151),
+                ('capital_increase_code', -151, -149), ('margin_rate', -149, -146), ('credit_order_yn', -146, -145),
+                ('credit_period', -145, -142), ('prev_day_volume', -142, -130), ('stock_par_value', -130, -118),
+                ('stock_listing_date', -118, -110), ('listed_shares_thousand', -110, -95), ('capital', -95, -74),
+                ('settlement_month', -74, -72), ('public_offering_price', -72, -65), ('preferred_stock_code', -65, -64),
+                ('short_sale_overheat_yn', -64, -63), ('unusual_rise_yn', -63, -62), ('krx300_stock_yn', -62, -61),
+                ('sales', -61, -52), ('operating_profit', -52, -43), ('ordinary_profit', -43, -34),
+                ('net_income', -34, -29), ('roe', -29, -20), ('base_year_month', -20, -12),
+                ('prev_day_market_cap_billion', -12, -3), ('company_credit_limit_exceed_yn', -3, -2),
+                ('collateral_loan_yn', -2, -1), ('securities_lending_yn', -1, None),
+            ]
+            df = self._slice_fields([row.strip() for row in lines], [(name, start, stop, 'strip') for name, start, stop in fields])
+
             # 공통 DataFrame 처리
-            df = self._create_dataframe(data, columns)
+            df = self._create_dataframe(df, [name for name, _, _ in fields])
 
             await ctx.info(f"국내주식 마스터파일 가공 완료: {len(df)}개 종목")
             return df
@@ -1083,7 +967,7 @@ class MasterFileManager:
             
             # 공통 DataFrame 처리
             df = df.astype(str)
-            df = df.replace(['nan', 'NaN', 'None', 'null'], '')
+            df = df.mask(df.isin(NULL_STRINGS), '')
 
             await ctx.info(f"해외주식 마스터파일 가공 완료: {len(df)}개 종목")
             return df
@@ -1098,64 +982,29 @@ class MasterFileManager:
         await ctx.info("해외지수 마스터파일 가공 중...")
 
         try:
-            import pandas as pd
-            import os
-
-            # 원본 코드와 정확히 동일한 파싱
-            tmp_fil1 = raw_file.replace('.tmp', '_part1.tmp')
-            tmp_fil2 = raw_file.replace('.tmp', '_part2.tmp')
-            wf1 = open(tmp_fil1, mode="w")
-            wf2 = open(tmp_fil2, mode="w")
+            lines = await self._read_lines(raw_file, ctx)
 
-            # 파일 읽기 (공통 로직)
-            file_content = await self._read_file_with_encoding(raw_file, ctx)
-            
-            # 파일 내용을 라인별로 처리
-            for row in file_content.splitlines():
-                if row[0:1] == 'X':
-                    rf1 = row[0:len(row) - 14]
-                    rf_1 = rf1[0:1]
-                    rf1_2 = rf1[1:11]
-                    rf1_3 = rf1[11:40].replace(",", "")
-                    rf1_4 = rf1[40:80].replace(",", "").strip()
-                    wf1.write(rf_1 + ',' + rf1_2 + ',' + rf1_3 + ',' + rf1_4 + '\n')
-                    rf2 = row[-15:]
-                    wf2.write(rf2 + '\n')
-                    continue
+            # 구분코드 'X' 행은 영문명/한글명 위치가 다름
+            data = []
+            for row in lines:
                 rf1 = row[0:len(row) - 14]
-                rf1_1 = rf1[0:1]
-                rf1_2 = rf1[1:11]
-                rf1_3 = rf1[11:50].replace(",", "")
-                rf1_4 = row[50:75].replace(",", "").strip()
-                wf1.write(rf1_1 + ',' + rf1_2 + ',' + rf1_3 + ',' + rf1_4 + '\n')
-                rf2 = row[-15:]
-                wf2.write(rf2 + '\n')
-
-            wf1.close()
-            wf2.close()
-
-            part1_columns = ['division_code', 'symbol', 'english_name', 'korean_name']
-            df1 = self._read_csv_with_encoding(tmp_fil1, header=None, names=part1_columns, dtype=str)
+                if row[0:1] == 'X':
+                    data.append([rf1[0:1], rf1[1:11], rf1[11:40].replace(",", ""), rf1[40:80].replace(",", "").strip()])
+                else:
+                    data.append([rf1[0:1], rf1[1:11], rf1[11:50].replace(",", ""), row[50:75].replace(",", "").strip()])
+            df1 = pd.DataFrame(data, columns=['division_code', 'symbol', 'english_name', 'korean_name'], dtype=object)
 
             field_specs = [4, 1, 1, 1, 4, 3]
             part2_columns = ['industry_code', 'dow30_inclusion_yn', 'nasdaq100_inclusion_yn', 'sp500_inclusion_yn', 'exchange_code', 'country_division_code']
-            df2 = self._read_fwf_with_encoding(tmp_fil2, widths=field_specs, names=part2_columns)
+            df2 = self._slice_fields([row[-15:] for row in lines], self._width_fields(part2_columns, field_specs))
+
             df2['industry_code'] = df2['industry_code'].str.replace(pat=r'[^A-Z]', repl=r'', regex=True)
             df2['dow30_inclusion_yn'] = df2['dow30_inclusion_yn'].str.replace(pat=r'[^0-1]+', repl=r'', regex=True)
             df2['nasdaq100_inclusion_yn'] = df2['nasdaq100_inclusion_yn'].str.replace(pat=r'[^0-1]+', repl=r'', regex=True)
             df2['sp500_inclusion_yn'] = df2['sp500_inclusion_yn'].str.replace(pat=r'[^0-1]+', repl=r'', regex=True)
 
-            DF = pd.concat([df1, df2], axis=1)
-            
             # 공통 DataFrame 처리
-            DF = DF.astype(str)
-            DF = DF.replace(['nan', 'NaN', 'None', 'null'], '')
-
-            # 임시 파일들 정리
-            os.remove(tmp_fil1)
-            os.remove(tmp_fil2)
-
-            # DataFrame 직접 반환 (CSV 저장 제거됨)
+            DF = self._create_dataframe(pd.concat([df1, df2], axis=1), list(df1.columns) + part2_columns)
 
             await ctx.info(f"해외지수 마스터파일 가공 완료: {len(DF)}개 종목")
             return DF
@@ -1182,7 +1031,7 @@ class MasterFileManager:
             
             # 공통 DataFrame 처리
             df = df.astype(str)
-            df = df.replace(['nan', 'NaN', 'None', 'null'], '')
+            df = df.mask(df.isin(NULL_STRINGS), '')
 
             # DataFrame 직접 반환 (CSV 저장 제거됨)
 
@@ -1211,7 +1060,7 @@ class MasterFileManager:
             
             # 공통 DataFrame 처리
             df = df.astype(str)
-            df = df.replace(['nan', 'NaN', 'None', 'null'], '')
+            df = df.mask(df.isin(NULL_STRINGS), '')
 
             # DataFrame 직접 반환 (CSV 저장 제거됨)
 
@@ -1228,29 +1077,17 @@ class MasterFileManager:
         await ctx.info("국내CME연계 야간선물 마스터파일 가공 중...")
 
         try:
-            import pandas as pd
-
-            # 원본 코드와 정확히 동일한 파싱
-            columns = ['product_type', 'short_code', 'standard_code', 'korean_name', 'strike_price', 'underlying_short_code', 'underlying_name']
-            df = pd.DataFrame(columns=columns)
-            ridx = 1
-
-            # 파일 읽기 (공통 로직)
-            file_content = await self._read_file_with_encoding(raw_file, ctx)
-            
-            # 파일 내용을 라인별로 처리
-            for row in file_content.splitlines():
-                a = row[0:1]
-                b = row[1:10].strip()
-                c = row[10:22].strip()
-                d = row[22:63].strip()
-                e = row[63:72].strip()
-                f = row[72:81].strip()
-                g = row[81:].strip()
-                df.loc[ridx] = [a, b, c, d, e, f, g]
-                ridx += 1
-
-            # DataFrame 직접 반환 (CSV 저장 제거됨)
+            lines = await self._read_lines(raw_file, ctx)
+
+            df = self._slice_fields(lines, [
+                ('product_type', 0, 1, None),
+                ('short_code', 1, 10, 'strip'),
+                ('standard_code', 10, 22, 'strip'),
+                ('korean_name', 22, 63, 'strip'),
+                ('strike_price', 63, 72, 'strip'),
+                ('underlying_short_code', 72, 81, 'strip'),
+                ('underlying_name', 81, None, 'strip'),
+            ])
 
             await ctx.info(f"국내CME연계 야간선물 마스터파일 가공 완료: {len(df)}개 종목")
             return df
@@ -1265,65 +1102,27 @@ class MasterFileManager:
         await ctx.info("국내상품선물 마스터파일 가공 중...")
 
         try:
-            import pandas as pd
-            import os
+            lines = await self._read_lines(raw_file, ctx)
 
-            # 원본 코드와 정확히 동일한 파싱
             # df1 : '상품구분','상품종류','단축코드','표준코드','한글종목명'
-            tmp_fil1 = raw_file.replace('.tmp', '_part1.tmp')
-            tmp_fil2 = raw_file.replace('.tmp', '_part2.tmp')
-            wf1 = open(tmp_fil1, mode="w")
-            wf2 = open(tmp_fil2, mode="w")
-
-            # 파일 읽기 (공통 로직)
-            file_content = await self._read_file_with_encoding(raw_file, ctx)
-            
-            # 파일 내용을 라인별로 처리
-            for row in file_content.splitlines():
-                rf1 = row[0:55]
-                rf1_1 = rf1[0:1]
-                rf1_2 = rf1[1:2]
-                rf1_3 = rf1[2:11].strip()
-                rf1_4 = rf1[11:23].strip()
-                rf1_5 = rf1[23:55].strip()
-                wf1.write(rf1_1 + ',' + rf1_2 + ',' + rf1_3 + ',' + rf1_4 + ',' + rf1_5 + '\n')
-                rf2 = row[55:].lstrip()
-                wf2.write(rf2)
-
-            wf1.close()
-            wf2.close()
-
-            part1_columns = ['product_division', 'product_type', 'short_code', 'standard_code', 'korean_name']
-            df1 = self._read_csv_with_encoding(tmp_fil1, header=None, names=part1_columns)
+            df1 = self._slice_fields([row[:55] for row in lines], [
+                ('product_division', 0, 1, None),
+                ('product_type', 1, 2, None),
+                ('short_code', 2, 11, 'strip'),
+                ('standard_code', 11, 23, 'strip'),
+                ('korean_name', 23, 55, 'strip'),
+            ])
 
             # df2 : '월물구분코드','기초자산 단축코드','기초자산 명'
-            tmp_fil3 = raw_file.replace('.tmp', '_part3.tmp')
-            wf3 = open(tmp_fil3, mode="w")
-
-            # tmp_fil2 읽기 (공통 함수 사용)
-            tmp_fil2_content = await self._read_file_with_encoding(tmp_fil2, ctx)
-            for row in tmp_fil2_content.splitlines():
-                rf2 = row[:]
-                rf2_1 = rf2[8:9]
-                rf2_2 = rf2[9:12]
-                rf2_3 = rf2[12:].strip()
-                wf3.write(rf2_1 + ',' + rf2_2 + ',' + rf2_3 + '\n')
-
-            wf3.close()
-
-            part2_columns = ['maturity_division_code', 'underlying_short_code', 'underlying_name']
-            df2 = self._read_csv_with_encoding(tmp_fil3, header=None, names=part2_columns)
+            df2 = self._slice_fields([row[55:].lstrip() for row in lines], [
+                ('maturity_division_code', 8, 9, None),
+                ('underlying_short_code', 9, 12, None),
+                ('underlying_name', 12, None, 'strip'),
+            ])
 
             # DF : df1 + df2
             df = pd.concat([df1, df2], axis=1)
 
-            # 임시 파일들 정리
-            for tmp_file in [tmp_fil1, tmp_fil2, tmp_fil3]:
-                if os.path.exists(tmp_file):
-                    os.unlink(tmp_file)
-
-            # DataFrame 직접 반환 (CSV 저장 제거됨)
-
             await ctx.info(f"국내상품선물 마스터파일 가공 완료: {len(df)}개 종목")
             return df
 
@@ -1337,71 +1136,32 @@ class MasterFileManager:
         await ctx.info("국내EUREX연계 야간옵션 마스터파일 가공 중...")
 
         try:
-            import pandas as pd
-            import os
-
             # 파일이 존재하지 않는 경우 빈 DataFrame 반환
             if not os.path.exists(raw_file):
                 await ctx.warning(f"파일이 존재하지 않습니다: {raw_file}")
                 return pd.DataFrame()
 
-            # 원본 코드와 정확히 동일한 파싱
-            # df1 : '상품종류','단축코드','표준코드','한글종목명'
-            tmp_fil1 = raw_file.replace('.tmp', '_part1.tmp')
-            tmp_fil2 = raw_file.replace('.tmp', '_part2.tmp')
-            wf1 = open(tmp_fil1, mode="w")
-            wf2 = open(tmp_fil2, mode="w")
+            lines = await self._read_lines(raw_file, ctx)
 
-            # 파일 읽기 (공통 로직)
-            file_content = await self._read_file_with_encoding(raw_file, ctx)
-            
-            # 파일 내용을 라인별로 처리 (참조 사이트와 정확히 동일)
-            for row in file_content.splitlines():
-                rf1 = row[0:59]
-                rf1_1 = rf1[0:1]
-                rf1_2 = rf1[1:10]
-                rf1_3 = rf1[10:22].strip()
-                rf1_4 = rf1[22:59].strip()
-                # 마지막 필드에 콤마가 포함될 수 있으므로 따옴표로 감싸기
-                wf1.write(rf1_1 + ',' + rf1_2 + ',' + rf1_3 + ',"' + rf1_4 + '"' + '\n')
-                rf2 = row[59:].lstrip()
-                wf2.write(rf2 + '\n')
-
-            wf1.close()
-            wf2.close()
-
-            part1_columns = ['product_type', 'short_code', 'standard_code', 'korean_name']
-            df1 = self._read_csv_with_encoding(tmp_fil1, header=None, names=part1_columns)
-    
+            # df1 : '상품종류','단축코드','표준코드','한글종목명'
+            df1 = self._slice_fields([row[:59] for row in lines], [
+                ('product_type', 0, 1, None),
+                ('short_code', 1, 10, None),
+                ('standard_code', 10, 22, 'strip'),
+                ('korean_name', 22, 59, 'strip'),
+            ])
 
             # df2 : 'ATM구분','행사가','기초자산 단축코드','기초자산 명'
-            tmp_fil3 = raw_file.replace('.tmp', '_part3.tmp')
-            wf3 = open(tmp_fil3, mode="w")
-
-            # tmp_fil2 읽기 (참조 사이트와 동일하게 cp949 직접 사용)
-            with open(tmp_fil2, mode="r", encoding="cp949") as f:
-                for row in f:
-                    rf2 = row[:]
-                    rf2_1 = rf2[0:1]
-                    rf2_2 = rf2[1:9]
-                    rf2_3 = rf2[9:17]
-                    rf2_4 = rf2[17:].strip()
-                    wf3.write(rf2_1 + ',' + rf2_2 + ',' + rf2_3 + ',' + rf2_4 + '\n')
-
-            wf3.close()
-
-            part2_columns = ['atm_division', 'strike_price', 'underlying_short_code', 'underlying_name']
-            df2 = self._read_csv_with_encoding(tmp_fil3, header=None, names=part2_columns)
+            df2 = self._slice_fields([row[59:].lstrip() for row in lines], [
+                ('atm_division', 0, 1, None),
+                ('strike_price', 1, 9, None),
+                ('underlying_short_code', 9, 17, None),
+                ('underlying_name', 17, None, 'strip'),
+            ])
 
             # DF : df1 + df2
             df = pd.concat([df1, df2], axis=1)
 
-            # 임시 파일들 정리
-            for tmp_file in [tmp_fil1, tmp_fil2, tmp_fil3]:
-                if os.path.exists(tmp_file):
-                    os.unlink(tmp_file)
-
-            # DataFrame 직접 반환 (CSV 저장 제거됨)
             await ctx.info(f"국내EUREX연계 야간옵션 마스터파일 가공 완료: {len(df)}개 종목")
             return df
 
@@ -1415,47 +1175,31 @@ class MasterFileManager:
         await ctx.info("해외선물 마스터파일 가공 중...")
 
         try:
-            import pandas as pd
-
-            # 원본 코드와 정확히 동일한 파싱
-            columns = ['stock_code', 'server_auto_order_yn', 'server_auto_twap_yn', 'server_auto_economic_order_yn',
-                       'filler', 'korean_name', 'exchange_code', 'item_code', 'item_type', 'output_decimal', 'calculation_decimal',
-                       'tick_size', 'tick_value', 'contract_size', 'price_display_base', 'conversion_multiplier', 'most_active_month_yn',
-                       'nearest_month_yn', 'spread_yn', 'spread_leg1_yn', 'sub_exchange_code']
-            df = pd.DataFrame(columns=columns)
-            ridx = 1
-
-            # 파일 읽기 (공통 로직)
-            file_content = await self._read_file_with_encoding(raw_file, ctx)
-            
-            # 파일 내용을 라인별로 처리
-            for row in file_content.splitlines():
-                a = row[:32]  # 종목코드
-                b = row[32:33].rstrip()  # 서버자동주문 가능 종목 여부
-                c = row[33:34].rstrip()  # 서버자동주문 TWAP 가능 종목 여부
-                d = row[34:35]  # 서버자동 경제지표 주문 가능 종목 여부
-                e = row[35:82].rstrip()  # 필러
-                f = row[82:107].rstrip()  # 종목한글명
-                g = row[-92:-82]  # 거래소코드 (ISAM KEY 1)
-                h = row[-82:-72].rstrip()  # 품목코드 (ISAM KEY 2)
-                i = row[-72:-69].rstrip()  # 품목종류
-                j = row[-69:-64]  # 출력 소수점
-                k = row[-64:-59].rstrip()  # 계산 소수점
-                l = row[-59:-45].rstrip()  # 틱사이즈
-                m = row[-45:-31]  # 틱가치
-                n = row[-31:-21].rstrip()  # 계약크기
-                o = row[-21:-17].rstrip()  # 가격표시진법
-                p = row[-17:-7]  # 환산승수
-                q = row[-7:-6].rstrip()  # 최다월물여부 0:원월물 1:최다월물
-                r = row[-6:-5].rstrip()  # 최근월물여부 0:원월물 1:최근월물
-                s = row[-5:-4].rstrip()  # 스프레드여부
-                t = row[-4:-3].rstrip()  # 스프레드기준종목 LEG1 여부 Y/N
-                u = row[-3:].rstrip()  # 서브 거래소 코드
-
-                df.loc[ridx] = [a, b, c, d, e, f, g, h, i, j, k, l, m, n, o, p, q, r, s, t, u]
-                ridx += 1
-
-            # DataFrame 직접 반환 (CSV 저장 제거됨)
+            lines = await self._read_lines(raw_file, ctx)
+
+            df = self._slice_fields(lines, [
+                ('stock_code', 0, 32, None),  # 종목코드
+                ('server_auto_order_yn', 32, 33, 'rstrip'),  # 서버자동주문 가능 종목 여부
+                ('server_auto_twap_yn', 33, 34, 'rstrip'),  # 서버자동주문 TWAP 가능 종목 여부
+                ('server_auto_economic_order_yn', 34, 35, None),  # 서버자동 경제지표 주문 가능 종목 여부
+                ('filler', 35, 82, 'rstrip'),  # 필러
+                ('korean_name', 82, 107, 'rstrip'),  # 종목한글명
+                ('exchange_code', -92, -82, None),  # 거래소코드 (ISAM KEY 1)
+                ('item_code', -82, -72, 'rstrip'),  # 품목코드 (ISAM KEY 2)
+                ('item_type', -72, -69, 'rstrip'),  # 품목종류
+                ('output_decimal', -69, -64, None),  # 출력 소수점
+                ('calculation_decimal', -64, -59, 'rstrip'),  # 계산 소수점
+                ('tick_size', -59, -45, 'rstrip'),  # 틱사이즈
+                ('tick_value', -45, -31, None),  # 틱가치
+                ('contract_size', -31, -21, 'rstrip'),  # 계약크기
+                ('price_display_base', -21, -17, 'rstrip'),  # 가격표시진법
+                ('conversion_multiplier', -17, -7, None),  # 환산승수
+                ('most_active_month_yn', -7, -6, 'rstrip'),  # 최다월물여부 0:원월물 1:최다월물
+                ('nearest_month_yn', -6, -5, 'rstrip'),  # 최근월물여부 0:원월물 1:최근월물
+                ('spread_yn', -5, -4, 'rstrip'),  # 스프레드여부
+                ('spread_leg1_yn', -4, -3, 'rstrip'),  # 스프레드기준종목 LEG1 여부 Y/N
+                ('sub_exchange_code', -3, None, 'rstrip'),  # 서브 거래소 코드
+            ])
 
             await ctx.info(f"해외선물 마스터파일 가공 완료: {len(df)}개 종목")
             return df
@@ -1470,34 +1214,25 @@ class MasterFileManager:
         await ctx.info("국내채권 마스터파일 가공 중...")
 
         try:
-            import pandas as pd
-
-            # 원본 코드와 정확히 동일한 파싱
             await ctx.info("고정폭 텍스트 파일 파싱 중...")
-            
-            # 파일 읽기 (공통 로직)
-            file_content = await self._read_file_with_encoding(raw_file, ctx)
-            lines = file_content.splitlines()
 
-            data = []
-            for row in lines:
-                row = row.strip()
-                bond_type = row[0:2].strip()
-                bond_cls_code = row[2:4].strip()
-                stnd_iscd = row[4:16].strip()
-                rdmp_date = row[-8:].strip()
-                pblc_date = row[-16:-8].strip()
-                lstn_date = row[-24:-16].strip()
-                bond_int_cls_code = row[-26:-24].strip()
-                sname = row[16:-26].rstrip()  # 종목명을 뒤에서부터 추출하여 남은 부분
-
-                data.append(
-                    [bond_type, bond_cls_code, stnd_iscd, sname, bond_int_cls_code, lstn_date, pblc_date, rdmp_date])
-
-            columns = ['bond_type', 'bond_classification_code', 'standard_code', 'bond_name', 'bond_interest_classification_code', 'listing_date', 'issue_date', 'redemption_date']
-            
+            lines = await self._read_lines(raw_file, ctx)
+
+            # 종목명은 앞뒤 고정폭 항목을 뺀 가운데 부분
+            fields = [
+                ('bond_type', 0, 2, 'strip'),
+                ('bond_classification_code', 2, 4, 'strip'),
+                ('standard_code', 4, 16, 'strip'),
+                ('bond_name', 16, -26, 'rstrip'),
+                ('bond_interest_classification_code', -26, -24, 'strip'),
+                ('listing_date', -24, -16, 'strip'),
+                ('issue_date', -16, -8, 'strip'),
+                ('redemption_date', -8, None, 'strip'),
+            ]
+            df = self._slice_fields([row.strip() for row in lines], fields)
+
             # 공통 DataFrame 처리
-            df = self._create_dataframe(data, columns)
+            df = self._create_dataframe(df, [field[0] for field in fields])
 
             await ctx.info(f"국내채권 마스터파일 가공 완료: {len(df)}개 종목")
             return df
@@ -1512,75 +1247,54 @@ class MasterFileManager:
         await ctx.info("ELW 마스터파일 가공 중...")
 
         try:
-            import pandas as pd
-
-            # 원본 코드와 정확히 동일한 파싱
             await ctx.info("복잡한 고정폭 텍스트 파일 파싱 중...")
-            
-            # 파일 읽기 (공통 로직)
-            file_content = await self._read_file_with_encoding(raw_file, ctx)
-            lines = file_content.splitlines()
 
-            data = []
-            for row in lines:
-                # print(row)
-                mksc_shrn_iscd = row[0:9].strip()  # 단축코드
-                stnd_iscd = row[9:21].strip()  # 표준코드
-                hts_kor_isnm = row[21:50].strip()  # 한글 종목명
-
-                crow = row[50:].strip()
-                elw_nvlt_optn_cls_code = crow[:1].strip()  # ELW권리형태
-                elw_ko_barrier = crow[1:14].strip()  # ELW조기종료발생기준가격
-                bskt_yn = crow[14:15].strip()  # 바스켓 여부 (Y/N)
-                unas_iscd1 = crow[15:24].strip()  # 기초자산코드1
-                unas_iscd2 = crow[24:33].strip()  # 기초자산코드2
-                unas_iscd3 = crow[33:42].strip()  # 기초자산코드3
-                unas_iscd4 = crow[42:51].strip()  # 기초자산코드4
-                unas_iscd5 = crow[51:60].strip()  # 기초자산코드5
-
-                # Calculate positions from the end of the row
-                mrkt_prtt_no10 = row[-6:].strip()  # 시장 참가자 번호10
-                mrkt_prtt_no9 = row[-11:-6].strip()  # 시장 참가자 번호9
-                mrkt_prtt_no8 = row[-16:-11].strip()  # 시장 참가자 번호8
-                mrkt_prtt_no7 = row[-21:-16].strip()  # 시장 참가자 번호7
-                mrkt_prtt_no6 = row[-26:-21].strip()  # 시장 참가자 번호6
-                mrkt_prtt_no5 = row[-31:-26].strip()  # 시장 참가자 번호5
-                mrkt_prtt_no4 = row[-36:-31].strip()  # 시장 참가자 번호4
-                mrkt_prtt_no3 = row[-41:-36].strip()  # 시장 참가자 번호3
-                mrkt_prtt_no2 = row[-46:-41].strip()  # 시장 참가자 번호2
-                mrkt_prtt_no1 = row[-51:-46].strip()  # 시장 참가자 번호1
-                lstn_stcn = row[-66:-51].strip()  # 상장주수(천)
-                prdy_avls = row[-75:-66].strip()  # 전일시가총액(억)
-                paym_date = row[-83:-75].strip()  # 지급일
-                rght_type_cls_code = row[-84:-83].strip()  # 권리 유형 구분 코드
-                rmnn_dynu = row[-88:-84].strip()  # 잔존 일수
-                stck_last_tr_month = row[-96:-88].strip()  # 최종거래일
-                acpr = row[-105:-96].strip()  # 행사가
-                elw_pblc_mrkt_prtt_no = row[-110:-105].strip()  # 발행사코드
-
-                elw_pblc_istu_name = row[-11:-110].strip()  # 발행사 한글 종목명
-
-                data.append([mksc_shrn_iscd, stnd_iscd, hts_kor_isnm,
-                             elw_nvlt_optn_cls_code, elw_ko_barrier, bskt_yn,
-                             unas_iscd1, unas_iscd2, unas_iscd3, unas_iscd4,
-                             unas_iscd5, elw_pblc_istu_name, elw_pblc_mrkt_prtt_no,
-                             acpr, stck_last_tr_month, rmnn_dynu, rght_type_cls_code,
-                             paym_date, prdy_avls, lstn_stcn, mrkt_prtt_no1,
-                             mrkt_prtt_no2, mrkt_prtt_no3, mrkt_prtt_no4,
-                             mrkt_prtt_no5, mrkt_prtt_no6, mrkt_prtt_no7,
-                             mrkt_prtt_no8, mrkt_prtt_no9, mrkt_prtt_no10])
-
-            columns = ['short_code', 'standard_code', 'korean_name', 'elw_right_type', 'elw_early_termination_price',
-                       'basket_yn', 'underlying_code1', 'underlying_code2', 'underlying_code3',
-                       'underlying_code4', 'underlying_code5', 'issuer_korean_name', 'issuer_code',
-                       'strike_price', 'last_trading_date', 'remaining_days', 'right_type_division_code', 'payment_date',
-                       'prev_day_market_cap_billion', 'listed_shares_thousand', 'market_participant_no1',
-                       'market_participant_no2', 'market_participant_no3', 'market_participant_no4',
-                       'market_participant_no5', 'market_participant_no6', 'market_participant_no7',
-                       'market_participant_no8', 'market_participant_no9', 'market_participant_no10']
+            lines = await self._read_lines(raw_file, ctx)
+
+            df1 = self._slice_fields(lines, [
+                ('short_code', 0, 9, 'strip'),  # 단축코드
+                ('standard_code', 9, 21, 'strip'),  # 표준코드
+                ('korean_name', 21, 50, 'strip'),  # 한글 종목명
+            ])
+
+            # 종목명 뒤 부분(앞 공백 제거 기준)
+            df2 = self._slice_fields([row[50:].strip() for row in lines], [
+                ('elw_right_type', 0, 1, 'strip'),  # ELW권리형태
+                ('elw_early_termination_price', 1, 14, 'strip'),  # ELW조기종료발생기준가격
+                ('basket_yn', 14, 15, 'strip'),  # 바스켓 여부 (Y/N)
+                ('underlying_code1', 15, 24, 'strip'),  # 기초자산코드1
+                ('underlying_code2', 24, 33, 'strip'),  # 기초자산코드2
+                ('underlying_code3', 33, 42, 'strip'),  # 기초자산코드3
+                ('underlying_code4', 42, 51, 'strip'),  # 기초자산코드4
+                ('underlying_code5', 51, 60, 'strip'),  # 기초자산코드5
+            ])
+
+            # 줄 끝에서부터 계산하는 항목
+            df3 = self._slice_fields(lines, [
+                ('issuer_korean_name', -11, -110, 'strip'),  # 발행사 한글 종목명
+                ('issuer_code', -110, -105, 'strip'),  # 발행사코드
+                ('strike_price', -105, -96, 'strip'),  # 행사가
+                ('last_trading_date', -96, -88, 'strip'),  # 최종거래일
+                ('remaining_days', -88, -84, 'strip'),  # 잔존 일수
+                ('right_type_division_code', -84, -83, 'strip'),  # 권리 유형 구분 코드
+                ('payment_date', -83, -75, 'strip'),  # 지급일
+                ('prev_day_market_cap_billion', -75, -66, 'strip'),  # 전일시가총액(억)
+                ('listed_shares_thousand', -66, -51, 'strip'),  # 상장주수(천)
+                ('market_participant_no1', -51, -46, 'strip'),  # 시장 참가자 번호1
+                ('market_participant_no2', -46, -41, 'strip'),  # 시장 참가자 번호2
+                ('market_participant_no3', -41, -36, 'strip'),  # 시장 참가자 번호3
+                ('market_participant_no4', -36, -31, 'strip'),  # 시장 참가자 번호4
+                ('market_participant_no5', -31, -26, 'strip'),  # 시장 참가자 번호5
+                ('market_participant_no6', -26, -21, 'strip'),  # 시장 참가자 번호6
+                ('market_participant_no7', -21, -16, 'strip'),  # 시장 참가자 번호7
+                ('market_participant_no8', -16, -11, 'strip'),  # 시장 참가자 번호8
+                ('market_participant_no9', -11, -6, 'strip'),  # 시장 참가자 번호9
+                ('market_participant_no10', -6, None, 'strip'),  # 시장 참가자 번호10
+            ])
 
             # 공통 DataFrame 처리
-            df = self._create_dataframe(data, columns)
+            df = pd.concat([df1, df2, df3], axis=1)
+            df = self._create_dataframe(df, list(df.columns))
 
             await ctx.info(f"ELW 마스터파일 가공 완료: {len(df)}개 종목")
             return df
@@ -1589,5 +1303,3 @@ class MasterFileManager:
             self._log("error", "elw_master", "process", str(e))
             await ctx.error(f"ELW 마스터파일 가공 실패: {str(e)}")
             return pd.DataFrame()
-    
-    
\ No newline at end of file
@@ -0,0 +1,135 @@
+import asyncio
+import logging
+import os
+import threading
+from typing import Dict, Iterable, Optional
+
+from module.decorator import singleton
+from module.plugin.master_file import MasterFileManager
+from module.plugin.master_search import MasterSearch
+
+MASTER_REFRESH_INTERVAL = 600  # 최신 여부 확인 주기 (초)
+MASTER_WAIT_TIMEOUT = 600  # 검색 시 진행 중인 갱신 완료 대기 (초)
+
+
+class _LogContext:
+    """백그라운드 갱신용 Context 대체 (FastMCP ctx.info 등을 로그로 기록)"""
+
+    def __init__(self, tool_name: str):
+        self.tool_name = tool_name
+
+    async def info(self, message: str):
+        logging.debug(f"[master:{self.tool_name}] {message}")
+
+    async def warning(self, message: str):
+        logging.warning(f"[master:{self.tool_name}] {message}")
+
+    async def error(self, message: str):
+        logging.error(f"[master:{self.tool_name}] {message}")
+
+
+@singleton
+class MasterFileRefresher:
+    """마스터파일 최신화 백그라운드 타이머
+
+    - watch()로 등록된 툴의 마스터파일을 주기적으로(MASTER_REFRESH_INTERVAL) 확인해 필요 시 갱신
+    - 종목 검색은 갱신을 직접 하지 않고, 해당 툴이 갱신 중(또는 최초 준비 전)일 때만 wait_ready()로 대기
+    - 갱신이 끝나면 검색 인덱스를 준비하고 검색 캐시를 비움
+    """
+
+    def __init__(self, interval: Optional[float] = None):
+        self.interval = interval or float(os.getenv("MASTER_REFRESH_INTERVAL", MASTER_REFRESH_INTERVAL))
+        self._ready: Dict[str, threading.Event] = {}
+        self._managers: Dict[str, MasterFileManager] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, tool_names: Iterable[str] | str) -> None:
+        """툴 등록 (처음 등록된 툴은 즉시 확인) 및 타이머 시작"""
+        if isinstance(tool_names, str):
+            tool_names = [tool_names]
+
+        added = False
+        with self._lock:
+            for tool_name in tool_names:
+                if tool_name not in self._ready:
+                    self._ready[tool_name] = threading.Event()
+                    added = True
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name="master-refresh", daemon=True)
+                self._thread.start()
+        if added:
+            self._wakeup.set()
+
+    def is_ready(self, tool_name: str) -> bool:
+        event = self._ready.get(tool_name)
+        return event is not None and event.is_set()
+
+    def wait_ready(self, tool_name: str, timeout: float = MASTER_WAIT_TIMEOUT) -> bool:
+        """진행 중인 갱신이 끝날 때까지 대기 (blocking)"""
+        event = self._ready.get(tool_name)
+        return event is not None and event.wait(timeout)
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._wakeup.set()
+
+    # ========== 내부 ==========
+    def _loop(self) -> None:
+        while not self._stopped.is_set():
+            self._wakeup.clear()
+            with self._lock:
+                tool_names = list(self._ready)
+
+            # 최신 상태인 툴은 먼저 준비 완료로 표시해 다른 툴 갱신을 기다리지 않게 함
+            stale = []
+            for tool_name in tool_names:
+                try:
+                    if self._manager(tool_name).needs_update():
+                        stale.append(tool_name)
+                    else:
+                        self._mark_ready(tool_name)
+                except Exception as e:
+                    logging.error(f"마스터파일 상태 확인 실패: {tool_name} - {e}")
+                    self._ready[tool_name].set()
+
+            for tool_name in stale:
+                if self._stopped.is_set():
+                    return
+                self._refresh(tool_name)
+
+            self._wakeup.wait(self.interval)
+
+    def _manager(self, tool_name: str) -> MasterFileManager:
+        manager = self._managers.get(tool_name)
+        if manager is None:
+            manager = self._managers[tool_name] = MasterFileManager(tool_name)
+        return manager
+
+    def _refresh(self, tool_name: str) -> None:
+        event = self._ready[tool_name]
+        event.clear()
+        try:
+            logging.info(f"마스터파일 갱신 시작: {tool_name}")
+            asyncio.run(self._manager(tool_name).ensure_master_file_updated(_LogContext(tool_name)))
+            logging.info(f"마스터파일 갱신 완료: {tool_name}")
+        except Exception as e:
+            # 갱신 실패 시에도 기존 데이터로 검색할 수 있도록 준비 완료 처리
+            logging.error(f"마스터파일 갱신 실패: {tool_name} - {e}")
+        finally:
+            self._mark_ready(tool_name)
+
+    def _mark_ready(self, tool_name: str) -> None:
+        event = self._ready[tool_name]
+        if not event.is_set():
+            manager = self._manager(tool_name)
+            search = MasterSearch()
+            try:
+                for model_class in manager.get_master_models_for_tool(tool_name):
+                    search.ensure_indexes(manager.db_engine, model_class)
+            except Exception as e:
+                logging.error(f"검색 인덱스 준비 실패: {tool_name} - {e}")
+            search.invalidate(tool_name)
+            event.set()
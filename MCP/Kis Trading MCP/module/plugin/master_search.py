@@ -0,0 +1,197 @@
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+from module.decorator import singleton
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_SIZE = 1024  # 최근 검색 결과 보관 수
+
+# 순위: 종목코드 일치 > 종목명 일치 > 종목명 앞글자 > 종목명 포함
+MATCH_TYPES = ("code_exact", "name_exact", "name_prefix", "name_contains")
+
+
+@singleton
+class MasterSearch:
+    """마스터 테이블 종목 검색 인덱스
+
+    - 종목코드/종목명 일치 및 앞글자 검색은 code/name B-tree 인덱스 사용 (앞글자는 범위 조건)
+    - 중간 포함 검색은 FTS5 trigram 인덱스 사용 (3글자 미만은 원본 테이블 순차 검색)
+    - 툴의 모든 마스터 모델을 하나의 쿼리로 검색해 순위가 가장 높은 1건 반환
+    - 최근 검색 결과는 툴별 LRU 캐시에 보관하고 마스터 갱신 시 invalidate()로 비움
+    """
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE):
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, str], Optional[Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._indexed: Dict[str, bool] = {}  # 테이블명 → FTS 사용 가능 여부
+
+    # ========== 인덱스 ==========
+    def ensure_indexes(self, db_engine, model_class: Type) -> bool:
+        """code/name B-tree 인덱스와 FTS5 trigram 인덱스(+동기화 트리거) 생성
+
+        Returns:
+            FTS 인덱스 사용 가능 여부 (SQLite에 FTS5/trigram이 없으면 False)
+        """
+        table = model_class.__tablename__
+        with self._lock:
+            if table in self._indexed:
+                return self._indexed[table]
+
+        with db_engine.engine.begin() as conn:
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS ix_{table}_code ON {table} (code)"))
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS ix_{table}_name ON {table} (name)"))
+
+        fts_available = True
+        try:
+            with db_engine.engine.begin() as conn:
+                exists = conn.execute(
+                    text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                    {"name": f"{table}_fts"},
+                ).first()
+                if not exists:
+                    conn.execute(text(
+                        f"CREATE VIRTUAL TABLE {table}_fts USING fts5("
+                        f"name, content='{table}', content_rowid='id', tokenize='trigram')"
+                    ))
+                    self._create_triggers(conn, table)
+                    # 기존 데이터 색인
+                    conn.execute(text(f"INSERT INTO {table}_fts ({table}_fts) VALUES ('rebuild')"))
+                    logger.info(f"FTS index created: {table}_fts")
+        except SQLAlchemyError as e:
+            fts_available = False
+            logger.warning(f"FTS5 trigram index unavailable for {table}, using LIKE scan: {e}")
+
+        with self._lock:
+            self._indexed[table] = fts_available
+        return fts_available
+
+    def rebuild(self, db_engine, model_class: Type) -> None:
+        """FTS 인덱스 재구성 (트리거를 거치지 않고 테이블을 교체한 경우)"""
+        table = model_class.__tablename__
+        if self.ensure_indexes(db_engine, model_class):
+            with db_engine.engine.begin() as conn:
+                conn.execute(text(f"INSERT INTO {table}_fts ({table}_fts) VALUES ('rebuild')"))
+
+    @contextmanager
+    def bulk_load(self, conn, model_class: Type):
+        """테이블 전체 교체용: 호출측 트랜잭션 안에서 FTS 동기화 트리거를 잠시 제거하고 끝나면 한 번에 재색인
+
+        행마다 트리거로 FTS를 갱신하는 것보다 훨씬 빠르며, 같은 트랜잭션이므로 조회 측은 교체 전/후 상태만 봄
+        """
+        table = model_class.__tablename__
+        has_fts = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": f"{table}_fts"},
+        ).first() is not None
+        if has_fts:
+            for suffix in ("ai", "ad", "au"):
+                conn.execute(text(f"DROP TRIGGER IF EXISTS {table}_fts_{suffix}"))
+        yield
+        if has_fts:
+            self._create_triggers(conn, table)
+            conn.execute(text(f"INSERT INTO {table}_fts ({table}_fts) VALUES ('rebuild')"))
+
+    @staticmethod
+    def _create_triggers(conn, table: str) -> None:
+        conn.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_fts_ai AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO {table}_fts (rowid, name) VALUES (new.id, new.name); END"
+        ))
+        conn.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_fts_ad AFTER DELETE ON {table} BEGIN "
+            f"INSERT INTO {table}_fts ({table}_fts, rowid, name) VALUES ('delete', old.id, old.name); END"
+        ))
+        conn.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS {table}_fts_au AFTER UPDATE ON {table} BEGIN "
+            f"INSERT INTO {table}_fts ({table}_fts, rowid, name) VALUES ('delete', old.id, old.name); "
+            f"INSERT INTO {table}_fts (rowid, name) VALUES (new.id, new.name); END"
+        ))
+
+    # ========== 검색 ==========
+    def find(self, db_engine, tool_name: str, model_classes: List[Type], search_term: str) -> Optional[Dict[str, Any]]:
+        """종목코드 또는 종목명으로 순위가 가장 높은 종목 1건 조회
+
+        Returns:
+            {"code", "name", "ex", "match_type"} 또는 None
+        """
+        key = (tool_name, search_term)
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        result = self._query(db_engine, model_classes, search_term)
+
+        with self._lock:
+            self._cache[key] = result
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def invalidate(self, tool_name: Optional[str] = None) -> None:
+        """검색 캐시 비우기 (tool_name 지정 시 해당 툴만)"""
+        with self._lock:
+            if tool_name is None:
+                self._cache.clear()
+                return
+            for key in [key for key in self._cache if key[0] == tool_name]:
+                del self._cache[key]
+
+    def _query(self, db_engine, model_classes: List[Type], search_term: str) -> Optional[Dict[str, Any]]:
+        if not search_term or not model_classes:
+            return None
+
+        # 특수문자(%, _)가 없으면 ESCAPE 없이 LIKE를 써야 FTS trigram 인덱스를 사용함
+        has_wildcard = any(ch in search_term for ch in "%_\\")
+        if has_wildcard:
+            escaped = search_term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            contains_clause = "LIKE :contains ESCAPE '\\'"
+        else:
+            escaped = search_term
+            contains_clause = "LIKE :contains"
+
+        # 조건별로 가장 먼저 등록된 1건(min id)만 뽑아 합친 뒤 순위로 정렬
+        selects = []
+        for model_rank, model_class in enumerate(model_classes):
+            table = model_class.__tablename__
+            # trigram은 3글자 미만 패턴을 찾지 못하므로 원본 테이블 LIKE로 검색
+            use_fts = self.ensure_indexes(db_engine, model_class) and not has_wildcard and len(search_term) >= 3
+            ex = "t.ex" if hasattr(model_class, "ex") else "NULL"
+            conditions = [
+                f"SELECT min(id) FROM {table} WHERE code = :term",
+                f"SELECT min(id) FROM {table} WHERE name = :term",
+                f"SELECT min(id) FROM {table} WHERE name >= :term AND name < :term_end",
+                f"SELECT min(rowid) FROM {table}_fts WHERE name {contains_clause}" if use_fts
+                else f"SELECT min(id) FROM {table} WHERE name {contains_clause}",
+            ]
+            for match_rank, condition in enumerate(conditions):
+                selects.append(
+                    f"SELECT t.code AS code, t.name AS name, {ex} AS ex, "
+                    f"{match_rank} AS match_rank, {model_rank} AS model_rank "
+                    f"FROM {table} t WHERE t.id = ({condition})"
+                )
+
+        sql = (
+            "SELECT code, name, ex, match_rank FROM ("
+            + " UNION ALL ".join(selects)
+            + ") ORDER BY match_rank, model_rank LIMIT 1"
+        )
+        params = {
+            "term": search_term,
+            "term_end": search_term + "\U0010ffff",  # 앞글자 범위 상한
+            "contains": f"%{escaped}%",
+        }
+
+        with db_engine.engine.connect() as conn:
+            row = conn.execute(text(sql), params).first()
+        if row is None:
+            return None
+        return {"code": row.code, "name": row.name, "ex": row.ex, "match_type": MATCH_TYPES[row.match_rank]}
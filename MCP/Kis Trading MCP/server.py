@@ -7,7 +7,7 @@ from fastmcp import FastMCP
 
 from module import setup_environment, EnvironmentMiddleware, EnvironmentConfig, setup_kis_config
 from module.mcp_auth import McpAuthMiddleware, ensure_http_access_token
-from module.plugin import Database
+from module.plugin import Database, ApiCodeCache, ApiWorkerPool, MasterFileManager, MasterFileRefresher
 from tools import *
 
 logging.basicConfig(
@@ -43,6 +43,22 @@ def main():
         logging.error(f"❌ Database initialization failed: {e}")
         sys.exit(1)
 
+    # 마스터파일 최신화 백그라운드 타이머 (종목 검색은 인덱스 조회만 수행)
+    MasterFileRefresher().watch(MasterFileManager.TOOL_MASTER_MAPPING.keys())
+
+    # API 코드 캐시 + 상주 워커 준비
+    logging.info("setup API code cache ...")
+    try:
+        code_cache = ApiCodeCache()
+        logging.info(f"📦 API code version: {code_cache.prepare()}")
+        if os.getenv("KIS_API_EXECUTION", "pool") == "pool":
+            code_cache.get_kis_auth()
+            ApiWorkerPool().warm_up(code_cache.code_root)
+            logging.info(f"⚙️ API workers ready: {ApiWorkerPool().size}")
+    except Exception as e:
+        # 워커 없이도 호출 시점에 캐시 다운로드/subprocess 실행으로 동작
+        logging.warning(f"⚠️ API code cache/worker setup failed: {e}")
+
     # MCP 서버 설정
     mcp_server = FastMCP(
         name="My Awesome MCP Server",
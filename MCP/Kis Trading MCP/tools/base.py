@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+import asyncio
 import json
 import os
 import re
@@ -9,7 +10,7 @@ import subprocess
 import requests
 from fastmcp import FastMCP, Context
 
-from module.plugin import MasterFileManager
+from module.plugin import MasterFileManager, MasterFileRefresher, MasterSearch, ApiCodeCache, ApiWorkerPool
 from module.plugin.database import Database
 import module.factory as factory
 
@@ -17,6 +18,10 @@ ALLOWED_ENV_DV = frozenset({"real", "demo"})
 TRENV_EXPR_PATTERN = re.compile(r"^ka\._TRENV\.\w+$")
 FUNCTION_NAME_PATTERN = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 
+# API 실행 방식: pool(상주 워커 프로세스, 기본) / subprocess(호출마다 격리된 새 프로세스)
+EXECUTION_MODES = frozenset({"pool", "subprocess"})
+EXECUTION_TIMEOUT = 15  # 초
+
 # 사용자 입력을 포함하지 않는 고정 실행 템플릿 (function_name만 서버 검증 후 치환)
 API_RUNNER_TEMPLATE = """
 # MCP API runner (fixed template)
@@ -82,7 +87,12 @@ if __name__ == "__main__":
 
 
 class ApiExecutor:
-    """API 실행 클래스 - GitHub에서 코드를 다운로드하고 실행"""
+    """API 실행 클래스 - 로컬 캐시의 API 코드를 상주 워커에서 실행
+
+    - API 코드는 ApiCodeCache(버전별 로컬 캐시)에서 가져오고, 캐시에 없을 때만 GitHub에서 다운로드
+    - 기본은 ApiWorkerPool(kis_auth를 미리 import한 상주 프로세스)에서 함수명으로 실행
+    - KIS_API_EXECUTION=subprocess이거나 워커를 띄울 수 없으면 임시 디렉토리 + 새 프로세스로 격리 실행
+    """
 
     def __init__(self, tool_name: str):
         """초기화"""
@@ -90,6 +100,11 @@ class ApiExecutor:
         self.temp_base_dir = "./tmp"
         # 절대 경로로 venv python 설정
         self.venv_python = os.path.join(os.getcwd(), ".venv", "bin", "python")
+        self.code_cache = ApiCodeCache()
+        self.worker_pool = ApiWorkerPool()
+
+        execution_mode = os.getenv("KIS_API_EXECUTION", "pool")
+        self.execution_mode = execution_mode if execution_mode in EXECUTION_MODES else "pool"
 
         # temp 디렉토리 생성
         os.makedirs(self.temp_base_dir, exist_ok=True)
@@ -143,23 +158,41 @@ class ApiExecutor:
             return False
 
     def _download_kis_auth(self, temp_dir: str) -> bool:
-        """kis_auth.py 다운로드"""
-        kis_auth_url = "https://raw.githubusercontent.com/koreainvestment/open-trading-api/main/examples_llm/kis_auth.py"
+        """kis_auth.py 준비 (로컬 캐시에서 복사, 캐시에 없으면 다운로드 후 저장)"""
         kis_auth_path = os.path.join(temp_dir, "kis_auth.py")
-        return self._download_file(kis_auth_url, kis_auth_path)
+        try:
+            shutil.copyfile(self.code_cache.get_kis_auth(), kis_auth_path)
+            return True
+        except Exception as e:
+            print(f"kis_auth.py 준비 실패: {str(e)}")
+            return False
 
     def _download_api_code(self, github_url: str, temp_dir: str, api_type: str) -> str:
-        """API 코드 다운로드"""
+        """API 코드 준비 (로컬 캐시에서 복사, examples_llm 밖의 URL은 직접 다운로드)"""
+        api_code_path = os.path.join(temp_dir, "api_code.py")
+        cached_path = self._get_cached_api_code(github_url, api_type)
+        if cached_path:
+            shutil.copyfile(cached_path, api_code_path)
+            return api_code_path
+
         # GitHub URL을 raw URL로 변환하고 api_type/api_type.py를 붙여서 실제 파일 경로 생성
         raw_url = github_url.replace('/tree/', '/').replace('github.com', 'raw.githubusercontent.com')
         full_url = f"{raw_url}/{api_type}.py"
-        api_code_path = os.path.join(temp_dir, "api_code.py")
 
         if self._download_file(full_url, api_code_path):
             return api_code_path
         else:
             raise Exception(f"API 코드 다운로드 실패: {full_url}")
 
+    def _get_cached_api_code(self, github_url: str, api_type: str) -> Optional[str]:
+        """캐시된 API 코드 경로 (examples_llm 밖의 URL이면 None)"""
+        if ApiCodeCache.relative_path(github_url, api_type) is None:
+            return None
+        try:
+            return self.code_cache.get_api_code(github_url, api_type)
+        except Exception as e:
+            raise Exception(f"API 코드 다운로드 실패: {github_url}/{api_type}.py ({str(e)})")
+
     @classmethod
     def _extract_trenv_params_from_example(cls, api_code_content: str) -> Dict[str, str]:
         """예제 파일에서 trenv 사용 패턴 완전 추출"""
@@ -192,12 +225,92 @@ class ApiExecutor:
         
         return dynamic_mappings
 
+    @classmethod
+    def _prepare_call(cls, code: str, params: Dict[str, Any], api_type: str) -> Tuple[str, Dict[str, Any]]:
+        """API 코드에서 함수명을 찾고 실행 파라미터(params.json 내용) 구성
+
+        Returns:
+            (함수명, {"env_dv", "params", "has_stock_name"})
+        """
+        # 1. 코드에서 함수명과 시그니처 추출
+        function_match = re.search(r'def\s+(\w+)\s*\((.*?)\):', code, re.DOTALL)
+        if not function_match:
+            raise Exception("코드에서 함수를 찾을 수 없습니다.")
+
+        function_name = cls._validate_function_name(function_match.group(1))
+        function_params = function_match.group(2)
+
+        # 2. 함수가 max_depth 파라미터를 받는지 확인
+        has_max_depth = 'max_depth' in function_params
+
+        # 3. 파라미터 조정
+        adjusted_params = params.copy()
+
+        # max_depth 파라미터 처리
+        if has_max_depth:
+            # 함수가 max_depth를 받는 경우에만 처리
+            if 'max_depth' not in adjusted_params:
+                adjusted_params['max_depth'] = 1
+                print(f"[기본값] {function_name} 함수에 max_depth=1 설정")
+            else:
+                print(f"[사용자 설정] {function_name} 함수에 max_depth={adjusted_params['max_depth']} 사용")
+        else:
+            # 함수가 max_depth를 받지 않는 경우 제거
+            if 'max_depth' in adjusted_params:
+                del adjusted_params['max_depth']
+                print(f"[제거] {function_name} 함수는 max_depth 파라미터를 지원하지 않아 제거함")
+
+        # 🆕 동적으로 trenv 패턴 추출
+        dynamic_mappings = cls._extract_trenv_params_from_example(code)
+
+        # 기본 매핑과 동적 매핑 결합
+        account_mappings = {
+            'cano': 'ka._TRENV.my_acct',  # 종합계좌번호 (변수 접근)
+            'acnt_prdt_cd': 'ka._TRENV.my_prod',  # 계좌상품코드 (변수 접근)
+            'my_htsid': 'ka._TRENV.my_htsid',  # HTS ID (변수 접근)
+            'user_id': 'ka._TRENV.my_htsid',  # domestic_stock에서 발견된 변형
+            **dynamic_mappings  # 동적으로 발견된 매핑 추가
+        }
+
+        for param_name, correct_value in account_mappings.items():
+            if param_name in function_params:
+                if param_name in adjusted_params:
+                    original_value = adjusted_params[param_name]
+                    adjusted_params[param_name] = correct_value
+                    print(f"[보안강제] {function_name} 함수의 {param_name}='{original_value}' → {correct_value} (LLM값 무시)")
+                else:
+                    adjusted_params[param_name] = correct_value
+                    print(f"[자동설정] {function_name} 함수에 {param_name}={correct_value} 설정")
+
+        # 거래소ID구분코드 처리 (API 타입 기반 추론)
+        if 'excg_id_dvsn_cd' in function_params and 'excg_id_dvsn_cd' not in adjusted_params:
+            if api_type.startswith('domestic'):
+                adjusted_params['excg_id_dvsn_cd'] = '"KRX"'
+                print(f"[추론] 국내 API({api_type})로 판단하여 excg_id_dvsn_cd='KRX' 설정")
+            else:
+                print(f"[경고] {api_type} API에서 excg_id_dvsn_cd 파라미터가 필요합니다. (예: NASD, NYSE, KRX)")
+                # overseas_stock 등은 사용자가 명시적으로 제공해야 함
+
+        # 4. env_dv 검증 (인증 분기 및 API 함수 인자용)
+        env_dv = cls._validate_env_dv(adjusted_params.pop("env_dv", "demo"))
+        if "env_dv" in function_params:
+            adjusted_params["env_dv"] = env_dv
+        if env_dv == "demo":
+            print(f"[모의투자] {function_name} 함수에 ka.auth(\"vps\") 적용")
+        else:
+            print(f"[실전투자] {function_name} 함수에 ka.auth() 적용")
+
+        params_payload = {
+            "env_dv": env_dv,
+            "params": cls._serialize_params_for_runner(adjusted_params),
+            "has_stock_name": "stock_name" in params,
+        }
+        return function_name, params_payload
+
     @classmethod
     def _modify_api_code(cls, api_code_path: str, params: Dict[str, Any], api_type: str) -> str:
-        """API 코드 수정 (파라미터 적용)"""
+        """API 코드 수정 (파라미터 적용) - subprocess 실행용"""
         try:
-            import re
-
             with open(api_code_path, 'r', encoding='utf-8') as f:
                 code = f.read()
 
@@ -205,90 +318,19 @@ class ApiExecutor:
             code = re.sub(r"sys\.path\.extend\(\[.*?\]\)", "", code, flags=re.DOTALL)
             code = re.sub(r"import sys\n", "", code)  # import sys도 제거
 
-            # 2. 코드에서 함수명과 시그니처 추출
-            function_match = re.search(r'def\s+(\w+)\s*\((.*?)\):', code, re.DOTALL)
-            if not function_match:
-                raise Exception("코드에서 함수를 찾을 수 없습니다.")
-
-            function_name = cls._validate_function_name(function_match.group(1))
-            function_params = function_match.group(2)
-
-            # 3. 함수가 max_depth 파라미터를 받는지 확인
-            has_max_depth = 'max_depth' in function_params
-
-            # 4. 파라미터 조정
-            adjusted_params = params.copy()
-
-            # max_depth 파라미터 처리
-            if has_max_depth:
-                # 함수가 max_depth를 받는 경우에만 처리
-                if 'max_depth' not in adjusted_params:
-                    adjusted_params['max_depth'] = 1
-                    print(f"[기본값] {function_name} 함수에 max_depth=1 설정")
-                else:
-                    print(f"[사용자 설정] {function_name} 함수에 max_depth={adjusted_params['max_depth']} 사용")
-            else:
-                # 함수가 max_depth를 받지 않는 경우 제거
-                if 'max_depth' in adjusted_params:
-                    del adjusted_params['max_depth']
-                    print(f"[제거] {function_name} 함수는 max_depth 파라미터를 지원하지 않아 제거함")
-
-            # 🆕 동적으로 trenv 패턴 추출
-            dynamic_mappings = cls._extract_trenv_params_from_example(code)
-            
-            # 기본 매핑과 동적 매핑 결합
-            account_mappings = {
-                'cano': 'ka._TRENV.my_acct',  # 종합계좌번호 (변수 접근)
-                'acnt_prdt_cd': 'ka._TRENV.my_prod',  # 계좌상품코드 (변수 접근)
-                'my_htsid': 'ka._TRENV.my_htsid',  # HTS ID (변수 접근)
-                'user_id': 'ka._TRENV.my_htsid',  # domestic_stock에서 발견된 변형
-                **dynamic_mappings  # 동적으로 발견된 매핑 추가
-            }
-
-            for param_name, correct_value in account_mappings.items():
-                if param_name in function_params:
-                    if param_name in adjusted_params:
-                        original_value = adjusted_params[param_name]
-                        adjusted_params[param_name] = correct_value
-                        print(f"[보안강제] {function_name} 함수의 {param_name}='{original_value}' → {correct_value} (LLM값 무시)")
-                    else:
-                        adjusted_params[param_name] = correct_value
-                        print(f"[자동설정] {function_name} 함수에 {param_name}={correct_value} 설정")
-
-            # 거래소ID구분코드 처리 (API 타입 기반 추론)
-            if 'excg_id_dvsn_cd' in function_params and 'excg_id_dvsn_cd' not in adjusted_params:
-                if api_type.startswith('domestic'):
-                    adjusted_params['excg_id_dvsn_cd'] = '"KRX"'
-                    print(f"[추론] 국내 API({api_type})로 판단하여 excg_id_dvsn_cd='KRX' 설정")
-                else:
-                    print(f"[경고] {api_type} API에서 excg_id_dvsn_cd 파라미터가 필요합니다. (예: NASD, NYSE, KRX)")
-                    # overseas_stock 등은 사용자가 명시적으로 제공해야 함
-
-            # 5. env_dv 검증 (인증 분기 및 API 함수 인자용)
-            env_dv = cls._validate_env_dv(adjusted_params.pop("env_dv", "demo"))
-            if "env_dv" in function_params:
-                adjusted_params["env_dv"] = env_dv
-            if env_dv == "demo":
-                print(f"[모의투자] {function_name} 함수에 ka.auth(\"vps\") 적용")
-            else:
-                print(f"[실전투자] {function_name} 함수에 ka.auth() 적용")
-
+            # 2. 함수명/실행 파라미터 구성
+            function_name, params_payload = cls._prepare_call(code, params, api_type)
             runner_code = API_RUNNER_TEMPLATE.replace("__FUNCTION_NAME__", function_name)
 
             temp_dir = os.path.dirname(api_code_path)
-            params_payload = {
-                "env_dv": env_dv,
-                "params": cls._serialize_params_for_runner(adjusted_params),
-                "has_stock_name": "stock_name" in params,
-            }
             params_json_path = os.path.join(temp_dir, "params.json")
             with open(params_json_path, "w", encoding="utf-8") as f:
                 json.dump(params_payload, f, ensure_ascii=False)
 
-            # 6. 코드 끝에 고정 실행 템플릿 추가
+            # 3. 코드 끝에 고정 실행 템플릿 추가
             modified_code = code + runner_code
 
-            # 7. 수정된 코드 저장
+            # 4. 수정된 코드 저장
             with open(api_code_path, 'w', encoding='utf-8') as f:
                 f.write(modified_code)
 
@@ -298,7 +340,50 @@ class ApiExecutor:
         except Exception as e:
             raise Exception(f"코드 수정 실패: {str(e)}")
 
-    def _execute_code(self, temp_dir: str, timeout: int = 15) -> Dict[str, Any]:
+    async def _execute_in_pool(self, api_code_path: str, params: Dict[str, Any], api_type: str) -> Dict[str, Any]:
+        """상주 워커에서 함수명 + 직렬화된 파라미터로 실행 (코드 수정/임시 파일 없음)"""
+        with open(api_code_path, 'r', encoding='utf-8') as f:
+            code = f.read()
+        function_name, params_payload = self._prepare_call(code, params, api_type)
+        self.code_cache.get_kis_auth()  # 워커가 import할 kis_auth.py 준비
+        return await asyncio.to_thread(
+            self.worker_pool.run,
+            self.code_cache.code_root,
+            api_code_path,
+            function_name,
+            params_payload,
+            EXECUTION_TIMEOUT,
+        )
+
+    async def _execute_in_subprocess(self, ctx: Context, github_url: str, params: Dict[str, Any], api_type: str) -> Tuple[str, Dict[str, Any]]:
+        """임시 디렉토리에 코드를 준비해 새 프로세스로 격리 실행
+
+        Returns:
+            (임시 디렉토리, 실행 결과)
+        """
+        # FastMCP Context에서 request_id 안전하게 가져오기
+        try:
+            request_id = ctx.get_state(factory.CONTEXT_REQUEST_ID)
+        except:
+            request_id = "unknown"
+        temp_dir = self._create_temp_directory(request_id)
+
+        try:
+            # kis_auth.py 준비
+            if not self._download_kis_auth(temp_dir):
+                raise Exception("kis_auth.py 다운로드 실패")
+
+            # API 코드 준비 및 수정
+            api_code_path = self._download_api_code(github_url, temp_dir, api_type)
+            self._modify_api_code(api_code_path, params, api_type)
+
+            # 코드 실행 (이벤트 루프를 막지 않도록 스레드에서 대기)
+            return temp_dir, await asyncio.to_thread(self._execute_code, temp_dir, EXECUTION_TIMEOUT)
+        except Exception:
+            self._cleanup_temp_directory(temp_dir)
+            raise
+
+    def _execute_code(self, temp_dir: str, timeout: int = EXECUTION_TIMEOUT) -> Dict[str, Any]:
         """코드 실행"""
         try:
             # 실행할 파일 경로 (상대 경로로 변경)
@@ -359,37 +444,35 @@ class ApiExecutor:
             # env_dv 사전 검증 (코드 생성 전 차단)
             self._validate_env_dv(params.get("env_dv", "demo"))
 
-            # 1. 임시 디렉토리 생성
-            # FastMCP Context에서 request_id 안전하게 가져오기
-            try:
-                request_id = ctx.get_state(factory.CONTEXT_REQUEST_ID)
-            except:
-                request_id = "unknown"
-            temp_dir = self._create_temp_directory(request_id)
-
-            # 2. kis_auth.py 다운로드
-            if not self._download_kis_auth(temp_dir):
-                raise Exception("kis_auth.py 다운로드 실패")
-
-            # 3. API 코드 다운로드
-            api_code_path = self._download_api_code(github_url, temp_dir, api_type)
-
-            # 4. 코드 수정
-            self._modify_api_code(api_code_path, params, api_type)
-
-            # 5. 코드 실행
-            execution_result = self._execute_code(temp_dir)
-
-            # 6. 실행 시간 계산
+            # 1. 상주 워커 실행 (로컬 캐시 코드)
+            execution_result = None
+            execution_mode = "subprocess"
+            if self.execution_mode == "pool":
+                api_code_path = self._get_cached_api_code(github_url, api_type)
+                if api_code_path:
+                    try:
+                        execution_result = await self._execute_in_pool(api_code_path, params, api_type)
+                        execution_mode = "pool"
+                    except RuntimeError as e:
+                        # 워커를 띄울 수 없으면 subprocess로 대체
+                        await ctx.warning(f"API 워커 사용 불가, subprocess로 실행합니다: {str(e)}")
+
+            # 2. 격리 실행 (subprocess 모드 또는 워커 사용 불가 시)
+            if execution_result is None:
+                temp_dir, execution_result = await self._execute_in_subprocess(ctx, github_url, params, api_type)
+
+            # 3. 실행 시간 계산
             execution_time = time.time() - start_time
 
-            # 7. 결과 반환
+            # 4. 결과 반환
             result = {
                 "success": execution_result["success"],
                 "api_type": api_type,
                 "params": params,
                 "message": f"{self.tool_name} API 호출 완료",
                 "execution_time": f"{execution_time:.2f}s",
+                "execution_mode": execution_mode,
+                "code_version": self.code_cache.version,
                 "temp_dir": temp_dir,
                 "venv_used": True,
                 "cleanup_success": True
@@ -415,7 +498,7 @@ class ApiExecutor:
                 "cleanup_success": False
             }
         finally:
-            # 8. 임시 디렉토리 정리
+            # 5. 임시 디렉토리 정리
             if temp_dir:
                 self._cleanup_temp_directory(temp_dir)
 
@@ -641,7 +724,7 @@ class BaseTool(ABC):
             return params
     
     async def _find_stock_by_name_or_code(self, ctx: Context, search_value: str) -> Dict[str, Any]:
-        """종목명 또는 종목코드로 종목번호 찾기"""
+        """종목명 또는 종목코드로 종목번호 찾기 (코드 일치 > 이름 일치 > 앞글자 > 포함 순)"""
         try:
             # 검색어에서 띄어쓰기 제거
             search_term = search_value.replace(" ", "")
@@ -650,13 +733,13 @@ class BaseTool(ABC):
             if not self.db.ensure_initialized():
                 return {"found": False, "message": "데이터베이스 초기화 실패"}
 
-            # 마스터 파일 업데이트 확인 (force_update=False로 필요시에만 업데이트)
-            try:
-                from module.plugin import MasterFileManager
-                master_file_manager = MasterFileManager(self.tool_name)
-                await master_file_manager.ensure_master_file_updated(ctx, force_update=False)
-            except Exception as e:
-                await ctx.warning(f"마스터 파일 업데이트 확인 중 오류: {str(e)}")
+            # 마스터 파일 최신화는 백그라운드 타이머가 담당 (갱신 중일 때만 완료 대기)
+            refresher = MasterFileRefresher()
+            refresher.watch(self.tool_name)
+            if not refresher.is_ready(self.tool_name):
+                await ctx.info(f"{self.tool_name} 마스터파일 갱신 완료 대기 중...")
+                if not await asyncio.to_thread(refresher.wait_ready, self.tool_name):
+                    await ctx.warning("마스터파일 갱신이 끝나지 않아 기존 데이터로 검색합니다.")
             
             # DB 엔진
             db_engine = self.db.get_by_name("master")
@@ -665,79 +748,12 @@ class BaseTool(ABC):
             if not master_models:
                 return {"found": False, "message": f"지원하지 않는 툴: {self.tool_name}"}
             
-            # 각 모델에서 우선순위별 검색
-            for model_class in master_models:
-                try:
-                    # 1순위: 종목코드로 완전 매칭
-                    code_results = db_engine.list(
-                        model_class, 
-                        filters={"code": search_term}, 
-                        limit=1
-                    )
-                    
-                    if code_results:
-                        result = code_results[0]
-                        return {
-                            "found": True,
-                            "code": result.code,
-                            "name": result.name,
-                            "ex": result.ex if hasattr(result, 'ex') else None,
-                            "match_type": "code_exact"
-                        }
-                    
-                    # 2순위: 종목명으로 완전 매칭
-                    name_results = db_engine.list(
-                        model_class, 
-                        filters={"name": search_term}, 
-                        limit=1
-                    )
-                    
-                    if name_results:
-                        result = name_results[0]
-                        return {
-                            "found": True,
-                            "code": result.code,
-                            "name": result.name,
-                            "ex": result.ex if hasattr(result, 'ex') else None,
-                            "match_type": "name_exact"
-                        }
-                    
-                    # 3순위: 종목명으로 앞글자 매칭
-                    prefix_results = db_engine.list(
-                        model_class, 
-                        filters={"name": f"{search_term}%"}, 
-                        limit=1
-                    )
-                    
-                    if prefix_results:
-                        result = prefix_results[0]
-                        return {
-                            "found": True,
-                            "code": result.code,
-                            "name": result.name,
-                            "ex": result.ex if hasattr(result, 'ex') else None,
-                            "match_type": "name_prefix"
-                        }
-                    
-                    # 4순위: 종목명으로 중간 매칭
-                    contains_results = db_engine.list(
-                        model_class, 
-                        filters={"name": f"%{search_term}%"}, 
-                        limit=1
-                    )
-                    
-                    if contains_results:
-                        result = contains_results[0]
-                        return {
-                            "found": True,
-                            "code": result.code,
-                            "name": result.name,
-                            "ex": result.ex if hasattr(result, 'ex') else None,
-                            "match_type": "name_contains"
-                        }
-                        
-                except Exception as e:
-                    continue
+            # 툴의 모든 모델을 한 번에 순위 검색 (최근 검색은 캐시)
+            result = await asyncio.to_thread(
+                MasterSearch().find, db_engine, self.tool_name, master_models, search_term
+            )
+            if result:
+                return {"found": True, **result}
             
             return {"found": False, "message": f"종목을 찾을 수 없음: {search_value}"}
             
@@ -0,0 +1,273 @@
+"""백그라운드 작업 관리
+
+백테스트처럼 오래 걸리는 요청을 이벤트 루프 밖의 제한된 작업 스레드 풀에서 실행합니다.
+
+- 작업 ID로 상태 조회, 진행 이벤트 스트리밍(SSE), 취소 지원
+- 동시 실행 수(JOB_WORKERS)와 대기 작업 수(MAX_PENDING_JOBS)를 제한
+- 완료 작업은 MAX_FINISHED_JOBS개까지 보관하고, 밀려난 작업은 job.on_evict()로
+  등록한 정리 함수(결과 디렉토리 삭제 등)를 실행
+- 취소는 협조적: 작업 함수가 단계 사이에 job.check_cancelled()를 호출하거나
+  job.cancel_event를 하위 실행기(Lean 프로세스 등)에 넘겨 중단합니다
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from fastapi.encoders import jsonable_encoder
+
+logger = logging.getLogger(__name__)
+
+JOB_WORKERS = 2  # 동시 실행 작업 수
+MAX_PENDING_JOBS = 16  # 대기 + 실행 중 작업 상한
+MAX_FINISHED_JOBS = 100  # 보관할 완료 작업 수
+EVENT_POLL_INTERVAL = 0.25  # SSE 이벤트 확인 간격 (초)
+
+JOB_STATUSES = ("queued", "running", "succeeded", "failed", "cancelled")
+FINISHED_STATUSES = ("succeeded", "failed", "cancelled")
+
+
+class JobCancelled(Exception):
+    """취소 요청으로 작업 중단"""
+
+
+class JobQueueFull(Exception):
+    """대기 작업 수 초과"""
+
+
+@dataclass
+class Job:
+    """백그라운드 작업 상태
+
+    Attributes:
+        id: 작업 ID
+        kind: 작업 종류 (예: "backtest")
+        status: queued / running / succeeded / failed / cancelled
+        progress: 진행률 (0.0 ~ 1.0)
+        message: 마지막 진행 메시지
+        result: 성공 시 결과
+        error: 실패 시 {"status_code": int, "detail": str}
+        events: 진행 이벤트 목록 (SSE로 순서대로 전달)
+    """
+    id: str
+    kind: str
+    status: str = "queued"
+    progress: float = 0.0
+    message: str = ""
+    result: Any = None
+    error: Optional[Dict[str, Any]] = None
+    created_at: datetime = field(default_factory=datetime.now)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    events: List[Dict[str, Any]] = field(default_factory=list)
+    cancel_event: threading.Event = field(default_factory=threading.Event, repr=False)
+    future: Optional[Future] = field(default=None, repr=False)
+    cleanups: List[Callable[[], Any]] = field(default_factory=list, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self.cancel_event.is_set()
+
+    def report(self, message: str, progress: Optional[float] = None, **data: Any) -> None:
+        """진행 상황 기록 (작업 스레드에서 호출)"""
+        if progress is not None:
+            self.progress = max(0.0, min(1.0, progress))
+        self.message = message
+        self._emit("progress", message=message, progress=self.progress, **data)
+
+    def on_evict(self, cleanup: Callable[[], Any]) -> None:
+        """작업 기록이 보관 한도(max_finished)에서 밀려 삭제될 때 실행할 정리 함수 등록"""
+        self.cleanups.append(cleanup)
+
+    def check_cancelled(self) -> None:
+        """취소 요청 시 JobCancelled 발생"""
+        if self.cancel_event.is_set():
+            raise JobCancelled(f"작업 취소됨: {self.id}")
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        """API 응답용 dict"""
+        data = {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "progress": round(self.progress, 4),
+            "message": self.message,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+        if include_result:
+            data["result"] = jsonable_encoder(self.result)
+        return data
+
+    def _emit(self, event_type: str, **data: Any) -> None:
+        # list.append는 원자적이므로 SSE 리더는 길이 기준으로 새 이벤트만 읽음
+        self.events.append({
+            "seq": len(self.events),
+            "type": event_type,
+            "time": datetime.now().isoformat(),
+            **data,
+        })
+
+
+class JobManager:
+    """제한된 작업 스레드 풀 기반 작업 관리자
+
+    Args:
+        max_workers: 동시 실행 작업 수
+        max_pending: 대기 + 실행 중 작업 상한 (초과 시 JobQueueFull)
+        max_finished: 보관할 완료 작업 수 (오래된 것부터 삭제)
+    """
+
+    def __init__(
+        self,
+        max_workers: int = JOB_WORKERS,
+        max_pending: int = MAX_PENDING_JOBS,
+        max_finished: int = MAX_FINISHED_JOBS,
+    ):
+        self.max_pending = max_pending
+        self.max_finished = max_finished
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")
+        self._jobs: Dict[str, Job] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, kind: str, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Job:
+        """작업 등록 (fn(job, *args, **kwargs)를 작업 스레드에서 실행)
+
+        Raises:
+            JobQueueFull: 대기 작업 수 초과
+        """
+        with self._lock:
+            active = sum(1 for job in self._jobs.values() if not job.finished)
+            if active >= self.max_pending:
+                raise JobQueueFull(f"대기 중인 작업이 너무 많습니다 (최대 {self.max_pending}개)")
+            job = Job(id=uuid.uuid4().hex[:12], kind=kind)
+            self._jobs[job.id] = job
+            evicted = self._prune()
+
+        self._evict(evicted)
+
+        job._emit("status", status=job.status)
+        job.future = self._executor.submit(self._run, job, fn, args, kwargs)
+        logger.info(f"[Job] 등록: {job.id} ({kind})")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        """최근 등록 순 작업 목록"""
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda j: j.created_at, reverse=True)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """작업 취소 요청 (대기 중이면 즉시 취소, 실행 중이면 다음 확인 지점에서 중단)"""
+        job = self._jobs.get(job_id)
+        if job is None or job.finished:
+            return job
+
+        job.cancel_event.set()
+        if job.future is not None and job.future.cancel():
+            self._finish(job, "cancelled", message="실행 전 취소됨")
+        else:
+            job._emit("cancel_requested")
+        logger.info(f"[Job] 취소 요청: {job.id}")
+        return job
+
+    async def wait(self, job: Job) -> Any:
+        """작업 완료 대기 (이벤트 루프를 막지 않음). 실패/취소 시 작업의 예외를 그대로 전달"""
+        return await asyncio.wrap_future(job.future)
+
+    async def stream(self, job: Job) -> AsyncIterator[str]:
+        """작업 이벤트를 SSE 형식으로 전달 (완료되면 종료)"""
+        sent = 0
+        while True:
+            events = job.events
+            while sent < len(events):
+                event = events[sent]
+                sent += 1
+                yield f"event: {event['type']}\ndata: {json.dumps(jsonable_encoder(event), ensure_ascii=False)}\n\n"
+            if job.finished and sent >= len(job.events):
+                return
+            await asyncio.sleep(EVENT_POLL_INTERVAL)
+
+    def shutdown(self) -> None:
+        """실행 중 작업에 취소 요청 후 스레드 풀 종료"""
+        for job in self._jobs.values():
+            if not job.finished:
+                job.cancel_event.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+
+    def _run(self, job: Job, fn: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+        job.started_at = datetime.now()
+        job.status = "running"
+        job._emit("status", status=job.status)
+        try:
+            job.check_cancelled()
+            result = fn(job, *args, **kwargs)
+        except Exception as e:
+            if isinstance(e, JobCancelled) or job.cancel_requested:
+                self._finish(job, "cancelled", message="취소됨")
+                raise JobCancelled(f"작업 취소됨: {job.id}") from e
+            status_code = getattr(e, "status_code", 500)
+            detail = getattr(e, "detail", None) or str(e)
+            self._finish(job, "failed", message=str(detail), error={"status_code": status_code, "detail": detail})
+            logger.warning(f"[Job] 실패: {job.id} - {detail}")
+            raise
+        job.result = result
+        self._finish(job, "succeeded", message="완료", progress=1.0)
+        return result
+
+    def _finish(
+        self,
+        job: Job,
+        status: str,
+        message: str,
+        error: Optional[Dict[str, Any]] = None,
+        progress: Optional[float] = None,
+    ) -> None:
+        job.error = error
+        job.message = message
+        if progress is not None:
+            job.progress = progress
+        job.finished_at = datetime.now()
+        # 마지막 이벤트를 먼저 기록해야 SSE가 완료 상태를 보고 끝내기 전에 전달됨
+        job._emit("status", status=status, message=message, error=error)
+        job.status = status
+        logger.info(f"[Job] {status}: {job.id}")
+
+    def _prune(self) -> List[Job]:
+        finished = sorted((job for job in self._jobs.values() if job.finished), key=lambda j: j.created_at)
+        evicted = finished[:max(0, len(finished) - self.max_finished)]
+        for job in evicted:
+            del self._jobs[job.id]
+        return evicted
+
+    @staticmethod
+    def _evict(jobs: List[Job]) -> None:
+        """삭제된 작업의 정리 함수 실행 (잠금 밖에서 호출)"""
+        for job in jobs:
+            for cleanup in job.cleanups:
+                try:
+                    cleanup()
+                except Exception as e:
+                    logger.warning(f"[Job] 정리 실패: {job.id} - {e}")
+
+
+# 프로세스 전역 작업 관리자
+job_manager = JobManager()
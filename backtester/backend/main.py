@@ -33,6 +33,7 @@ _workspace_path = _project_root / ".lean-workspace"
 from kis_backtest.lean.project_manager import LeanProjectManager
 LeanProjectManager.set_workspace(str(_workspace_path))
 
+from backend.jobs import job_manager
 from backend.routes import strategies, backtest, files, symbols, auth
 
 # 로깅 설정
@@ -48,6 +49,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """애플리케이션 라이프사이클 관리"""
     logger.info("KIS2 Strategy API 서버 시작")
     yield
+    job_manager.shutdown()
     logger.info("KIS2 Strategy API 서버 종료")
 
 
@@ -1,16 +1,22 @@
 """Backtest API Routes.
 
 Lean Docker 기반 백테스트 실행.
+engine="native" 요청은 Docker 없이 네이티브 엔진으로 실행합니다.
+실행은 backend.jobs 작업 스레드에서 진행되며 /jobs API로 상태 조회·SSE·취소를 지원합니다.
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from functools import partial
+from typing import Any, Dict, List, Literal, Optional, Union
 from datetime import date, datetime, timedelta
 from pathlib import Path
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
+from backend.jobs import Job, JobCancelled, JobQueueFull, job_manager
 from backend.schemas.backtest import (
     BacktestRequest,
     BacktestResponse,
@@ -19,8 +25,9 @@ from kis_backtest.strategies.registry import StrategyRegistry
 from kis_backtest.codegen.generator import LeanCodeGenerator, CodeGenConfig
 from kis_backtest.lean.executor import LeanExecutor, LeanRun
 from kis_backtest.lean.project_manager import LeanProjectManager
-from kis_backtest.lean.data_converter import DataConverter
 from kis_backtest.lean.result_formatter import parse_lean_value
+from kis_backtest.native import NativeExecutor
+from kis_backtest.data import MarketDataStore
 import kis_backtest.strategies.preset  # 전략 자동 등록
 
 
@@ -208,6 +215,51 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
+def _run_native_backtest(
+    strategy: Any,
+    config: CodeGenConfig,
+    symbols: List[str],
+    start_date: str,
+    end_date: str,
+    initial_capital: float,
+    workspace: Path,
+    run_id: str,
+) -> BacktestResponse:
+    """네이티브 엔진으로 백테스트 실행 (prepare_market_data가 준비한 저장소 사용)"""
+    data = MarketDataStore(workspace / "store").read_many(symbols)
+    if not data:
+        raise HTTPException(status_code=400, detail="데이터 준비 실패: 캐시된 데이터 없음")
+
+    try:
+        lean_run = NativeExecutor.run(
+            strategy,
+            data,
+            symbols,
+            start_date,
+            end_date,
+            initial_capital=initial_capital,
+            config=config,
+            run_id=run_id,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"네이티브 엔진 실행 불가: {e}")
+
+    try:
+        result_data = _lean_run_to_api_response(
+            lean_run, strategy.name, symbols,
+            start_date, end_date, initial_capital,
+            workspace=workspace,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"백테스트 실행 오류: {e}")
+
+    return BacktestResponse(
+        success=True,
+        data=result_data,
+        message="백테스트 완료 (native)",
+    )
+
+
 def _classify_lean_error(error: str, output: str) -> str:
     """Lean 에러 메시지를 사용자 친화적으로 분류
 
@@ -264,8 +316,12 @@ async def prepare_market_data(
     start_date: str,
     end_date: str,
     workspace: Path,
+    emit_lean_csv: bool = True,
 ) -> dict:
-    """백테스트용 시장 데이터 준비 (KIS API → Lean CSV)
+    """백테스트용 시장 데이터 준비 (KIS API → 컬럼형 저장소 → Lean CSV)
+
+    Args:
+        emit_lean_csv: Lean 엔진용 CSV 생성 여부 (네이티브 엔진은 불필요)
     
     Returns:
         {"downloaded": [...], "skipped": [...], "errors": [...]}
@@ -274,7 +330,7 @@ async def prepare_market_data(
     from kis_backtest.providers.kis.data import KISDataProvider
     
     output_dir = workspace / "data" / "equity" / "krx" / "daily"
-    output_dir.mkdir(parents=True, exist_ok=True)
+    store = MarketDataStore(workspace / "store")
     
     result = {"downloaded": [], "skipped": [], "errors": []}
     
@@ -282,110 +338,61 @@ async def prepare_market_data(
     req_start = datetime.strptime(start_date, "%Y-%m-%d").date()
     req_end = datetime.strptime(end_date, "%Y-%m-%d").date()
     
-    def check_date_coverage(csv_path: Path) -> bool:
-        """CSV 파일이 요청 날짜 범위를 커버하는지 확인 (관대한 체크)
-
-        캐싱 정책:
-        1. 종료일: 7일(주말 포함 5영업일) 허용 - 휴장일/주말 대응
-        2. 시작일: 데이터 시작 후면 OK - 과거 데이터 불필요
-        3. 커버리지: 85% 이상이면 캐시 사용
-        """
-        try:
-            with open(csv_path, 'r') as f:
-                lines = f.readlines()
-                if len(lines) < 2:
-                    return False
-
-                # 첫번째/마지막 줄에서 날짜 추출 (YYYYMMDD 형식)
-                first_date_str = lines[0].split(',')[0].strip()
-                last_date_str = lines[-1].split(',')[0].strip()
-
-                first_date = datetime.strptime(first_date_str, "%Y%m%d").date()
-                last_date = datetime.strptime(last_date_str, "%Y%m%d").date()
-
-                # 관대한 날짜 체크
-                tolerance_days = 7  # 주말 포함 약 5 영업일
-                coverage_threshold = 0.85  # 85% 이상 커버 시 캐시 사용
-
-                # 1. 종료일 체크: tolerance_days 허용
-                if req_end > last_date + timedelta(days=tolerance_days):
-                    logger.info(f"[Data] 종료일 초과: 요청={req_end}, 데이터={last_date} (허용={tolerance_days}일)")
-                    return False
-
-                # 2. 시작일 체크: 데이터 시작 후면 OK (너무 이전 데이터 요청 시만 실패)
-                # 요청 시작일이 데이터보다 30일 이상 앞서면 재다운로드
-                if req_start < first_date - timedelta(days=30):
-                    logger.info(f"[Data] 시작일 부족: 요청={req_start}, 데이터 시작={first_date}")
-                    return False
-
-                # 3. 커버리지 체크
-                req_days = (req_end - req_start).days
-                if req_days <= 0:
-                    return True  # 당일 요청
-
-                # 실제 커버 가능한 범위 계산
-                effective_start = max(req_start, first_date)
-                effective_end = min(req_end, last_date)
-                covered_days = (effective_end - effective_start).days
-
-                coverage = covered_days / req_days if req_days > 0 else 1.0
-
-                if coverage < coverage_threshold:
-                    logger.info(f"[Data] 커버리지 부족: {coverage:.1%} < {coverage_threshold:.0%}")
-                    return False
-
-                logger.debug(f"[Data] 캐시 사용: {csv_path.name} (커버리지={coverage:.1%})")
-                return True
-
-        except Exception as e:
-            logger.warning(f"[Data] 날짜 체크 실패: {e}")
-            return False
-    
-    # 이미 있는 파일 확인 - 날짜 범위도 체크
+    # 저장소 확인 - 조회하지 않은 구간 계산
     for symbol in symbols:
-        csv_path = output_dir / f"{symbol.lower()}.csv"
-        if csv_path.exists() and csv_path.stat().st_size > 100:
-            if check_date_coverage(csv_path):
-                result["skipped"].append(symbol)
-                continue
-            else:
-                # 날짜 범위 불일치 - 파일 삭제 후 재다운로드
-                logger.info(f"[Data] {symbol} 날짜 범위 불일치로 재다운로드")
-                csv_path.unlink()
+        if not store.has(symbol):
+            # 저장소 도입 이전 Lean CSV 캐시 가져오기
+            csv_path = output_dir / f"{symbol.lower()}.csv"
+            if csv_path.exists() and csv_path.stat().st_size > 100:
+                try:
+                    store.import_lean_csv(csv_path, symbol)
+                except Exception as e:
+                    logger.warning(f"[Data] {symbol} 기존 CSV 가져오기 실패: {e}")
+
+        if not store.missing_ranges(symbol, req_start, req_end):
+            result["skipped"].append(symbol)
     
     symbols_to_download = [s for s in symbols if s not in result["skipped"]]
     
     if not symbols_to_download:
         logger.info("[Data] 모든 종목 데이터 캐시 사용")
-        return result
-    
-    # KIS 인증
-    try:
-        auth = KISAuth.from_env()
-        provider = KISDataProvider(auth)
-    except Exception as e:
-        logger.warning(f"[Data] KIS 인증 실패: {e} - 기존 캐시만 사용")
-        for s in symbols_to_download:
-            result["errors"].append({"symbol": s, "error": str(e)})
-        return result
-    
-    # 데이터 다운로드
-    for symbol in symbols_to_download:
+    else:
+        # KIS 인증
         try:
-            logger.info(f"[Data] 다운로드 중: {symbol}")
-            bars = provider.get_history(symbol, req_start, req_end)
-            
-            if bars:
-                # Lean CSV 변환
-                DataConverter.bars_to_lean_csv(bars, symbol, output_dir)
+            auth = KISAuth.from_env()
+            provider = KISDataProvider(auth)
+        except Exception as e:
+            logger.warning(f"[Data] KIS 인증 실패: {e} - 기존 캐시만 사용")
+            for s in symbols_to_download:
+                result["errors"].append({"symbol": s, "error": str(e)})
+            symbols_to_download = []
+        
+        # 누락 구간만 동시 다운로드 (완료 순서대로 저장)
+        jobs = [
+            (symbol, gap_start, gap_end)
+            for symbol in symbols_to_download
+            for gap_start, gap_end in store.missing_ranges(symbol, req_start, req_end)
+        ]
+        fetched_bars = {symbol: 0 for symbol in symbols_to_download}
+        if jobs:
+            try:
+                async for (symbol, gap_start, gap_end), bars in provider.iter_history_ranges(jobs):
+                    logger.info(f"[Data] 다운로드: {symbol} {gap_start}~{gap_end} ({len(bars)} bars)")
+                    store.record_fetch(symbol, bars, gap_start, gap_end)
+                    fetched_bars[symbol] += len(bars)
+            except Exception as e:
+                logger.error(f"[Data] 일괄 다운로드 실패: {e}")
+
+        for symbol, count in fetched_bars.items():
+            if count:
                 result["downloaded"].append(symbol)
-                logger.info(f"[Data] 완료: {symbol} ({len(bars)} bars)")
+                logger.info(f"[Data] 완료: {symbol} ({count} bars)")
             else:
                 result["errors"].append({"symbol": symbol, "error": "데이터 없음"})
-                
-        except Exception as e:
-            logger.error(f"[Data] {symbol} 다운로드 실패: {e}")
-            result["errors"].append({"symbol": symbol, "error": str(e)})
+    
+    # Lean CSV 생성 (Lean 엔진 실행 시에만)
+    if emit_lean_csv:
+        store.export_lean_csv(result["downloaded"] + result["skipped"], output_dir)
     
     return result
 
@@ -478,78 +485,89 @@ async def prepare_benchmark_data(
         return False
 
 
-@router.post(
-    "/run",
-    response_model=BacktestResponse,
-    summary="백테스트 실행",
-    description="전략을 백테스트합니다 (Lean Docker). param_overrides로 파라미터 변경 가능.",
-)
-async def run_backtest(request: BacktestRequest) -> BacktestResponse:
-    """백테스트 실행
+class CustomBacktestRequest(BaseModel):
+    """커스텀 백테스트 요청"""
+    yaml_content: str
+    symbols: List[str]
+    start_date: str
+    end_date: str
+    initial_capital: float = 100_000_000
+    param_overrides: Optional[Dict[str, Any]] = None  # $param_name 오버라이드
+    commission_rate: Optional[float] = 0.00015  # 수수료율 (기본 0.015%)
+    tax_rate: Optional[float] = 0.002  # 거래세율 (기본 0.2%)
+    slippage: Optional[float] = 0.0  # 슬리피지 (기본 0%)
+    engine: Literal["lean", "native"] = "lean"  # 백테스트 엔진
 
-    param_overrides 예시:
-        {"period": 21, "oversold": 25}
+
+# ============================================
+# 백테스트 실행 (작업 스레드)
+# ============================================
+
+
+def _execute_backtest(
+    job: Job,
+    strategy: Any,
+    request: Union[BacktestRequest, CustomBacktestRequest],
+    start_date: str,
+    end_date: str,
+    run_id: str,
+    native_run_id: str,
+) -> BacktestResponse:
+    """데이터 준비 → 코드 생성 → 엔진 실행 (job_manager 작업 스레드에서 실행)
+
+    KIS 조회와 Lean 프로세스 대기가 이벤트 루프를 막지 않도록 라우트에서 직접 호출하지 않습니다.
+    단계 사이마다 취소 요청을 확인하고, Lean 실행 중 취소되면 컨테이너를 중지합니다.
     """
+    # 같은 전략 작업이 동시에 실행돼도 프로젝트 디렉토리(main.py, config, 결과)를 공유하지 않도록 작업 ID 부여
+    run_id = f"{run_id}_{job.id}"
+    native_run_id = f"{native_run_id}_{job.id}"
+    # 결과는 히스토리에서 다시 읽으므로 작업 기록이 보관 한도에서 밀려날 때 함께 삭제
+    for project_run_id in (run_id, native_run_id):
+        job.on_evict(partial(LeanProjectManager.cleanup_project, project_run_id))
 
-    # 전략 빌드 (param_overrides 적용)
-    try:
-        if request.param_overrides:
-            definition = StrategyRegistry.build_with_params(
-                request.strategy_id,
-                **request.param_overrides,
-            )
-        else:
-            definition = StrategyRegistry.build(request.strategy_id)
-    except KeyError:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Strategy not found: {request.strategy_id}"
-        )
-    
-    # 날짜 검증
-    start_date = request.start_date
-    end_date = request.end_date
-    
-    if isinstance(start_date, date):
-        start_date = start_date.isoformat()
-    if isinstance(end_date, date):
-        end_date = end_date.isoformat()
-    
     # 워크스페이스 경로
     manager = LeanProjectManager()
     workspace = manager.workspace
-    
+
     # 시장 데이터 준비 (KIS API → Lean CSV)
+    job.report("시장 데이터 준비", 0.05)
     try:
-        data_result = await prepare_market_data(
+        data_result = asyncio.run(prepare_market_data(
             symbols=request.symbols,
             start_date=start_date,
             end_date=end_date,
             workspace=workspace,
-        )
+            emit_lean_csv=request.engine == "lean",
+        ))
         logger.info(f"[Data] 결과: {data_result}")
-        
+
         # 데이터 없으면 에러
         if data_result["errors"] and not data_result["downloaded"] and not data_result["skipped"]:
             error_msg = data_result["errors"][0]["error"] if data_result["errors"] else "데이터 다운로드 실패"
             raise HTTPException(status_code=400, detail=f"데이터 준비 실패: {error_msg}")
-            
+
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"데이터 준비 실패: {e}")
 
+    job.check_cancelled()
+
     # 벤치마크 데이터 준비 (KOSPI)
+    job.report("벤치마크 데이터 준비", 0.4)
     try:
-        await prepare_benchmark_data(
+        asyncio.run(prepare_benchmark_data(
             start_date=start_date,
             end_date=end_date,
             workspace=workspace,
-        )
+        ))
     except Exception as e:
         logger.warning(f"[Benchmark] 준비 실패 (무시): {e}")
 
+    job.check_cancelled()
+
     # Lean 코드 생성
+    job.report("전략 코드 생성", 0.5)
     try:
         # 거래 비용 설정
         config = CodeGenConfig(
@@ -558,7 +576,7 @@ async def run_backtest(request: BacktestRequest) -> BacktestResponse:
             slippage=request.slippage or 0.0,
             initial_capital=request.initial_capital,
         )
-        generator = LeanCodeGenerator(definition, config=config)
+        generator = LeanCodeGenerator(strategy, config=config)
         code = generator.generate(
             symbols=request.symbols,
             start_date=start_date,
@@ -568,6 +586,18 @@ async def run_backtest(request: BacktestRequest) -> BacktestResponse:
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Code generation failed: {e}")
 
+    job.check_cancelled()
+
+    # 네이티브 엔진 (Docker 불필요)
+    if request.engine == "native":
+        job.report("네이티브 엔진 실행", 0.6)
+        return _run_native_backtest(
+            strategy, config, request.symbols,
+            start_date, end_date, request.initial_capital,
+            workspace=workspace,
+            run_id=native_run_id,
+        )
+
     # Docker 환경 확인
     if not LeanExecutor.check_docker():
         raise HTTPException(
@@ -582,24 +612,26 @@ async def run_backtest(request: BacktestRequest) -> BacktestResponse:
         )
 
     # 프로젝트 생성 및 백테스트 실행
+    job.report("Lean 백테스트 실행", 0.6)
     try:
         project = LeanProjectManager.create_project(
-            run_id=f"bt_{definition.id}",
+            run_id=run_id,
             symbols=request.symbols,
             start_date=start_date,
             end_date=end_date,
             initial_capital=request.initial_capital,
-            strategy_id=definition.id,
-            strategy_name=definition.name,
+            strategy_id=strategy.id,
+            strategy_name=strategy.name,
         )
         # 코드 저장
         project.main_py.write_text(code)
 
-        lean_run = LeanExecutor.run(project)
+        lean_run = LeanExecutor.run(project, cancel_event=job.cancel_event)
+        job.check_cancelled()
 
         if lean_run.success:
             result_data = _lean_run_to_api_response(
-                lean_run, definition.name, request.symbols,
+                lean_run, strategy.name, request.symbols,
                 start_date, end_date, request.initial_capital,
                 workspace=workspace,
             )
@@ -613,24 +645,121 @@ async def run_backtest(request: BacktestRequest) -> BacktestResponse:
             error = lean_run.error or "Unknown error"
             error_detail = _classify_lean_error(error, lean_run.output)
             raise HTTPException(status_code=500, detail=error_detail)
-    except HTTPException:
+    except (HTTPException, JobCancelled):
         raise
     except Exception as e:
+        job.check_cancelled()
         raise HTTPException(status_code=500, detail=f"백테스트 실행 오류: {e}")
 
 
+def _build_strategy(request: BacktestRequest) -> Any:
+    """레지스트리 전략 빌드 (param_overrides 적용)"""
+    try:
+        if request.param_overrides:
+            return StrategyRegistry.build_with_params(
+                request.strategy_id,
+                **request.param_overrides,
+            )
+        return StrategyRegistry.build(request.strategy_id)
+    except KeyError:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Strategy not found: {request.strategy_id}"
+        )
+
+
+def _load_custom_strategy(request: CustomBacktestRequest) -> Any:
+    """YAML 파싱 → StrategySchema (타입 안전, param_overrides 적용)"""
+    from kis_backtest.file.loader import StrategyFileLoader
+
+    try:
+        schema = StrategyFileLoader.load_schema_with_params(
+            request.yaml_content,
+            param_overrides=request.param_overrides,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Invalid YAML: {e}")
+
+    if schema is None:
+        raise HTTPException(status_code=400, detail="전략 스키마 생성 실패")
+    return schema
+
+
+def _submit_backtest(request: BacktestRequest) -> Job:
+    """레지스트리 전략 백테스트 작업 등록"""
+    definition = _build_strategy(request)
+
+    # 날짜 검증
+    start_date = request.start_date
+    end_date = request.end_date
+
+    if isinstance(start_date, date):
+        start_date = start_date.isoformat()
+    if isinstance(end_date, date):
+        end_date = end_date.isoformat()
+
+    return _submit(
+        _execute_backtest, definition, request, start_date, end_date,
+        run_id=f"bt_{definition.id}",
+        native_run_id=f"bt_native_{definition.id}",
+    )
 
-class CustomBacktestRequest(BaseModel):
-    """커스텀 백테스트 요청"""
-    yaml_content: str
-    symbols: List[str]
-    start_date: str
-    end_date: str
-    initial_capital: float = 100_000_000
-    param_overrides: Optional[Dict[str, Any]] = None  # $param_name 오버라이드
-    commission_rate: Optional[float] = 0.00015  # 수수료율 (기본 0.015%)
-    tax_rate: Optional[float] = 0.002  # 거래세율 (기본 0.2%)
-    slippage: Optional[float] = 0.0  # 슬리피지 (기본 0%)
+
+def _submit_custom_backtest(request: CustomBacktestRequest) -> Job:
+    """커스텀(YAML) 전략 백테스트 작업 등록"""
+    schema = _load_custom_strategy(request)
+    return _submit(
+        _execute_backtest, schema, request, request.start_date, request.end_date,
+        run_id=f"bt_custom_{schema.id}",
+        native_run_id=f"bt_native_custom_{schema.id}",
+    )
+
+
+def _submit(fn: Any, *args: Any, **kwargs: Any) -> Job:
+    try:
+        return job_manager.submit("backtest", fn, *args, **kwargs)
+    except JobQueueFull as e:
+        raise HTTPException(status_code=429, detail=str(e))
+
+
+async def _wait_response(job: Job) -> BacktestResponse:
+    """작업 완료까지 대기 후 응답 (동기 API 호환용)"""
+    try:
+        return await job_manager.wait(job)
+    except (JobCancelled, asyncio.CancelledError):
+        if job.status != "cancelled":
+            raise
+        raise HTTPException(status_code=409, detail=f"백테스트가 취소되었습니다 (job_id={job.id})")
+
+
+def _get_job(job_id: str) -> Job:
+    job = job_manager.get(job_id)
+    if job is None or job.kind != "backtest":
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job
+
+
+# ============================================
+# API 엔드포인트
+# ============================================
+
+
+@router.post(
+    "/run",
+    response_model=BacktestResponse,
+    summary="백테스트 실행",
+    description="전략을 백테스트합니다 (Lean Docker 또는 engine=native). param_overrides로 파라미터 변경 가능.",
+)
+async def run_backtest(request: BacktestRequest) -> BacktestResponse:
+    """백테스트 실행 (완료까지 대기)
+
+    작업 스레드에서 실행되므로 대기 중에도 다른 요청은 처리됩니다.
+    진행 상황 조회/취소가 필요하면 POST /jobs를 사용하세요.
+
+    param_overrides 예시:
+        {"period": 21, "oversold": 25}
+    """
+    return await _wait_response(_submit_backtest(request))
 
 
 @router.post(
@@ -640,124 +769,60 @@ class CustomBacktestRequest(BaseModel):
     description="YAML 정의로 커스텀 전략을 백테스트합니다. param_overrides로 $param_name 값 변경 가능.",
 )
 async def run_custom_backtest(request: CustomBacktestRequest) -> BacktestResponse:
-    """커스텀 전략 백테스트 - 스키마 기반
+    """커스텀 전략 백테스트 - 스키마 기반 (완료까지 대기)
 
     param_overrides로 YAML의 $param_name 값을 오버라이드할 수 있습니다.
     예: {"period": 21, "oversold": 25}
     """
-    from kis_backtest.file.loader import StrategyFileLoader
+    return await _wait_response(_submit_custom_backtest(request))
 
-    # YAML 파싱 → StrategySchema (타입 안전, param_overrides 적용)
-    try:
-        schema = StrategyFileLoader.load_schema_with_params(
-            request.yaml_content,
-            param_overrides=request.param_overrides,
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Invalid YAML: {e}")
-    
-    # 워크스페이스 경로
-    manager = LeanProjectManager()
-    workspace = manager.workspace
-    
-    # 시장 데이터 준비 (KIS API → Lean CSV)
-    try:
-        data_result = await prepare_market_data(
-            symbols=request.symbols,
-            start_date=request.start_date,
-            end_date=request.end_date,
-            workspace=workspace,
-        )
-        logger.info(f"[Data] 결과: {data_result}")
-        
-        # 데이터 없으면 에러
-        if data_result["errors"] and not data_result["downloaded"] and not data_result["skipped"]:
-            error_msg = data_result["errors"][0]["error"] if data_result["errors"] else "데이터 다운로드 실패"
-            raise HTTPException(status_code=400, detail=f"데이터 준비 실패: {error_msg}")
-            
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"데이터 준비 실패: {e}")
 
-    # 벤치마크 데이터 준비 (KOSPI)
-    try:
-        await prepare_benchmark_data(
-            start_date=request.start_date,
-            end_date=request.end_date,
-            workspace=workspace,
-        )
-    except Exception as e:
-        logger.warning(f"[Benchmark] 준비 실패 (무시): {e}")
+@router.post(
+    "/jobs",
+    status_code=202,
+    summary="백테스트 작업 등록",
+    description="백테스트를 백그라운드 작업으로 등록하고 job_id를 바로 반환합니다.",
+)
+async def create_backtest_job(request: BacktestRequest) -> Dict[str, Any]:
+    """백테스트 작업 등록 → GET /jobs/{job_id} 또는 /jobs/{job_id}/events로 진행 확인"""
+    return _submit_backtest(request).to_dict(include_result=False)
 
-    # Lean 코드 생성 (스키마 기반)
-    try:
-        if schema is None:
-            raise HTTPException(status_code=400, detail="전략 스키마 생성 실패")
-        
-        # 거래 비용 설정
-        config = CodeGenConfig(
-            commission_rate=request.commission_rate or 0.00015,
-            tax_rate=request.tax_rate or 0.002,
-            slippage=request.slippage or 0.0,
-            initial_capital=request.initial_capital,
-        )
-        generator = LeanCodeGenerator(schema, config=config)
-        code = generator.generate(
-            symbols=request.symbols,
-            start_date=request.start_date,
-            end_date=request.end_date,
-            initial_capital=request.initial_capital,
-        )
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Code generation failed: {e}")
-    
-    # Docker 환경 확인
-    if not LeanExecutor.check_docker():
-        raise HTTPException(
-            status_code=503,
-            detail="Docker가 실행되지 않습니다. Docker Desktop을 시작해주세요."
-        )
 
-    if not LeanExecutor.check_image():
-        raise HTTPException(
-            status_code=503,
-            detail="Lean 이미지가 없습니다. 'docker pull quantconnect/lean:latest' 실행 후 재시도해주세요."
-        )
+@router.post(
+    "/jobs/custom",
+    status_code=202,
+    summary="커스텀 전략 백테스트 작업 등록",
+)
+async def create_custom_backtest_job(request: CustomBacktestRequest) -> Dict[str, Any]:
+    """커스텀(YAML) 전략 백테스트 작업 등록"""
+    return _submit_custom_backtest(request).to_dict(include_result=False)
 
-    # 프로젝트 생성 및 백테스트 실행
-    try:
-        project = LeanProjectManager.create_project(
-            run_id=f"bt_custom_{schema.id}",
-            symbols=request.symbols,
-            start_date=request.start_date,
-            end_date=request.end_date,
-            initial_capital=request.initial_capital,
-            strategy_id=schema.id,
-            strategy_name=schema.name,
-        )
-        # 코드 저장
-        project.main_py.write_text(code)
 
-        lean_run = LeanExecutor.run(project)
+@router.get("/jobs", summary="백테스트 작업 목록")
+async def list_backtest_jobs() -> List[Dict[str, Any]]:
+    """최근 작업 목록 (결과 제외)"""
+    return [job.to_dict(include_result=False) for job in job_manager.list() if job.kind == "backtest"]
 
-        if lean_run.success:
-            result_data = _lean_run_to_api_response(
-                lean_run, schema.name, request.symbols,
-                request.start_date, request.end_date, request.initial_capital,
-                workspace=workspace,
-            )
-            return BacktestResponse(
-                success=True,
-                data=result_data,
-                message="백테스트 완료",
-            )
-        else:
-            # 에러 메시지 분류
-            error = lean_run.error or "Unknown error"
-            error_detail = _classify_lean_error(error, lean_run.output)
-            raise HTTPException(status_code=500, detail=error_detail)
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"백테스트 실행 오류: {e}")
+
+@router.get("/jobs/{job_id}", summary="백테스트 작업 상태")
+async def get_backtest_job(job_id: str) -> Dict[str, Any]:
+    """작업 상태/진행률 (완료 시 result에 BacktestResponse 포함)"""
+    return _get_job(job_id).to_dict()
+
+
+@router.get("/jobs/{job_id}/events", summary="백테스트 진행 이벤트 (SSE)")
+async def stream_backtest_job(job_id: str) -> StreamingResponse:
+    """진행 이벤트를 Server-Sent Events로 전달 (작업이 끝나면 스트림 종료)"""
+    job = _get_job(job_id)
+    return StreamingResponse(
+        job_manager.stream(job),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@router.delete("/jobs/{job_id}", summary="백테스트 작업 취소")
+async def cancel_backtest_job(job_id: str) -> Dict[str, Any]:
+    """대기 중이면 즉시, 실행 중이면 다음 단계 전(Lean은 컨테이너 중지)에 취소"""
+    _get_job(job_id)
+    return job_manager.cancel(job_id).to_dict(include_result=False)
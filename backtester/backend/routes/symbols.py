@@ -7,6 +7,7 @@
 import logging
 import zipfile
 from datetime import date, datetime
+from bisect import bisect_left, bisect_right
 from io import BytesIO
 from pathlib import Path
 from typing import Optional
@@ -156,6 +157,7 @@ def _get_all_symbols() -> list[dict]:
             if symbols:
                 _symbol_cache[exchange] = symbols
                 _last_loaded[exchange] = datetime.now()
+                _reset_symbol_index()
                 all_symbols.extend(symbols)
 
     return all_symbols
@@ -174,35 +176,183 @@ def _check_needs_update() -> bool:
 
 
 # ============================================
-# 검색 로직
+# 검색 인덱스
 # ============================================
 
+# 한글 초성 (유니코드 음절 배열 순서)
+_CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_CHOSUNG_SET = frozenset(_CHOSUNG)
+_HANGUL_FIRST = 0xAC00  # 가
+_HANGUL_LAST = 0xD7A3  # 힣
+_SYLLABLES_PER_CHOSUNG = 588  # 중성 21 × 종성 28
 
-def search_symbols(query: str, limit: int = 20, exchange: Optional[str] = None) -> list[dict]:
-    """종목 검색 (코드 또는 이름)"""
-    query = query.lower().strip()
-    results: list[dict] = []
-
-    all_symbols = _get_all_symbols()
-
-    for stock in all_symbols:
-        if exchange and stock["exchange"] != exchange.lower():
-            continue
-        if query in stock["code"].lower() or query in stock["name"].lower():
-            results.append(stock)
-            if len(results) >= limit:
+# 접두어 검색 상한 (모든 키 문자보다 큰 코드 포인트)
+_PREFIX_END = "\U0010ffff"
+
+# 현재 마스터로 만든 검색 인덱스 (마스터 캐시 갱신 시 None으로 초기화)
+_symbol_index: Optional["SymbolIndex"] = None
+
+
+def _is_hangul_syllable(ch: str) -> bool:
+    return _HANGUL_FIRST <= ord(ch) <= _HANGUL_LAST
+
+
+def _to_chosung(text: str) -> str:
+    """한글 음절을 초성으로 변환 (그 외 문자는 그대로)
+
+    예: "삼성전자" → "ㅅㅅㅈㅈ", "sk하이닉스" → "skㅎㅇㄴㅅ"
+    """
+    return "".join(
+        _CHOSUNG[(ord(ch) - _HANGUL_FIRST) // _SYLLABLES_PER_CHOSUNG] if _is_hangul_syllable(ch) else ch
+        for ch in text
+    )
+
+
+def _is_chosung_query(query: str) -> bool:
+    """초성 검색어 여부 (초성 자음이 있고 완성형 한글이 없음)"""
+    return any(ch in _CHOSUNG_SET for ch in query) and not any(_is_hangul_syllable(ch) for ch in query)
+
+
+class _KeyIndex:
+    """검색 키 하나(종목코드, 종목명, 초성)에 대한 인덱스
+
+    - 정렬 배열 + 이진 탐색: 일치/접두어 검색
+    - 1-gram/2-gram 역색인: 부분 문자열 검색 (후보 교집합 후 실제 포함 여부 확인)
+
+    keys[i]는 마스터 i번째 종목의 키이며, 역색인 목록은 종목 순서로 정렬되어 있습니다.
+    """
+
+    def __init__(self, keys: list[str]):
+        self.keys = keys
+        ordered = sorted(range(len(keys)), key=keys.__getitem__)
+        self._sorted_keys = [keys[i] for i in ordered]
+        self._sorted_ids = ordered
+        self._postings: dict[str, list[int]] = {}
+        for i, key in enumerate(keys):
+            grams = set(key) | {key[j:j + 2] for j in range(len(key) - 1)}
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(i)
+
+    def exact(self, query: str) -> list[int]:
+        """키가 query와 같은 종목 (키 순서)"""
+        lo = bisect_left(self._sorted_keys, query)
+        hi = bisect_right(self._sorted_keys, query, lo)
+        return self._sorted_ids[lo:hi]
+
+    def prefix(self, query: str) -> list[int]:
+        """키가 query로 시작하는 종목 (키 순서)"""
+        lo = bisect_left(self._sorted_keys, query)
+        hi = bisect_left(self._sorted_keys, query + _PREFIX_END, lo)
+        return self._sorted_ids[lo:hi]
+
+    def contains(self, query: str) -> list[int]:
+        """키에 query가 포함된 종목 (종목 순서)"""
+        if len(query) <= 2:
+            return self._postings.get(query, [])
+
+        bigrams = {query[j:j + 2] for j in range(len(query) - 1)}
+        postings = sorted((self._postings.get(gram, []) for gram in bigrams), key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
                 break
+            candidates.intersection_update(posting)
+        return sorted(i for i in candidates if query in self.keys[i])
+
+
+class SymbolIndex:
+    """종목 검색 인덱스 (마스터 로드 시 1회 생성)
+
+    - 종목코드 → 종목 dict
+    - 종목코드/종목명/초성별 _KeyIndex
+
+    검색 결과 순위: 일치 > 접두어 > 포함
+    (같은 순위 안에서는 종목코드 매칭이 먼저, 접두어는 키 순서, 포함은 마스터 순서)
+    """
+
+    def __init__(self, symbols: list[dict]):
+        self.symbols = list(symbols)
+        self.by_code: dict[str, dict] = {}
+        for stock in self.symbols:
+            self.by_code.setdefault(stock["code"], stock)
+
+        names = [stock["name"].lower() for stock in self.symbols]
+        self._codes = _KeyIndex([stock["code"].lower() for stock in self.symbols])
+        self._names = _KeyIndex(names)
+        self._chosung = _KeyIndex([_to_chosung(name) for name in names])
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def get(self, code: str) -> Optional[dict]:
+        """종목코드로 종목 조회"""
+        return self.by_code.get(code)
+
+    def search(self, query: str, limit: int = 20, exchange: Optional[str] = None) -> list[dict]:
+        """종목코드/종목명(초성 포함) 검색
+
+        Args:
+            query: 검색어 (대소문자 무시, 초성만 입력 시 초성 검색)
+            limit: 최대 결과 수
+            exchange: 거래소 필터 (kospi, kosdaq)
+
+        Returns:
+            순위순 검색 결과 목록
+        """
+        query = query.lower().strip()
+        exchange = exchange.lower() if exchange else None
+        keys = [self._chosung] if _is_chosung_query(query) else [self._codes, self._names]
+
+        results: list[dict] = []
+        seen: set[int] = set()
+        for match in (_KeyIndex.exact, _KeyIndex.prefix, _KeyIndex.contains):
+            for key in keys:
+                for i in match(key, query):
+                    if i in seen:
+                        continue
+                    stock = self.symbols[i]
+                    if exchange and stock["exchange"] != exchange:
+                        continue
+                    seen.add(i)
+                    results.append(stock)
+                    if len(results) >= limit:
+                        return results
+        return results
+
+
+def _reset_symbol_index() -> None:
+    """마스터 캐시가 바뀌면 호출 (다음 검색 시 인덱스 재생성)"""
+    global _symbol_index
+    _symbol_index = None
+
+
+def _get_symbol_index() -> SymbolIndex:
+    """현재 마스터 기준 검색 인덱스 (없거나 마스터가 갱신되면 재생성)"""
+    global _symbol_index
+
+    if _symbol_index is None or any(exchange not in _symbol_cache for exchange in ["kospi", "kosdaq"]):
+        # 아직 로드되지 않은 거래소는 CSV가 생겼는지 확인 (로드되면 인덱스 초기화)
+        all_symbols = _get_all_symbols()
+        if _symbol_index is None:
+            _symbol_index = SymbolIndex(all_symbols)
+            logger.info(f"종목 검색 인덱스 생성: {len(_symbol_index)}개 종목")
+
+    return _symbol_index
 
-    return results
+
+# ============================================
+# 검색 로직
+# ============================================
+
+
+def search_symbols(query: str, limit: int = 20, exchange: Optional[str] = None) -> list[dict]:
+    """종목 검색 (코드 또는 이름, 초성) - 일치 > 접두어 > 포함 순"""
+    return _get_symbol_index().search(query, limit=limit, exchange=exchange)
 
 
 def get_symbol_by_code(code: str) -> Optional[dict]:
     """종목코드로 종목 정보 조회"""
-    all_symbols = _get_all_symbols()
-    for stock in all_symbols:
-        if stock["code"] == code:
-            return stock
-    return None
+    return _get_symbol_index().get(code)
 
 
 # ============================================
@@ -375,6 +525,7 @@ async def _download_and_parse(exchange: str, timeout: float = 60.0) -> tuple[lis
             _save_to_csv(exchange, symbols)
             _symbol_cache[exchange] = symbols
             _last_loaded[exchange] = datetime.now()
+            _reset_symbol_index()
             logger.info(f"마스터파일 수집 완료: {exchange} - {len(symbols)}개 종목")
 
         return symbols, None
@@ -3,7 +3,7 @@
 """
 
 from datetime import date
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Literal, Optional, Union
 
 from pydantic import BaseModel, Field
 
@@ -31,6 +31,10 @@ class BacktestRequest(BaseModel):
         default=0.0,
         description="슬리피지 (기본 0 = 0%)"
     )
+    engine: Literal["lean", "native"] = Field(
+        default="lean",
+        description="백테스트 엔진 (lean: Docker, native: 프로세스 내 NumPy/pandas)"
+    )
 
     class Config:
         json_schema_extra = {
@@ -326,7 +326,8 @@ def run_live_strategy():
 
     try:
         print("\n전략 실행 중... (60초 후 자동 종료)")
-        live.run_strategy(symbols, on_bar, on_fill, timeout=60)
+        # 체결을 1초봉으로 집계해 봉 마감마다 on_bar 호출
+        live.run_strategy(symbols, on_bar, on_fill, timeout=60, interval="1s")
 
     except KeyboardInterrupt:
         print("\n\n전략 중지")
@@ -3,11 +3,11 @@
 # ====|  API 호출 공통 함수 포함                                  |=====================
 
 import asyncio
-import copy
 import json
 import logging
 import os
 import time
+import weakref
 from base64 import b64decode
 from collections import namedtuple
 from collections.abc import Callable
@@ -16,7 +16,8 @@ from io import StringIO
 
 import pandas as pd
 
-# pip install requests (패키지설치)
+# pip install requests httpx (패키지설치)
+import httpx
 import requests
 
 # 웹 소켓 모듈을 선언한다.
@@ -29,6 +30,14 @@ from Crypto.Cipher import AES
 # pip install pycryptodome
 from Crypto.Util.Padding import unpad
 
+# pip install orjson (선택, 설치되어 있으면 응답 JSON 디코딩에 사용)
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 def clearConsole():
     return os.system("cls" if os.name in ("nt", "dos") else "clear")
@@ -58,11 +67,183 @@ _DEBUG = False
 _isPaper = False
 _smartSleep = 0.1
 
-# Rate Limiter: 모든 REST API 호출을 직렬화하여 초당 제한 준수
+# Rate Limiter: REST/웹소켓 호출을 토큰 버킷으로 제한 (스레드/asyncio 공용)
 import threading
 
-_rate_lock = threading.Lock()
-_last_api_call_time = 0.0
+# 환경(prod/vps) × TR 분류별 (초당, 분당) 한도, None은 제한 없음
+# "all"은 같은 환경의 모든 분류가 함께 쓰는 앱키 전체 한도
+DEFAULT_RATE_LIMITS = {
+    ("prod", "all"): (18, None),
+    ("prod", "order"): (10, None),
+    ("prod", "token"): (1, 1),
+    ("prod", "approval"): (1, None),
+    ("prod", "ws"): (5, None),
+    ("vps", "all"): (2, None),
+    ("vps", "order"): (2, None),
+    ("vps", "token"): (1, 1),
+    ("vps", "approval"): (1, None),
+    ("vps", "ws"): (2, None),
+}
+
+
+# 버킷 용량 (연속 호출 허용 수): 용량만큼의 버스트가 초당 보충분에 더해지므로
+# 초당 한도 용량을 1로 두어 임의의 1초 구간 호출 수가 한도 + 1을 넘지 않게 함
+_BUCKET_BURST = 1.0
+
+
+def classify_tr(tr_id, api_url=""):
+    """TR ID → 레이트 리밋 분류 (token / approval / order / rest)"""
+    if api_url.startswith("/oauth2/Approval"):
+        return "approval"
+    if api_url.startswith("/oauth2"):
+        return "token"
+    # 주문/정정/취소 TR은 끝자리 U (조회는 R)
+    if tr_id and tr_id[-1] == "U":
+        return "order"
+    return "rest"
+
+
+class _TokenBucket:
+    """토큰 버킷 (예약 방식: 잔량이 음수가 되면 그만큼 대기 시간 반환)"""
+
+    def __init__(self, rate, capacity):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, now, n=1.0):
+        self._refill(now)
+        self.tokens -= n
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def drain(self, now, seconds):
+        self._refill(now)
+        self.tokens = min(self.tokens, -seconds * self.rate)
+
+    def available(self, now):
+        self._refill(now)
+        return max(0.0, self.tokens)
+
+
+class RateLimiter:
+    """환경/TR 분류별 초당·분당 토큰 버킷 레이트 리미터
+
+    acquire()는 스레드에서, acquire_async()는 이벤트 루프에서 사용합니다.
+    대기 시간은 잠금 안에서 예약하고 잠금 밖에서 대기하므로
+    여러 스레드/코루틴이 섞여도 합산 호출률이 한도를 넘지 않습니다.
+
+    사용 예:
+        rate_limiter.configure("prod", "all", per_second=15)
+        rate_limiter.acquire("prod", "rest")
+        rate_limiter.get_metrics()
+    """
+
+    def __init__(self, limits=None):
+        self._lock = threading.Lock()
+        self._limits = dict(DEFAULT_RATE_LIMITS if limits is None else limits)
+        self._buckets = {}
+        self._metrics = {}
+
+    def configure(self, env, tr_class, per_second=None, per_minute=None):
+        """한도 설정 (둘 다 None이면 해당 분류 제한 해제)"""
+        with self._lock:
+            if per_second is None and per_minute is None:
+                self._limits.pop((env, tr_class), None)
+            else:
+                self._limits[(env, tr_class)] = (per_second, per_minute)
+            self._buckets.pop((env, tr_class), None)
+
+    def _get_buckets(self, key):
+        if key not in self._buckets:
+            limit = self._limits.get(key)
+            buckets = []
+            if limit is not None:
+                per_second, per_minute = limit
+                if per_second:
+                    buckets.append(_TokenBucket(per_second, _BUCKET_BURST))
+                if per_minute:
+                    buckets.append(_TokenBucket(per_minute / 60.0, _BUCKET_BURST))
+            self._buckets[key] = buckets
+        return self._buckets[key]
+
+    def _keys(self, env, tr_class):
+        # 분류별 한도 + 앱키 전체 한도 (토큰 발급/웹소켓은 별도 한도만 적용)
+        if tr_class in ("token", "approval", "ws"):
+            return [(env, tr_class)]
+        return [(env, tr_class), (env, "all")]
+
+    def reserve(self, env, tr_class="rest"):
+        """토큰 1개 예약 후 대기해야 할 시간(초) 반환"""
+        with self._lock:
+            now = time.monotonic()
+            wait = 0.0
+            for key in self._keys(env, tr_class):
+                for bucket in self._get_buckets(key):
+                    wait = max(wait, bucket.reserve(now))
+            m = self._metrics.setdefault(
+                (env, tr_class), {"acquired": 0, "waited": 0, "wait_seconds": 0.0, "max_wait_seconds": 0.0}
+            )
+            m["acquired"] += 1
+            if wait > 0:
+                m["waited"] += 1
+                m["wait_seconds"] += wait
+                m["max_wait_seconds"] = max(m["max_wait_seconds"], wait)
+        return wait
+
+    def acquire(self, env, tr_class="rest"):
+        """토큰 획득 (필요 시 블로킹 대기), 대기한 시간 반환"""
+        wait = self.reserve(env, tr_class)
+        if wait > 0:
+            if _DEBUG:
+                print(f"[RateLimit] Waiting {wait:.3f}s ({env}/{tr_class})")
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, env, tr_class="rest"):
+        """토큰 획득 (asyncio 대기), 대기한 시간 반환"""
+        wait = self.reserve(env, tr_class)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def penalize(self, env, tr_class="rest", seconds=1.0):
+        """서버 한도 초과 응답(EGW00201) 시 버킷을 비워 seconds 동안 호출 보류"""
+        with self._lock:
+            now = time.monotonic()
+            for key in self._keys(env, tr_class):
+                for bucket in self._get_buckets(key):
+                    bucket.drain(now, seconds)
+
+    def get_metrics(self):
+        """분류별 호출/대기 통계와 남은 토큰 수"""
+        with self._lock:
+            now = time.monotonic()
+            result = {}
+            for (env, tr_class), limit in self._limits.items():
+                buckets = self._get_buckets((env, tr_class))
+                result[f"{env}/{tr_class}"] = {
+                    "per_second": limit[0],
+                    "per_minute": limit[1],
+                    "tokens_available": min((b.available(now) for b in buckets), default=None),
+                }
+            for (env, tr_class), m in self._metrics.items():
+                entry = result.setdefault(f"{env}/{tr_class}", {})
+                entry.update(m)
+                entry["avg_wait_seconds"] = m["wait_seconds"] / m["acquired"] if m["acquired"] else 0.0
+            return result
+
+
+# 프로세스 공용 레이트 리미터
+rate_limiter = RateLimiter()
+
+
+def _rate_env():
+    return "vps" if _isPaper else "prod"
 
 # 기본 헤더값 정의
 _base_headers = {
@@ -72,6 +253,15 @@ _base_headers = {
     "User-Agent": _cfg["my_agent"],
 }
 
+# HTTP 연결 재사용 (keep-alive: 호출마다 TCP/TLS 핸드셰이크 방지)
+_session = requests.Session()
+_session.mount(
+    "https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=20)
+)
+
+# 메모리 토큰 캐시 (토큰값, 만료일시) - 토큰 파일 YAML 재파싱 방지
+_token_cache = None
+
 
 # 토큰 발급 받아 저장 (토큰값, 토큰 유효시간,1일, 6시간 이내 발급신청시는 기존 토큰값과 동일, 발급시 알림톡 발송)
 def save_token(my_token, my_expired):
@@ -82,9 +272,21 @@ def save_token(my_token, my_expired):
         f.write(f"token: {my_token}\n")
         f.write(f"valid-date: {valid_date}\n")
 
+    global _token_cache
+    _token_cache = (my_token, valid_date)
+
 
 # 토큰 확인 (토큰값, 토큰 유효시간_1일, 6시간 이내 발급신청시는 기존 토큰값과 동일, 발급시 알림톡 발송)
 def read_token():
+    global _token_cache
+    # 메모리 캐시 우선 (만료 전이면 파일을 읽지 않음)
+    if _token_cache is not None:
+        token, valid_date = _token_cache
+        if valid_date > datetime.now():
+            return token
+        _token_cache = None
+        return None
+
     try:
         # 토큰이 저장된 파일 읽기
         with open(token_tmp, encoding="UTF-8") as f:
@@ -98,6 +300,7 @@ def read_token():
         # print('expire dt: ', exp_dt, ' vs now dt:', now_dt)
         # 저장된 토큰 만료일자 체크 (만료일시 > 현재일시 인경우 보관 토큰 리턴)
         if exp_dt > now_dt:
+            _token_cache = (tkg_tmp["token"], tkg_tmp["valid-date"])
             return tkg_tmp["token"]
         else:
             # print('Need new token: ', tkg_tmp['valid-date'])
@@ -111,7 +314,7 @@ def read_token():
 def _getBaseHeader():
     if _autoReAuth:
         reAuth()
-    return copy.deepcopy(_base_headers)
+    return dict(_base_headers)  # 값이 모두 문자열이므로 얕은 복사로 충분
 
 
 # 가져오기 : 앱키, 앱시크리트, 종합계좌번호(계좌번호 중 숫자8자리), 계좌상품코드(계좌번호 중 숫자2자리), 토큰, 도메인
@@ -191,10 +394,44 @@ def changeTREnv(token_key, svr="prod", product=_cfg["my_prod"]):
     _setTRENV(cfg)
 
 
-def _getResultObject(json_data):
-    _tc_ = namedtuple("res", json_data.keys())
+# 응답 필드 접근 객체: 파싱한 dict 하나를 감싸 속성으로 조회 (응답마다 namedtuple 클래스를 만들지 않음)
+# namedtuple처럼 body.output, body._fields, body._asdict(), 순회/인덱스 접근을 지원
+class APIRespData:
+    __slots__ = ("_data",)
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getattr__(self, name):
+        if name == "_data" or name.startswith("__"):
+            raise AttributeError(name)
+        try:
+            return self._data[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    @property
+    def _fields(self):
+        return tuple(self._data)
+
+    def _asdict(self):
+        return dict(self._data)
+
+    def __iter__(self):
+        return iter(self._data.values())
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, index):
+        return tuple(self._data.values())[index]
 
-    return _tc_(**json_data)
+    def __repr__(self):
+        return f"APIRespData({self._data!r})"
+
+
+def _getResultObject(json_data):
+    return APIRespData(json_data)
 
 
 # Token 발급, 유효기간 1일, 6시간 이내 발급시 기존 token값 유지, 발급시 알림톡 무조건 발송
@@ -221,7 +458,8 @@ def auth(svr="prod", product=_cfg["my_prod"], url=None):
     # print("saved_token: ", saved_token)
     if saved_token is None:  # 기존 발급 토큰 확인이 안되면 발급처리
         url = f"{_cfg[svr]}/oauth2/tokenP"
-        res = requests.post(
+        rate_limiter.acquire(svr, "token")
+        res = _session.post(
             url, data=json.dumps(p), headers=_getBaseHeader()
         )  # 토큰 발급
         rescode = res.status_code
@@ -281,7 +519,7 @@ def getTREnv():
 def set_order_hash_key(h, p):
     url = f"{getTREnv().my_url}/uapi/hashkey"  # hashkey 발급 API URL
 
-    res = requests.post(url, data=json.dumps(p), headers=h)
+    res = _session.post(url, data=json.dumps(p), headers=h)
     rescode = res.status_code
     if rescode == 200:
         h["hashkey"] = _getResultObject(res.json()).HASH
@@ -294,34 +532,52 @@ class APIResp:
     def __init__(self, resp):
         self._rescode = resp.status_code
         self._resp = resp
-        self._header = self._setHeader()
-        self._body = self._setBody()
-        self._err_code = self._body.msg_cd
-        self._err_message = self._body.msg1
+        # header/body는 처음 조회할 때 한 번만 만듦
+        self._header = None
+        self._body = None
 
     def getResCode(self):
         return self._rescode
 
     def _setHeader(self):
         fld = dict()
-        for x in self._resp.headers.keys():
-            if x.islower():
-                fld[x] = self._resp.headers.get(x)
-        _th_ = namedtuple("header", fld.keys())
+        for x, value in self._resp.headers.items():
+            if x.islower() and x.isidentifier():
+                fld[x] = value
 
-        return _th_(**fld)
+        return APIRespData(fld)
 
     def _setBody(self):
-        _tb_ = namedtuple("body", self._resp.json().keys())
-
-        return _tb_(**self._resp.json())
+        return APIRespData(_json_loads(self._resp.content))
 
     def getHeader(self):
+        if self._header is None:
+            self._header = self._setHeader()
         return self._header
 
     def getBody(self):
+        if self._body is None:
+            self._body = self._setBody()
         return self._body
 
+    def getFrame(self, output="output", numeric=None):
+        """body의 output 필드 → DataFrame (단건 dict는 1행)
+
+        Args:
+            output: body 필드명 (output, output1, output2 등)
+            numeric: 숫자로 변환할 컬럼 목록 (가격/수량 등 문자열로 오는 값, 변환 불가 값은 NaN)
+        """
+        rows = getattr(self.getBody(), output, None)
+        if not rows:
+            return pd.DataFrame()
+        if isinstance(rows, dict):
+            rows = [rows]
+        df = pd.DataFrame(rows)
+        for column in numeric or ():
+            if column in df.columns:
+                df[column] = pd.to_numeric(df[column], errors="coerce")
+        return df
+
     def getResponse(self):
         return self._resp
 
@@ -335,10 +591,10 @@ class APIResp:
             return False
 
     def getErrorCode(self):
-        return self._err_code
+        return getattr(self.getBody(), "msg_cd", "")
 
     def getErrorMessage(self):
-        return self._err_message
+        return getattr(self.getBody(), "msg1", "")
 
     def printAll(self):
         print("<Header>")
@@ -418,24 +674,7 @@ class APIRespError(APIResp):
 ########### API call wrapping : API 호출 공통
 
 
-def _url_fetch(
-        api_url, ptr_id, tr_cont, params, appendHeaders=None, postFlag=False, hashFlag=True
-):
-    global _last_api_call_time
-
-    # Rate Limiting: 모의투자 0.5초, 실전 0.05초 최소 간격 보장
-    with _rate_lock:
-        now = time.monotonic()
-        elapsed = now - _last_api_call_time
-        if elapsed < _smartSleep:
-            wait_time = _smartSleep - elapsed
-            if _DEBUG:
-                print(f"[RateLimit] Waiting {wait_time:.3f}s before API call")
-            time.sleep(wait_time)
-        _last_api_call_time = time.monotonic()
-
-    url = f"{getTREnv().my_url}{api_url}"
-
+def _build_headers(ptr_id, tr_cont, appendHeaders=None):
     headers = _getBaseHeader()  # 기본 header 값 정리
 
     # 추가 Header 설정
@@ -453,6 +692,19 @@ def _url_fetch(
             for x in appendHeaders.keys():
                 headers[x] = appendHeaders.get(x)
 
+    return tr_id, headers
+
+
+def _url_fetch(
+        api_url, ptr_id, tr_cont, params, appendHeaders=None, postFlag=False, hashFlag=True
+):
+    # Rate Limiting: 환경/TR 분류별 토큰 버킷 (스레드 간 공유)
+    rate_limiter.acquire(_rate_env(), classify_tr(ptr_id, api_url))
+
+    url = f"{getTREnv().my_url}{api_url}"
+
+    tr_id, headers = _build_headers(ptr_id, tr_cont, appendHeaders)
+
     if _DEBUG:
         print("< Sending Info >")
         print(f"URL: {url}, TR: {tr_id}")
@@ -461,9 +713,70 @@ def _url_fetch(
 
     if postFlag:
         # if (hashFlag): set_order_hash_key(headers, params)
-        res = requests.post(url, headers=headers, data=json.dumps(params))
+        res = _session.post(url, headers=headers, data=json.dumps(params))
+    else:
+        res = _session.get(url, headers=headers, params=params)
+
+    if res.status_code == 200:
+        ar = APIResp(res)
+        if _DEBUG:
+            ar.printAll()
+        return ar
+    else:
+        print("Error Code : " + str(res.status_code) + " | " + res.text)
+        return APIRespError(res.status_code, res.text)
+
+
+########### 비동기 API 호출 (keep-alive 연결 풀)
+
+# 이벤트 루프별 httpx.AsyncClient (클라이언트는 생성한 루프에서만 사용 가능)
+_async_clients = weakref.WeakKeyDictionary()
+ASYNC_POOL_SIZE = 20
+
+
+def _get_async_client():
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(30.0),
+            limits=httpx.Limits(
+                max_connections=ASYNC_POOL_SIZE,
+                max_keepalive_connections=ASYNC_POOL_SIZE,
+            ),
+        )
+        _async_clients[loop] = client
+    return client
+
+
+async def close_async_client():
+    """현재 이벤트 루프의 연결 풀 종료 (asyncio.run 종료 전 호출)"""
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def _url_fetch_async(
+        api_url, ptr_id, tr_cont, params, appendHeaders=None, postFlag=False
+):
+    """_url_fetch의 비동기 버전 - 공용 레이트 리미터와 연결 풀 사용"""
+    await rate_limiter.acquire_async(_rate_env(), classify_tr(ptr_id, api_url))
+
+    url = f"{getTREnv().my_url}{api_url}"
+
+    tr_id, headers = _build_headers(ptr_id, tr_cont, appendHeaders)
+
+    if _DEBUG:
+        print("< Sending Info >")
+        print(f"URL: {url}, TR: {tr_id}")
+        print(f"<header>\n{headers}")
+        print(f"<body>\n{params}")
+
+    client = _get_async_client()
+    if postFlag:
+        res = await client.post(url, headers=headers, content=json.dumps(params))
     else:
-        res = requests.get(url, headers=headers, params=params)
+        res = await client.get(url, headers=headers, params=params)
 
     if res.status_code == 200:
         ar = APIResp(res)
@@ -490,7 +803,7 @@ def _getBaseHeader_ws():
     if _autoReAuth:
         reAuth_ws()
 
-    return copy.deepcopy(_base_headers_ws)
+    return dict(_base_headers_ws)
 
 
 def auth_ws(svr="prod", product=_cfg["my_prod"]):
@@ -506,7 +819,8 @@ def auth_ws(svr="prod", product=_cfg["my_prod"]):
     p["secretkey"] = _cfg[ak2]
 
     url = f"{_cfg[svr]}/oauth2/Approval"
-    res = requests.post(url, data=json.dumps(p), headers=_getBaseHeader())  # 토큰 발급
+    rate_limiter.acquire(svr, "approval")
+    res = _session.post(url, data=json.dumps(p), headers=_getBaseHeader())  # 토큰 발급
     rescode = res.status_code
     if rescode == 200:  # 토큰 정상 발급
         approval_key = _getResultObject(res.json()).approval_key
@@ -667,6 +981,18 @@ def add_data_map(
         data_map[tr_id]["iv"] = iv
 
 
+def _split_records(data, count, columns):
+    """^ 구분 실시간 본문 → [{컬럼: 값}, ...] (건수만큼 컬럼 수 단위로 분할)"""
+    fields = data.split("^")
+    width = len(columns)
+    if count > 1 and width * count != len(fields):
+        width = len(fields) // count
+    return [
+        dict(zip(columns, fields[i * width:(i + 1) * width]))
+        for i in range(max(count, 1))
+    ]
+
+
 class KISWebSocket:
     api_url: str = ""
     on_result: Callable[
@@ -678,14 +1004,18 @@ class KISWebSocket:
     amx_retries: int = 0
 
     # init
-    def __init__(self, api_url: str, max_retries: int = 3):
+    # parse_mode: "dataframe"(기본) 또는 "records"(DataFrame 없이 {컬럼: 값} 리스트)
+    def __init__(self, api_url: str, max_retries: int = 3, parse_mode: str = "dataframe"):
+        if parse_mode not in ("dataframe", "records"):
+            raise ValueError("parse_mode must be 'dataframe' or 'records'")
         self.api_url = api_url
         self.max_retries = max_retries
+        self.parse_mode = parse_mode
 
     # private
     async def __subscriber(self, ws: websockets.ClientConnection):
         async for raw in ws:
-            logging.info("received message >> %s" % raw)
+            logging.info("received message >> %s", raw)
             show_result = False
 
             df = pd.DataFrame()
@@ -702,9 +1032,13 @@ class KISWebSocket:
                 if dm.get("encrypt", None) == "Y":
                     d = aes_cbc_base64_dec(dm["key"], dm["iv"], d)
 
-                df = pd.read_csv(
-                    StringIO(d), header=None, sep="^", names=dm["columns"], dtype=object
-                )
+                if self.parse_mode == "records":
+                    count = int(d1[2]) if d1[2].isdigit() else 1
+                    df = _split_records(d, count, dm["columns"])
+                else:
+                    df = pd.read_csv(
+                        StringIO(d), header=None, sep="^", names=dm["columns"], dtype=object
+                    )
 
                 show_result = True
 
@@ -768,8 +1102,8 @@ class KISWebSocket:
 
         logging.info("send message >> %s" % json.dumps(msg))
 
+        await rate_limiter.acquire_async(_rate_env(), "ws")
         await ws.send(json.dumps(msg))
-        smart_sleep()
 
     async def send_multiple(
             self,
@@ -26,10 +26,19 @@ from .lean.result_formatter import parse_lean_value
 # 전략 시스템
 from .strategies.registry import StrategyRegistry, STRATEGY_REGISTRY
 from .strategies.generator import StrategyGenerator, generate_strategy
-from .codegen.generator import LeanCodeGenerator
+from .codegen.generator import LeanCodeGenerator, CodeGenConfig
+
+# 네이티브 엔진
+from .native import NativeExecutor, StreamingEvaluator
+
+# 시장 데이터 저장소
+from .data import MarketDataStore
 
 logger = logging.getLogger(__name__)
 
+# 지원 백테스트 엔진
+ENGINES = ("lean", "native")
+
 
 class LeanClient:
     """Lean CLI 래핑 클라이언트
@@ -45,7 +54,8 @@ class LeanClient:
         engine_image: str = "quantconnect/lean:latest",
         data_provider: Optional[DataProvider] = None,
         brokerage_provider: Optional[BrokerageProvider] = None,
-        report_theme: Optional[BaseTheme] = None
+        report_theme: Optional[BaseTheme] = None,
+        engine: str = "lean",
     ):
         """
         Args:
@@ -56,9 +66,16 @@ class LeanClient:
             brokerage_provider: 브로커리지 제공자 (한투 등).
             report_theme: 리포트 테마.
                          None이면 KISTheme 사용.
+            engine: 백테스트 엔진 ("lean" 또는 "native").
+                    "native"는 Docker 없이 프로세스 내에서 전략을 평가합니다.
+                    (backtest_strategy, backtest_rule에 적용)
         """
+        if engine not in ENGINES:
+            raise ConfigurationError(f"알 수 없는 엔진: {engine} (지원: {', '.join(ENGINES)})")
+
         self._workspace_dir = workspace_dir or Path.cwd()
         self._engine_image = engine_image
+        self._engine = engine
         
         # Provider 설정
         self._data_provider = data_provider
@@ -67,6 +84,9 @@ class LeanClient:
         # 리포트 생성기
         self._report_generator = KISReportGenerator(theme=report_theme)
         
+        # 시장 데이터 저장소
+        self._store = MarketDataStore(Path(".lean-workspace") / "store")
+        
     @property
     def data_provider(self) -> Optional[DataProvider]:
         """데이터 제공자"""
@@ -76,6 +96,11 @@ class LeanClient:
     def brokerage_provider(self) -> Optional[BrokerageProvider]:
         """브로커리지 제공자"""
         return self._brokerage_provider
+
+    @property
+    def engine(self) -> str:
+        """백테스트 엔진 ("lean" 또는 "native")"""
+        return self._engine
     
     def backtest(
         self,
@@ -152,6 +177,8 @@ class LeanClient:
         initial_cash: float = 100_000_000,
         market_type: str = "krx",
         risk_management: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, pd.DataFrame]] = None,
+        include_benchmark: bool = True,
     ) -> BacktestResult:
         """전략 ID로 백테스트 실행
         
@@ -164,6 +191,8 @@ class LeanClient:
             initial_cash: 초기 자본금
             market_type: 시장 타입 ("krx" 또는 "us")
             risk_management: 리스크 관리 설정
+            data: 미리 수집한 데이터 딕셔너리 (없으면 data_provider에서 가져옴)
+            include_benchmark: KOSPI 벤치마크 수집 여부
         
         Returns:
             BacktestResult: 백테스트 결과 객체
@@ -182,12 +211,42 @@ class LeanClient:
             raise ConfigurationError(f"알 수 없는 전략: {strategy_id}")
         
         # Docker 확인
-        if not LeanExecutor.check_docker():
+        if self._engine == "lean" and not LeanExecutor.check_docker():
             raise DockerError("Docker가 실행되지 않았습니다.")
         
         # 1. 데이터 수집
-        logger.info(f"[Backtest] 데이터 수집 중: {symbols}")
-        data_dict = self._fetch_data(symbols, start_date, end_date, market_type)
+        if data is None:
+            logger.info(f"[Backtest] 데이터 수집 중: {symbols}")
+            data_dict = self._fetch_data(symbols, start_date, end_date, market_type)
+        else:
+            data_dict = data
+        
+        if self._engine == "native":
+            try:
+                schema = StrategyGenerator(
+                    strategy_id,
+                    symbols,
+                    start_date,
+                    end_date,
+                    initial_capital=initial_cash,
+                    market_type=market_type,
+                    params=params,
+                ).schema
+            except ValueError as e:
+                raise AlgorithmError(f"전략 스키마 생성 오류: {e}")
+            
+            run_id = f"bt_{datetime.now().strftime('%Y%m%d%H%M%S')}_{uuid.uuid4().hex[:6]}"
+            result = self._run_native(
+                schema, data_dict, symbols, start_date, end_date,
+                initial_cash, market_type, run_id,
+            )
+            result.strategy_id = strategy_id
+            
+            if market_type == "krx" and include_benchmark:
+                result.benchmark_curve = self._fetch_benchmark(start_date, end_date)
+            
+            logger.info(f"[Backtest] 완료 (native): {result.total_return_pct:.2%} 수익률")
+            return result
         
         # 2. 전략 코드 생성
         logger.info(f"[Backtest] 전략 코드 생성: {strategy_id}")
@@ -243,7 +302,7 @@ class LeanClient:
         result.run_id = run_id
         
         # 8. KOSPI 벤치마크 수집 (KRX 시장만)
-        if market_type == "krx":
+        if market_type == "krx" and include_benchmark:
             result.benchmark_curve = self._fetch_benchmark(start_date, end_date)
         
         logger.info(f"[Backtest] 완료: {result.total_return_pct:.2%} 수익률")
@@ -272,6 +331,10 @@ class LeanClient:
         
         Returns:
             BacktestResult: 백테스트 결과 객체
+        
+        Note:
+            QCAlgorithm 코드는 Lean에서만 실행 가능하므로 engine 설정과 무관하게
+            항상 Lean Docker로 실행됩니다.
         """
         # Docker 확인
         if not LeanExecutor.check_docker():
@@ -328,15 +391,13 @@ class LeanClient:
         end_date: str,
         market_type: str = "krx",
     ) -> Dict[str, pd.DataFrame]:
-        """데이터 수집 (캐시 우선, API 호출 간격 적용)"""
-        import time
-        from pathlib import Path
+        """데이터 수집 (저장소에 없는 구간만 API 조회, 호출 간격 적용)"""
+        from datetime import datetime
 
         if self._data_provider is None:
             raise ConfigurationError("data_provider가 설정되지 않았습니다.")
 
         # 문자열 → date 변환
-        from datetime import datetime, timedelta
         if isinstance(start_date, str):
             start_date_dt = datetime.strptime(start_date, "%Y-%m-%d").date()
         else:
@@ -346,98 +407,99 @@ class LeanClient:
         else:
             end_date_dt = end_date
 
-        # 캐시 디렉토리 (workspace)
-        workspace = Path(".lean-workspace")
-        cache_dir = workspace / "data" / "equity" / market_type / "daily"
+        store = self._store
+        # 기존 Lean CSV 캐시 (저장소 도입 이전 데이터 마이그레이션용)
+        legacy_dir = Path(".lean-workspace") / "data" / "equity" / market_type / "daily"
 
         data_dict = {}
-        api_call_count = 0
 
-        def check_cache_coverage(csv_path: Path) -> bool:
-            """캐시 파일이 요청 날짜 범위를 커버하는지 확인"""
-            try:
-                with open(csv_path, 'r') as f:
-                    lines = f.readlines()
-                if len(lines) < 2:
-                    return False
-
-                # 첫/마지막 줄에서 날짜 파싱 (YYYYMMDD 형식)
-                first_date = datetime.strptime(lines[0].split(",")[0], "%Y%m%d").date()
-                last_date = datetime.strptime(lines[-1].split(",")[0], "%Y%m%d").date()
+        # 1. 저장소 확인 (기존 CSV 캐시는 처음 한 번 가져오기)
+        for symbol in symbols:
+            if not store.has(symbol, market_type):
+                legacy_file = legacy_dir / f"{symbol.lower()}.csv"
+                if legacy_file.exists():
+                    try:
+                        store.import_lean_csv(legacy_file, symbol, market_type)
+                    except Exception as e:
+                        logger.warning(f"  - {symbol} 기존 CSV 가져오기 실패: {e}")
 
-                # 7일 허용 범위로 체크
-                tolerance = timedelta(days=7)
-                if first_date <= start_date_dt + tolerance and last_date >= end_date_dt - tolerance:
-                    return True
-                return False
-            except Exception:
-                return False
+        # 2. 조회하지 않은 구간만 API 호출
+        # 호출 간격은 kis_auth 공용 레이트 리미터가 관리
+        jobs = [
+            (symbol, gap_start, gap_end)
+            for symbol in symbols
+            for gap_start, gap_end in store.missing_ranges(
+                symbol, start_date_dt, end_date_dt, market_type
+            )
+        ]
+        fetched = {job[0] for job in jobs}
 
-        def load_from_cache(csv_path: Path) -> pd.DataFrame:
-            """캐시 파일에서 DataFrame 로드"""
-            rows = []
-            with open(csv_path, 'r') as f:
-                for line in f:
-                    parts = line.strip().split(",")
-                    if len(parts) >= 6:
-                        rows.append({
-                            "date": datetime.strptime(parts[0], "%Y%m%d"),
-                            "open": float(parts[1]),
-                            "high": float(parts[2]),
-                            "low": float(parts[3]),
-                            "close": float(parts[4]),
-                            "volume": int(parts[5]),
-                        })
-            return pd.DataFrame(rows)
+        def on_result(job, bars):
+            symbol, gap_start, gap_end = job
+            logger.info(f"  - {symbol}: API 조회 {gap_start}~{gap_end} ({len(bars)}건)")
+            store.record_fetch(symbol, bars, gap_start, gap_end, market_type)
 
-        for symbol in symbols:
-            # 1. 캐시 확인
-            cache_file = cache_dir / f"{symbol.lower()}.csv"
-            if cache_file.exists() and check_cache_coverage(cache_file):
+        if jobs and hasattr(self._data_provider, "get_history_ranges"):
+            # 종목·구간 동시 조회 (완료 순서대로 저장)
+            try:
+                self._data_provider.get_history_ranges(jobs, on_result=on_result)
+            except Exception as e:
+                logger.warning(f"  - 일괄 데이터 수집 실패: {e}")
+        else:
+            for job in jobs:
                 try:
-                    df = load_from_cache(cache_file)
-                    if not df.empty:
-                        data_dict[symbol] = df
-                        logger.info(f"  - {symbol}: 캐시 사용 ({len(df)}건)")
-                        continue
+                    bars = self._data_provider.get_history(
+                        job[0], job[1], job[2], Resolution.DAILY
+                    )
+                    on_result(job, bars)
                 except Exception as e:
-                    logger.warning(f"  - {symbol} 캐시 로드 실패: {e}")
-
-            # 2. API 호출 (간격 적용)
-            if api_call_count > 0:
-                time.sleep(0.5)  # API 호출 간격 0.5초
+                    logger.warning(f"  - {job[0]} 데이터 수집 실패 ({job[1]}~{job[2]}): {e}")
 
-            try:
-                bars = self._data_provider.get_history(
-                    symbol, start_date_dt, end_date_dt, Resolution.DAILY
-                )
-                api_call_count += 1
-
-                # Bar 리스트 → DataFrame
-                df = pd.DataFrame([
-                    {
-                        "date": bar.time,
-                        "open": bar.open,
-                        "high": bar.high,
-                        "low": bar.low,
-                        "close": bar.close,
-                        "volume": bar.volume,
-                    }
-                    for bar in bars
-                ])
-
-                if not df.empty:
-                    data_dict[symbol] = df
-                    logger.info(f"  - {symbol}: API 조회 ({len(df)}건)")
-
-            except Exception as e:
-                logger.warning(f"  - {symbol} 데이터 수집 실패: {e}")
+        for symbol in symbols:
+            df = store.read(symbol, market=market_type)
+            if not df.empty:
+                data_dict[symbol] = df
+                if symbol not in fetched:
+                    logger.info(f"  - {symbol}: 캐시 사용 ({len(df)}건)")
 
         if not data_dict:
             raise ConfigurationError("데이터를 수집할 수 없습니다.")
 
         return data_dict
     
+    def _run_native(
+        self,
+        schema,
+        data_dict: Dict[str, pd.DataFrame],
+        symbols: List[str],
+        start_date: str,
+        end_date: str,
+        initial_cash: float,
+        market_type: str,
+        run_id: str,
+    ) -> BacktestResult:
+        """네이티브 엔진으로 스키마 백테스트 실행 (Docker 불필요)"""
+        logger.info("[Backtest] 네이티브 엔진 실행 중")
+        config = CodeGenConfig(market=market_type, initial_capital=initial_cash)
+        try:
+            lean_run = NativeExecutor.run(
+                schema,
+                data_dict,
+                symbols,
+                start_date,
+                end_date,
+                initial_capital=initial_cash,
+                config=config,
+                run_id=run_id,
+            )
+        except ValueError as e:
+            raise ConfigurationError(str(e))
+
+        result = self._lean_run_to_result(lean_run, initial_cash)
+        result.run_id = run_id
+        result.symbols = symbols
+        return result
+
     def _lean_run_to_result(
         self,
         lean_run: LeanRun,
@@ -562,6 +624,7 @@ class LeanClient:
         market_type: str = "krx",
         on_progress: Optional[callable] = None,
         seed: Optional[int] = None,
+        early_stop: Optional[callable] = None,
     ) -> OptimizationResult:
         """파라미터 최적화
         
@@ -578,11 +641,13 @@ class LeanClient:
             target_direction: "max" 또는 "min"
             strategy: 탐색 전략 ("grid" 또는 "random")
             max_samples: random search 시 최대 샘플 수
-            max_workers: 동시 실행 수 (현재 순차 실행)
+            max_workers: 동시 실행 수 (Lean 컨테이너/워커 수)
             initial_cash: 초기 자본금
             market_type: 시장 타입 ("krx" 또는 "us")
-            on_progress: 진행 콜백 (completed, total, run) -> None
+            on_progress: 진행 콜백 (completed, total, run) -> None (완료 순서)
             seed: 랜덤 시드 (재현성용)
+            early_stop: 조기 종료 조건 (completed_runs) -> bool.
+                        True 반환 시 대기 중인 실행을 취소
         
         Returns:
             OptimizationResult: 최적화 결과
@@ -611,7 +676,7 @@ class LeanClient:
             raise ConfigurationError(f"알 수 없는 전략: {strategy_id}")
         
         # Docker 확인
-        if not LeanExecutor.check_docker():
+        if self._engine == "lean" and not LeanExecutor.check_docker():
             raise DockerError("Docker가 실행되지 않았습니다.")
         
         # 최적화기 생성 및 실행
@@ -634,6 +699,7 @@ class LeanClient:
             market_type=market_type,
             on_progress=on_progress,
             seed=seed,
+            early_stop=early_stop,
         )
     
     def backtest_rule(
@@ -683,13 +749,12 @@ class LeanClient:
         """
         from .dsl.builder import StrategyRule
         from .core.converters import from_definition
-        from .codegen.generator import LeanCodeGenerator, CodeGenConfig
 
         if not isinstance(rule, StrategyRule):
             raise ConfigurationError("rule은 RuleBuilder.build()로 생성한 StrategyRule이어야 합니다.")
 
         # Docker 확인
-        if not LeanExecutor.check_docker():
+        if self._engine == "lean" and not LeanExecutor.check_docker():
             raise DockerError("Docker가 실행되지 않았습니다.")
 
         logger.info(f"[Backtest] RuleBuilder 전략 실행: {rule.name}")
@@ -702,6 +767,17 @@ class LeanClient:
         strategy_def = rule.to_strategy_definition()
         schema = from_definition(strategy_def)
 
+        if self._engine == "native":
+            run_id = f"bt_rule_{datetime.now().strftime('%Y%m%d%H%M%S')}_{uuid.uuid4().hex[:6]}"
+            result = self._run_native(
+                schema, data_dict, symbols, start_date, end_date,
+                initial_cash, market_type, run_id,
+            )
+            result.strategy_id = rule.name
+
+            logger.info(f"[Backtest] 완료 (native): {rule.name}")
+            return result
+
         # 3. Lean 코드 직접 생성
         config = CodeGenConfig(
             market=market_type,
@@ -1032,6 +1108,7 @@ class LiveClient:
         self._brokerage = brokerage_provider
         self._running = False
         self._ws_client = None
+        self._evaluator: Optional[StreamingEvaluator] = None
     
     def submit_order(
         self,
@@ -1100,7 +1177,8 @@ class LiveClient:
         self,
         symbols: List[str],
         on_bar,
-        timeout: Optional[float] = None
+        timeout: Optional[float] = None,
+        interval: Optional[str] = None
     ):
         """실시간 데이터 구독
         
@@ -1108,11 +1186,26 @@ class LiveClient:
             symbols: 종목코드 리스트
             on_bar: 콜백 함수 (symbol, Bar) -> None
             timeout: 타임아웃 (초). None이면 무한 실행
+            interval: 봉 해상도 ("1s", "1m", "5m", "100t" 등). None이면 체결마다 호출
         """
         if self._data_provider is None:
             raise ConfigurationError("data_provider가 설정되지 않았습니다.")
         
-        return self._data_provider.subscribe_realtime(symbols, on_bar, timeout=timeout)
+        kwargs = {"interval": interval} if interval else {}
+        return self._data_provider.subscribe_realtime(symbols, on_bar, timeout=timeout, **kwargs)
+    
+    def get_realtime_bars(self, symbol: str, interval: str, count: Optional[int] = None):
+        """실시간 구독으로 완성된 봉 조회 (오래된 순)
+        
+        Args:
+            symbol: 종목코드
+            interval: 구독 시 지정한 봉 해상도
+            count: 최근 N개 (None이면 보관 중인 전체)
+        """
+        aggregator = getattr(self._data_provider, "bar_aggregator", None)
+        if aggregator is None:
+            return []
+        return aggregator.history(symbol, interval, count)
     
     def subscribe_fills(self, on_fill, timeout: Optional[float] = None):
         """체결 통보 구독
@@ -1131,7 +1224,9 @@ class LiveClient:
         symbols: List[str],
         on_bar,
         on_fill=None,
-        timeout: Optional[float] = None
+        timeout: Optional[float] = None,
+        interval: Optional[str] = None,
+        strategy=None
     ):
         """전략 실행 (실시간 데이터 + 체결 통보)
         
@@ -1140,6 +1235,11 @@ class LiveClient:
             on_bar: 실시간 데이터 콜백 (symbol, Bar) -> None
             on_fill: 체결 통보 콜백 (Order) -> None
             timeout: 타임아웃 (초). None이면 무한 실행
+            interval: 봉 해상도 ("1s", "1m", "5m", "100t" 등).
+                지정 시 on_bar는 봉 마감마다 호출 (None이면 체결마다)
+            strategy: StrategyDefinition/StrategySchema 또는 StreamingEvaluator.
+                지정 시 봉마다 지표와 진입/청산 조건을 증분 평가한 뒤 on_bar 호출
+                (on_bar 안에서 get_signal(symbol)로 조회, interval과 함께 사용)
         
         사용 예:
             def on_bar(symbol, bar):
@@ -1149,13 +1249,33 @@ class LiveClient:
             def on_fill(order):
                 print(f"체결: {order.symbol} {order.filled_quantity}주")
             
-            live.run_strategy(["005930"], on_bar, on_fill, timeout=3600)
+            live.run_strategy(["005930"], on_bar, on_fill, timeout=3600, interval="1m")
+        
+        전략 정의 평가:
+            def on_bar(symbol, bar):
+                signal = live.get_signal(symbol)
+                if signal.entry:
+                    live.submit_order(symbol, "buy", 1)
+            
+            live.run_strategy(symbols, on_bar, interval="1m", strategy=StrategyRegistry.build("sma_crossover"))
         """
         if self._data_provider is None:
             raise ConfigurationError("data_provider가 설정되지 않았습니다.")
         
+        # 전략 정의 증분 평가 (지표/조건 갱신 후 on_bar 호출)
+        if strategy is not None:
+            evaluator = strategy if isinstance(strategy, StreamingEvaluator) else StreamingEvaluator(strategy)
+            user_on_bar = on_bar
+            
+            def on_bar(symbol, bar):
+                evaluator.update(symbol, bar)
+                user_on_bar(symbol, bar)
+            
+            self._evaluator = evaluator
+        
         # WebSocket 클라이언트 설정
-        ws_client = self._data_provider.subscribe_realtime_async(symbols, on_bar)
+        kwargs = {"interval": interval} if interval else {}
+        ws_client = self._data_provider.subscribe_realtime_async(symbols, on_bar, **kwargs)
         
         # 체결 통보 구독 (동일한 WebSocket에 추가)
         if on_fill and self._brokerage:
@@ -1199,11 +1319,22 @@ class LiveClient:
         logger.info(f"전략 실행 시작: {symbols}")
         
         # 블로킹 실행
-        ws_client.start(timeout=timeout)
+        try:
+            ws_client.start(timeout=timeout)
+        finally:
+            # 봉 타이머 종료 후 진행 중인 봉 전달
+            if interval and hasattr(self._data_provider, "flush_realtime_bars"):
+                self._data_provider.flush_realtime_bars()
         
         self._running = False
         logger.info("전략 실행 종료")
     
+    def get_signal(self, symbol: str):
+        """run_strategy(strategy=...)의 마지막 평가 결과 (StrategySignal, 없으면 None)"""
+        if self._evaluator is None:
+            return None
+        return self._evaluator.signal(symbol)
+    
     def stop(self):
         """전략 실행 중지"""
         if self._ws_client:
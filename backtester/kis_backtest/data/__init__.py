@@ -0,0 +1,10 @@
+"""시장 데이터 저장소 및 실시간 봉 집계"""
+
+from .bars import BarAggregator, parse_interval
+from .store import MarketDataStore
+
+__all__ = [
+    "BarAggregator",
+    "MarketDataStore",
+    "parse_interval",
+]
@@ -0,0 +1,428 @@
+"""실시간 체결 → OHLCV 봉 집계
+
+실시간 체결(H0STCNT0)을 종목별로 시간봉(1s/1m/5m 등) 또는 N틱봉으로 집계합니다.
+
+- 봉 OHLC는 체결가, 거래량은 체결량(CNTG_VOL) 합계로 계산 (당일 누적 시/고/저가를 쓰지 않음)
+- 봉 시간은 구간 시작 시각 (예: 1분봉 09:01:00 = 09:01:00~09:01:59 체결)
+- 완성된 봉은 종목 × 해상도별로 미리 할당한 링 버퍼(BAR_DTYPE)에 보관
+- 봉은 구간 경계가 지나면 마감되어 구독자에게 한 번만 전달:
+    같은 종목의 다음 구간 체결이 오면 즉시,
+    체결이 없는 종목은 다른 종목 체결 시각(거래소 시계)이 경계 + grace초를 지나면 마감
+- 이미 마감된 구간의 늦은 체결은 late_policy에 따라 버리거나("drop") 현재 봉에 합산("merge")
+- 체결이 끊긴 종목의 마지막 봉은 start_clock()의 벽시계 타이머가 advance()로 마감
+- 날짜가 바뀌면 진행 중인 봉을 전일 날짜로 마감하고 종목별 상태/시계를 초기화
+
+사용 예:
+    aggregator = BarAggregator()
+    aggregator.subscribe("1m", on_bar)          # on_bar(symbol, Bar)
+    aggregator.start_clock()
+    ws.subscribe_price(symbols, aggregator.on_price)
+    ws.start()
+    aggregator.stop_clock()
+    aggregator.flush()                          # 종료 시 미완성 봉 전달
+"""
+
+import logging
+import re
+import threading
+from datetime import date, datetime, time as dt_time, timedelta
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from ..models import Bar, Resolution
+from .store import BAR_DTYPE
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CAPACITY = 1024  # 종목 × 해상도별 보관 봉 수
+DEFAULT_GRACE = 2  # 다른 종목 체결 시각 기준 마감 유예 (초)
+DEFAULT_CLOCK_PERIOD = 1.0  # start_clock() 기본 주기 (초)
+LATE_POLICIES = ("drop", "merge")
+
+_NS_PER_SECOND = 1_000_000_000
+_INTERVAL_PATTERN = re.compile(r"^(\d+)\s*(s|sec|m|min|h|t|tick)$")
+_INTERVAL_UNITS = {"s": 1, "sec": 1, "m": 60, "min": 60, "h": 3600}
+_RESOLUTION_INTERVALS = {
+    Resolution.TICK: ("tick", 1),
+    Resolution.SECOND: ("time", 1),
+    Resolution.MINUTE: ("time", 60),
+    Resolution.HOUR: ("time", 3600),
+}
+
+BarInterval = Union[str, Resolution]
+
+
+def parse_interval(interval: BarInterval) -> Tuple[str, int]:
+    """해상도 문자열 해석
+
+    Args:
+        interval: "1s", "30s", "1m", "5m", "1h", "100t"(100틱) 또는 Resolution
+
+    Returns:
+        ("time", 초) 또는 ("tick", 틱 수)
+    """
+    if isinstance(interval, Resolution):
+        if interval not in _RESOLUTION_INTERVALS:
+            raise ValueError(f"실시간 집계를 지원하지 않는 해상도: {interval}")
+        return _RESOLUTION_INTERVALS[interval]
+
+    match = _INTERVAL_PATTERN.match(str(interval).strip().lower())
+    if not match or int(match.group(1)) <= 0:
+        raise ValueError(f"잘못된 봉 해상도: {interval} (예: 1s, 1m, 5m, 100t)")
+    size, unit = int(match.group(1)), match.group(2)
+    if unit in ("t", "tick"):
+        return "tick", size
+    seconds = size * _INTERVAL_UNITS[unit]
+    if 86400 % seconds:
+        raise ValueError(f"하루를 나누어 떨어지지 않는 봉 해상도: {interval}")
+    return "time", seconds
+
+
+def _seconds_of_day(value: Union[str, datetime]) -> int:
+    """체결시간(HHMMSS 문자열 또는 datetime) → 자정 기준 초"""
+    if isinstance(value, datetime):
+        return value.hour * 3600 + value.minute * 60 + value.second
+    return int(value[0:2]) * 3600 + int(value[2:4]) * 60 + int(value[4:6])
+
+
+class _BarSeries:
+    """종목 1개 × 해상도 1개의 진행 중 봉과 완성 봉 링 버퍼"""
+
+    __slots__ = (
+        "kind", "size", "buffer", "count",
+        "start", "open", "high", "low", "close", "volume", "ticks", "last_start",
+    )
+
+    def __init__(self, kind: str, size: int, capacity: int):
+        self.kind = kind
+        self.size = size
+        self.buffer = np.zeros(capacity, dtype=BAR_DTYPE)
+        self.count = 0  # 지금까지 완성된 봉 수 (버퍼 위치 = count % capacity)
+        self.start: Optional[int] = None  # 진행 중 봉 시작 (자정 기준 초), 없으면 None
+        self.open = self.high = self.low = self.close = 0.0
+        self.volume = 0
+        self.ticks = 0
+        self.last_start = -1  # 마지막으로 마감된 봉 시작 (늦은 체결 판정용)
+
+    def begin(self, start: int, price: float, volume: int) -> None:
+        self.start = start
+        self.open = self.high = self.low = self.close = price
+        self.volume = volume
+        self.ticks = 1
+
+    def add(self, price: float, volume: int) -> None:
+        if price > self.high:
+            self.high = price
+        elif price < self.low:
+            self.low = price
+        self.close = price
+        self.volume += volume
+        self.ticks += 1
+
+    def merge(self, price: float, volume: int) -> None:
+        """늦은 체결 합산 (종가는 유지)"""
+        if price > self.high:
+            self.high = price
+        elif price < self.low:
+            self.low = price
+        self.volume += volume
+        self.ticks += 1
+
+    def close_bar(self, day_start: datetime, day_start_ns: int) -> Bar:
+        start = self.start
+        self.buffer[self.count % len(self.buffer)] = (
+            day_start_ns + start * _NS_PER_SECOND,
+            self.open, self.high, self.low, self.close, self.volume,
+        )
+        self.count += 1
+        self.last_start = start
+        self.start = None
+        return Bar(
+            time=day_start + timedelta(seconds=start),
+            open=self.open,
+            high=self.high,
+            low=self.low,
+            close=self.close,
+            volume=self.volume,
+        )
+
+    def records(self, count: Optional[int] = None) -> np.ndarray:
+        """완성된 봉 (오래된 순)"""
+        capacity = len(self.buffer)
+        available = min(self.count, capacity)
+        count = available if count is None else min(count, available)
+        end = self.count % capacity
+        indices = (np.arange(end - count, end) % capacity) if count else np.empty(0, dtype=int)
+        return self.buffer[indices]
+
+
+class BarAggregator:
+    """실시간 체결 → 종목별 OHLCV 봉 집계기
+
+    Args:
+        capacity: 종목 × 해상도별 보관할 완성 봉 수 (링 버퍼)
+        late_policy: 마감된 구간의 늦은 체결 처리 ("drop": 버림, "merge": 현재 봉 고/저가·거래량에 합산)
+        grace: 체결이 없는 종목의 봉을 다른 종목 체결 시각 기준으로 마감할 때의 유예 (초)
+        session_date: 봉 시간의 날짜 고정 (기본: 체결 수신일, 날짜가 바뀌면 새 거래일로 전환)
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        late_policy: str = "drop",
+        grace: int = DEFAULT_GRACE,
+        session_date: Optional[date] = None,
+    ):
+        if late_policy not in LATE_POLICIES:
+            raise ValueError(f"late_policy는 {LATE_POLICIES} 중 하나여야 합니다: {late_policy}")
+        self.capacity = capacity
+        self.late_policy = late_policy
+        self.grace = grace
+        self._session_date = session_date
+        self._day_start: Optional[datetime] = None
+        self._day_start_ns = 0
+        self._intervals: Dict[Tuple[str, int], List[Callable[[str, Bar], None]]] = {}
+        self._series: Dict[Tuple[str, int], Dict[str, _BarSeries]] = {}
+        self._clock = -1  # 수신한 체결 중 가장 늦은 시각 (자정 기준 초)
+        self._lock = threading.Lock()
+        self._clock_thread: Optional[threading.Thread] = None
+        self._clock_stop = threading.Event()
+        self.late_ticks = 0
+
+    # ========== 구독 ==========
+    def subscribe(self, interval: BarInterval, on_bar: Callable[[str, Bar], None]) -> Tuple[str, int]:
+        """해상도별 봉 구독
+
+        Args:
+            interval: "1s", "1m", "5m", "100t" 또는 Resolution
+            on_bar: 봉 마감 시 콜백 (symbol, Bar)
+
+        Returns:
+            해상도 키 ("time", 초) / ("tick", 틱 수) - history() 조회에 사용 가능
+        """
+        key = parse_interval(interval)
+        with self._lock:
+            self._intervals.setdefault(key, []).append(on_bar)
+            self._series.setdefault(key, {})
+        return key
+
+    # ========== 입력 ==========
+    def on_price(self, symbol: str, price) -> None:
+        """KISWebSocket.subscribe_price 콜백 (RealtimePrice)"""
+        self.on_tick(symbol, price.time, price.price, price.volume)
+
+    def on_tick(self, symbol: str, tick_time: Union[str, datetime], price: float, volume: int) -> None:
+        """체결 1건 반영
+
+        Args:
+            symbol: 종목코드
+            tick_time: 체결시간 (HHMMSS 문자열 또는 datetime)
+            price: 체결가
+            volume: 체결량
+        """
+        try:
+            seconds = _seconds_of_day(tick_time)
+        except (TypeError, ValueError, IndexError):
+            logger.warning(f"체결시간 파싱 오류: {symbol} {tick_time!r}")
+            return
+        price = float(price)
+
+        emitted: List[Tuple[Callable, str, Bar]] = []
+        with self._lock:
+            if not self._enter_day(self._tick_day(tick_time), emitted):
+                self.late_ticks += 1  # 이미 지난 거래일의 체결
+                return
+
+            for key, by_symbol in self._series.items():
+                series = by_symbol.get(symbol)
+                if series is None:
+                    series = by_symbol[symbol] = _BarSeries(key[0], key[1], self.capacity)
+                bar = self._apply(series, seconds, price, volume)
+                if bar is not None:
+                    emitted.extend((callback, symbol, bar) for callback in self._intervals[key])
+
+            # 거래소 시계가 넘어가면 체결이 없는 종목의 지난 봉도 마감
+            if seconds > self._clock:
+                self._clock = seconds
+                emitted.extend(self._close_expired(seconds - self.grace))
+
+        self._emit(emitted)
+
+    def advance(self, tick_time: Union[str, datetime]) -> None:
+        """체결 없이 시각만 진행 (타이머 등에서 호출해 경계가 지난 봉 마감)"""
+        seconds = _seconds_of_day(tick_time)
+        emitted: List[Tuple[Callable, str, Bar]] = []
+        with self._lock:
+            if self._day_start is None:
+                return
+            if not self._enter_day(self._tick_day(tick_time), emitted):
+                return
+            if seconds > self._clock:
+                self._clock = seconds
+                emitted.extend(self._close_expired(seconds - self.grace))
+        self._emit(emitted)
+
+    def start_clock(self, period: float = DEFAULT_CLOCK_PERIOD) -> None:
+        """벽시계로 advance()를 주기적으로 호출하는 스레드 시작
+
+        체결이 끊긴 종목(비유동 종목, 장 마감)의 마지막 봉도 경계 + grace초가 지나면 마감되고,
+        자정이 지나면 거래일이 전환됩니다. 실시간 수신용이며 과거 체결 재생에는 쓰지 않습니다.
+        """
+        with self._lock:
+            if self._clock_thread is not None:
+                return
+            self._clock_stop = threading.Event()
+            self._clock_thread = threading.Thread(
+                target=self._run_clock, args=(period, self._clock_stop), name="bar-clock", daemon=True
+            )
+            thread = self._clock_thread
+        thread.start()
+
+    def stop_clock(self) -> None:
+        """start_clock() 스레드 종료"""
+        with self._lock:
+            thread, self._clock_thread = self._clock_thread, None
+            self._clock_stop.set()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def flush(self) -> None:
+        """진행 중인 봉 모두 마감 (구독 종료 시)"""
+        with self._lock:
+            emitted = self._close_all()
+        self._emit(emitted)
+
+    # ========== 조회 ==========
+    def history(self, symbol: str, interval: BarInterval, count: Optional[int] = None) -> List[Bar]:
+        """완성된 봉 조회 (오래된 순, 최대 capacity개)"""
+        records = self.history_array(symbol, interval, count)
+        return [
+            Bar(
+                time=pd.Timestamp(int(r["date"])).to_pydatetime(),
+                open=float(r["open"]),
+                high=float(r["high"]),
+                low=float(r["low"]),
+                close=float(r["close"]),
+                volume=int(r["volume"]),
+            )
+            for r in records
+        ]
+
+    def history_array(self, symbol: str, interval: BarInterval, count: Optional[int] = None) -> np.ndarray:
+        """완성된 봉 조회 (BAR_DTYPE 배열, 오래된 순)"""
+        key = parse_interval(interval)
+        with self._lock:
+            series = self._series.get(key, {}).get(symbol)
+            if series is None:
+                return np.zeros(0, dtype=BAR_DTYPE)
+            return series.records(count).copy()
+
+    # ========== 내부 ==========
+    def _tick_day(self, tick_time: Union[str, datetime]) -> date:
+        """체결이 속한 거래일 (session_date 지정 시 고정, 아니면 datetime의 날짜 또는 오늘)"""
+        if self._session_date is not None:
+            return self._session_date
+        if isinstance(tick_time, datetime):
+            return tick_time.date()
+        return datetime.now().date()
+
+    def _enter_day(self, day: date, emitted: List[Tuple[Callable, str, Bar]]) -> bool:
+        """거래일 확인/전환 (지난 거래일이면 False)
+
+        날짜가 바뀌면 진행 중인 봉을 전일 날짜로 마감하고, 종목별 늦은 체결 기준과
+        거래소 시계를 초기화합니다. 완성 봉 버퍼(history)는 유지합니다.
+        """
+        if self._day_start is not None:
+            current = self._day_start.date()
+            if day == current:
+                return True
+            if day < current:
+                return False
+            emitted.extend(self._close_all())
+            for by_symbol in self._series.values():
+                for series in by_symbol.values():
+                    series.last_start = -1
+                    series.ticks = 0
+            self._clock = -1
+            logger.info(f"거래일 전환: {current} → {day}")
+        self._day_start = datetime.combine(day, dt_time())
+        self._day_start_ns = pd.Timestamp(self._day_start).value
+        return True
+
+    def _close_all(self) -> List[Tuple[Callable, str, Bar]]:
+        """진행 중인 봉 모두 마감"""
+        emitted = []
+        for key, by_symbol in self._series.items():
+            for symbol, series in by_symbol.items():
+                if series.start is not None:
+                    bar = series.close_bar(self._day_start, self._day_start_ns)
+                    emitted.extend((callback, symbol, bar) for callback in self._intervals[key])
+        return emitted
+
+    def _run_clock(self, period: float, stop: threading.Event) -> None:
+        while not stop.wait(period):
+            try:
+                self.advance(datetime.now())
+            except Exception as e:
+                logger.error(f"봉 타이머 오류: {e}")
+
+    def _apply(self, series: _BarSeries, seconds: int, price: float, volume: int) -> Optional[Bar]:
+        """체결을 봉에 반영하고 마감된 봉이 있으면 반환"""
+        if series.kind == "tick":
+            if series.start is None:
+                series.begin(seconds, price, volume)
+            else:
+                series.add(price, volume)
+            if series.ticks >= series.size:
+                return series.close_bar(self._day_start, self._day_start_ns)
+            return None
+
+        start = seconds - seconds % series.size
+        if series.start is None:
+            if start <= series.last_start:
+                return self._late(series, start, price, volume)
+            series.begin(start, price, volume)
+            return None
+        if start == series.start:
+            series.add(price, volume)
+            return None
+        if start < series.start:
+            return self._late(series, start, price, volume)
+
+        bar = series.close_bar(self._day_start, self._day_start_ns)
+        series.begin(start, price, volume)
+        return bar
+
+    def _late(self, series: _BarSeries, start: int, price: float, volume: int) -> None:
+        self.late_ticks += 1
+        if self.late_policy == "merge":
+            if series.start is None:
+                # 마감 직후라 진행 중 봉이 없으면 거래소 시계 기준 현재 구간 봉을 연다
+                clock_start = max(self._clock - self._clock % series.size, series.last_start + series.size)
+                series.begin(clock_start, price, volume)
+            else:
+                series.merge(price, volume)
+        return None
+
+    def _close_expired(self, until: int) -> List[Tuple[Callable, str, Bar]]:
+        """경계(봉 시작 + 해상도)가 until 이하인 진행 중 시간봉 마감"""
+        emitted = []
+        for key, by_symbol in self._series.items():
+            if key[0] != "time":
+                continue
+            for symbol, series in by_symbol.items():
+                if series.start is not None and series.start + series.size <= until:
+                    bar = series.close_bar(self._day_start, self._day_start_ns)
+                    emitted.extend((callback, symbol, bar) for callback in self._intervals[key])
+        return emitted
+
+    @staticmethod
+    def _emit(emitted: List[Tuple[Callable, str, Bar]]) -> None:
+        # 콜백은 잠금 밖에서 호출 (콜백 안에서 history() 조회 가능)
+        for callback, symbol, bar in emitted:
+            try:
+                callback(symbol, bar)
+            except Exception as e:
+                logger.error(f"봉 콜백 오류: {symbol} - {e}")
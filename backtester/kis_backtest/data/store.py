@@ -0,0 +1,615 @@
+"""컬럼형 시장 데이터 저장소
+
+종목별 OHLCV를 메모리 매핑 가능한 NumPy 구조체 배열(.npy)로 저장하고,
+종목별 날짜 커버리지 인덱스(_index.json)를 함께 관리합니다.
+
+디렉토리 구조:
+    {root}/{market}/{resolution}/{symbol}.npy
+    {root}/{market}/{resolution}/_index.json
+    {root}/{market}/_calendar.json         (거래일/종목별 결측일/확정 휴장일)
+
+요청 범위 중 조회한 적 없는 구간만 missing_ranges()로 계산해 받아오고,
+write()로 멱등 병합합니다. 주말과 휴장일(확정 또는 여러 종목이 함께 결측인 날)만
+남는 구간은 다시 요청하지 않습니다.
+
+Lean CSV는 저장소의 원본이 아니며, Lean 엔진이 필요할 때만 export_lean_csv()로 생성합니다.
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from ..models import Bar
+
+logger = logging.getLogger(__name__)
+
+# 저장 레코드 형식 (date: datetime64[ns] 정수값)
+BAR_DTYPE = np.dtype([
+    ("date", "<i8"),
+    ("open", "<f8"),
+    ("high", "<f8"),
+    ("low", "<f8"),
+    ("close", "<f8"),
+    ("volume", "<f8"),
+])
+
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+INDEX_FILE = "_index.json"
+CALENDAR_FILE = "_calendar.json"
+
+# 빈 응답을 휴장일로 간주해 조회 완료로 기록할 최대 영업일 수
+MAX_EMPTY_GAP_DAYS = 5
+
+# 확정 휴장일이 아닌 날을 휴장일로 보려면 함께 결측이어야 하는 최소 종목 수
+HOLIDAY_MIN_SYMBOLS = 3
+
+DateLike = Union[str, date, datetime, pd.Timestamp]
+
+
+def _to_date(value: DateLike) -> date:
+    """YYYY-MM-DD / YYYYMMDD / date / datetime → date"""
+    if isinstance(value, pd.Timestamp):
+        return value.date()
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    text = str(value).strip()
+    fmt = "%Y%m%d" if len(text) == 8 and text.isdigit() else "%Y-%m-%d"
+    return datetime.strptime(text[:10], fmt).date()
+
+
+def _date_to_ns(value: date) -> int:
+    return int(pd.Timestamp(value).value)
+
+
+def _merge_ranges(ranges: List[Tuple[date, date]]) -> List[Tuple[date, date]]:
+    """겹치거나 맞닿은 날짜 구간 병합"""
+    merged: List[Tuple[date, date]] = []
+    for start, end in sorted(ranges):
+        if merged and (start - merged[-1][1]).days <= 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class MarketDataStore:
+    """종목/시장/해상도 단위 컬럼형 시장 데이터 저장소
+
+    Example:
+        store = MarketDataStore()
+        store.write("005930", df, start="2024-01-01", end="2024-12-31")
+        if store.covers("005930", "2024-03-01", "2024-06-30"):
+            df = store.read("005930", "2024-03-01", "2024-06-30")
+        store.export_lean_csv(["005930"], ".lean-workspace/data/equity/krx/daily")
+    """
+
+    def __init__(self, root: Optional[Union[str, Path]] = None):
+        """
+        Args:
+            root: 저장소 루트 (None이면 {Lean 워크스페이스}/store)
+        """
+        if root is None:
+            from ..lean.project_manager import LeanProjectManager
+            root = LeanProjectManager.workspace / "store"
+        self.root = Path(root)
+        self._lock = threading.RLock()
+        self._indexes: Dict[Tuple[str, str], Dict[str, Dict]] = {}
+        self._calendars: Dict[Tuple[str, str], Dict[str, object]] = {}
+
+    # ============================================================
+    # 경로 / 인덱스
+    # ============================================================
+
+    def _dir(self, market: str, resolution: str) -> Path:
+        return self.root / market / str(getattr(resolution, "value", resolution))
+
+    def _path(self, symbol: str, market: str, resolution: str) -> Path:
+        return self._dir(market, resolution) / f"{symbol.lower()}.npy"
+
+    def _index(self, market: str, resolution: str) -> Dict[str, Dict]:
+        """커버리지 인덱스 로드 (메모리 캐시)"""
+        key = (market, str(getattr(resolution, "value", resolution)))
+        with self._lock:
+            if key not in self._indexes:
+                index_path = self._dir(market, resolution) / INDEX_FILE
+                index: Dict[str, Dict] = {}
+                if index_path.exists():
+                    try:
+                        index = json.loads(index_path.read_text())
+                    except (OSError, ValueError) as e:
+                        logger.warning(f"[Store] 인덱스 로드 실패 ({index_path}): {e}")
+                self._indexes[key] = index
+            return self._indexes[key]
+
+    def _calendar(self, market: str) -> Dict[str, object]:
+        """시장 달력 로드 (YYYYMMDD 정수)
+
+        trading: 봉이 관측된 거래일
+        absent: {날짜: 그 날 봉이 없던 종목} (종목의 첫 봉~마지막 봉 사이 평일만)
+        confirmed: add_holidays()로 등록한 확정 휴장일
+        """
+        key = (market, CALENDAR_FILE)
+        with self._lock:
+            if key not in self._calendars:
+                path = self.root / market / CALENDAR_FILE
+                calendar = {"trading": set(), "absent": {}, "confirmed": set()}
+                if path.exists():
+                    try:
+                        raw = json.loads(path.read_text())
+                        # 이전 형식의 holidays(단일 종목 결측으로 추정한 값)는 신뢰하지 않고 버림
+                        calendar["trading"] = set(raw.get("trading", []))
+                        calendar["confirmed"] = set(raw.get("confirmed", []))
+                        calendar["absent"] = {
+                            int(day): set(symbols) for day, symbols in raw.get("absent", {}).items()
+                        }
+                    except (OSError, ValueError) as e:
+                        logger.warning(f"[Store] 달력 로드 실패 ({path}): {e}")
+                self._calendars[key] = calendar
+            return self._calendars[key]
+
+    def _save_calendar(self, market: str) -> None:
+        directory = self.root / market
+        directory.mkdir(parents=True, exist_ok=True)
+        calendar = self._calendar(market)
+        data = {
+            "trading": sorted(calendar["trading"]),
+            "confirmed": sorted(calendar["confirmed"]),
+            "absent": {str(day): sorted(symbols) for day, symbols in sorted(calendar["absent"].items())},
+        }
+        tmp_path = directory / f".{CALENDAR_FILE}.{os.getpid()}.{threading.get_ident()}.tmp"
+        tmp_path.write_text(json.dumps(data))
+        os.replace(tmp_path, directory / CALENDAR_FILE)
+
+    def _record_calendar(
+        self, market: str, symbol: str, start: date, end: date, bar_dates: np.ndarray
+    ) -> None:
+        """조회 구간의 거래일과 종목별 결측일 기록
+
+        결측일은 종목의 첫 봉~마지막 봉 사이 평일만 기록하므로 상장 전/상장폐지 후 날짜는
+        남지 않습니다. 거래정지일도 결측으로 남지만, 휴장일은 HOLIDAY_MIN_SYMBOLS개 이상
+        종목이 함께 결측이고 거래일로 관측된 적 없는 날만 인정합니다 (_holiday_set).
+
+        Args:
+            bar_dates: 종목의 저장된 전체 봉 날짜 (정렬, datetime64[ns] 정수)
+        """
+        if len(bar_dates) == 0:
+            return
+        calendar = self._calendar(market)
+        lo = int(np.searchsorted(bar_dates, _date_to_ns(start), side="left"))
+        hi = int(np.searchsorted(bar_dates, _date_to_ns(end + timedelta(days=1)), side="left"))
+        traded = set(
+            pd.to_datetime(bar_dates[lo:hi]).strftime("%Y%m%d").astype(int).tolist()
+        )
+        calendar["trading"] |= traded
+
+        first = max(start, pd.Timestamp(int(bar_dates[0])).date())
+        last = min(end, pd.Timestamp(int(bar_dates[-1])).date())
+        days = pd.bdate_range(first, last) if first <= last else []
+        if len(days):
+            symbol = symbol.lower()
+            absent = calendar["absent"]
+            for day in set(days.strftime("%Y%m%d").astype(int).tolist()) - traded:
+                absent.setdefault(day, set()).add(symbol)
+        self._save_calendar(market)
+
+    def _holiday_set(self, market: str) -> set:
+        """확정 휴장일 + 여러 종목이 함께 결측이고 거래일로 관측된 적 없는 날"""
+        calendar = self._calendar(market)
+        inferred = {
+            day for day, symbols in calendar["absent"].items()
+            if len(symbols) >= HOLIDAY_MIN_SYMBOLS
+        }
+        return calendar["confirmed"] | (inferred - calendar["trading"])
+
+    def add_holidays(self, days: Iterable[DateLike], market: str = "krx") -> None:
+        """확정 휴장일 등록 (거래소 휴장일 API 등 실제 시장 달력)"""
+        with self._lock:
+            calendar = self._calendar(market)
+            calendar["confirmed"] |= {int(_to_date(d).strftime("%Y%m%d")) for d in days}
+            self._save_calendar(market)
+
+    def holidays(self, market: str = "krx") -> List[date]:
+        """휴장일 목록 (확정 + 여러 종목 관측으로 추정)"""
+        return [_to_date(str(d)) for d in sorted(self._holiday_set(market))]
+
+    def _save_index(self, market: str, resolution: str) -> None:
+        directory = self._dir(market, resolution)
+        directory.mkdir(parents=True, exist_ok=True)
+        index_path = directory / INDEX_FILE
+        tmp_path = directory / f".{INDEX_FILE}.{os.getpid()}.{threading.get_ident()}.tmp"
+        tmp_path.write_text(json.dumps(self._index(market, resolution), indent=1, sort_keys=True))
+        os.replace(tmp_path, index_path)
+
+    # ============================================================
+    # 조회
+    # ============================================================
+
+    def symbols(self, market: str = "krx", resolution: str = "daily") -> List[str]:
+        """저장된 종목 목록"""
+        return sorted(self._index(market, resolution).keys())
+
+    def has(self, symbol: str, market: str = "krx", resolution: str = "daily") -> bool:
+        """종목 데이터 존재 여부"""
+        return symbol.lower() in self._index(market, resolution)
+
+    def ranges(
+        self,
+        symbol: str,
+        market: str = "krx",
+        resolution: str = "daily",
+    ) -> List[Tuple[date, date]]:
+        """종목의 조회 완료 구간 목록 (병합됨, 시간순)"""
+        entry = self._index(market, resolution).get(symbol.lower())
+        if not entry:
+            return []
+        return [(_to_date(s), _to_date(e)) for s, e in entry.get("ranges", [])]
+
+    def coverage(
+        self,
+        symbol: str,
+        market: str = "krx",
+        resolution: str = "daily",
+    ) -> Optional[Tuple[date, date]]:
+        """종목의 전체 커버리지 (첫 구간 시작 ~ 마지막 구간 끝)"""
+        ranges = self.ranges(symbol, market, resolution)
+        if not ranges:
+            return None
+        return ranges[0][0], ranges[-1][1]
+
+    def missing_ranges(
+        self,
+        symbol: str,
+        start: DateLike,
+        end: DateLike,
+        market: str = "krx",
+        resolution: str = "daily",
+    ) -> List[Tuple[date, date]]:
+        """요청 범위 중 아직 조회하지 않은 구간 목록
+
+        조회 완료 구간을 빼고, 주말/휴장일만 남는 구간은 제외하며,
+        남은 구간은 첫/마지막 영업일로 좁혀 반환합니다.
+        """
+        req_start, req_end = _to_date(start), _to_date(end)
+        if req_end < req_start:
+            return []
+
+        gaps: List[Tuple[date, date]] = []
+        cursor = req_start
+        for first, last in self.ranges(symbol, market, resolution):
+            if last < cursor:
+                continue
+            if first > req_end:
+                break
+            if first > cursor:
+                gaps.append((cursor, min(req_end, first - timedelta(days=1))))
+            cursor = max(cursor, last + timedelta(days=1))
+            if cursor > req_end:
+                break
+        if cursor <= req_end:
+            gaps.append((cursor, req_end))
+
+        holidays = self._holiday_set(market)
+        result: List[Tuple[date, date]] = []
+        for gap_start, gap_end in gaps:
+            days = [
+                d for d in pd.bdate_range(gap_start, gap_end)
+                if int(d.strftime("%Y%m%d")) not in holidays
+            ]
+            if days:
+                result.append((days[0].date(), days[-1].date()))
+        return result
+
+    def covers(
+        self,
+        symbol: str,
+        start: DateLike,
+        end: DateLike,
+        market: str = "krx",
+        resolution: str = "daily",
+    ) -> bool:
+        """요청 범위를 모두 조회했는지 확인 (주말/휴장일 제외)"""
+        return not self.missing_ranges(symbol, start, end, market, resolution)
+
+    def _load_array(self, symbol: str, market: str, resolution: str) -> Optional[np.ndarray]:
+        path = self._path(symbol, market, resolution)
+        if not path.exists():
+            return None
+        return np.load(path, mmap_mode="r")
+
+    def read(
+        self,
+        symbol: str,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        market: str = "krx",
+        resolution: str = "daily",
+    ) -> pd.DataFrame:
+        """종목 데이터 읽기
+
+        Returns:
+            DataFrame(date, open, high, low, close, volume). 없으면 빈 DataFrame
+        """
+        arr = self._load_array(symbol, market, resolution)
+        if arr is None or len(arr) == 0:
+            return pd.DataFrame(columns=["date"] + OHLCV_COLUMNS)
+
+        dates = arr["date"]
+        lo = 0 if start is None else int(np.searchsorted(dates, _date_to_ns(_to_date(start)), side="left"))
+        if end is None:
+            hi = len(arr)
+        else:
+            end_ns = _date_to_ns(_to_date(end)) + pd.Timedelta(days=1).value
+            hi = int(np.searchsorted(dates, end_ns, side="left"))
+
+        chunk = np.array(arr[lo:hi])
+        df = pd.DataFrame({col: chunk[col] for col in OHLCV_COLUMNS})
+        df.insert(0, "date", pd.to_datetime(chunk["date"]))
+        return df
+
+    def read_many(
+        self,
+        symbols: Iterable[str],
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        market: str = "krx",
+        resolution: str = "daily",
+    ) -> Dict[str, pd.DataFrame]:
+        """여러 종목 읽기 (데이터 없는 종목 제외)"""
+        result: Dict[str, pd.DataFrame] = {}
+        for symbol in symbols:
+            df = self.read(symbol, start, end, market, resolution)
+            if not df.empty:
+                result[symbol] = df
+        return result
+
+    # ============================================================
+    # 쓰기
+    # ============================================================
+
+    @staticmethod
+    def _to_array(df: pd.DataFrame) -> np.ndarray:
+        """DataFrame → 날짜 정렬/중복 제거된 구조체 배열"""
+        frame = df
+        if "date" not in frame.columns:
+            frame = frame.reset_index()
+            frame = frame.rename(columns={frame.columns[0]: "date"})
+        dates = pd.to_datetime(frame["date"]).dt.normalize()
+
+        arr = np.empty(len(frame), dtype=BAR_DTYPE)
+        arr["date"] = dates.to_numpy(dtype="datetime64[ns]").astype("int64")
+        for col in OHLCV_COLUMNS:
+            arr[col] = frame[col].to_numpy(dtype=float)
+
+        # 날짜 기준 정렬, 같은 날짜는 마지막 값 우선
+        order = np.argsort(arr["date"], kind="stable")
+        arr = arr[order]
+        keep = np.ones(len(arr), dtype=bool)
+        keep[:-1] = arr["date"][1:] != arr["date"][:-1]
+        return arr[keep]
+
+    def write(
+        self,
+        symbol: str,
+        df: pd.DataFrame,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        market: str = "krx",
+        resolution: str = "daily",
+        save_index: bool = True,
+    ) -> int:
+        """종목 데이터 병합 저장 (같은 날짜는 새 값으로 교체, 멱등)
+
+        Args:
+            df: DataFrame(date, open, high, low, close, volume)
+            start/end: 이번에 조회한 요청 범위 (없으면 데이터 첫/마지막 날짜)
+            save_index: 인덱스 파일 즉시 저장 여부 (일괄 저장 시 False)
+
+        Returns:
+            저장 후 전체 행 수
+        """
+        new = self._to_array(df) if len(df) else np.empty(0, dtype=BAR_DTYPE)
+        if start is None and len(new):
+            start = pd.Timestamp(int(new["date"][0])).date()
+        if end is None and len(new):
+            end = pd.Timestamp(int(new["date"][-1])).date()
+        if start is None or end is None:
+            return 0
+
+        with self._lock:
+            existing = self._load_array(symbol, market, resolution)
+            if existing is not None and len(existing):
+                merged = np.concatenate([np.array(existing), new])
+                order = np.argsort(merged["date"], kind="stable")
+                merged = merged[order]
+                # 같은 날짜는 뒤(새 데이터)를 남김
+                keep = np.ones(len(merged), dtype=bool)
+                keep[:-1] = merged["date"][1:] != merged["date"][:-1]
+                merged = merged[keep]
+            else:
+                merged = new
+            existing = None  # mmap 해제 후 교체
+
+            directory = self._dir(market, resolution)
+            directory.mkdir(parents=True, exist_ok=True)
+            path = self._path(symbol, market, resolution)
+            tmp_path = directory / f".{symbol.lower()}.{os.getpid()}.{threading.get_ident()}.tmp.npy"
+            np.save(tmp_path, merged)
+            os.replace(tmp_path, path)
+
+            # 당일 봉은 장중 미완성일 수 있으므로 커버리지는 전일까지만 기록
+            req_start, req_end = _to_date(start), _to_date(end)
+            req_end = min(req_end, date.today() - timedelta(days=1))
+
+            index = self._index(market, resolution)
+            ranges = self.ranges(symbol, market, resolution)
+            if req_start <= req_end:
+                ranges = _merge_ranges(ranges + [(req_start, req_end)])
+                if str(getattr(resolution, "value", resolution)) == "daily":
+                    self._record_calendar(market, symbol, req_start, req_end, merged["date"])
+            index[symbol.lower()] = {
+                "ranges": [[s.isoformat(), e.isoformat()] for s, e in ranges],
+                "rows": int(len(merged)),
+                "updated_at": datetime.now().isoformat(timespec="seconds"),
+            }
+            if save_index:
+                self._save_index(market, resolution)
+
+        return int(len(merged))
+
+    def write_many(
+        self,
+        data: Dict[str, pd.DataFrame],
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        market: str = "krx",
+        resolution: str = "daily",
+    ) -> Dict[str, int]:
+        """여러 종목 일괄 저장 (인덱스는 마지막에 한 번만 저장)"""
+        with self._lock:
+            rows = {
+                symbol: self.write(symbol, df, start, end, market, resolution, save_index=False)
+                for symbol, df in data.items()
+            }
+            self._save_index(market, resolution)
+        return rows
+
+    def write_bars(
+        self,
+        symbol: str,
+        bars: List["Bar"],
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        market: str = "krx",
+        resolution: str = "daily",
+    ) -> int:
+        """Bar 리스트 병합 저장 (write와 동일)"""
+        df = pd.DataFrame({
+            "date": [bar.time for bar in bars],
+            "open": [bar.open for bar in bars],
+            "high": [bar.high for bar in bars],
+            "low": [bar.low for bar in bars],
+            "close": [bar.close for bar in bars],
+            "volume": [bar.volume for bar in bars],
+        })
+        return self.write(symbol, df, start, end, market, resolution)
+
+    def fill_gaps(
+        self,
+        symbol: str,
+        start: DateLike,
+        end: DateLike,
+        fetch: Callable[[date, date], List["Bar"]],
+        market: str = "krx",
+        resolution: str = "daily",
+    ) -> List[Tuple[date, date]]:
+        """조회하지 않은 구간만 fetch로 받아와 병합 저장
+
+        Args:
+            fetch: (gap_start, gap_end) -> Bar 리스트
+
+        Returns:
+            실제로 조회한 구간 목록
+
+        빈 응답은 짧은 구간(영업일 MAX_EMPTY_GAP_DAYS일 이하)일 때만 조회 완료로 기록합니다.
+        긴 구간의 빈 응답은 API 오류일 수 있으므로 다음 요청 때 다시 조회합니다.
+        """
+        fetched: List[Tuple[date, date]] = []
+        for gap_start, gap_end in self.missing_ranges(symbol, start, end, market, resolution):
+            bars = fetch(gap_start, gap_end)
+            fetched.append((gap_start, gap_end))
+            self.record_fetch(symbol, bars, gap_start, gap_end, market, resolution)
+        return fetched
+
+    def record_fetch(
+        self,
+        symbol: str,
+        bars: List["Bar"],
+        start: DateLike,
+        end: DateLike,
+        market: str = "krx",
+        resolution: str = "daily",
+    ) -> bool:
+        """구간 조회 결과 저장 (fill_gaps와 같은 빈 응답 규칙 적용)
+
+        Returns:
+            커버리지 기록 여부
+        """
+        if bars or len(pd.bdate_range(start, end)) <= MAX_EMPTY_GAP_DAYS:
+            self.write_bars(symbol, bars, start, end, market, resolution)
+            return True
+        logger.warning(f"[Store] {symbol} {start}~{end}: 빈 응답 - 커버리지 미기록")
+        return False
+
+    # ============================================================
+    # Lean CSV 연동
+    # ============================================================
+
+    def export_lean_csv(
+        self,
+        symbols: Iterable[str],
+        output_dir: Union[str, Path],
+        market: str = "krx",
+        resolution: str = "daily",
+    ) -> Dict[str, Path]:
+        """Lean 엔진용 CSV 생성 (저장소보다 최신인 CSV는 건너뜀)
+
+        Returns:
+            {symbol: csv_path}
+        """
+        from ..lean.data_converter import DataConverter
+
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        market_type = "krx" if market == "krx" else "us"
+
+        exported: Dict[str, Path] = {}
+        for symbol in symbols:
+            src = self._path(symbol, market, resolution)
+            if not src.exists():
+                continue
+            csv_path = output_path / f"{symbol.lower()}.csv"
+            if csv_path.exists() and csv_path.stat().st_mtime >= src.stat().st_mtime:
+                exported[symbol] = csv_path
+                continue
+            df = self.read(symbol, market=market, resolution=resolution)
+            if df.empty:
+                continue
+            exported[symbol] = DataConverter._export_symbol(symbol, df, output_path, market_type)
+        return exported
+
+    def import_lean_csv(
+        self,
+        csv_path: Union[str, Path],
+        symbol: Optional[str] = None,
+        market: str = "krx",
+        resolution: str = "daily",
+    ) -> int:
+        """기존 Lean CSV 캐시를 저장소로 가져오기 (마이그레이션용)
+
+        Returns:
+            저장 후 전체 행 수 (가져올 데이터가 없으면 0)
+        """
+        csv_path = Path(csv_path)
+        symbol = symbol or csv_path.stem
+        df = pd.read_csv(
+            csv_path,
+            header=None,
+            names=["date"] + OHLCV_COLUMNS,
+            usecols=range(6),
+            dtype={"date": str},
+        )
+        if df.empty:
+            return 0
+        df["date"] = pd.to_datetime(df["date"], format="%Y%m%d")
+        return self.write(symbol, df, market=market, resolution=resolution)
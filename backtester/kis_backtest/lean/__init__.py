@@ -1,6 +1,7 @@
 """Lean 백테스팅 엔진 래퍼"""
 
 from .executor import LeanExecutor, LeanRun
+from .container_pool import LeanContainerPool
 from .project_manager import LeanProject, LeanProjectManager
 from .data_converter import DataConverter
 from .result_formatter import ResultFormatter
@@ -16,6 +17,7 @@ from .optimizer import (
 __all__ = [
     "LeanExecutor",
     "LeanRun",
+    "LeanContainerPool",
     "LeanProject", 
     "LeanProjectManager",
     "DataConverter",
@@ -0,0 +1,342 @@
+"""Lean 컨테이너 풀
+
+N개의 Lean 컨테이너를 띄워 두고 백테스트 작업을 재사용 실행.
+
+`LeanExecutor.run`은 백테스트마다 `docker run --rm`으로 컨테이너를 만들고
+지우기 때문에 짧은 일봉 백테스트에서는 컨테이너 기동 비용이 실행 시간을 압도합니다.
+풀은 컨테이너를 한 번만 기동하고 작업 큐에서 꺼낸 프로젝트를
+`docker exec`로 같은 컨테이너 안에서 실행합니다.
+
+마운트 구조:
+    {workspace}/projects → /Projects      (작업 디렉토리, 프로젝트별 main.py/결과)
+    {workspace}/data     → /Data:ro       (공유 읽기 전용 데이터)
+    {workspace}/pool/lean-config.json → 런처 기본 config.json
+
+Example:
+    with LeanContainerPool(size=4) as pool:
+        LeanExecutor.set_pool(pool)
+        result = client.optimize(..., max_workers=4)
+        LeanExecutor.set_pool(None)
+"""
+
+import json
+import logging
+import queue
+import subprocess
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .executor import LEAN_IMAGE, LeanExecutor, LeanRun
+from .project_manager import LeanProject, LeanProjectManager
+
+logger = logging.getLogger(__name__)
+
+# 컨테이너 안 Lean 런처 명령 (이미지 WORKDIR 기준)
+LEAN_LAUNCHER_CMD = ["dotnet", "QuantConnect.Lean.Launcher.dll"]
+
+# 컨테이너를 살려 두는 명령 (엔트리포인트 대체)
+KEEPALIVE_CMD = ["sleep", "infinity"]
+
+# 컨테이너 내부 마운트 경로
+CONTAINER_PROJECTS = "/Projects"
+CONTAINER_DATA = "/Data"
+CONTAINER_CONFIG = "/Lean/Launcher/bin/Debug/config.json"
+
+
+@dataclass
+class _PoolJob:
+    """풀 작업 단위"""
+    project: LeanProject
+    timeout: int
+    future: Future
+    queued_at: float = field(default_factory=time.monotonic)
+
+
+class LeanContainerPool:
+    """상시 실행 Lean 컨테이너 풀
+
+    Attributes:
+        size: 컨테이너 수 (= 동시 실행 수)
+        image: Lean Docker 이미지 (테스트용 가짜 이미지 지정 가능)
+        launcher_cmd: 컨테이너 안에서 실행할 런처 명령
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        workspace: Optional[Path] = None,
+        image: str = LEAN_IMAGE,
+        launcher_cmd: Optional[List[str]] = None,
+        timeout: int = 600,
+    ):
+        """
+        Args:
+            size: 컨테이너 수
+            workspace: Lean 워크스페이스 (None이면 LeanProjectManager.workspace)
+            image: Lean Docker 이미지
+            launcher_cmd: 런처 명령 (기본 dotnet QuantConnect.Lean.Launcher.dll)
+            timeout: 작업별 기본 타임아웃 (초)
+        """
+        self.size = max(1, int(size))
+        self.workspace = Path(workspace or LeanProjectManager.workspace).resolve()
+        self.image = image
+        self.launcher_cmd = launcher_cmd or list(LEAN_LAUNCHER_CMD)
+        self.timeout = timeout
+
+        self._pool_id = uuid.uuid4().hex[:8]
+        self._queue: "queue.Queue[Optional[_PoolJob]]" = queue.Queue()
+        self._containers: List[str] = []
+        self._workers: List[threading.Thread] = []
+        self._running = False
+        self._lock = threading.Lock()
+
+        # 통계
+        self._completed = 0
+        self._failed = 0
+        self._total_wait = 0.0
+        self._total_run = 0.0
+
+    # ============================================================
+    # 수명 주기
+    # ============================================================
+
+    @property
+    def is_running(self) -> bool:
+        """풀 실행 여부"""
+        return self._running
+
+    def start(self) -> "LeanContainerPool":
+        """컨테이너 기동 및 워커 시작"""
+        if self._running:
+            return self
+
+        LeanProjectManager.init_workspace()
+        projects_path = self.workspace / "projects"
+        data_path = self.workspace / "data"
+        projects_path.mkdir(parents=True, exist_ok=True)
+        data_path.mkdir(parents=True, exist_ok=True)
+
+        pool_dir = self.workspace / "pool"
+        pool_dir.mkdir(parents=True, exist_ok=True)
+        config_path = pool_dir / "lean-config.json"
+        config_path.write_text(json.dumps(LeanExecutor.build_lean_config(), indent=2))
+
+        for i in range(self.size):
+            name = f"kis-lean-pool-{self._pool_id}-{i}"
+            self._start_container(name, projects_path, data_path, config_path)
+            self._containers.append(name)
+
+        self._running = True
+        for name in self._containers:
+            worker = threading.Thread(
+                target=self._worker_loop,
+                args=(name,),
+                name=f"lean-pool-{name}",
+                daemon=True,
+            )
+            worker.start()
+            self._workers.append(worker)
+
+        logger.info(f"[LeanPool] 시작: 컨테이너 {self.size}개 ({self.image})")
+        return self
+
+    def stop(self) -> None:
+        """워커 종료 및 컨테이너 제거 (대기 중 작업은 취소)"""
+        if not self._running:
+            return
+        self._running = False
+
+        # 대기 중 작업 취소
+        while True:
+            try:
+                job = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None:
+                job.future.cancel()
+
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join(timeout=self.timeout)
+        self._workers.clear()
+
+        for name in self._containers:
+            self._docker(["rm", "-f", name], timeout=30)
+        self._containers.clear()
+
+        logger.info(f"[LeanPool] 종료: 완료 {self._completed}, 실패 {self._failed}")
+
+    def __enter__(self) -> "LeanContainerPool":
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    # ============================================================
+    # 작업 제출
+    # ============================================================
+
+    def submit(self, project: LeanProject, timeout: Optional[int] = None) -> Future:
+        """백테스트 작업 제출
+
+        Returns:
+            Future[LeanRun]
+        """
+        if not self._running:
+            raise RuntimeError("Lean 컨테이너 풀이 실행 중이 아닙니다.")
+
+        projects_path = (self.workspace / "projects").resolve()
+        if project.project_dir.resolve().parent != projects_path:
+            raise RuntimeError(
+                f"프로젝트가 풀 워크스페이스 밖에 있습니다: {project.project_dir}"
+            )
+
+        future: Future = Future()
+        self._queue.put(_PoolJob(project=project, timeout=timeout or self.timeout, future=future))
+        return future
+
+    def run(self, project: LeanProject, timeout: Optional[int] = None) -> LeanRun:
+        """백테스트 실행 (완료까지 대기)
+
+        Raises:
+            RuntimeError: 실행 실패 시 (LeanExecutor.run과 동일)
+        """
+        return self.submit(project, timeout=timeout).result()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 통계"""
+        with self._lock:
+            done = self._completed + self._failed
+            return {
+                "size": self.size,
+                "running": self._running,
+                "queued": self._queue.qsize(),
+                "completed": self._completed,
+                "failed": self._failed,
+                "avg_queue_wait_seconds": self._total_wait / done if done else 0.0,
+                "avg_run_seconds": self._total_run / done if done else 0.0,
+            }
+
+    # ============================================================
+    # 내부
+    # ============================================================
+
+    def _docker(self, args: List[str], timeout: int) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            ["docker", *args],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+
+    def _start_container(
+        self,
+        name: str,
+        projects_path: Path,
+        data_path: Path,
+        config_path: Path,
+    ) -> None:
+        """상시 실행 컨테이너 기동"""
+        cmd = [
+            "run", "-d", "--name", name,
+            "-v", f"{projects_path.resolve()}:{CONTAINER_PROJECTS}",
+            "-v", f"{data_path.resolve()}:{CONTAINER_DATA}:ro",
+            "-v", f"{config_path.resolve()}:{CONTAINER_CONFIG}:ro",
+            "--entrypoint", KEEPALIVE_CMD[0],
+            self.image,
+            *KEEPALIVE_CMD[1:],
+        ]
+        try:
+            result = self._docker(cmd, timeout=120)
+        except FileNotFoundError:
+            raise RuntimeError("Docker가 설치되지 않았습니다.")
+        if result.returncode != 0:
+            raise RuntimeError(f"Lean 컨테이너 기동 실패 ({name}): {result.stderr.strip()}")
+
+    def _restart_container(self, name: str) -> None:
+        """타임아웃 등으로 상태가 불확실한 컨테이너 재시작"""
+        logger.warning(f"[LeanPool] 컨테이너 재시작: {name}")
+        self._docker(["restart", "-t", "0", name], timeout=60)
+
+    def _worker_loop(self, container: str) -> None:
+        """컨테이너 하나를 담당하는 워커"""
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+            if not job.future.set_running_or_notify_cancel():
+                continue
+
+            wait = time.monotonic() - job.queued_at
+            try:
+                run = self._execute(container, job.project, job.timeout)
+                run.queue_wait_seconds = wait
+                with self._lock:
+                    self._completed += 1
+                    self._total_wait += wait
+                    self._total_run += run.duration_seconds
+                job.future.set_result(run)
+            except Exception as e:
+                with self._lock:
+                    self._failed += 1
+                    self._total_wait += wait
+                job.future.set_exception(e)
+
+    def _execute(self, container: str, project: LeanProject, timeout: int) -> LeanRun:
+        """컨테이너 안에서 Lean 런처 실행"""
+        started_at = datetime.now()
+        output_dir = project.output_dir
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        job_dir = f"{CONTAINER_PROJECTS}/{project.project_dir.name}"
+        job_config = LeanExecutor.build_lean_config(**{
+            "algorithm-location": f"{job_dir}/main.py",
+            "results-destination-folder": f"{job_dir}/backtests",
+        })
+        config_path = project.project_dir / "lean-config.json"
+        config_path.write_text(json.dumps(job_config, indent=2))
+
+        cmd = [
+            "exec", container,
+            *self.launcher_cmd,
+            "--config", f"{job_dir}/lean-config.json",
+            "--algorithm-location", f"{job_dir}/main.py",
+            "--results-destination-folder", f"{job_dir}/backtests",
+        ]
+
+        logger.info(f"[LeanPool] 실행: {project.run_id} @ {container}")
+        try:
+            result = self._docker(cmd, timeout=timeout)
+        except subprocess.TimeoutExpired:
+            self._restart_container(container)
+            raise RuntimeError(f"Lean 백테스트 타임아웃 ({timeout}초)")
+
+        finished_at = datetime.now()
+        duration = (finished_at - started_at).total_seconds()
+
+        if result.returncode != 0:
+            stdout = result.stdout + result.stderr
+            error_msg = f"Lean 백테스트 실패 (exit code: {result.returncode})\n{stdout[-2000:]}"
+            logger.error(f"[LeanPool] {error_msg}")
+            raise RuntimeError(error_msg)
+
+        run = LeanRun(
+            project=project,
+            success=True,
+            output_dir=output_dir,
+            duration_seconds=duration,
+            started_at=started_at,
+            finished_at=finished_at,
+            container=container,
+        )
+        run.load_result()
+
+        logger.info(f"[LeanPool] 완료: {project.run_id} ({duration:.1f}초)")
+        return run
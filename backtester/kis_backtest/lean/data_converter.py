@@ -4,6 +4,8 @@ KIS OpenAPI 데이터를 Lean이 읽을 수 있는 CSV 포맷으로 변환.
 """
 
 import logging
+import os
+import threading
 from pathlib import Path
 from typing import Dict, List, TYPE_CHECKING
 
@@ -102,13 +104,16 @@ class DataConverter:
             df_out['volume'] = df_out['volume'].astype(int)
         
         # CSV 출력 (헤더 없음)
+        # 임시 파일에 쓴 뒤 교체 - 병렬 실행 중인 컨테이너가 잘린 파일을 읽지 않도록
         csv_path = output_dir / f"{symbol.lower()}.csv"
+        tmp_path = output_dir / f".{symbol.lower()}.{os.getpid()}.{threading.get_ident()}.tmp"
         
         df_out[['date_str', 'open', 'high', 'low', 'close', 'volume']].to_csv(
-            csv_path,
+            tmp_path,
             index=False,
             header=False,
         )
+        os.replace(tmp_path, csv_path)
         
         return csv_path
     
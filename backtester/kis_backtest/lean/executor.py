@@ -6,10 +6,13 @@ Docker 컨테이너로 Lean 백테스트 직접 실행. (Lean CLI 불필요)
 import json
 import logging
 import subprocess
+import threading
+import time
+import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from .project_manager import LeanProject
 
@@ -18,6 +21,9 @@ logger = logging.getLogger(__name__)
 # Lean Docker 이미지
 LEAN_IMAGE = "quantconnect/lean:latest"
 
+# 실행 중 취소/타임아웃 확인 간격 (초)
+CANCEL_POLL_INTERVAL = 0.5
+
 
 @dataclass
 class LeanRun:
@@ -30,6 +36,13 @@ class LeanRun:
     duration_seconds: float = 0
     started_at: datetime = field(default_factory=datetime.now)
     finished_at: Optional[datetime] = None
+    queue_wait_seconds: float = 0
+    container: Optional[str] = None
+    
+    @property
+    def wall_seconds(self) -> float:
+        """제출부터 완료까지 전체 시간 (대기 + 실행)"""
+        return self.queue_wait_seconds + self.duration_seconds
     
     @property
     def result_json(self) -> Optional[Path]:
@@ -115,7 +128,18 @@ class LeanRun:
 
 
 class LeanExecutor:
-    """Lean Docker 실행기 (Lean CLI 불필요)"""
+    """Lean Docker 실행기 (Lean CLI 불필요)
+    
+    set_pool()로 LeanContainerPool을 지정하면 run()이 컨테이너를 새로 만들지 않고
+    풀의 상시 실행 컨테이너에서 백테스트를 실행합니다.
+    """
+    
+    _pool: Optional[Any] = None
+    
+    @classmethod
+    def set_pool(cls, pool: Optional[Any]) -> None:
+        """기본 컨테이너 풀 지정 (None이면 컨테이너별 실행으로 복귀)"""
+        cls._pool = pool
     
     @classmethod
     def run(
@@ -123,6 +147,7 @@ class LeanExecutor:
         project: LeanProject,
         stream_logs: bool = False,
         timeout: int = 600,
+        cancel_event: Optional[threading.Event] = None,
     ) -> LeanRun:
         """Docker로 Lean 백테스트 실행
         
@@ -130,13 +155,18 @@ class LeanExecutor:
             project: Lean 프로젝트
             stream_logs: 로그 스트리밍 여부
             timeout: 타임아웃 (초)
+            cancel_event: set되면 컨테이너를 중지하고 취소 (컨테이너 풀 사용 시 미지원)
         
         Returns:
             LeanRun 결과 객체
         
         Raises:
-            RuntimeError: 실행 실패 시
+            RuntimeError: 실행 실패/타임아웃/취소 시
         """
+        pool = cls._pool
+        if pool is not None and pool.is_running:
+            return pool.run(project, timeout=timeout)
+        
         started_at = datetime.now()
         output_dir = project.output_dir
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -162,43 +192,15 @@ class LeanExecutor:
             raise RuntimeError(f"symbol-properties-database.csv가 없습니다. setup_lean_data.sh 실행 필요: {symbol_props}")
         
         # Lean config.json 생성
-        lean_config = {
-            "algorithm-type-name": "Algorithm",
-            "algorithm-language": "Python",
-            "algorithm-location": "/Algorithm/main.py",
-            "data-folder": "/Data",
-            "results-destination-folder": "/Results",
-            "debugging": False,
-            "debugging-method": "LocalCmdLine",
-            "log-handler": "ConsoleLogHandler",
-            "messaging-handler": "QuantConnect.Messaging.Messaging",
-            "job-queue-handler": "QuantConnect.Queues.JobQueue",
-            "api-handler": "QuantConnect.Api.Api",
-            "map-file-provider": "QuantConnect.Data.Auxiliary.LocalDiskMapFileProvider",
-            "factor-file-provider": "QuantConnect.Data.Auxiliary.LocalDiskFactorFileProvider",
-            "data-provider": "QuantConnect.Lean.Engine.DataFeeds.DefaultDataProvider",
-            "object-store": "QuantConnect.Lean.Engine.Storage.LocalObjectStore",
-            "data-aggregator": "QuantConnect.Lean.Engine.DataFeeds.AggregationManager",
-            "environments": {
-                "backtesting": {
-                    "live-mode": False,
-                    "setup-handler": "QuantConnect.Lean.Engine.Setup.BacktestingSetupHandler",
-                    "result-handler": "QuantConnect.Lean.Engine.Results.BacktestingResultHandler",
-                    "data-feed-handler": "QuantConnect.Lean.Engine.DataFeeds.FileSystemDataFeed",
-                    "real-time-handler": "QuantConnect.Lean.Engine.RealTime.BacktestingRealTimeHandler",
-                    "history-provider": "QuantConnect.Lean.Engine.HistoricalData.SubscriptionDataReaderHistoryProvider",
-                    "transaction-handler": "QuantConnect.Lean.Engine.TransactionHandlers.BacktestingTransactionHandler"
-                }
-            },
-            "environment": "backtesting"
-        }
+        lean_config = cls.build_lean_config()
         
         config_path = project_path / "lean-config.json"
         config_path.write_text(json.dumps(lean_config, indent=2))
         
-        # Docker 명령어 구성
+        # Docker 명령어 구성 (취소/타임아웃 시 docker kill 할 수 있도록 이름 지정)
+        container_name = f"lean_{project.run_id}_{uuid.uuid4().hex[:8]}"
         cmd = [
-            "docker", "run", "--rm",
+            "docker", "run", "--rm", "--name", container_name,
             "-v", f"{project_path}:/Algorithm:ro",
             "-v", f"{data_path}:/Data:ro",
             "-v", f"{results_path}:/Results",
@@ -210,19 +212,13 @@ class LeanExecutor:
         logger.debug(f"[Lean] 명령어: {' '.join(cmd)}")
         
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
+            returncode, stdout = cls._wait_container(cmd, container_name, timeout, cancel_event)
             
             finished_at = datetime.now()
             duration = (finished_at - started_at).total_seconds()
-            stdout = result.stdout + result.stderr
             
-            if result.returncode != 0:
-                error_msg = f"Lean 백테스트 실패 (exit code: {result.returncode})\n{stdout[-2000:]}"
+            if returncode != 0:
+                error_msg = f"Lean 백테스트 실패 (exit code: {returncode})\n{stdout[-2000:]}"
                 logger.error(f"[Lean] {error_msg}")
                 raise RuntimeError(error_msg)
             
@@ -251,6 +247,85 @@ class LeanExecutor:
             logger.error(f"[Lean] {error_msg}")
             raise RuntimeError(error_msg)
     
+    @classmethod
+    def _wait_container(
+        cls,
+        cmd: List[str],
+        container_name: str,
+        timeout: int,
+        cancel_event: Optional[threading.Event],
+    ) -> Tuple[int, str]:
+        """docker run 프로세스 완료 대기 (취소/타임아웃 시 컨테이너 중지)
+        
+        Returns:
+            (exit code, stdout + stderr)
+        
+        Raises:
+            subprocess.TimeoutExpired: 타임아웃
+            RuntimeError: 취소
+        """
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                stdout, stderr = proc.communicate(timeout=CANCEL_POLL_INTERVAL)
+                return proc.returncode, stdout + stderr
+            except subprocess.TimeoutExpired:
+                cancelled = cancel_event is not None and cancel_event.is_set()
+                if not cancelled and time.monotonic() < deadline:
+                    continue
+                # docker CLI만 종료하면 컨테이너가 남으므로 컨테이너를 먼저 중지
+                try:
+                    subprocess.run(["docker", "kill", container_name], capture_output=True, timeout=30)
+                except (FileNotFoundError, subprocess.TimeoutExpired) as e:
+                    logger.warning(f"[Lean] 컨테이너 중지 실패: {container_name} ({e})")
+                proc.kill()
+                proc.communicate()
+                if cancelled:
+                    logger.info(f"[Lean] 취소: {container_name}")
+                    raise RuntimeError("Lean 백테스트 취소")
+                raise subprocess.TimeoutExpired(cmd, timeout)
+    
+    @classmethod
+    def build_lean_config(cls, **overrides: Any) -> Dict[str, Any]:
+        """Lean 런처 config.json 내용 생성
+
+        Args:
+            **overrides: 덮어쓸 설정 (예: algorithm-location)
+        """
+        config = {
+            "algorithm-type-name": "Algorithm",
+            "algorithm-language": "Python",
+            "algorithm-location": "/Algorithm/main.py",
+            "data-folder": "/Data",
+            "results-destination-folder": "/Results",
+            "debugging": False,
+            "debugging-method": "LocalCmdLine",
+            "log-handler": "ConsoleLogHandler",
+            "messaging-handler": "QuantConnect.Messaging.Messaging",
+            "job-queue-handler": "QuantConnect.Queues.JobQueue",
+            "api-handler": "QuantConnect.Api.Api",
+            "map-file-provider": "QuantConnect.Data.Auxiliary.LocalDiskMapFileProvider",
+            "factor-file-provider": "QuantConnect.Data.Auxiliary.LocalDiskFactorFileProvider",
+            "data-provider": "QuantConnect.Lean.Engine.DataFeeds.DefaultDataProvider",
+            "object-store": "QuantConnect.Lean.Engine.Storage.LocalObjectStore",
+            "data-aggregator": "QuantConnect.Lean.Engine.DataFeeds.AggregationManager",
+            "environments": {
+                "backtesting": {
+                    "live-mode": False,
+                    "setup-handler": "QuantConnect.Lean.Engine.Setup.BacktestingSetupHandler",
+                    "result-handler": "QuantConnect.Lean.Engine.Results.BacktestingResultHandler",
+                    "data-feed-handler": "QuantConnect.Lean.Engine.DataFeeds.FileSystemDataFeed",
+                    "real-time-handler": "QuantConnect.Lean.Engine.RealTime.BacktestingRealTimeHandler",
+                    "history-provider": "QuantConnect.Lean.Engine.HistoricalData.SubscriptionDataReaderHistoryProvider",
+                    "transaction-handler": "QuantConnect.Lean.Engine.TransactionHandlers.BacktestingTransactionHandler"
+                }
+            },
+            "environment": "backtesting"
+        }
+        config.update(overrides)
+        return config
+    
     @classmethod
     def pull_image(cls) -> bool:
         """Lean Docker 이미지 다운로드"""
@@ -9,6 +9,7 @@ Grid Search / Random Search를 통한 전략 파라미터 최적화 기능 제
 import logging
 import statistics
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from functools import reduce
 from itertools import product
@@ -184,24 +185,34 @@ class OptimizationRun:
 # ============================================================
 
 class ParallelExecutor:
-    """백테스트 실행기
-    
-    현재는 Docker 컨테이너 리소스 제한으로 인해 순차 실행.
-    추후 asyncio 기반 병렬 실행으로 확장 가능.
+    """백테스트 병렬 실행기
+
+    max_workers 크기의 워커 풀로 백테스트를 동시에 실행합니다.
+    - 실행마다 고유 run_id 프로젝트 디렉토리 사용 (LeanClient.backtest_strategy)
+    - 시장 데이터는 실행 전 한 번만 수집/내보내기 후 읽기 전용 /Data 마운트로 공유
+    - 진행 콜백은 완료 순서대로 호출 스레드에서 실행
+    - early_stop이 True를 반환하면 아직 시작하지 않은 실행을 취소
+
+    워커는 스레드이며 실제 작업은 Lean Docker 컨테이너(또는 네이티브 엔진)에서
+    수행되므로 동시 컨테이너 수가 max_workers로 제한됩니다.
     """
     
     def __init__(
         self,
         max_workers: int = 4,
-        on_progress: Optional[Callable[[int, int, OptimizationRun], None]] = None
+        on_progress: Optional[Callable[[int, int, OptimizationRun], None]] = None,
+        early_stop: Optional[Callable[[List[OptimizationRun]], bool]] = None,
     ):
         """
         Args:
-            max_workers: 최대 동시 실행 수 (현재 미사용, 순차 실행)
+            max_workers: 최대 동시 실행 수
             on_progress: 진행 콜백 (completed, total, run) -> None
+            early_stop: 조기 종료 조건 (completed_runs) -> bool.
+                        완료된 실행 목록(완료 순서)을 받아 True면 남은 실행 취소
         """
-        self.max_workers = max_workers
+        self.max_workers = max(1, int(max_workers))
         self.on_progress = on_progress
+        self.early_stop = early_stop
     
     def run_grid(
         self,
@@ -229,33 +240,22 @@ class ParallelExecutor:
             market_type: 시장 타입
         
         Returns:
-            OptimizationRun 리스트
+            OptimizationRun 리스트 (그리드 순서, 취소된 조합 제외)
         """
-        results: List[OptimizationRun] = []
-        total = len(parameter_grid)
-        completed = 0
-        
-        logger.info(f"[Optimizer] Grid Search 시작: {total}개 조합")
-        
-        for params in parameter_grid:
-            run = self._run_single(
-                client=client,
-                strategy_id=strategy_id,
-                symbols=symbols,
-                start_date=start_date,
-                end_date=end_date,
-                params=params,
-                initial_cash=initial_cash,
-                market_type=market_type,
-            )
-            
-            results.append(run)
-            completed += 1
-            
-            if self.on_progress:
-                self.on_progress(completed, total, run)
+        logger.info(f"[Optimizer] Grid Search 시작: {len(parameter_grid)}개 조합")
+        
+        results = self._run_all(
+            client=client,
+            strategy_id=strategy_id,
+            symbols=symbols,
+            start_date=start_date,
+            end_date=end_date,
+            params_list=list(parameter_grid),
+            initial_cash=initial_cash,
+            market_type=market_type,
+        )
         
-        logger.info(f"[Optimizer] Grid Search 완료: {completed}개 실행")
+        logger.info(f"[Optimizer] Grid Search 완료: {len(results)}개 실행")
         return results
     
     def run_random(
@@ -288,36 +288,110 @@ class ParallelExecutor:
             seed: 랜덤 시드
         
         Returns:
-            OptimizationRun 리스트
+            OptimizationRun 리스트 (샘플 순서, 취소된 샘플 제외)
         """
         samples = parameter_grid.sample(max_samples, seed=seed)
-        total = len(samples)
         
-        logger.info(f"[Optimizer] Random Search 시작: {total}개 샘플")
+        logger.info(f"[Optimizer] Random Search 시작: {len(samples)}개 샘플")
+        
+        results = self._run_all(
+            client=client,
+            strategy_id=strategy_id,
+            symbols=symbols,
+            start_date=start_date,
+            end_date=end_date,
+            params_list=samples,
+            initial_cash=initial_cash,
+            market_type=market_type,
+        )
         
-        results: List[OptimizationRun] = []
-        completed = 0
+        logger.info(f"[Optimizer] Random Search 완료: {len(results)}개 실행")
+        return results
+    
+    def _run_all(
+        self,
+        client: "LeanClient",
+        strategy_id: str,
+        symbols: List[str],
+        start_date: str,
+        end_date: str,
+        params_list: List[Dict[str, Any]],
+        initial_cash: float,
+        market_type: str,
+    ) -> List[OptimizationRun]:
+        """파라미터 조합 목록을 워커 풀에서 실행"""
+        total = len(params_list)
+        if total == 0:
+            return []
         
-        for params in samples:
-            run = self._run_single(
-                client=client,
-                strategy_id=strategy_id,
-                symbols=symbols,
-                start_date=start_date,
-                end_date=end_date,
-                params=params,
-                initial_cash=initial_cash,
-                market_type=market_type,
-            )
-            
-            results.append(run)
-            completed += 1
-            
-            if self.on_progress:
-                self.on_progress(completed, total, run)
+        # 공유 데이터 준비 (한 번만 수집 → 모든 실행이 같은 읽기 전용 데이터 사용)
+        data = self._prepare_shared_data(client, symbols, start_date, end_date, market_type)
         
-        logger.info(f"[Optimizer] Random Search 완료: {completed}개 실행")
-        return results
+        slots: List[Optional[OptimizationRun]] = [None] * total
+        completed_runs: List[OptimizationRun] = []
+        stopped = False
+        
+        pool = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, total),
+            thread_name_prefix="optimizer",
+        )
+        try:
+            futures = {
+                pool.submit(
+                    self._run_single,
+                    client=client,
+                    strategy_id=strategy_id,
+                    symbols=symbols,
+                    start_date=start_date,
+                    end_date=end_date,
+                    params=params,
+                    initial_cash=initial_cash,
+                    market_type=market_type,
+                    data=data,
+                ): index
+                for index, params in enumerate(params_list)
+            }
+            
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                
+                run = future.result()
+                slots[futures[future]] = run
+                completed_runs.append(run)
+                
+                if self.on_progress:
+                    self.on_progress(len(completed_runs), total, run)
+                
+                if not stopped and self.early_stop and self.early_stop(completed_runs):
+                    stopped = True
+                    cancelled = sum(1 for f in futures if f.cancel())
+                    logger.info(
+                        f"[Optimizer] 조기 종료: {len(completed_runs)}개 완료, "
+                        f"{cancelled}개 취소 (실행 중인 작업은 완료 대기)"
+                    )
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+        
+        return [run for run in slots if run is not None]
+    
+    @staticmethod
+    def _prepare_shared_data(
+        client: "LeanClient",
+        symbols: List[str],
+        start_date: str,
+        end_date: str,
+        market_type: str,
+    ) -> Optional[Dict[str, pd.DataFrame]]:
+        """모든 실행이 공유할 시장 데이터 수집
+
+        실패 시 None을 반환하고 각 실행이 개별적으로 수집합니다.
+        """
+        try:
+            return client._fetch_data(symbols, start_date, end_date, market_type)
+        except Exception as e:
+            logger.warning(f"[Optimizer] 공유 데이터 준비 실패 (실행별 수집): {e}")
+            return None
     
     def _run_single(
         self,
@@ -329,6 +403,7 @@ class ParallelExecutor:
         params: Dict[str, Any],
         initial_cash: float,
         market_type: str,
+        data: Optional[Dict[str, pd.DataFrame]] = None,
     ) -> OptimizationRun:
         """단일 백테스트 실행"""
         start_time = time.time()
@@ -342,6 +417,8 @@ class ParallelExecutor:
                 params=params,
                 initial_cash=initial_cash,
                 market_type=market_type,
+                data=data,
+                include_benchmark=False,
             )
             
             duration = time.time() - start_time
@@ -558,6 +635,7 @@ class StrategyOptimizer:
         market_type: str = "krx",
         on_progress: Optional[Callable[[int, int, OptimizationRun], None]] = None,
         seed: Optional[int] = None,
+        early_stop: Optional[Callable[[List[OptimizationRun]], bool]] = None,
     ):
         """파라미터 최적화 실행
         
@@ -573,8 +651,9 @@ class StrategyOptimizer:
             max_samples: random search용 최대 샘플 수
             initial_cash: 초기 자본금
             market_type: 시장 타입
-            on_progress: 진행 콜백
+            on_progress: 진행 콜백 (완료 순서)
             seed: 랜덤 시드
+            early_stop: 조기 종료 조건 (completed_runs) -> bool
         
         Returns:
             OptimizationResult
@@ -598,6 +677,7 @@ class StrategyOptimizer:
         executor = ParallelExecutor(
             max_workers=self.max_workers,
             on_progress=on_progress,
+            early_stop=early_stop,
         )
         
         # 최적화 실행
@@ -0,0 +1,25 @@
+"""네이티브 백테스트 엔진
+
+Docker/Lean 없이 NumPy/pandas로 StrategySchema를 직접 평가하는 엔진.
+파라미터 탐색 등 대량 반복 실행에 사용하고, 최종 검증은 Lean으로 수행합니다.
+실시간 평가용으로 같은 지표/조건을 봉 단위로 갱신하는 스트리밍 평가기도 제공합니다.
+"""
+
+from .evaluator import StrategySignal, StreamingEvaluator
+from .executor import NativeExecutor, load_daily_data, load_lean_csv
+from .indicators import NATIVE_INDICATORS, compute_indicator, is_supported
+from .streaming import STREAMING_INDICATORS, StreamingIndicator, create_streaming_indicator
+
+__all__ = [
+    "NativeExecutor",
+    "load_daily_data",
+    "load_lean_csv",
+    "NATIVE_INDICATORS",
+    "compute_indicator",
+    "is_supported",
+    "StreamingEvaluator",
+    "StrategySignal",
+    "STREAMING_INDICATORS",
+    "StreamingIndicator",
+    "create_streaming_indicator",
+]
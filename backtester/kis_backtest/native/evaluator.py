@@ -0,0 +1,258 @@
+"""스트리밍 전략 평가기
+
+StrategySchema의 진입/청산 조건을 새 봉마다 증분 평가합니다.
+지표는 native/streaming.py로 봉당 고정 비용에 갱신하고, 조건 트리는 생성 시 한 번
+함수로 변환해 종목별 상태에 적용하므로 과거 구간을 다시 계산하지 않습니다.
+
+NativeExecutor(_SymbolSignals)와 같은 규칙을 따릅니다:
+- 모든 지표 출력이 준비된 봉부터 평가 (준비 전 봉은 신호 없음)
+- 교차 조건의 이전값은 직전 평가 봉의 값, 첫 평가 봉에서는 0
+- 조건이 없는 AND/OR 그룹은 항상 참
+
+사용 예:
+    evaluator = StreamingEvaluator(get_strategy("sma_crossover"))
+    signal = evaluator.update("005930", bar)
+    if signal.entry:
+        ...
+"""
+
+import operator
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from ..core.converters import from_definition
+from ..core.schema import (
+    CompositeConditionSchema,
+    ConditionSchema,
+    OperatorType,
+    PRICE_FIELDS,
+    StrategySchema,
+)
+from ..core.strategy import StrategyDefinition
+from ..models import Bar
+from .streaming import StreamingIndicator, create_streaming_indicator
+
+# 값 조회 키: (alias, output), 가격 필드는 ("close", "value") 형태
+ValueKey = Tuple[str, str]
+# 조건 함수: (현재값, 직전 평가 봉 값) → bool
+_Predicate = Callable[[Dict[ValueKey, float], Dict[ValueKey, float]], bool]
+
+_COMPARE = {
+    OperatorType.GREATER_THAN: operator.gt,
+    OperatorType.LESS_THAN: operator.lt,
+    OperatorType.GREATER_EQUAL: operator.ge,
+    OperatorType.LESS_EQUAL: operator.le,
+    OperatorType.EQUAL: operator.eq,
+    OperatorType.NOT_EQUAL: operator.ne,
+}
+
+_SCALE = {
+    "mul": operator.mul,
+    "div": operator.truediv,
+    "add": operator.add,
+    "sub": operator.sub,
+}
+
+
+@dataclass
+class StrategySignal:
+    """봉 1개에 대한 평가 결과"""
+    symbol: str
+    time: Optional[datetime]
+    ready: bool
+    entry: bool
+    exit: bool
+
+
+class _SymbolState:
+    """종목별 지표 인스턴스와 교차 조건용 직전 값"""
+
+    __slots__ = ("indicators", "current", "prev", "signal")
+
+    def __init__(self, indicators: Dict[str, StreamingIndicator]):
+        self.indicators = indicators
+        self.current: Dict[ValueKey, float] = {}
+        self.prev: Dict[ValueKey, float] = {}
+        self.signal: Optional[StrategySignal] = None
+
+
+class StreamingEvaluator:
+    """StrategySchema/StrategyDefinition 증분 평가기 (종목 수 제한 없음)
+
+    Args:
+        strategy: StrategySchema 또는 StrategyDefinition
+
+    Raises:
+        ValueError: 스트리밍 계산을 지원하지 않는 지표/캔들스틱 조건
+    """
+
+    def __init__(self, strategy: Union[StrategySchema, StrategyDefinition]):
+        if isinstance(strategy, StrategyDefinition):
+            strategy = from_definition(strategy)
+        self.schema = strategy
+
+        # alias → (지표 ID, 파라미터)
+        self._specs: Dict[str, Tuple[str, dict]] = {}
+        for ind in strategy.get_unique_indicators():
+            alias = ind.alias or ind.id
+            if alias not in self._specs:
+                self._specs[alias] = (ind.id, dict(ind.params))
+        # 미지원 지표는 생성 시점에 바로 오류
+        self._outputs = {
+            alias: create_streaming_indicator(indicator_id, params).outputs
+            for alias, (indicator_id, params) in self._specs.items()
+        }
+
+        self._entry = self._compile(strategy.entry)
+        self._exit = self._compile(strategy.exit)
+        self._states: Dict[str, _SymbolState] = {}
+
+    # ========== 입력 ==========
+    def update(self, symbol: str, bar: Bar) -> StrategySignal:
+        """봉 1개 반영 후 진입/청산 신호 평가"""
+        return self._update(symbol, bar.time, bar.open, bar.high, bar.low, bar.close, bar.volume)
+
+    def warm_up(self, symbol: str, bars: Union[Iterable[Bar], pd.DataFrame]) -> Optional[StrategySignal]:
+        """과거 봉으로 지표 상태 준비 (Bar 목록 또는 open/high/low/close/volume DataFrame)
+
+        Returns:
+            마지막 봉의 평가 결과 (봉이 없으면 None)
+        """
+        signal = None
+        if isinstance(bars, pd.DataFrame):
+            times = bars["date"] if "date" in bars.columns else bars.index
+            columns = bars[["open", "high", "low", "close", "volume"]].itertuples(index=False, name=None)
+            for ts, (o, h, l, c, v) in zip(times, columns):
+                signal = self._update(symbol, pd.Timestamp(ts).to_pydatetime(), o, h, l, c, v)
+        else:
+            for bar in bars:
+                signal = self.update(symbol, bar)
+        return signal
+
+    def reset(self, symbol: Optional[str] = None) -> None:
+        """종목 상태 초기화 (symbol 미지정 시 전체)"""
+        if symbol is None:
+            self._states.clear()
+        else:
+            self._states.pop(symbol, None)
+
+    # ========== 조회 ==========
+    def signal(self, symbol: str) -> Optional[StrategySignal]:
+        """마지막 평가 결과"""
+        state = self._states.get(symbol)
+        return state.signal if state is not None else None
+
+    def value(self, symbol: str, alias: str, output: str = "value") -> float:
+        """지표 현재 값 (준비 전이면 NaN)"""
+        state = self._states.get(symbol)
+        if state is None or alias not in state.indicators:
+            return float("nan")
+        return state.indicators[alias].values.get(output, float("nan"))
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self._states)
+
+    # ========== 내부 ==========
+    def _update(self, symbol, time, open, high, low, close, volume) -> StrategySignal:
+        state = self._states.get(symbol)
+        if state is None:
+            state = self._states[symbol] = _SymbolState({
+                alias: create_streaming_indicator(indicator_id, params)
+                for alias, (indicator_id, params) in self._specs.items()
+            })
+
+        open, high, low, close, volume = float(open), float(high), float(low), float(close), float(volume)
+        ready = True
+        current = state.current
+        for alias, indicator in state.indicators.items():
+            for output, value in indicator.update(open, high, low, close, volume).items():
+                current[(alias, output)] = value
+                if value != value:
+                    ready = False
+        current[("close", "value")] = close
+        current[("open", "value")] = open
+        current[("high", "value")] = high
+        current[("low", "value")] = low
+        current[("volume", "value")] = volume
+
+        if ready:
+            entry = self._entry(current, state.prev)
+            exit_ = self._exit(current, state.prev)
+            # 모든 키를 봉마다 다시 쓰므로 두 dict를 맞바꿔 재사용
+            state.prev, state.current = current, state.prev
+        else:
+            entry = exit_ = False
+
+        state.signal = StrategySignal(symbol=symbol, time=time, ready=ready, entry=entry, exit=exit_)
+        return state.signal
+
+    def _key(self, alias: Optional[str], output: str = "value") -> ValueKey:
+        """조건의 피연산자 → 값 조회 키 (_SymbolSignals.value와 같은 해석)"""
+        if alias is None or alias == "price":
+            alias = "close"
+        if alias in PRICE_FIELDS:
+            return (alias, "value")
+        outputs = self._outputs.get(alias)
+        if outputs is None:
+            raise ValueError(f"정의되지 않은 지표 alias: {alias}")
+        if output not in outputs:
+            if "value" in outputs and output in ("value", alias):
+                output = "value"
+            else:
+                raise ValueError(f"지표 '{alias}'에 '{output}' 출력이 없습니다")
+        return (alias, output)
+
+    def _compile(self, cond: Union[ConditionSchema, CompositeConditionSchema]) -> _Predicate:
+        """조건 트리 → 함수 (생성 시 한 번)"""
+        if isinstance(cond, CompositeConditionSchema):
+            if not cond.conditions:
+                return lambda cur, prev: True
+            parts = [self._compile(c) for c in cond.conditions]
+            if cond.logic == "AND":
+                return lambda cur, prev: all(p(cur, prev) for p in parts)
+            return lambda cur, prev: any(p(cur, prev) for p in parts)
+        return self._compile_single(cond)
+
+    def _compile_single(self, cond: ConditionSchema) -> _Predicate:
+        if cond.is_candlestick_condition():
+            raise ValueError(f"스트리밍 평가는 캔들스틱 조건을 지원하지 않습니다: {cond.candlestick}")
+
+        left = self._key(cond.indicator, cond.indicator_output)
+
+        if cond.is_cross_condition():
+            above = cond.operator == OperatorType.CROSS_ABOVE
+            if cond.value is not None:
+                level = float(cond.value)
+                if above:
+                    return lambda cur, prev: prev.get(left, 0.0) <= level and cur[left] > level
+                return lambda cur, prev: prev.get(left, 0.0) >= level and cur[left] < level
+            right = self._key(cond.compare_to, cond.compare_output)
+            if above:
+                return lambda cur, prev: prev.get(left, 0.0) <= prev.get(right, 0.0) and cur[left] > cur[right]
+            return lambda cur, prev: prev.get(left, 0.0) >= prev.get(right, 0.0) and cur[left] < cur[right]
+
+        compare = _COMPARE.get(cond.operator, operator.gt)
+        if cond.value is not None:
+            level = float(cond.value)
+            return lambda cur, prev: compare(cur[left], level)
+        if cond.compare_to is None:
+            return lambda cur, prev: compare(cur[left], 0.0)
+
+        right = self._key(cond.compare_to, cond.compare_output)
+        if cond.compare_scalar is not None:
+            scale = _SCALE.get(cond.compare_operation or "mul")
+            if scale is not None:
+                scalar = float(cond.compare_scalar)
+                return lambda cur, prev: compare(cur[left], _scaled(scale, cur[right], scalar))
+        return lambda cur, prev: compare(cur[left], cur[right])
+
+
+def _scaled(scale: Callable[[float, float], float], value: float, scalar: float) -> float:
+    try:
+        return scale(value, scalar)
+    except ZeroDivisionError:
+        return float("nan")
@@ -0,0 +1,567 @@
+"""네이티브 백테스트 실행기
+
+Docker/Lean 없이 프로세스 내에서 StrategySchema를 일봉 데이터 위에 직접 평가.
+결과는 Lean 결과 JSON과 같은 형태의 LeanRun으로 반환하므로
+LeanClient._lean_run_to_result, backend 응답 변환 로직을 그대로 사용합니다.
+
+LeanCodeGenerator가 생성하는 알고리즘과 동일한 규칙을 따릅니다:
+- 지표는 시작일부터 갱신, 모든 지표가 준비된 봉부터 매매
+- 교차 조건의 이전값은 첫 매매 가능 봉에서 0 (prev_values.get(..., 0))
+- 진입: 보유 0주일 때 SetHoldings(1/종목수), 청산: Liquidate
+- 손절/익절/트레일링 스탑은 진입 시 종가 기준
+- 수수료: 매수 commission, 매도 commission + tax (CustomFeeModel)
+- 슬리피지: KRX 호가 단위 기반 (KRXSlippageModel)
+"""
+
+import logging
+import math
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from ..codegen.generator import CodeGenConfig
+from ..core.converters import from_definition
+from ..core.schema import (
+    CompositeConditionSchema,
+    ConditionSchema,
+    OperatorType,
+    PRICE_FIELDS,
+    StrategySchema,
+)
+from ..core.strategy import StrategyDefinition
+from ..lean.executor import LeanRun
+from ..lean.project_manager import LeanProject, LeanProjectManager
+from .indicators import compute_indicator
+
+logger = logging.getLogger(__name__)
+
+# Lean 기본 FreePortfolioValuePercentage (SetHoldings 버퍼)
+FREE_PORTFOLIO_VALUE_PCT = 0.0025
+
+# 연율화 기준 거래일 수
+TRADING_DAYS_PER_YEAR = 252
+
+
+def krx_slippage_tick(price: float) -> int:
+    """KRXSlippageModel._tick과 동일한 호가 단위"""
+    if price < 1000:
+        return 1
+    elif price < 5000:
+        return 5
+    elif price < 10000:
+        return 10
+    elif price < 50000:
+        return 50
+    elif price < 100000:
+        return 100
+    elif price < 500000:
+        return 500
+    return 1000
+
+
+def apply_krx_slippage(price: float, slip_rate: float, is_buy: bool) -> float:
+    """KRXSlippageModel.GetSlippageApproximation 적용 후 체결가 반환"""
+    if slip_rate <= 0:
+        return price
+    p = int(round(price))
+    if p <= 0:
+        return price
+    tick = krx_slippage_tick(p)
+    raw = int(round(p * slip_rate))
+    if is_buy:
+        target = ((p + raw + tick - 1) // tick) * tick
+        return price + abs(target - p)
+    target = ((p - raw) // tick) * tick
+    return price - abs(target - p)
+
+
+def load_lean_csv(csv_path: Union[str, Path]) -> pd.DataFrame:
+    """Lean 일봉 CSV (YYYYMMDD,open,high,low,close,volume) 로드"""
+    df = pd.read_csv(
+        csv_path,
+        header=None,
+        names=["date", "open", "high", "low", "close", "volume"],
+        usecols=range(6),
+        dtype={"date": str},
+    )
+    df["date"] = pd.to_datetime(df["date"], format="%Y%m%d")
+    return df
+
+
+def load_daily_data(
+    symbols: List[str],
+    data_dir: Union[str, Path],
+) -> Dict[str, pd.DataFrame]:
+    """캐시된 Lean 일봉 CSV 디렉토리에서 종목별 DataFrame 로드"""
+    data_dir = Path(data_dir)
+    data: Dict[str, pd.DataFrame] = {}
+    for symbol in symbols:
+        csv_path = data_dir / f"{symbol.lower()}.csv"
+        if csv_path.exists():
+            data[symbol] = load_lean_csv(csv_path)
+    return data
+
+
+@dataclass
+class _Trade:
+    """진입~청산 한 번의 거래"""
+    symbol: str
+    quantity: int
+    entry_cost: float
+    exit_value: float = 0.0
+
+    @property
+    def pnl(self) -> float:
+        return self.exit_value - self.entry_cost
+
+    @property
+    def pnl_pct(self) -> float:
+        return self.pnl / self.entry_cost if self.entry_cost else 0.0
+
+
+class _SymbolSignals:
+    """종목별 벡터화된 신호 계산 결과"""
+
+    def __init__(
+        self,
+        executor_schema: StrategySchema,
+        df: pd.DataFrame,
+    ):
+        self.schema = executor_schema
+        self.df = df
+        self._indicator_map = executor_schema.collect_all_indicators()
+        self._values: Dict[Tuple[str, str], np.ndarray] = {}
+        self._outputs: Dict[str, Dict[str, pd.Series]] = {}
+
+        self._compute_indicators()
+        self.ready = self._ready_mask()
+        self._ready_idx = np.flatnonzero(self.ready)
+
+        self.entry = self._eval(executor_schema.entry)
+        self.exit = self._eval(executor_schema.exit)
+
+    def _compute_indicators(self) -> None:
+        for ind in self.schema.get_unique_indicators():
+            alias = ind.alias or ind.id
+            if alias in self._outputs:
+                continue
+            self._outputs[alias] = compute_indicator(ind.id, self.df, ind.params)
+
+    def _ready_mask(self) -> np.ndarray:
+        """모든 지표가 준비된 봉 (Lean IsReady 체크)"""
+        ready = np.ones(len(self.df), dtype=bool)
+        for outputs in self._outputs.values():
+            for series in outputs.values():
+                ready &= series.notna().to_numpy()
+        return ready
+
+    def value(self, alias: Optional[str], output: str = "value") -> np.ndarray:
+        """지표/가격 값 배열 (LeanCodeGenerator._get_indicator_code와 동일한 해석)"""
+        if alias is None or alias == "price":
+            alias = "close"
+        key = (alias, output)
+        if key in self._values:
+            return self._values[key]
+
+        if alias in PRICE_FIELDS:
+            arr = self.df[alias].to_numpy(dtype=float)
+        else:
+            outputs = self._outputs.get(alias)
+            if outputs is None:
+                raise ValueError(f"정의되지 않은 지표 alias: {alias}")
+            if output not in outputs:
+                if "value" in outputs and output in ("value", alias):
+                    output = "value"
+                else:
+                    raise ValueError(f"지표 '{alias}'에 '{output}' 출력이 없습니다")
+            arr = outputs[output].to_numpy(dtype=float)
+
+        self._values[key] = arr
+        return arr
+
+    def prev(self, alias: Optional[str], output: str = "value") -> np.ndarray:
+        """직전 매매 가능 봉의 값 (첫 봉은 0, Lean prev_values 기본값)"""
+        current = self.value(alias, output)
+        prev = np.zeros(len(current))
+        idx = self._ready_idx
+        if len(idx) > 1:
+            prev[idx[1:]] = current[idx[:-1]]
+        return prev
+
+    def _eval(
+        self,
+        cond: Union[ConditionSchema, CompositeConditionSchema],
+    ) -> np.ndarray:
+        if isinstance(cond, CompositeConditionSchema):
+            if not cond.conditions:
+                return np.ones(len(self.df), dtype=bool)
+            results = [self._eval(c) for c in cond.conditions]
+            if cond.logic == "AND":
+                return np.logical_and.reduce(results)
+            return np.logical_or.reduce(results)
+        return self._eval_single(cond)
+
+    def _eval_single(self, cond: ConditionSchema) -> np.ndarray:
+        if cond.is_candlestick_condition():
+            raise ValueError(
+                f"네이티브 엔진은 캔들스틱 조건을 지원하지 않습니다: {cond.candlestick} (engine='lean' 사용)"
+            )
+
+        left = self.value(cond.indicator, cond.indicator_output)
+
+        with np.errstate(invalid="ignore"):
+            if cond.is_cross_condition():
+                prev_left = self.prev(cond.indicator, cond.indicator_output)
+                if cond.value is not None:
+                    right = prev_right = np.full(len(left), float(cond.value))
+                else:
+                    right = self.value(cond.compare_to, cond.compare_output)
+                    prev_right = self.prev(cond.compare_to, cond.compare_output)
+                if cond.operator == OperatorType.CROSS_ABOVE:
+                    return (prev_left <= prev_right) & (left > right)
+                return (prev_left >= prev_right) & (left < right)
+
+            if cond.value is not None:
+                right = np.full(len(left), float(cond.value))
+            elif cond.compare_to is not None:
+                right = self.value(cond.compare_to, cond.compare_output)
+                if cond.compare_scalar is not None:
+                    op = cond.compare_operation or "mul"
+                    if op == "mul":
+                        right = right * cond.compare_scalar
+                    elif op == "div":
+                        right = right / cond.compare_scalar
+                    elif op == "add":
+                        right = right + cond.compare_scalar
+                    elif op == "sub":
+                        right = right - cond.compare_scalar
+            else:
+                right = np.zeros(len(left))
+
+            if cond.operator == OperatorType.LESS_THAN:
+                return left < right
+            if cond.operator == OperatorType.GREATER_EQUAL:
+                return left >= right
+            if cond.operator == OperatorType.LESS_EQUAL:
+                return left <= right
+            if cond.operator == OperatorType.EQUAL:
+                return left == right
+            if cond.operator == OperatorType.NOT_EQUAL:
+                return left != right
+            return left > right
+
+
+class NativeExecutor:
+    """네이티브 백테스트 실행기 (Docker 불필요)
+
+    LeanExecutor.run과 같은 LeanRun을 반환합니다.
+
+    Example:
+        data = load_daily_data(["005930"], ".lean-workspace/data/equity/krx/daily")
+        run = NativeExecutor.run(schema, data, ["005930"], "2024-01-01", "2024-12-31")
+        print(run.get_statistics()["Net Profit"])
+    """
+
+    @classmethod
+    def run(
+        cls,
+        strategy: Union[StrategySchema, StrategyDefinition],
+        data: Dict[str, pd.DataFrame],
+        symbols: List[str],
+        start_date: str,
+        end_date: str,
+        initial_capital: Optional[float] = None,
+        config: Optional[CodeGenConfig] = None,
+        run_id: Optional[str] = None,
+    ) -> LeanRun:
+        """네이티브 백테스트 실행
+
+        Args:
+            strategy: StrategySchema 또는 StrategyDefinition
+            data: {symbol: DataFrame(date, open, high, low, close, volume)}
+            symbols: 종목코드 리스트 (비중 계산 기준)
+            start_date: 시작일 (YYYY-MM-DD)
+            end_date: 종료일 (YYYY-MM-DD)
+            initial_capital: 초기 자본 (None이면 config 사용)
+            config: 수수료/세금/슬리피지 설정 (CodeGenConfig 공유)
+            run_id: 실행 ID
+
+        Returns:
+            LeanRun (raw_result에 Lean 형식 결과 포함)
+
+        Raises:
+            ValueError: 지원하지 않는 지표/조건 또는 데이터 없음
+        """
+        started_at = datetime.now()
+        config = config or CodeGenConfig()
+        capital = float(initial_capital or config.initial_capital)
+
+        if isinstance(strategy, StrategyDefinition):
+            schema = from_definition(strategy)
+        else:
+            schema = strategy
+
+        run_id = run_id or f"native_{datetime.now().strftime('%Y%m%d%H%M%S')}_{uuid.uuid4().hex[:6]}"
+
+        start_ts = pd.Timestamp(start_date)
+        end_ts = pd.Timestamp(end_date)
+
+        # 1. 종목별 데이터 정규화 + 벡터화 신호 계산
+        signals: Dict[str, _SymbolSignals] = {}
+        for symbol in symbols:
+            df = data.get(symbol)
+            if df is None or df.empty:
+                logger.warning(f"[Native] {symbol}: 데이터 없음 - 제외")
+                continue
+            df = cls._normalize(df)
+            df = df[(df.index >= start_ts) & (df.index <= end_ts)]
+            if df.empty:
+                logger.warning(f"[Native] {symbol}: 기간 내 데이터 없음 - 제외")
+                continue
+            signals[symbol] = _SymbolSignals(schema, df)
+
+        if not signals:
+            raise ValueError("백테스트할 데이터가 없습니다.")
+
+        # 2. 포트폴리오 시뮬레이션
+        raw_result = cls._simulate(schema, signals, symbols, capital, config)
+
+        finished_at = datetime.now()
+        duration = (finished_at - started_at).total_seconds()
+
+        project = LeanProject(
+            run_id=run_id,
+            project_dir=LeanProjectManager.workspace / "projects" / run_id,
+            data_dir=LeanProjectManager.workspace / "data" / "equity" / config.market / "daily",
+            symbols=symbols,
+            start_date=start_date,
+            end_date=end_date,
+            initial_capital=capital,
+            commission_rate=config.commission_rate,
+            tax_rate=config.tax_rate,
+            market_type=config.market,
+            currency="KRW" if config.market == "krx" else "USD",
+        )
+
+        logger.info(f"[Native] 완료: {run_id} ({duration:.3f}초)")
+        return LeanRun(
+            project=project,
+            success=True,
+            output_dir=project.output_dir,
+            raw_result=raw_result,
+            duration_seconds=duration,
+            started_at=started_at,
+            finished_at=finished_at,
+        )
+
+    @staticmethod
+    def _normalize(df: pd.DataFrame) -> pd.DataFrame:
+        """date 컬럼/인덱스 → 정렬된 DatetimeIndex"""
+        out = df.copy()
+        if "date" in out.columns:
+            out["date"] = pd.to_datetime(out["date"])
+            out = out.set_index("date")
+        else:
+            out.index = pd.to_datetime(out.index)
+        out = out[~out.index.duplicated(keep="first")].sort_index()
+        for col in ("open", "high", "low", "close", "volume"):
+            if col not in out.columns:
+                raise ValueError(f"필수 컬럼 없음: {col}")
+            out[col] = out[col].astype(float)
+        return out
+
+    @classmethod
+    def _simulate(
+        cls,
+        schema: StrategySchema,
+        signals: Dict[str, _SymbolSignals],
+        symbols: List[str],
+        capital: float,
+        config: CodeGenConfig,
+    ) -> Dict[str, Any]:
+        """일자별 포트폴리오 시뮬레이션 (신호는 이미 벡터화 계산됨)"""
+        risk = schema.risk
+        strategy_name = schema.name or schema.id
+        weight = 1.0 / len(symbols)
+        commission = config.commission_rate
+        sell_fee_rate = config.commission_rate + config.tax_rate
+
+        # 날짜 × 종목 가격/신호 패널
+        dates = sorted(set().union(*(s.df.index for s in signals.values())))
+        date_index = pd.DatetimeIndex(dates)
+        panel_pos: Dict[str, np.ndarray] = {
+            symbol: date_index.get_indexer(sig.df.index)
+            for symbol, sig in signals.items()
+        }
+        closes = np.full((len(dates), len(signals)), np.nan)
+        for j, (symbol, sig) in enumerate(signals.items()):
+            closes[panel_pos[symbol], j] = sig.df["close"].to_numpy()
+        row_of: List[Dict[str, int]] = [dict() for _ in dates]
+        for symbol, pos in panel_pos.items():
+            for row, p in enumerate(pos):
+                row_of[p][symbol] = row
+
+        cash = capital
+        quantity: Dict[str, int] = {s: 0 for s in signals}
+        last_price: Dict[str, float] = {s: 0.0 for s in signals}
+        entry_prices: Dict[str, float] = {}
+        high_prices: Dict[str, float] = {}
+        open_trades: Dict[str, _Trade] = {}
+        closed_trades: List[_Trade] = []
+        orders: Dict[str, Dict[str, Any]] = {}
+        total_fees = 0.0
+        equity = np.empty(len(dates))
+
+        def add_order(symbol: str, ts: pd.Timestamp, qty: int, fill: float, fee: float, tag: str) -> None:
+            order_id = len(orders) + 1
+            orders[str(order_id)] = {
+                "id": order_id,
+                "symbol": {"value": symbol.upper()},
+                "direction": 0 if qty > 0 else 1,
+                "quantity": qty,
+                "price": fill,
+                "value": abs(qty) * fill,
+                "fee": fee,
+                "time": ts.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "status": 3,  # Filled
+                "tag": tag,
+            }
+
+        for t, ts in enumerate(dates):
+            for symbol, row in row_of[t].items():
+                sig = signals[symbol]
+                price = float(sig.df["close"].iat[row])
+                last_price[symbol] = price
+
+                if not sig.ready[row]:
+                    continue
+
+                holdings = quantity[symbol]
+
+                # === 진입 ===
+                if sig.entry[row] and holdings == 0:
+                    portfolio_value = cash + sum(quantity[s] * last_price[s] for s in quantity)
+                    target = portfolio_value * (1 - FREE_PORTFOLIO_VALUE_PCT) * weight
+                    fill = apply_krx_slippage(price, config.slippage, is_buy=True)
+                    unit_cost = fill * (1 + commission)
+                    qty = int(math.floor(min(target, cash) / unit_cost)) if unit_cost > 0 else 0
+                    if qty > 0:
+                        value = qty * fill
+                        fee = value * commission
+                        cash -= value + fee
+                        total_fees += fee
+                        quantity[symbol] = qty
+                        open_trades[symbol] = _Trade(symbol, qty, value + fee)
+                        add_order(symbol, ts, qty, fill, fee, f"ENTRY: {strategy_name}")
+                    entry_prices[symbol] = price
+                    high_prices[symbol] = price
+
+                # === 청산 ===
+                exit_signal = bool(sig.exit[row])
+                if risk is not None and holdings > 0:
+                    entry = entry_prices.get(symbol)
+                    if entry and risk.stop_loss_pct is not None:
+                        if (price - entry) / entry * 100 <= -risk.stop_loss_pct:
+                            exit_signal = True
+                    if entry and risk.take_profit_pct is not None:
+                        if (price - entry) / entry * 100 >= risk.take_profit_pct:
+                            exit_signal = True
+                    if risk.trailing_stop_pct is not None and symbol in high_prices:
+                        high_prices[symbol] = max(high_prices[symbol], price)
+                        drawdown = (price - high_prices[symbol]) / high_prices[symbol] * 100
+                        if drawdown <= -risk.trailing_stop_pct:
+                            exit_signal = True
+
+                if exit_signal and holdings > 0:
+                    qty = quantity[symbol]
+                    fill = apply_krx_slippage(price, config.slippage, is_buy=False)
+                    value = qty * fill
+                    fee = value * sell_fee_rate
+                    cash += value - fee
+                    total_fees += fee
+                    quantity[symbol] = 0
+                    trade = open_trades.pop(symbol, None)
+                    if trade is not None:
+                        trade.exit_value = value - fee
+                        closed_trades.append(trade)
+                    add_order(symbol, ts, -qty, fill, fee, f"EXIT: {strategy_name}")
+
+            held = np.array([quantity[s] for s in signals], dtype=float)
+            marks = np.array([last_price[s] for s in signals], dtype=float)
+            equity[t] = cash + float(held @ marks)
+
+        equity_series = pd.Series(equity, index=date_index)
+        statistics = cls._statistics(equity_series, capital, closed_trades, len(orders), total_fees)
+
+        values = [
+            [int(datetime(ts.year, ts.month, ts.day).timestamp()), v, v, v, v]
+            for ts, v in zip(date_index, equity)
+        ]
+        return {
+            "statistics": statistics,
+            "charts": {"Strategy Equity": {"series": {"Equity": {"values": values}}}},
+            "orders": orders,
+            "engine": "native",
+        }
+
+    @staticmethod
+    def _statistics(
+        equity: pd.Series,
+        capital: float,
+        trades: List[_Trade],
+        total_orders: int,
+        total_fees: float,
+    ) -> Dict[str, str]:
+        """Lean statistics 형식 (문자열, % 포함)으로 통계 계산"""
+        end_equity = float(equity.iloc[-1])
+        net_profit = (end_equity - capital) / capital
+
+        days = (equity.index[-1] - equity.index[0]).days
+        years = days / 365.25
+        cagr = (end_equity / capital) ** (1 / years) - 1 if years > 0 and end_equity > 0 else 0.0
+
+        running_max = np.maximum.accumulate(np.concatenate([[capital], equity.to_numpy()]))[1:]
+        drawdown = float(np.max(1 - equity.to_numpy() / running_max)) if len(equity) else 0.0
+
+        returns = equity.pct_change().dropna()
+        annual_std = float(returns.std() * np.sqrt(TRADING_DAYS_PER_YEAR)) if len(returns) > 1 else 0.0
+        annual_return = float(returns.mean() * TRADING_DAYS_PER_YEAR) if len(returns) else 0.0
+        sharpe = annual_return / annual_std if annual_std > 0 else 0.0
+        downside = returns[returns < 0]
+        downside_std = float(downside.std() * np.sqrt(TRADING_DAYS_PER_YEAR)) if len(downside) > 1 else 0.0
+        sortino = annual_return / downside_std if downside_std > 0 else 0.0
+
+        wins = [t.pnl_pct for t in trades if t.pnl > 0]
+        losses = [t.pnl_pct for t in trades if t.pnl <= 0]
+        n_trades = len(trades)
+        win_rate = len(wins) / n_trades if n_trades else 0.0
+        loss_rate = len(losses) / n_trades if n_trades else 0.0
+        avg_win = float(np.mean(wins)) if wins else 0.0
+        avg_loss = float(np.mean(losses)) if losses else 0.0
+        pl_ratio = avg_win / abs(avg_loss) if avg_loss else 0.0
+        expectancy = win_rate * pl_ratio - loss_rate if n_trades else 0.0
+
+        return {
+            "Total Orders": str(total_orders),
+            "Average Win": f"{avg_win * 100:.2f}%",
+            "Average Loss": f"{avg_loss * 100:.2f}%",
+            "Compounding Annual Return": f"{cagr * 100:.3f}%",
+            "Drawdown": f"{drawdown * 100:.3f}%",
+            "Expectancy": f"{expectancy:.3f}",
+            "Start Equity": f"{capital:.0f}",
+            "End Equity": f"{end_equity:.0f}",
+            "Net Profit": f"{net_profit * 100:.3f}%",
+            "Sharpe Ratio": f"{sharpe:.3f}",
+            "Sortino Ratio": f"{sortino:.3f}",
+            "Loss Rate": f"{loss_rate * 100:.0f}%",
+            "Win Rate": f"{win_rate * 100:.0f}%",
+            "Profit-Loss Ratio": f"{pl_ratio:.2f}",
+            "Annual Standard Deviation": f"{annual_std:.3f}",
+            "Annual Variance": f"{annual_std ** 2:.3f}",
+            "Total Fees": f"{total_fees:.2f}",
+        }
@@ -0,0 +1,447 @@
+"""네이티브 지표 계산 (NumPy/pandas 벡터화)
+
+Lean 지표 클래스(INDICATOR_REGISTRY)와 동일한 정의를 일봉 OHLCV 전체 구간에
+한 번에 계산합니다. 준비되지 않은 구간(IsReady=False)은 NaN으로 표시합니다.
+
+Lean 매핑 규칙:
+- decimal-only 지표는 종가(close)로 갱신
+- TradeBar 지표는 OHLCV 전체 사용
+- wma는 Lean WilderMovingAverage와 동일 (INDICATOR_REGISTRY 기준)
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+IndicatorOutputs = Dict[str, pd.Series]
+
+
+# ============================================================
+# 기본 연산
+# ============================================================
+
+def _sma(s: pd.Series, period: int) -> pd.Series:
+    return s.rolling(period, min_periods=period).mean()
+
+
+def _seeded_ewm(s: pd.Series, period: int, alpha: float) -> pd.Series:
+    """첫 period개 SMA로 시드한 지수 평활 (Lean EMA/Wilders 방식)"""
+    out = pd.Series(np.nan, index=s.index, dtype=float)
+    valid = s.dropna()
+    if len(valid) < period:
+        return out
+    seed_pos = s.index.get_loc(valid.index[period - 1])
+    seeded = s.iloc[seed_pos:].copy().astype(float)
+    seeded.iloc[0] = valid.iloc[:period].mean()
+    out.iloc[seed_pos:] = seeded.ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    return out
+
+
+def _ema(s: pd.Series, period: int) -> pd.Series:
+    return _seeded_ewm(s, period, 2.0 / (period + 1))
+
+
+def _wilder(s: pd.Series, period: int) -> pd.Series:
+    return _seeded_ewm(s, period, 1.0 / period)
+
+
+def _lwma(s: pd.Series, period: int) -> pd.Series:
+    values = s.to_numpy(dtype=float)
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        weights = np.arange(1, period + 1, dtype=float)
+        windows = sliding_window_view(values, period)
+        out[period - 1:] = windows @ weights / weights.sum()
+    return pd.Series(out, index=s.index)
+
+
+def _rolling_std(s: pd.Series, period: int, ddof: int = 0) -> pd.Series:
+    # Lean StandardDeviation/Variance는 모분산(ddof=0)
+    return s.rolling(period, min_periods=period).std(ddof=ddof)
+
+
+def _true_range(df: pd.DataFrame) -> pd.Series:
+    prev_close = df["close"].shift(1)
+    tr = pd.concat([
+        df["high"] - df["low"],
+        (df["high"] - prev_close).abs(),
+        (df["low"] - prev_close).abs(),
+    ], axis=1).max(axis=1)
+    tr.iloc[0] = df["high"].iloc[0] - df["low"].iloc[0]
+    return tr
+
+
+def _p(params: Dict[str, Any], key: str, default: Any) -> Any:
+    value = params.get(key, default)
+    return default if value is None else value
+
+
+# ============================================================
+# 지표 구현 (id → fn(df, params) → {output: Series})
+# ============================================================
+
+def _calc_sma(df, params):
+    return {"value": _sma(df["close"], int(_p(params, "period", 20)))}
+
+
+def _calc_ema(df, params):
+    return {"value": _ema(df["close"], int(_p(params, "period", 20)))}
+
+
+def _calc_wilders(df, params):
+    return {"value": _wilder(df["close"], int(_p(params, "period", 21)))}
+
+
+def _calc_lwma(df, params):
+    return {"value": _lwma(df["close"], int(_p(params, "period", 21)))}
+
+
+def _calc_dema(df, params):
+    period = int(_p(params, "period", 21))
+    e1 = _ema(df["close"], period)
+    e2 = _ema(e1, period)
+    return {"value": 2 * e1 - e2}
+
+
+def _calc_tema(df, params):
+    period = int(_p(params, "period", 21))
+    e1 = _ema(df["close"], period)
+    e2 = _ema(e1, period)
+    e3 = _ema(e2, period)
+    return {"value": 3 * e1 - 3 * e2 + e3}
+
+
+def _calc_trima(df, params):
+    period = int(_p(params, "period", 21))
+    first = (period + 1) // 2 if period % 2 else period // 2 + 1
+    second = period + 1 - first
+    return {"value": _sma(_sma(df["close"], first), second)}
+
+
+def _calc_hma(df, params):
+    period = int(_p(params, "period", 21))
+    half = _lwma(df["close"], max(period // 2, 1))
+    full = _lwma(df["close"], period)
+    return {"value": _lwma(2 * half - full, max(int(np.sqrt(period)), 1))}
+
+
+def _calc_rsi(df, params):
+    period = int(_p(params, "period", 14))
+    delta = df["close"].diff()
+    gain = _wilder(delta.clip(lower=0), period)
+    loss = _wilder((-delta).clip(lower=0), period)
+    rs = gain / loss.replace(0, np.nan)
+    rsi = 100 - 100 / (1 + rs)
+    rsi = rsi.where(loss != 0, 100.0).where(gain.notna())
+    return {"value": rsi}
+
+
+def _calc_macd(df, params):
+    fast = int(_p(params, "fast", 12))
+    slow = int(_p(params, "slow", 26))
+    signal = int(_p(params, "signal", 9))
+    macd = _ema(df["close"], fast) - _ema(df["close"], slow)
+    sig = _ema(macd, signal)
+    return {"value": macd, "signal": sig, "histogram": macd - sig}
+
+
+def _calc_apo(df, params):
+    fast = int(_p(params, "fast", 12))
+    slow = int(_p(params, "slow", 26))
+    return {"value": _ema(df["close"], fast) - _ema(df["close"], slow)}
+
+
+def _calc_bollinger(df, params):
+    period = int(_p(params, "period", 20))
+    k = float(_p(params, "std", 2.0))
+    middle = _sma(df["close"], period)
+    std = _rolling_std(df["close"], period)
+    return {"upper": middle + k * std, "middle": middle, "lower": middle - k * std}
+
+
+def _calc_stochastic(df, params):
+    k_period = int(_p(params, "k_period", 14))
+    d_period = int(_p(params, "d_period", 3))
+    hh = df["high"].rolling(k_period, min_periods=k_period).max()
+    ll = df["low"].rolling(k_period, min_periods=k_period).min()
+    rng = hh - ll
+    k = (100 * (df["close"] - ll) / rng.replace(0, np.nan)).where(rng != 0, 0.0).where(hh.notna())
+    return {"k": k, "d": _sma(k, d_period)}
+
+
+def _calc_cci(df, params):
+    period = int(_p(params, "period", 20))
+    tp = (df["high"] + df["low"] + df["close"]) / 3
+    values = tp.to_numpy(dtype=float)
+    mean_dev = np.full(len(values), np.nan)
+    if len(values) >= period:
+        windows = sliding_window_view(values, period)
+        mean_dev[period - 1:] = np.abs(windows - windows.mean(axis=1, keepdims=True)).mean(axis=1)
+    mean_dev = pd.Series(mean_dev, index=tp.index)
+    cci = (tp - _sma(tp, period)) / (0.015 * mean_dev)
+    return {"value": cci.where(mean_dev != 0, 0.0).where(mean_dev.notna())}
+
+
+def _calc_williams_r(df, params):
+    period = int(_p(params, "period", 14))
+    hh = df["high"].rolling(period, min_periods=period).max()
+    ll = df["low"].rolling(period, min_periods=period).min()
+    rng = hh - ll
+    wr = (-100 * (hh - df["close"]) / rng.replace(0, np.nan)).where(rng != 0, 0.0).where(hh.notna())
+    return {"value": wr}
+
+
+def _calc_momentum(df, params):
+    period = int(_p(params, "period", 10))
+    prev = df["close"].shift(period)
+    return {"value": (df["close"] - prev) / prev * 100}
+
+
+def _calc_cmo(df, params):
+    period = int(_p(params, "period", 14))
+    delta = df["close"].diff()
+    up = delta.clip(lower=0).rolling(period, min_periods=period).sum()
+    down = (-delta).clip(lower=0).rolling(period, min_periods=period).sum()
+    total = up + down
+    return {"value": (100 * (up - down) / total.replace(0, np.nan)).where(total != 0, 0.0).where(up.notna())}
+
+
+def _calc_atr(df, params):
+    return {"value": _sma(_true_range(df), int(_p(params, "period", 14)))}
+
+
+def _calc_natr(df, params):
+    period = int(_p(params, "period", 14))
+    atr = _wilder(_true_range(df), period)
+    return {"value": atr / df["close"] * 100}
+
+
+def _calc_adx(df, params):
+    period = int(_p(params, "period", 14))
+    up = df["high"].diff()
+    down = -df["low"].diff()
+    plus_dm = up.where((up > down) & (up > 0), 0.0)
+    minus_dm = down.where((down > up) & (down > 0), 0.0)
+    tr = _true_range(df)
+    plus_dm.iloc[0] = minus_dm.iloc[0] = np.nan
+    tr.iloc[0] = np.nan
+    atr = _wilder(tr, period)
+    plus_di = 100 * _wilder(plus_dm, period) / atr
+    minus_di = 100 * _wilder(minus_dm, period) / atr
+    di_sum = plus_di + minus_di
+    dx = (100 * (plus_di - minus_di).abs() / di_sum.replace(0, np.nan)).where(di_sum != 0, 0.0).where(atr.notna())
+    return {"value": _wilder(dx, period), "plus_di": plus_di, "minus_di": minus_di}
+
+
+def _calc_keltner(df, params):
+    period = int(_p(params, "period", 20))
+    k = float(_p(params, "multiplier", 2.0))
+    middle = _sma(df["close"], period)
+    atr = _sma(_true_range(df), period)
+    return {"upper": middle + k * atr, "middle": middle, "lower": middle - k * atr}
+
+
+def _calc_donchian(df, params):
+    period = int(_p(params, "period", 20))
+    return {
+        "upper": df["high"].rolling(period, min_periods=period).max(),
+        "lower": df["low"].rolling(period, min_periods=period).min(),
+    }
+
+
+def _calc_std(df, params):
+    return {"value": _rolling_std(df["close"], int(_p(params, "period", 21)))}
+
+
+def _calc_variance(df, params):
+    period = int(_p(params, "period", 21))
+    return {"value": df["close"].rolling(period, min_periods=period).var(ddof=0)}
+
+
+def _calc_maximum(df, params):
+    period = int(_p(params, "period", 252))
+    return {"value": df["close"].rolling(period, min_periods=period).max()}
+
+
+def _calc_minimum(df, params):
+    period = int(_p(params, "period", 252))
+    return {"value": df["close"].rolling(period, min_periods=period).min()}
+
+
+def _calc_midpoint(df, params):
+    period = int(_p(params, "period", 14))
+    roll = df["close"].rolling(period, min_periods=period)
+    return {"value": (roll.max() + roll.min()) / 2}
+
+
+def _calc_midprice(df, params):
+    period = int(_p(params, "period", 14))
+    hh = df["high"].rolling(period, min_periods=period).max()
+    ll = df["low"].rolling(period, min_periods=period).min()
+    return {"value": (hh + ll) / 2}
+
+
+def _calc_obv(df, params):
+    direction = np.sign(df["close"].diff()).fillna(0)
+    obv = (direction * df["volume"]).cumsum() + df["volume"].iloc[0]
+    return {"value": obv}
+
+
+def _calc_ad(df, params):
+    rng = df["high"] - df["low"]
+    mfm = (((df["close"] - df["low"]) - (df["high"] - df["close"])) / rng.replace(0, np.nan)).fillna(0)
+    return {"value": (mfm * df["volume"]).cumsum()}
+
+
+def _calc_mfi(df, params):
+    period = int(_p(params, "period", 14))
+    tp = (df["high"] + df["low"] + df["close"]) / 3
+    flow = tp * df["volume"]
+    delta = tp.diff()
+    pos = flow.where(delta > 0, 0.0).rolling(period, min_periods=period).sum()
+    neg = flow.where(delta < 0, 0.0).rolling(period, min_periods=period).sum()
+    total = pos + neg
+    return {"value": (100 * pos / total.replace(0, np.nan)).where(total != 0, 0.0).where(pos.notna())}
+
+
+def _calc_vwma(df, params):
+    period = int(_p(params, "period", 21))
+    pv = (df["close"] * df["volume"]).rolling(period, min_periods=period).sum()
+    vol = df["volume"].rolling(period, min_periods=period).sum()
+    return {"value": pv / vol.replace(0, np.nan)}
+
+
+def _calc_logr(df, params):
+    period = int(_p(params, "period", 1))
+    return {"value": np.log(df["close"] / df["close"].shift(period))}
+
+
+def _calc_ibs(df, params):
+    rng = df["high"] - df["low"]
+    return {"value": ((df["close"] - df["low"]) / rng.replace(0, np.nan)).fillna(0)}
+
+
+def _calc_bop(df, params):
+    rng = df["high"] - df["low"]
+    return {"value": ((df["close"] - df["open"]) / rng.replace(0, np.nan)).fillna(0)}
+
+
+# ------------------------------------------------------------
+# 커스텀 지표 (LeanCodeGenerator 커스텀 로직과 동일)
+# ------------------------------------------------------------
+
+def _calc_consecutive(df, params):
+    close = df["close"]
+    if _p(params, "direction", "up") == "up":
+        hit = close > close.shift(1)
+    else:
+        hit = close < close.shift(1)
+    counter = hit.astype(int).groupby((~hit).cumsum()).cumsum()
+    return {"value": counter.astype(float)}
+
+
+def _calc_disparity(df, params):
+    sma = _sma(df["close"], int(_p(params, "period", 20)))
+    disparity = (df["close"] / sma * 100).where(sma > 0, 100.0).where(sma.notna())
+    return {"value": disparity}
+
+
+def _calc_volatility_ind(df, params):
+    period = int(_p(params, "period", 10))
+    returns = df["close"].pct_change()
+    vol = returns.rolling(period, min_periods=2).std(ddof=1)
+    return {"value": vol.fillna(0.0)}
+
+
+def _calc_change(df, params):
+    return {"value": (df["close"].pct_change() * 100).fillna(0.0)}
+
+
+def _calc_returns(df, params):
+    return _calc_momentum(df, {"period": _p(params, "period", 10)})
+
+
+NATIVE_INDICATORS: Dict[str, Callable[[pd.DataFrame, Dict[str, Any]], IndicatorOutputs]] = {
+    # 이동평균
+    "sma": _calc_sma,
+    "ema": _calc_ema,
+    "wma": _calc_wilders,
+    "lwma": _calc_lwma,
+    "dema": _calc_dema,
+    "tema": _calc_tema,
+    "trima": _calc_trima,
+    "hma": _calc_hma,
+    # 오실레이터
+    "rsi": _calc_rsi,
+    "macd": _calc_macd,
+    "apo": _calc_apo,
+    "stochastic": _calc_stochastic,
+    "cci": _calc_cci,
+    "williams_r": _calc_williams_r,
+    "momentum": _calc_momentum,
+    "roc": _calc_momentum,
+    "cmo": _calc_cmo,
+    # 추세/변동성
+    "adx": _calc_adx,
+    "atr": _calc_atr,
+    "natr": _calc_natr,
+    "bollinger": _calc_bollinger,
+    "keltner": _calc_keltner,
+    "donchian": _calc_donchian,
+    "std": _calc_std,
+    "variance": _calc_variance,
+    # 통계/가격
+    "maximum": _calc_maximum,
+    "minimum": _calc_minimum,
+    "midpoint": _calc_midpoint,
+    "midprice": _calc_midprice,
+    "logr": _calc_logr,
+    "ibs": _calc_ibs,
+    "bop": _calc_bop,
+    # 거래량
+    "obv": _calc_obv,
+    "ad": _calc_ad,
+    "adl": _calc_ad,
+    "mfi": _calc_mfi,
+    "vwma": _calc_vwma,
+    # 커스텀
+    "consecutive": _calc_consecutive,
+    "disparity": _calc_disparity,
+    "volatility_ind": _calc_volatility_ind,
+    "change": _calc_change,
+    "returns": _calc_returns,
+}
+
+
+def is_supported(indicator_id: str) -> bool:
+    """네이티브 엔진 지원 여부"""
+    return indicator_id in NATIVE_INDICATORS
+
+
+def compute_indicator(
+    indicator_id: str,
+    df: pd.DataFrame,
+    params: Dict[str, Any],
+) -> IndicatorOutputs:
+    """지표 계산
+
+    Args:
+        indicator_id: 지표 ID (INDICATOR_REGISTRY 키)
+        df: open/high/low/close/volume 컬럼을 가진 일봉 DataFrame
+        params: 지표 파라미터
+
+    Returns:
+        {output: Series} (단일 출력 지표는 "value" 키)
+
+    Raises:
+        ValueError: 네이티브 엔진에서 지원하지 않는 지표
+    """
+    fn = NATIVE_INDICATORS.get(indicator_id)
+    if fn is None:
+        raise ValueError(f"네이티브 엔진에서 지원하지 않는 지표입니다: {indicator_id} (engine='lean' 사용)")
+    return fn(df, params)
@@ -0,0 +1,849 @@
+"""네이티브 지표 스트리밍 계산 (봉 단위 갱신)
+
+native/indicators.py와 같은 정의를 새 봉이 올 때마다 고정 크기 상태로 갱신합니다.
+같은 봉 시퀀스에 대해 compute_indicator 결과의 마지막 값과 일치하며,
+준비되지 않은 구간(IsReady=False)은 NaN입니다.
+
+- 이동합/최대·최소/분산은 고정 길이 창과 누적값으로 갱신 (봉당 O(1))
+- cci의 평균편차만 창 전체를 다시 계산 (봉당 O(period))
+- 입력이 NaN인 준비 구간은 상태에 반영하지 않음 (벡터 계산의 앞쪽 NaN과 동일)
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Any, Callable, Dict, Tuple
+
+from .indicators import _p
+
+NAN = float("nan")
+
+
+# ============================================================
+# 기본 연산 (값 1개 입력 → 현재 값, NaN 입력은 무시하고 NaN 반환)
+# ============================================================
+
+class _RollingSum:
+    """최근 period개 합계 (min_periods=period)"""
+
+    __slots__ = ("period", "window", "total", "nonzero")
+
+    def __init__(self, period: int):
+        self.period = period
+        self.window: deque = deque()
+        self.total = 0.0
+        self.nonzero = 0  # 창 안의 0이 아닌 값 수 (모두 0이면 누적 오차 없이 0)
+
+    def update(self, x: float) -> float:
+        if x != x:
+            return NAN
+        window = self.window
+        window.append(x)
+        self.total += x
+        if x:
+            self.nonzero += 1
+        if len(window) > self.period:
+            old = window.popleft()
+            self.total -= old
+            if old:
+                self.nonzero -= 1
+        if not self.nonzero:
+            self.total = 0.0
+        return self.total if len(window) == self.period else NAN
+
+
+class _SMA(_RollingSum):
+    __slots__ = ()
+
+    def update(self, x: float) -> float:
+        total = _RollingSum.update(self, x)
+        return total / self.period if total == total else NAN
+
+
+class _SeededEWM:
+    """첫 period개 SMA로 시드한 지수 평활 (_seeded_ewm)"""
+
+    __slots__ = ("period", "alpha", "count", "value")
+
+    def __init__(self, period: int, alpha: float):
+        self.period = period
+        self.alpha = alpha
+        self.count = 0
+        self.value = 0.0
+
+    def update(self, x: float) -> float:
+        if x != x:
+            return NAN
+        if self.count < self.period:
+            self.count += 1
+            self.value += x
+            if self.count < self.period:
+                return NAN
+            self.value /= self.period
+            return self.value
+        self.value += self.alpha * (x - self.value)
+        return self.value
+
+
+def _EMA(period: int) -> _SeededEWM:
+    return _SeededEWM(period, 2.0 / (period + 1))
+
+
+def _Wilder(period: int) -> _SeededEWM:
+    return _SeededEWM(period, 1.0 / period)
+
+
+class _LWMA:
+    """선형 가중 이동평균: 합계와 가중합을 함께 갱신"""
+
+    __slots__ = ("period", "window", "total", "weighted", "denominator")
+
+    def __init__(self, period: int):
+        self.period = period
+        self.window: deque = deque()
+        self.total = 0.0
+        self.weighted = 0.0
+        self.denominator = period * (period + 1) / 2
+
+    def update(self, x: float) -> float:
+        if x != x:
+            return NAN
+        window = self.window
+        if len(window) < self.period:
+            window.append(x)
+            self.total += x
+            self.weighted += len(window) * x
+            return self.weighted / self.denominator if len(window) == self.period else NAN
+        # 가중치가 1씩 줄어든 뒤(- total) 새 값이 가중치 period로 추가됨
+        self.weighted += self.period * x - self.total
+        self.total += x - window.popleft()
+        window.append(x)
+        return self.weighted / self.denominator
+
+
+class _RollingExtreme:
+    """최근 period개 최대/최소 (단조 덱)"""
+
+    __slots__ = ("period", "is_max", "window", "index")
+
+    def __init__(self, period: int, is_max: bool):
+        self.period = period
+        self.is_max = is_max
+        self.window: deque = deque()  # (index, value)
+        self.index = -1
+
+    def update(self, x: float) -> float:
+        if x != x:
+            return NAN
+        self.index += 1
+        window = self.window
+        if self.is_max:
+            while window and window[-1][1] <= x:
+                window.pop()
+        else:
+            while window and window[-1][1] >= x:
+                window.pop()
+        window.append((self.index, x))
+        if window[0][0] <= self.index - self.period:
+            window.popleft()
+        return window[0][1] if self.index >= self.period - 1 else NAN
+
+
+class _RollingMoments:
+    """최근 period개 평균/분산 (Welford 추가·제거)"""
+
+    __slots__ = ("period", "ddof", "min_count", "window", "mean", "m2")
+
+    def __init__(self, period: int, ddof: int = 0, min_count: int = 0):
+        self.period = period
+        self.ddof = ddof
+        self.min_count = min_count or period
+        self.window: deque = deque()
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, x: float) -> float:
+        """분산 반환"""
+        if x != x:
+            return NAN
+        window = self.window
+        if len(window) == self.period:
+            old = window.popleft()
+            n = len(window)
+            if n:
+                delta = old - self.mean
+                self.mean -= delta / n
+                self.m2 -= delta * (old - self.mean)
+            else:
+                self.mean = self.m2 = 0.0
+        window.append(x)
+        n = len(window)
+        delta = x - self.mean
+        self.mean += delta / n
+        self.m2 += delta * (x - self.mean)
+        if n < self.min_count or n <= self.ddof:
+            return NAN
+        return max(self.m2, 0.0) / (n - self.ddof)
+
+
+class _Lag:
+    """period봉 전 값"""
+
+    __slots__ = ("window",)
+
+    def __init__(self, period: int):
+        self.window: deque = deque(maxlen=period + 1)
+
+    def update(self, x: float) -> float:
+        self.window.append(x)
+        return self.window[0] if len(self.window) == self.window.maxlen else NAN
+
+
+class _TrueRange:
+    """True Range (첫 봉은 high - low)"""
+
+    __slots__ = ("prev_close",)
+
+    def __init__(self):
+        self.prev_close = NAN
+
+    def update(self, high: float, low: float, close: float) -> float:
+        prev_close = self.prev_close
+        self.prev_close = close
+        if prev_close != prev_close:
+            return high - low
+        return max(high - low, abs(high - prev_close), abs(low - prev_close))
+
+
+def _div(numerator: float, denominator: float) -> float:
+    """NumPy 나눗셈과 같은 결과 (0으로 나누면 ±inf 또는 NaN)"""
+    if denominator:
+        return numerator / denominator
+    if numerator != numerator or numerator == 0:
+        return NAN
+    return math.copysign(math.inf, numerator)
+
+
+def _ratio(numerator: float, denominator: float, zero: float) -> float:
+    """분모가 0이면 zero, 준비 전(NaN)이면 NaN"""
+    if denominator != denominator:
+        return NAN
+    if denominator == 0:
+        return zero
+    return numerator / denominator
+
+
+# ============================================================
+# 지표 구현
+# ============================================================
+
+class StreamingIndicator:
+    """스트리밍 지표 기본 클래스
+
+    update()로 봉 하나를 반영하고 values에서 출력별 현재 값을 조회합니다.
+    """
+
+    outputs: Tuple[str, ...] = ("value",)
+
+    def __init__(self, params: Dict[str, Any]):
+        self.values: Dict[str, float] = {name: NAN for name in self.outputs}
+
+    @property
+    def is_ready(self) -> bool:
+        return all(v == v for v in self.values.values())
+
+    def update(self, open: float, high: float, low: float, close: float, volume: float) -> Dict[str, float]:
+        raise NotImplementedError
+
+
+class _CloseIndicator(StreamingIndicator):
+    """종가 → 기본 연산 1개"""
+
+    default_period = 20
+
+    def __init__(self, params):
+        super().__init__(params)
+        self.calc = self.create(int(_p(params, "period", self.default_period)))
+
+    def create(self, period: int):
+        raise NotImplementedError
+
+    def update(self, open, high, low, close, volume):
+        self.values["value"] = self.calc.update(close)
+        return self.values
+
+
+class SMAIndicator(_CloseIndicator):
+    create = staticmethod(_SMA)
+
+
+class EMAIndicator(_CloseIndicator):
+    create = staticmethod(_EMA)
+
+
+class WildersIndicator(_CloseIndicator):
+    default_period = 21
+    create = staticmethod(_Wilder)
+
+
+class LWMAIndicator(_CloseIndicator):
+    default_period = 21
+    create = staticmethod(_LWMA)
+
+
+class STDIndicator(_CloseIndicator):
+    default_period = 21
+
+    def create(self, period):
+        return _RollingMoments(period)
+
+    def update(self, open, high, low, close, volume):
+        self.values["value"] = math.sqrt(self.calc.update(close))
+        return self.values
+
+
+class VarianceIndicator(_CloseIndicator):
+    default_period = 21
+
+    def create(self, period):
+        return _RollingMoments(period)
+
+
+class MaximumIndicator(_CloseIndicator):
+    default_period = 252
+
+    def create(self, period):
+        return _RollingExtreme(period, is_max=True)
+
+
+class MinimumIndicator(_CloseIndicator):
+    default_period = 252
+
+    def create(self, period):
+        return _RollingExtreme(period, is_max=False)
+
+
+class DEMAIndicator(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        period = int(_p(params, "period", 21))
+        self.e1, self.e2 = _EMA(period), _EMA(period)
+
+    def update(self, open, high, low, close, volume):
+        e1 = self.e1.update(close)
+        self.values["value"] = 2 * e1 - self.e2.update(e1)
+        return self.values
+
+
+class TEMAIndicator(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        period = int(_p(params, "period", 21))
+        self.e1, self.e2, self.e3 = _EMA(period), _EMA(period), _EMA(period)
+
+    def update(self, open, high, low, close, volume):
+        e1 = self.e1.update(close)
+        e2 = self.e2.update(e1)
+        self.values["value"] = 3 * e1 - 3 * e2 + self.e3.update(e2)
+        return self.values
+
+
+class TRIMAIndicator(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        period = int(_p(params, "period", 21))
+        first = (period + 1) // 2 if period % 2 else period // 2 + 1
+        self.s1, self.s2 = _SMA(first), _SMA(period + 1 - first)
+
+    def update(self, open, high, low, close, volume):
+        self.values["value"] = self.s2.update(self.s1.update(close))
+        return self.values
+
+
+class HMAIndicator(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        period = int(_p(params, "period", 21))
+        self.half = _LWMA(max(period // 2, 1))
+        self.full = _LWMA(period)
+        self.smooth = _LWMA(max(int(math.sqrt(period)), 1))
+
+    def update(self, open, high, low, close, volume):
+        raw = 2 * self.half.update(close) - self.full.update(close)
+        self.values["value"] = self.smooth.update(raw)
+        return self.values
+
+
+class RSIIndicator(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        period = int(_p(params, "period", 14))
+        self.gain, self.loss = _Wilder(period), _Wilder(period)
+        self.prev_close = NAN
+
+    def update(self, open, high, low, close, volume):
+        delta = close - self.prev_close
+        self.prev_close = close
+        gain = self.gain.update(max(delta, 0.0) if delta == delta else NAN)
+        loss = self.loss.update(max(-delta, 0.0) if delta == delta else NAN)
+        if gain != gain:
+            rsi = NAN
+        elif loss == 0:
+            rsi = 100.0
+        else:
+            rsi = 100 - 100 / (1 + gain / loss)
+        self.values["value"] = rsi
+        return self.values
+
+
+class MACDIndicator(StreamingIndicator):
+    outputs = ("value", "signal", "histogram")
+
+    def __init__(self, params):
+        super().__init__(params)
+        self.fast = _EMA(int(_p(params, "fast", 12)))
+        self.slow = _EMA(int(_p(params, "slow", 26)))
+        self.signal = _EMA(int(_p(params, "signal", 9)))
+
+    def update(self, open, high, low, close, volume):
+        macd = self.fast.update(close) - self.slow.update(close)
+        signal = self.signal.update(macd)
+        values = self.values
+        values["value"] = macd
+        values["signal"] = signal
+        values["histogram"] = macd - signal
+        return values
+
+
+class APOIndicator(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        self.fast = _EMA(int(_p(params, "fast", 12)))
+        self.slow = _EMA(int(_p(params, "slow", 26)))
+
+    def update(self, open, high, low, close, volume):
+        self.values["value"] = self.fast.update(close) - self.slow.update(close)
+        return self.values
+
+
+class BollingerIndicator(StreamingIndicator):
+    outputs = ("upper", "middle", "lower")
+
+    def __init__(self, params):
+        super().__init__(params)
+        period = int(_p(params, "period", 20))
+        self.k = float(_p(params, "std", 2.0))
+        self.middle = _SMA(period)
+        self.moments = _RollingMoments(period)
+
+    def update(self, open, high, low, close, volume):
+        middle = self.middle.update(close)
+        band = self.k * math.sqrt(self.moments.update(close))
+        values = self.values
+        values["upper"] = middle + band
+        values["middle"] = middle
+        values["lower"] = middle - band
+        return values
+
+
+class StochasticIndicator(StreamingIndicator):
+    outputs = ("k", "d")
+
+    def __init__(self, params):
+        super().__init__(params)
+        k_period = int(_p(params, "k_period", 14))
+        self.hh = _RollingExtreme(k_period, is_max=True)
+        self.ll = _RollingExtreme(k_period, is_max=False)
+        self.d = _SMA(int(_p(params, "d_period", 3)))
+
+    def update(self, open, high, low, close, volume):
+        hh, ll = self.hh.update(high), self.ll.update(low)
+        k = _ratio(100 * (close - ll), hh - ll, 0.0)
+        self.values["k"] = k
+        self.values["d"] = self.d.update(k)
+        return self.values
+
+
+class CCIIndicator(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        self.period = int(_p(params, "period", 20))
+        self.window: deque = deque(maxlen=self.period)
+        self.sma = _SMA(self.period)
+
+    def update(self, open, high, low, close, volume):
+        tp = (high + low + close) / 3
+        self.window.append(tp)
+        mean = self.sma.update(tp)
+        if mean != mean:
+            self.values["value"] = NAN
+            return self.values
+        # 평균편차는 창 평균 기준이므로 창 전체 재계산
+        window_mean = sum(self.window) / self.period
+        mean_dev = sum(abs(x - window_mean) for x in self.window) / self.period
+        self.values["value"] = _ratio(tp - mean, 0.015 * mean_dev, 0.0)
+        return self.values
+
+
+class WilliamsRIndicator(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        period = int(_p(params, "period", 14))
+        self.hh = _RollingExtreme(period, is_max=True)
+        self.ll = _RollingExtreme(period, is_max=False)
+
+    def update(self, open, high, low, close, volume):
+        hh, ll = self.hh.update(high), self.ll.update(low)
+        self.values["value"] = _ratio(-100 * (hh - close), hh - ll, 0.0)
+        return self.values
+
+
+class MomentumIndicator(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        self.lag = _Lag(int(_p(params, "period", 10)))
+
+    def update(self, open, high, low, close, volume):
+        prev = self.lag.update(close)
+        self.values["value"] = _div(close - prev, prev) * 100
+        return self.values
+
+
+class CMOIndicator(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        period = int(_p(params, "period", 14))
+        self.up, self.down = _RollingSum(period), _RollingSum(period)
+        self.prev_close = NAN
+
+    def update(self, open, high, low, close, volume):
+        delta = close - self.prev_close
+        self.prev_close = close
+        up = self.up.update(max(delta, 0.0) if delta == delta else NAN)
+        down = self.down.update(max(-delta, 0.0) if delta == delta else NAN)
+        self.values["value"] = _ratio(100 * (up - down), up + down, 0.0)
+        return self.values
+
+
+class ATRIndicator(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        self.tr = _TrueRange()
+        self.sma = _SMA(int(_p(params, "period", 14)))
+
+    def update(self, open, high, low, close, volume):
+        self.values["value"] = self.sma.update(self.tr.update(high, low, close))
+        return self.values
+
+
+class NATRIndicator(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        self.tr = _TrueRange()
+        self.atr = _Wilder(int(_p(params, "period", 14)))
+
+    def update(self, open, high, low, close, volume):
+        self.values["value"] = _div(self.atr.update(self.tr.update(high, low, close)), close) * 100
+        return self.values
+
+
+class ADXIndicator(StreamingIndicator):
+    outputs = ("value", "plus_di", "minus_di")
+
+    def __init__(self, params):
+        super().__init__(params)
+        period = int(_p(params, "period", 14))
+        self.tr = _TrueRange()
+        self.atr, self.plus, self.minus, self.adx = (_Wilder(period) for _ in range(4))
+        self.prev_high = self.prev_low = NAN
+
+    def update(self, open, high, low, close, volume):
+        up = high - self.prev_high
+        down = self.prev_low - low
+        first = self.prev_high != self.prev_high
+        self.prev_high, self.prev_low = high, low
+
+        tr = self.tr.update(high, low, close)
+        if first:
+            # 첫 봉은 DM/TR 모두 NaN (diff 기준)
+            plus_dm = minus_dm = tr = NAN
+        else:
+            plus_dm = up if up > down and up > 0 else 0.0
+            minus_dm = down if down > up and down > 0 else 0.0
+
+        atr = self.atr.update(tr)
+        plus_di = _div(100 * self.plus.update(plus_dm), atr)
+        minus_di = _div(100 * self.minus.update(minus_dm), atr)
+        dx = _ratio(100 * abs(plus_di - minus_di), plus_di + minus_di, 0.0)
+
+        values = self.values
+        values["value"] = self.adx.update(dx)
+        values["plus_di"] = plus_di
+        values["minus_di"] = minus_di
+        return values
+
+
+class KeltnerIndicator(StreamingIndicator):
+    outputs = ("upper", "middle", "lower")
+
+    def __init__(self, params):
+        super().__init__(params)
+        period = int(_p(params, "period", 20))
+        self.k = float(_p(params, "multiplier", 2.0))
+        self.middle = _SMA(period)
+        self.tr = _TrueRange()
+        self.atr = _SMA(period)
+
+    def update(self, open, high, low, close, volume):
+        middle = self.middle.update(close)
+        band = self.k * self.atr.update(self.tr.update(high, low, close))
+        values = self.values
+        values["upper"] = middle + band
+        values["middle"] = middle
+        values["lower"] = middle - band
+        return values
+
+
+class DonchianIndicator(StreamingIndicator):
+    outputs = ("upper", "lower")
+
+    def __init__(self, params):
+        super().__init__(params)
+        period = int(_p(params, "period", 20))
+        self.hh = _RollingExtreme(period, is_max=True)
+        self.ll = _RollingExtreme(period, is_max=False)
+
+    def update(self, open, high, low, close, volume):
+        self.values["upper"] = self.hh.update(high)
+        self.values["lower"] = self.ll.update(low)
+        return self.values
+
+
+class MidpointIndicator(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        period = int(_p(params, "period", 14))
+        self.hh = _RollingExtreme(period, is_max=True)
+        self.ll = _RollingExtreme(period, is_max=False)
+
+    def update(self, open, high, low, close, volume):
+        self.values["value"] = (self.hh.update(close) + self.ll.update(close)) / 2
+        return self.values
+
+
+class MidpriceIndicator(MidpointIndicator):
+    def update(self, open, high, low, close, volume):
+        self.values["value"] = (self.hh.update(high) + self.ll.update(low)) / 2
+        return self.values
+
+
+class OBVIndicator(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        self.prev_close = NAN
+        self.value = NAN
+
+    def update(self, open, high, low, close, volume):
+        if self.value != self.value:
+            self.value = volume
+        elif close > self.prev_close:
+            self.value += volume
+        elif close < self.prev_close:
+            self.value -= volume
+        self.prev_close = close
+        self.values["value"] = self.value
+        return self.values
+
+
+class ADIndicator(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        self.value = 0.0
+
+    def update(self, open, high, low, close, volume):
+        rng = high - low
+        mfm = ((close - low) - (high - close)) / rng if rng else 0.0
+        self.value += mfm * volume
+        self.values["value"] = self.value
+        return self.values
+
+
+class MFIIndicator(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        period = int(_p(params, "period", 14))
+        self.pos, self.neg = _RollingSum(period), _RollingSum(period)
+        self.prev_tp = NAN
+
+    def update(self, open, high, low, close, volume):
+        tp = (high + low + close) / 3
+        flow = tp * volume
+        delta = tp - self.prev_tp
+        self.prev_tp = tp
+        pos = self.pos.update(flow if delta > 0 else 0.0)
+        neg = self.neg.update(flow if delta < 0 else 0.0)
+        self.values["value"] = _ratio(100 * pos, pos + neg, 0.0)
+        return self.values
+
+
+class VWMAIndicator(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        period = int(_p(params, "period", 21))
+        self.pv, self.vol = _RollingSum(period), _RollingSum(period)
+
+    def update(self, open, high, low, close, volume):
+        pv, vol = self.pv.update(close * volume), self.vol.update(volume)
+        self.values["value"] = pv / vol if vol else NAN
+        return self.values
+
+
+class LogReturnIndicator(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        self.lag = _Lag(int(_p(params, "period", 1)))
+
+    def update(self, open, high, low, close, volume):
+        prev = self.lag.update(close)
+        self.values["value"] = math.log(close / prev) if prev == prev and prev > 0 and close > 0 else NAN
+        return self.values
+
+
+class IBSIndicator(StreamingIndicator):
+    def update(self, open, high, low, close, volume):
+        rng = high - low
+        self.values["value"] = (close - low) / rng if rng else 0.0
+        return self.values
+
+
+class BOPIndicator(StreamingIndicator):
+    def update(self, open, high, low, close, volume):
+        rng = high - low
+        self.values["value"] = (close - open) / rng if rng else 0.0
+        return self.values
+
+
+class ConsecutiveIndicator(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        self.up = _p(params, "direction", "up") == "up"
+        self.prev_close = NAN
+        self.count = 0.0
+
+    def update(self, open, high, low, close, volume):
+        hit = close > self.prev_close if self.up else close < self.prev_close
+        self.count = self.count + 1 if hit else 0.0
+        self.prev_close = close
+        self.values["value"] = self.count
+        return self.values
+
+
+class DisparityIndicator(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        self.sma = _SMA(int(_p(params, "period", 20)))
+
+    def update(self, open, high, low, close, volume):
+        sma = self.sma.update(close)
+        if sma != sma:
+            value = NAN
+        else:
+            value = close / sma * 100 if sma > 0 else 100.0
+        self.values["value"] = value
+        return self.values
+
+
+class VolatilityIndicator(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        self.moments = _RollingMoments(int(_p(params, "period", 10)), ddof=1, min_count=2)
+        self.prev_close = NAN
+
+    def update(self, open, high, low, close, volume):
+        prev = self.prev_close
+        self.prev_close = close
+        ret = close / prev - 1 if prev == prev and prev else NAN
+        variance = self.moments.update(ret)
+        self.values["value"] = math.sqrt(variance) if variance == variance else 0.0
+        return self.values
+
+
+class ChangeIndicator(StreamingIndicator):
+    def __init__(self, params):
+        super().__init__(params)
+        self.prev_close = NAN
+
+    def update(self, open, high, low, close, volume):
+        prev = self.prev_close
+        self.prev_close = close
+        self.values["value"] = (close / prev - 1) * 100 if prev == prev and prev else 0.0
+        return self.values
+
+
+STREAMING_INDICATORS: Dict[str, Callable[[Dict[str, Any]], StreamingIndicator]] = {
+    # 이동평균
+    "sma": SMAIndicator,
+    "ema": EMAIndicator,
+    "wma": WildersIndicator,
+    "lwma": LWMAIndicator,
+    "dema": DEMAIndicator,
+    "tema": TEMAIndicator,
+    "trima": TRIMAIndicator,
+    "hma": HMAIndicator,
+    # 오실레이터
+    "rsi": RSIIndicator,
+    "macd": MACDIndicator,
+    "apo": APOIndicator,
+    "stochastic": StochasticIndicator,
+    "cci": CCIIndicator,
+    "williams_r": WilliamsRIndicator,
+    "momentum": MomentumIndicator,
+    "roc": MomentumIndicator,
+    "cmo": CMOIndicator,
+    # 추세/변동성
+    "adx": ADXIndicator,
+    "atr": ATRIndicator,
+    "natr": NATRIndicator,
+    "bollinger": BollingerIndicator,
+    "keltner": KeltnerIndicator,
+    "donchian": DonchianIndicator,
+    "std": STDIndicator,
+    "variance": VarianceIndicator,
+    # 통계/가격
+    "maximum": MaximumIndicator,
+    "minimum": MinimumIndicator,
+    "midpoint": MidpointIndicator,
+    "midprice": MidpriceIndicator,
+    "logr": LogReturnIndicator,
+    "ibs": IBSIndicator,
+    "bop": BOPIndicator,
+    # 거래량
+    "obv": OBVIndicator,
+    "ad": ADIndicator,
+    "adl": ADIndicator,
+    "mfi": MFIIndicator,
+    "vwma": VWMAIndicator,
+    # 커스텀
+    "consecutive": ConsecutiveIndicator,
+    "disparity": DisparityIndicator,
+    "volatility_ind": VolatilityIndicator,
+    "change": ChangeIndicator,
+    "returns": lambda params: MomentumIndicator({"period": _p(params, "period", 10)}),
+}
+
+
+def create_streaming_indicator(indicator_id: str, params: Dict[str, Any]) -> StreamingIndicator:
+    """스트리밍 지표 생성
+
+    Args:
+        indicator_id: 지표 ID (INDICATOR_REGISTRY 키)
+        params: 지표 파라미터
+
+    Raises:
+        ValueError: 스트리밍 계산을 지원하지 않는 지표
+    """
+    factory = STREAMING_INDICATORS.get(indicator_id)
+    if factory is None:
+        raise ValueError(f"스트리밍 계산을 지원하지 않는 지표입니다: {indicator_id}")
+    return factory(params)
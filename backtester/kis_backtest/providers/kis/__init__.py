@@ -7,6 +7,8 @@ from .auth import KISAuth
 from .data import KISDataProvider
 from .brokerage import KISBrokerageProvider
 from .websocket import KISWebSocket, RealtimePrice, FillNotice
+from .ws_dispatch import CallbackDispatcher
+from .ws_session import KISWebSocketSessionManager, ShardCredential, WsMessage
 
 __all__ = [
     "KISAuth",
@@ -15,4 +17,8 @@ __all__ = [
     "KISWebSocket",
     "RealtimePrice",
     "FillNotice",
+    "KISWebSocketSessionManager",
+    "ShardCredential",
+    "WsMessage",
+    "CallbackDispatcher",
 ]
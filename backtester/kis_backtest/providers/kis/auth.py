@@ -305,6 +305,27 @@ class KISAuth:
         ka_resp = ka._url_fetch(endpoint, tr_id, tr_cont, body, postFlag=True)
         return APIResp(ka_resp)  # kis_auth.APIResp를 wrapper로 감싸기
     
+    async def get_async(
+        self,
+        endpoint: str,
+        params: Dict,
+        tr_id: str,
+        tr_cont: str = ""
+    ) -> APIResp:
+        """비동기 GET 요청 - kis_auth._url_fetch_async() 경유 (keep-alive 연결 풀)
+
+        Args:
+            endpoint: API 경로
+            params: 쿼리 파라미터
+            tr_id: 트랜잭션 ID
+            tr_cont: 연속조회 키
+
+        Returns:
+            APIResp wrapper 객체
+        """
+        ka_resp = await ka._url_fetch_async(endpoint, tr_id, tr_cont, params, postFlag=False)
+        return APIResp(ka_resp)
+
     def request(
         self,
         method: str,
@@ -326,6 +347,8 @@ class KISAuth:
         
         Returns:
             kis_auth의 APIResp 객체
+
+        호출 간격은 kis_auth.rate_limiter(환경/TR 분류별 토큰 버킷)가 관리합니다.
         """
         if method.upper() == "GET":
             return self.get(endpoint, params or {}, tr_id, tr_cont)
@@ -343,7 +366,28 @@ class KISAuth:
         tr_env = ka.getTREnv()
         return tr_env.my_token
     
+    @property
+    def rate_env(self) -> str:
+        """레이트 리밋 환경 키 (prod/vps)"""
+        return "vps" if self.is_paper else "prod"
+
+    def on_rate_limited(self, tr_id: str = "", seconds: float = 1.0) -> None:
+        """EGW00201(초당 한도 초과) 응답 시 공용 리미터를 seconds 동안 보류
+
+        다음 요청은 kis_auth._url_fetch의 리미터에서 자동으로 대기합니다.
+        """
+        ka.rate_limiter.penalize(self.rate_env, ka.classify_tr(tr_id), seconds)
+
+    @staticmethod
+    def rate_limit_metrics() -> Dict:
+        """공용 레이트 리미터 통계 (남은 토큰, 대기 횟수/시간)"""
+        return ka.rate_limiter.get_metrics()
+
     @staticmethod
     def smart_sleep(seconds: float = 0.1) -> None:
-        """레이트 리밋 대응 슬립 - kis_auth.smart_sleep() 호출"""
+        """레이트 리밋 대응 슬립 - kis_auth.smart_sleep() 호출
+
+        REST 호출은 kis_auth._url_fetch의 공용 리미터가 간격을 관리하므로
+        페이지 조회 사이에 호출할 필요가 없습니다 (하위 호환용).
+        """
         ka.smart_sleep()
@@ -3,16 +3,25 @@
 api_v1/routers/kis_data.py, api_v1/services/data_service.py 기반.
 """
 
+import asyncio
+import concurrent.futures
 import logging
-import time
 from datetime import date, datetime, timedelta
-from typing import Callable, List, Optional
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
 
 # EGW00201: 초당 API 호출 한도 초과
 _RATE_LIMIT_CODE = "EGW00201"
-_RATE_LIMIT_WAIT = 61  # 초 (KIS 한도 초기화 대기)
+_RATE_LIMIT_WAIT = 1.0  # 초 (공용 리미터 보류 시간, 초당 한도 초기화 대기)
 _RATE_LIMIT_MAX_RETRIES = 3
 
+# 일봉 API 페이지당 최대 건수
+_DAILY_PAGE_SIZE = 100
+# 일괄 조회 시 구간 분할 단위 (130일 ≈ 90영업일 → 구간당 1페이지)
+_DAILY_WINDOW_DAYS = 130
+# 일괄 조회 동시 요청 수
+_BULK_CONCURRENCY = 8
+
+from ...data.bars import BarAggregator, BarInterval
 from ...models import Bar, Quote, Resolution, IndexBar
 from ...models.trading import Subscription
 from ...models.market_data import StockInfo, FinancialData
@@ -21,9 +30,32 @@ from .auth import KISAuth
 from .constants import ApiPath, TrId, EXCHANGE_TO_KIS
 from .websocket import KISWebSocket, RealtimePrice
 
+import kis_auth as ka  # .auth가 backtester 루트를 sys.path에 추가
+
 logger = logging.getLogger(__name__)
 
 
+def _split_windows(start: date, end: date, days: int) -> List[Tuple[date, date]]:
+    """[start, end]를 days일 단위 구간으로 분할 (최근 구간부터)"""
+    windows = []
+    cursor = end
+    while cursor >= start:
+        window_start = max(start, cursor - timedelta(days=days - 1))
+        windows.append((window_start, cursor))
+        cursor = window_start - timedelta(days=1)
+    return windows
+
+
+def _run_coroutine(coro):
+    """동기 코드에서 코루틴 실행 (이벤트 루프 안에서 호출되면 별도 스레드 사용)"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
 class KISDataProvider:
     """한국투자증권 데이터 제공자
 
@@ -41,6 +73,7 @@ class KISDataProvider:
         """
         self._auth = auth
         self._ws_client = None  # WebSocket 클라이언트 (필요시 초기화)
+        self._bar_aggregator: Optional[BarAggregator] = None  # interval 지정 실시간 구독 시 생성
     
     def get_history(
         self,
@@ -79,15 +112,8 @@ class KISDataProvider:
         all_data = []
         current_end = end_str
         
-        while True:
-            params = {
-                "FID_COND_MRKT_DIV_CODE": "J",
-                "FID_INPUT_ISCD": symbol,
-                "FID_INPUT_DATE_1": start_str,
-                "FID_INPUT_DATE_2": current_end,
-                "FID_PERIOD_DIV_CODE": "D",
-                "FID_ORG_ADJ_PRC": "0",  # 수정주가
-            }
+        while current_end:
+            params = self._daily_params(symbol, start_str, current_end)
 
             # EGW00201 rate limit 자동 재시도
             resp = None
@@ -101,7 +127,7 @@ class KISDataProvider:
                             f"[RateLimit] {symbol} EGW00201 — {_RATE_LIMIT_WAIT}초 대기 후 재시도 "
                             f"({attempt + 1}/{_RATE_LIMIT_MAX_RETRIES})"
                         )
-                        time.sleep(_RATE_LIMIT_WAIT)
+                        self._auth.on_rate_limited(seconds=_RATE_LIMIT_WAIT)
                     continue
                 break  # 다른 에러
 
@@ -114,38 +140,233 @@ class KISDataProvider:
                 break
             
             all_data.extend(data)
-            
-            # 페이지네이션: 마지막 날짜가 시작일 이전이면 종료
-            last_date = data[-1].get("stck_bsop_date", "")
-            if last_date <= start_str or len(data) < 100:
-                break
-            
-            current_end = (
-                datetime.strptime(last_date, "%Y%m%d") - timedelta(days=1)
-            ).strftime("%Y%m%d")
-            
-            self._auth.smart_sleep()
+            current_end = self._next_daily_cursor(data, start_str)
         
-        # Bar 객체로 변환
-        bars = []
-        for row in all_data:
+        bars = self._parse_daily_rows(all_data)
+        logger.info(f"일봉 조회 완료: {symbol}, {len(bars)}건")
+        return bars
+
+    @staticmethod
+    def _daily_params(symbol: str, start_str: str, end_str: str) -> dict:
+        """일봉 조회 파라미터"""
+        return {
+            "FID_COND_MRKT_DIV_CODE": "J",
+            "FID_INPUT_ISCD": symbol,
+            "FID_INPUT_DATE_1": start_str,
+            "FID_INPUT_DATE_2": end_str,
+            "FID_PERIOD_DIV_CODE": "D",
+            "FID_ORG_ADJ_PRC": "0",  # 수정주가
+        }
+
+    @staticmethod
+    def _next_daily_cursor(data: list, start_str: str) -> Optional[str]:
+        """다음 페이지 종료일 (마지막 페이지면 None)"""
+        # 페이지네이션: 마지막 날짜가 시작일 이전이면 종료
+        last_date = data[-1].get("stck_bsop_date", "")
+        if last_date <= start_str or len(data) < _DAILY_PAGE_SIZE:
+            return None
+        return (
+            datetime.strptime(last_date, "%Y%m%d") - timedelta(days=1)
+        ).strftime("%Y%m%d")
+
+    @staticmethod
+    def _parse_daily_rows(rows: list) -> List[Bar]:
+        """일봉 응답 → Bar 리스트 (시간순, 날짜 중복 제거)"""
+        bars = {}
+        for row in rows:
             try:
-                bars.append(Bar(
+                bar = Bar(
                     time=datetime.strptime(row.get("stck_bsop_date", ""), "%Y%m%d"),
                     open=float(row.get("stck_oprc", 0)),
                     high=float(row.get("stck_hgpr", 0)),
                     low=float(row.get("stck_lwpr", 0)),
                     close=float(row.get("stck_clpr", 0)),
                     volume=int(row.get("acml_vol", 0)),
-                ))
+                )
             except (ValueError, TypeError) as e:
                 logger.warning(f"데이터 파싱 오류: {e}")
                 continue
+            bars[bar.time] = bar
         
         # 시간순 정렬
-        bars.sort(key=lambda b: b.time)
-        logger.info(f"일봉 조회 완료: {symbol}, {len(bars)}건")
-        return bars
+        return [bars[t] for t in sorted(bars)]
+
+    # ========================================
+    # 다종목 일괄 조회 (asyncio + 연결 풀)
+    # ========================================
+
+    async def _get_daily_rows_async(self, symbol: str, start: date, end: date) -> list:
+        """일봉 원본 행 비동기 조회 (_get_daily_bars와 같은 페이지네이션)
+
+        Raises:
+            KISError: 페이지 조회 실패 (받은 페이지까지만 돌려주면 구간 전체가 조회 완료로 기록됨)
+        """
+        start_str = start.strftime("%Y%m%d")
+        current_end = end.strftime("%Y%m%d")
+        all_data = []
+
+        while current_end:
+            params = self._daily_params(symbol, start_str, current_end)
+
+            resp = None
+            for attempt in range(_RATE_LIMIT_MAX_RETRIES):
+                resp = await self._auth.get_async(ApiPath.DOMESTIC_DAILY, params, TrId.DAILY_PRICE)
+                if resp.is_ok():
+                    break
+                if resp.error_code == _RATE_LIMIT_CODE:
+                    if attempt < _RATE_LIMIT_MAX_RETRIES - 1:
+                        logger.warning(
+                            f"[RateLimit] {symbol} EGW00201 — {_RATE_LIMIT_WAIT}초 보류 후 재시도 "
+                            f"({attempt + 1}/{_RATE_LIMIT_MAX_RETRIES})"
+                        )
+                        self._auth.on_rate_limited(seconds=_RATE_LIMIT_WAIT)
+                    continue
+                break
+
+            if not resp.is_ok():
+                raise KISError(
+                    f"[{resp.error_code}] {resp.error_message}",
+                    error_code=resp.error_code,
+                    error_message=resp.error_message,
+                )
+
+            data = resp.get_output2()
+            if not data:
+                break
+
+            all_data.extend(data)
+            current_end = self._next_daily_cursor(data, start_str)
+
+        return all_data
+
+    async def iter_history_ranges(
+        self,
+        ranges: Iterable[Tuple[str, date, date]],
+        max_concurrency: int = _BULK_CONCURRENCY,
+    ) -> AsyncIterator[Tuple[Tuple[str, date, date], List[Bar]]]:
+        """여러 (종목, 시작일, 종료일) 일봉을 동시에 조회, 완료되는 순서대로 반환
+
+        긴 구간은 페이지 하나에 들어가는 크기(_DAILY_WINDOW_DAYS)로 나눠
+        종목·구간 전체를 동시에 요청합니다. 실제 호출 속도는
+        kis_auth.rate_limiter가 정하므로 네트워크 지연이 아닌 레이트 리밋에 맞춰 끝납니다.
+
+        결과는 나눈 구간(창) 단위로 반환하며, 실패한 창은 로그만 남기고 건너뜁니다.
+        받은 창만 저장소에 조회 완료로 기록되므로 실패한 창은 다음 요청 때 다시 조회됩니다.
+
+        Args:
+            ranges: (종목코드, 시작일, 종료일) 목록
+            max_concurrency: 동시 요청 수 (연결 풀 크기 이하)
+
+        Yields:
+            ((종목코드, 창 시작일, 창 종료일), Bar 리스트)
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def fetch_window(job: Tuple[str, date, date]):
+            symbol, start, end = job
+            try:
+                async with semaphore:
+                    rows = await self._get_daily_rows_async(symbol, start, end)
+                return job, self._parse_daily_rows(rows)
+            except Exception as e:
+                logger.error(f"일봉 조회 실패: {symbol} {start}~{end} - {e}")
+                return job, None
+
+        tasks = [
+            asyncio.ensure_future(fetch_window((symbol, s, e)))
+            for symbol, start, end in ranges
+            for s, e in _split_windows(start, end, _DAILY_WINDOW_DAYS)
+        ]
+        try:
+            for future in asyncio.as_completed(tasks):
+                job, bars = await future
+                if bars is None:
+                    continue
+                logger.info(f"일봉 조회 완료: {job[0]} {job[1]}~{job[2]}, {len(bars)}건")
+                yield job, bars
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def iter_history_many(
+        self,
+        symbols: List[str],
+        start: date,
+        end: date,
+        max_concurrency: int = _BULK_CONCURRENCY,
+    ) -> AsyncIterator[Tuple[str, List[Bar]]]:
+        """여러 종목 일봉 동시 조회, 완료되는 창 순서대로 (종목코드, Bar 리스트) 반환
+
+        한 종목이 여러 번 나올 수 있고 실패한 창은 빠지므로, 조회 구간 전체를 완료로
+        기록하려면 iter_history_ranges의 창 구간을 사용하세요.
+
+        사용법:
+            async for symbol, bars in provider.iter_history_many(symbols, start, end):
+                store.write_bars(symbol, bars)
+        """
+        async for (symbol, _, _), bars in self.iter_history_ranges(
+            [(symbol, start, end) for symbol in symbols], max_concurrency
+        ):
+            yield symbol, bars
+
+    def get_history_ranges(
+        self,
+        ranges: Iterable[Tuple[str, date, date]],
+        on_result: Optional[Callable[[Tuple[str, date, date], List[Bar]], None]] = None,
+        max_concurrency: int = _BULK_CONCURRENCY,
+    ) -> Dict[Tuple[str, date, date], List[Bar]]:
+        """iter_history_ranges의 동기 버전
+
+        Args:
+            on_result: 창 하나가 완료될 때마다 호출 (완료 순서, 실패한 창은 호출 안 함)
+
+        Returns:
+            {(종목코드, 창 시작일, 창 종료일): Bar 리스트}
+        """
+        async def collect():
+            results = {}
+            try:
+                async for job, bars in self.iter_history_ranges(ranges, max_concurrency):
+                    results[job] = bars
+                    if on_result is not None:
+                        on_result(job, bars)
+            finally:
+                await ka.close_async_client()
+            return results
+
+        return _run_coroutine(collect())
+
+    def get_history_many(
+        self,
+        symbols: List[str],
+        start: date,
+        end: date,
+        on_result: Optional[Callable[[str, List[Bar]], None]] = None,
+        max_concurrency: int = _BULK_CONCURRENCY,
+    ) -> Dict[str, List[Bar]]:
+        """여러 종목 일봉 동시 조회 (동기 버전)
+
+        Args:
+            symbols: 종목코드 목록
+            start: 시작일
+            end: 종료일
+            on_result: 창 하나가 완료될 때마다 (종목코드, 그 창의 Bar 리스트)로 호출
+            max_concurrency: 동시 요청 수
+
+        Returns:
+            {종목코드: Bar 리스트}
+        """
+        def forward(job, bars):
+            if on_result is not None:
+                on_result(job[0], bars)
+
+        results = self.get_history_ranges(
+            [(symbol, start, end) for symbol in symbols], forward, max_concurrency
+        )
+        merged: Dict[str, List[Bar]] = {}
+        for (symbol, _, _), bars in sorted(results.items(), key=lambda item: item[0]):
+            merged.setdefault(symbol, []).extend(bars)
+        return merged
     
     def _get_minute_bars(self, symbol: str, target_date: date) -> List[Bar]:
         """분봉 조회
@@ -194,7 +415,6 @@ class KISDataProvider:
                 break
             
             current_time = min_time
-            self._auth.smart_sleep()
         
         # Bar 객체로 변환
         bars = []
@@ -260,7 +480,8 @@ class KISDataProvider:
         self,
         symbols: List[str],
         on_bar: Callable[[str, Bar], None],
-        timeout: Optional[float] = None
+        timeout: Optional[float] = None,
+        interval: Optional[BarInterval] = None,
     ) -> Subscription:
         """실시간 데이터 구독
         
@@ -270,44 +491,22 @@ class KISDataProvider:
             symbols: 종목코드 리스트
             on_bar: 콜백 함수 (symbol, Bar) -> None
             timeout: 타임아웃 (초). None이면 무한 실행
+            interval: 봉 해상도 ("1s", "1m", "5m", "100t" 등).
+                None이면 체결마다 당일 시/고/저가 기준 Bar 전달 (기존 방식)
         
         Returns:
             Subscription 객체
         """
-        # WebSocket 클라이언트 생성
-        if self._ws_client is None:
-            self._ws_client = KISWebSocket.from_auth(self._auth)
-
-        # RealtimePrice를 Bar로 변환하는 래퍼
-        def price_to_bar(symbol: str, price: RealtimePrice):
-            try:
-                # 시간 파싱 (HHMMSS)
-                time_str = price.time
-                today = datetime.now().date()
-                dt = datetime.combine(
-                    today,
-                    datetime.strptime(time_str, "%H%M%S").time()
-                )
-                
-                bar = Bar(
-                    time=dt,
-                    open=float(price.open_price),
-                    high=float(price.high_price),
-                    low=float(price.low_price),
-                    close=float(price.price),
-                    volume=price.volume,
-                )
-                on_bar(symbol, bar)
-            except Exception as e:
-                logger.error(f"Bar 변환 오류: {e}")
-        
-        self._ws_client.subscribe_price(symbols, price_to_bar)
+        ws_client = self.subscribe_realtime_async(symbols, on_bar, interval=interval)
         
         sub_id = f"sub_{datetime.now().timestamp()}"
         logger.info(f"실시간 구독 시작: {symbols}")
         
         # 블로킹 실행
-        self._ws_client.start(timeout=timeout)
+        try:
+            ws_client.start(timeout=timeout)
+        finally:
+            self.flush_realtime_bars()
         
         return Subscription(
             id=sub_id,
@@ -318,11 +517,14 @@ class KISDataProvider:
     def subscribe_realtime_async(
         self,
         symbols: List[str],
-        on_bar: Callable[[str, Bar], None]
+        on_bar: Callable[[str, Bar], None],
+        interval: Optional[BarInterval] = None,
     ) -> "KISWebSocket":
         """실시간 데이터 구독 (비동기)
         
         WebSocket 클라이언트를 반환하여 호출자가 직접 start()를 호출.
+        interval 지정 시 봉 타이머(1초)가 함께 시작되므로, 종료 후 flush_realtime_bars()로
+        타이머를 멈추고 미완성 봉을 전달하세요.
         
         Returns:
             KISWebSocket 클라이언트 (호출자가 .start() 호출 필요)
@@ -330,8 +532,53 @@ class KISDataProvider:
         if self._ws_client is None:
             self._ws_client = KISWebSocket.from_auth(self._auth)
 
+        # 봉 집계는 체결을 하나도 버리면 안 되므로 수신 루프에서 바로 실행하고,
+        # 완성 봉의 사용자 콜백만 디스패처로 넘김
+        self._ws_client.subscribe_price(
+            symbols, self._price_callback(on_bar, interval), inline=interval is not None
+        )
+        logger.info(f"실시간 구독 등록: {symbols} (봉: {interval or '체결'})")
+        
+        return self._ws_client
+    
+    @property
+    def bar_aggregator(self) -> Optional[BarAggregator]:
+        """interval 지정 실시간 구독의 봉 집계기 (완성 봉 history 조회용)"""
+        return self._bar_aggregator
+    
+    def flush_realtime_bars(self) -> None:
+        """실시간 구독 종료 시 봉 타이머를 멈추고 진행 중인 봉 전달"""
+        if self._bar_aggregator is not None:
+            self._bar_aggregator.stop_clock()
+            self._bar_aggregator.flush()
+    
+    def _dispatched_bar(self, on_bar: Callable[[str, Bar], None]) -> Callable[[str, Bar], None]:
+        """완성 봉 콜백을 WebSocket 디스패처로 실행 (느린 on_bar가 봉 집계를 막지 않음)"""
+        ws_client = self._ws_client
+
+        def deliver(symbol: str, bar: Bar) -> None:
+            # 완성 봉은 분당 몇 건뿐이므로 버리지 않음
+            ws_client.dispatch(f"bar:{symbol}", on_bar, symbol, bar, lossless=True)
+
+        return deliver
+
+    def _price_callback(
+        self,
+        on_bar: Callable[[str, Bar], None],
+        interval: Optional[BarInterval],
+    ) -> Callable[[str, RealtimePrice], None]:
+        """RealtimePrice 콜백 생성 (interval 지정 시 봉 집계, 아니면 체결마다 Bar 변환)"""
+        if interval is not None:
+            if self._bar_aggregator is None:
+                self._bar_aggregator = BarAggregator()
+            self._bar_aggregator.subscribe(interval, self._dispatched_bar(on_bar))
+            # 체결이 끊긴 종목의 마지막 봉도 경계가 지나면 마감되도록 벽시계로 진행
+            self._bar_aggregator.start_clock()
+            return self._bar_aggregator.on_price
+
         def price_to_bar(symbol: str, price: RealtimePrice):
             try:
+                # 시간 파싱 (HHMMSS)
                 time_str = price.time
                 today = datetime.now().date()
                 dt = datetime.combine(
@@ -351,10 +598,7 @@ class KISDataProvider:
             except Exception as e:
                 logger.error(f"Bar 변환 오류: {e}")
         
-        self._ws_client.subscribe_price(symbols, price_to_bar)
-        logger.info(f"실시간 구독 등록: {symbols}")
-        
-        return self._ws_client
+        return price_to_bar
     
     def get_stock_info(self, symbol: str) -> Optional[StockInfo]:
         """종목 정보 조회 (미구현)"""
@@ -422,7 +666,6 @@ class KISDataProvider:
                 break
             
             tr_cont = "N"
-            self._auth.smart_sleep()
         
         # Bar 객체로 변환
         bars = []
@@ -501,7 +744,7 @@ class KISDataProvider:
                             f"[RateLimit] 지수 {index_code} EGW00201 — {_RATE_LIMIT_WAIT}초 대기 후 재시도 "
                             f"({attempt + 1}/{_RATE_LIMIT_MAX_RETRIES})"
                         )
-                        time.sleep(_RATE_LIMIT_WAIT)
+                        self._auth.on_rate_limited(seconds=_RATE_LIMIT_WAIT)
                     continue
                 break
 
@@ -541,7 +784,6 @@ class KISDataProvider:
             cursor_date = (
                 datetime.strptime(last_date, "%Y%m%d") - timedelta(days=1)
             ).strftime("%Y%m%d")
-            self._auth.smart_sleep()
 
         # 오래된 순 정렬
         all_bars.sort(key=lambda b: b.time)
@@ -31,7 +31,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from io import StringIO
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
 
 import pandas as pd
 import requests
@@ -46,6 +46,9 @@ if str(_root) not in sys.path:
 
 import kis_auth as ka
 
+from .ws_dispatch import DEFAULT_QUEUE_SIZE, DEFAULT_WORKERS, DISPATCH_POLICIES, CallbackDispatcher
+from .ws_parser import WsRecordParser
+
 logger = logging.getLogger(__name__)
 
 
@@ -81,6 +84,26 @@ PRICE_COLUMNS = [
     "HOUR_CLS_CODE", "MRKT_TRTM_CLS_CODE", "VI_STND_PRC"
 ]
 
+# 실시간 호가 컬럼 (H0STASP0)
+ORDERBOOK_COLUMNS = [
+    "MKSC_SHRN_ISCD", "BSOP_HOUR", "HOUR_CLS_CODE",
+    "ASKP1", "ASKP2", "ASKP3", "ASKP4", "ASKP5",
+    "ASKP6", "ASKP7", "ASKP8", "ASKP9", "ASKP10",
+    "BIDP1", "BIDP2", "BIDP3", "BIDP4", "BIDP5",
+    "BIDP6", "BIDP7", "BIDP8", "BIDP9", "BIDP10",
+    "ASKP_RSQN1", "ASKP_RSQN2", "ASKP_RSQN3", "ASKP_RSQN4", "ASKP_RSQN5",
+    "ASKP_RSQN6", "ASKP_RSQN7", "ASKP_RSQN8", "ASKP_RSQN9", "ASKP_RSQN10",
+    "BIDP_RSQN1", "BIDP_RSQN2", "BIDP_RSQN3", "BIDP_RSQN4", "BIDP_RSQN5",
+    "BIDP_RSQN6", "BIDP_RSQN7", "BIDP_RSQN8", "BIDP_RSQN9", "BIDP_RSQN10",
+    "TOTAL_ASKP_RSQN", "TOTAL_BIDP_RSQN", "OVTM_TOTAL_ASKP_RSQN", "OVTM_TOTAL_BIDP_RSQN",
+    "ANTC_CNPR", "ANTC_CNQN", "ANTC_VOL", "ANTC_CNTG_VRSS", "ANTC_CNTG_VRSS_SIGN",
+    "ANTC_CNTG_PRDY_CTRT", "ACML_VOL", "TOTAL_ASKP_RSQN_ICDC", "TOTAL_BIDP_RSQN_ICDC",
+    "OVTM_TOTAL_ASKP_ICDC", "OVTM_TOTAL_BIDP_ICDC", "STCK_DEAL_CLS_CODE"
+]
+
+# 파싱 모드 (fast: 레코드 직접 분할, dataframe: pandas DataFrame 경유)
+PARSE_MODES = ("fast", "dataframe")
+
 # 체결 통보 컬럼
 FILL_COLUMNS = [
     "CUST_ID", "ACNT_NO", "ODER_NO", "ODER_QTY", "SELN_BYOV_CLS", "RCTF_CLS",
@@ -195,13 +218,29 @@ class KISWebSocket:
     def __init__(
         self,
         auth: "KISAuth",  # type: ignore
-        hts_id: Optional[str] = None
+        hts_id: Optional[str] = None,
+        parse_mode: str = "fast",
+        dispatch: str = "drop_oldest",
+        dispatch_queue_size: int = DEFAULT_QUEUE_SIZE,
+        dispatch_workers: int = DEFAULT_WORKERS,
     ):
         """
         Args:
             auth: KISAuth 인스턴스
             hts_id: HTS ID (체결통보에 필요, None이면 kis_devlp.yaml의 my_htsid 사용)
+            parse_mode: "fast"(기본, DataFrame 없이 분할) 또는 "dataframe"
+            dispatch: 콜백 실행 방식
+                "drop_oldest"(기본): 워커 스레드에서 실행, 종목별 큐가 차면 오래된 시세부터 버림
+                "conflate": 워커 스레드에서 실행, 종목별 최신 시세 1건만 유지
+                "inline": 수신 루프에서 바로 실행 (느린 콜백이 수신을 막음)
+            dispatch_queue_size: 종목별 대기 시세 수 (drop_oldest)
+            dispatch_workers: 콜백 워커 스레드 수
         """
+        if parse_mode not in PARSE_MODES:
+            raise ValueError(f"지원하지 않는 parse_mode: {parse_mode} (가능: {PARSE_MODES})")
+        if dispatch not in DISPATCH_POLICIES:
+            raise ValueError(f"지원하지 않는 dispatch: {dispatch} (가능: {DISPATCH_POLICIES})")
+        self.parse_mode = parse_mode
         self.auth = auth
         self.is_paper = auth.is_paper
         
@@ -225,11 +264,23 @@ class KISWebSocket:
         # 구독 관리
         self._subscriptions: Dict[str, dict] = {}
         self._data_map: Dict[str, dict] = {}
+
+        # TR ID별 컬럼→인덱스 맵 (구독 시 갱신)
+        self._parser = WsRecordParser()
+        self._parser.register(WsTrId.REALTIME_PRICE, PRICE_COLUMNS)
+        self._parser.register(WsTrId.FILL_NOTICE_REAL, FILL_COLUMNS)
+        self._parser.register(WsTrId.FILL_NOTICE_PAPER, FILL_COLUMNS)
         
         # 콜백
         self._price_callback: Optional[Callable[[str, RealtimePrice], None]] = None
+        self._price_inline = False  # True면 체결가 콜백을 디스패처 없이 수신 루프에서 실행
         self._fill_callback: Optional[Callable[[FillNotice], None]] = None
         self._on_result: Optional[Callable] = None
+
+        # 콜백 디스패처 (inline이면 None)
+        self._dispatcher: Optional[CallbackDispatcher] = None
+        if dispatch != "inline":
+            self._dispatcher = CallbackDispatcher(dispatch, dispatch_queue_size, dispatch_workers)
         
         # 재연결
         self._max_retries = 5
@@ -239,37 +290,58 @@ class KISWebSocket:
         logger.info(f"KISWebSocket (kis_auth) 초기화: is_paper={self.is_paper}, ws_url={self._ws_url}")
     
     @classmethod
-    def from_auth(cls, auth: "KISAuth", hts_id: Optional[str] = None) -> "KISWebSocket":  # type: ignore
+    def from_auth(
+        cls,
+        auth: "KISAuth",  # type: ignore
+        hts_id: Optional[str] = None,
+        parse_mode: str = "fast",
+        **kwargs,
+    ) -> "KISWebSocket":
         """KISAuth 인스턴스로 초기화 (권장)
         
         Args:
             auth: KISAuth 인스턴스
             hts_id: HTS ID (선택, None이면 kis_devlp.yaml에서 자동 로드)
+            parse_mode: "fast" 또는 "dataframe"
+            **kwargs: dispatch, dispatch_queue_size, dispatch_workers
         
         Returns:
             KISWebSocket 인스턴스
         """
-        return cls(auth, hts_id)
+        return cls(auth, hts_id, parse_mode, **kwargs)
     
     @classmethod
-    def from_env(cls, mode: Optional[str] = None, hts_id: Optional[str] = None) -> "KISWebSocket":
+    def from_env(
+        cls,
+        mode: Optional[str] = None,
+        hts_id: Optional[str] = None,
+        parse_mode: str = "fast",
+        **kwargs,
+    ) -> "KISWebSocket":
         """환경변수 대신 kis_devlp.yaml에서 로드 (하위 호환)
         
         Args:
             mode: "live" 또는 "paper" (None이면 "paper")
             hts_id: HTS ID (선택)
+            parse_mode: "fast" 또는 "dataframe"
+            **kwargs: dispatch, dispatch_queue_size, dispatch_workers
         
         Returns:
             KISWebSocket 인스턴스
         """
         from .auth import KISAuth
         auth = KISAuth.from_env(mode)
-        return cls(auth, hts_id)
+        return cls(auth, hts_id, parse_mode, **kwargs)
     
     # ========================================
     # 접속키 발급
     # ========================================
     
+    @property
+    def _rate_env(self) -> str:
+        """레이트 리밋 환경 키 (prod/vps)"""
+        return "vps" if self.is_paper else "prod"
+
     def get_approval_key(self) -> str:
         """WebSocket 접속키 반환
         
@@ -334,15 +406,19 @@ class KISWebSocket:
     def subscribe_price(
         self,
         symbols: List[str],
-        callback: Callable[[str, RealtimePrice], None]
+        callback: Callable[[str, RealtimePrice], None],
+        inline: bool = False,
     ) -> None:
         """실시간 체결가 구독
         
         Args:
             symbols: 종목코드 리스트 (예: ["005930", "000660"])
             callback: 콜백 함수 (symbol, RealtimePrice) -> None
+            inline: True면 dispatch 정책과 관계없이 수신 루프에서 바로 실행.
+                체결을 하나도 버리면 안 되는 가벼운 콜백(봉 집계 등)용
         """
         self._price_callback = callback
+        self._price_inline = inline
         
         name = "price"
         if name not in self._subscriptions:
@@ -435,7 +511,7 @@ class KISWebSocket:
         
         encrypted = parts[0] == "1"
         tr_id = parts[1]
-        # count = int(parts[2])  # 데이터 건수
+        count = int(parts[2]) if parts[2].isdigit() else 1  # 데이터 건수
         data = parts[3]
         
         # 암호화된 경우 복호화
@@ -447,6 +523,26 @@ class KISWebSocket:
                 logger.error(f"복호화 실패: {e}")
                 return
         
+        is_price = tr_id == WsTrId.REALTIME_PRICE and self._price_callback
+        is_fill = tr_id in (WsTrId.FILL_NOTICE_REAL, WsTrId.FILL_NOTICE_PAPER) and self._fill_callback
+        if not (is_price or is_fill):
+            return
+
+        if self.parse_mode == "dataframe":
+            rows = self._parse_dataframe(tr_id, dm, data)
+            if rows is None:
+                return
+        else:
+            rows = self._parser.parse(tr_id, data, count)
+        
+        # TR ID별 콜백 호출
+        if is_price:
+            self._process_price_data(rows)
+        else:
+            self._process_fill_data(rows)
+
+    def _parse_dataframe(self, tr_id: str, dm: dict, data: str) -> Optional[pd.DataFrame]:
+        """DataFrame 파싱 (parse_mode="dataframe")"""
         # 컬럼 정보 가져오기
         columns = dm.get("columns", [])
         if not columns:
@@ -457,7 +553,7 @@ class KISWebSocket:
         
         # DataFrame으로 파싱
         try:
-            df = pd.read_csv(
+            return pd.read_csv(
                 StringIO(data),
                 header=None,
                 sep="^",
@@ -466,17 +562,22 @@ class KISWebSocket:
             )
         except Exception as e:
             logger.error(f"데이터 파싱 오류: {e}")
-            return
-        
-        # TR ID별 콜백 호출
-        if tr_id == WsTrId.REALTIME_PRICE and self._price_callback:
-            self._process_price_data(df)
-        elif tr_id in (WsTrId.FILL_NOTICE_REAL, WsTrId.FILL_NOTICE_PAPER) and self._fill_callback:
-            self._process_fill_data(df)
-    
-    def _process_price_data(self, df: pd.DataFrame) -> None:
-        """실시간 체결가 데이터 처리 및 콜백"""
-        for _, row in df.iterrows():
+            return None
+    
+    @staticmethod
+    def _iter_rows(rows) -> Iterable:
+        """DataFrame이면 행 단위로, 레코드 리스트면 그대로 순회"""
+        if isinstance(rows, pd.DataFrame):
+            return (row for _, row in rows.iterrows())
+        return rows
+
+    def _process_price_data(self, rows) -> None:
+        """실시간 체결가 데이터 처리 및 콜백
+
+        Args:
+            rows: WsRecord 리스트 또는 DataFrame (컬럼명으로 get 가능한 행)
+        """
+        for row in self._iter_rows(rows):
             try:
                 price_data = RealtimePrice(
                     symbol=str(row.get("MKSC_SHRN_ISCD", "")),
@@ -494,14 +595,20 @@ class KISWebSocket:
                     bid_price=int(row.get("BIDP1", 0) or 0),
                 )
                 
-                self._price_callback(price_data.symbol, price_data)
+                if self._dispatcher is None or self._price_inline:
+                    self._price_callback(price_data.symbol, price_data)
+                else:
+                    self._dispatcher.submit(
+                        price_data.symbol, self._price_callback, price_data.symbol, price_data,
+                        exchange_time=price_data.time,
+                    )
                 
             except Exception as e:
                 logger.error(f"체결가 콜백 오류: {e}")
     
-    def _process_fill_data(self, df: pd.DataFrame) -> None:
+    def _process_fill_data(self, rows) -> None:
         """체결 통보 데이터 처리 및 콜백"""
-        for _, row in df.iterrows():
+        for row in self._iter_rows(rows):
             try:
                 is_fill = str(row.get("CNTG_YN", "")) == "2"
                 is_rejected = str(row.get("RFUS_YN", "")) == "Y"
@@ -520,7 +627,14 @@ class KISWebSocket:
                     is_rejected=is_rejected,
                 )
                 
-                self._fill_callback(notice)
+                if self._dispatcher is None:
+                    self._fill_callback(notice)
+                else:
+                    # 체결 통보는 버리지 않음
+                    self._dispatcher.submit(
+                        f"fill:{notice.symbol}", self._fill_callback, notice,
+                        exchange_time=notice.fill_time, lossless=True,
+                    )
                 
             except Exception as e:
                 logger.error(f"체결통보 콜백 오류: {e}")
@@ -540,10 +654,11 @@ class KISWebSocket:
             if tr_id not in self._data_map:
                 self._data_map[tr_id] = {}
             self._data_map[tr_id]["columns"] = columns
+            self._parser.register(tr_id, columns)
             
             logger.info(f"구독 요청 전송: {tr_id} - {item}")
+            await ka.rate_limiter.acquire_async(self._rate_env, "ws")
             await ws.send(json.dumps(msg))
-            await asyncio.sleep(0.1)  # rate limit
     
     async def _subscriber(self, ws) -> None:
         """메시지 수신 루프"""
@@ -605,6 +720,8 @@ class KISWebSocket:
             timeout: 실행 시간 제한 (초). None이면 무한 실행
         """
         self._running = True
+        if self._dispatcher is not None:
+            self._dispatcher.start()
         
         try:
             if timeout:
@@ -617,12 +734,37 @@ class KISWebSocket:
             logger.info("사용자 중단 (Ctrl+C)")
         finally:
             self._running = False
+            # 대기 중인 콜백까지 실행한 뒤 반환
+            if self._dispatcher is not None:
+                self._dispatcher.stop(drain=True)
     
     def stop(self) -> None:
         """WebSocket 종료"""
         self._running = False
         logger.info("WebSocket 종료 요청")
     
+    def dispatch(
+        self,
+        key: str,
+        callback: Callable,
+        *args: Any,
+        exchange_time: Any = None,
+        lossless: bool = False,
+    ) -> None:
+        """사용자 콜백을 디스패처로 실행 (inline이거나 디스패처가 멈춰 있으면 바로 실행)
+        
+        Args:
+            key: 순서를 보장할 단위 (종목코드 등)
+            callback: 실행할 함수
+            *args: 콜백 인자
+            exchange_time: 거래소 체결시간 (HHMMSS, 지연 통계용)
+            lossless: True면 큐 크기와 정책에 관계없이 버리지 않음
+        """
+        if self._dispatcher is None or not self._dispatcher.is_running:
+            callback(*args)
+            return
+        self._dispatcher.submit(key, callback, *args, exchange_time=exchange_time, lossless=lossless)
+    
     # ========================================
     # 속성
     # ========================================
@@ -632,6 +774,12 @@ class KISWebSocket:
         """실행 상태"""
         return self._running
     
+    def get_dispatch_stats(self) -> Dict[str, Any]:
+        """콜백 디스패치 통계 (큐 깊이, 드롭 수, 큐 대기/체결시간 기준 지연, 콜백 실행 시간)"""
+        if self._dispatcher is None:
+            return {"policy": "inline"}
+        return self._dispatcher.get_stats()
+    
     @property
     def subscribed_symbols(self) -> List[str]:
         """구독 중인 종목 목록"""
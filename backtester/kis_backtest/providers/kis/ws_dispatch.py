@@ -0,0 +1,250 @@
+"""WebSocket 콜백 디스패처
+
+수신 루프와 사용자 콜백을 분리합니다. 수신 루프는 콜백을 종목별 큐에 넣기만 하고,
+워커 스레드가 꺼내 실행하므로 콜백 안에서 주문(REST) 등 느린 작업을 해도
+소켓 수신과 PINGPONG 응답이 밀리지 않습니다.
+
+- 종목(키)별 큐 크기 제한, 가득 차면 정책에 따라 처리
+    drop_oldest: 가장 오래된 항목을 버리고 추가
+    conflate: 종목별 최신 항목 1건만 유지 (처리되지 않은 이전 시세는 덮어씀)
+- 같은 종목의 콜백은 수신 순서대로 한 번에 하나씩 실행, 종목 간에는 순환 처리
+- 체결 통보 등 lossless로 넣은 항목은 버리지 않음
+- 큐 대기 시간, 거래소 체결시간 → 콜백 시작 지연(초 단위 체결시간 기준), 콜백 실행 시간 통계
+
+사용 예:
+    dispatcher = CallbackDispatcher(policy="conflate")
+    dispatcher.start()
+    dispatcher.submit("005930", on_price, "005930", price, exchange_time=price.time)
+    dispatcher.stop()
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 디스패치 정책 (inline: 수신 루프에서 바로 실행, 기존 동작)
+DISPATCH_POLICIES = ("inline", "drop_oldest", "conflate")
+
+DEFAULT_QUEUE_SIZE = 1000  # 종목별 대기 항목 수 (drop_oldest)
+DEFAULT_WORKERS = 1
+
+# (callback, args, 큐 투입 시각(monotonic), 거래소 체결시간(자정 기준 초) 또는 None)
+_Item = Tuple[Callable, tuple, float, Optional[int]]
+
+
+class _LatencyStat:
+    """지연 누적 통계 (초)"""
+
+    __slots__ = ("count", "total", "max", "last")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.last = value
+        if value > self.max:
+            self.max = value
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "avg_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "max_ms": self.max * 1000,
+            "last_ms": self.last * 1000,
+        }
+
+
+def _exchange_seconds(value: Any) -> Optional[int]:
+    """체결시간(HHMMSS) → 자정 기준 초"""
+    if not value:
+        return None
+    try:
+        text = str(value)
+        return int(text[0:2]) * 3600 + int(text[2:4]) * 60 + int(text[4:6])
+    except (TypeError, ValueError):
+        return None
+
+
+class CallbackDispatcher:
+    """종목별 제한 큐 + 워커 스레드 콜백 실행기
+
+    Args:
+        policy: "drop_oldest" 또는 "conflate"
+        queue_size: 종목별 최대 대기 항목 수 (conflate는 항상 1)
+        workers: 워커 스레드 수 (같은 종목은 동시에 실행되지 않음)
+    """
+
+    def __init__(
+        self,
+        policy: str = "drop_oldest",
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        workers: int = DEFAULT_WORKERS,
+    ):
+        if policy not in DISPATCH_POLICIES or policy == "inline":
+            raise ValueError(f"지원하지 않는 디스패치 정책: {policy} (가능: drop_oldest, conflate)")
+        self.policy = policy
+        self.queue_size = 1 if policy == "conflate" else max(1, queue_size)
+        self.workers = max(1, workers)
+
+        self._pending: Dict[str, Deque[_Item]] = {}
+        self._ready: Deque[str] = deque()  # 처리할 항목이 있는 키 (실행 중인 키는 제외)
+        self._scheduled: Set[str] = set()  # ready에 있거나 실행 중인 키
+        self._cond = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._running = False
+
+        self.submitted = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.errors = 0
+        self.max_depth = 0
+        self._queue_latency = _LatencyStat()
+        self._exchange_latency = _LatencyStat()
+        self._handler_time = _LatencyStat()
+
+    # ========== 실행 ==========
+    def start(self) -> None:
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+            self._threads = [
+                threading.Thread(target=self._worker, name=f"ws-dispatch-{i}", daemon=True)
+                for i in range(self.workers)
+            ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, drain: bool = True, timeout: Optional[float] = 5.0) -> None:
+        """워커 종료
+
+        Args:
+            drain: 남은 항목을 모두 실행한 뒤 종료 (False면 버림)
+            timeout: 워커 종료 대기 (초)
+        """
+        with self._cond:
+            if not drain:
+                self.dropped += sum(len(q) for q in self._pending.values())
+                self._pending.clear()
+                self._ready.clear()
+            self._running = False
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    @property
+    def is_running(self) -> bool:
+        """워커 실행 상태"""
+        return self._running
+
+    # ========== 입력 ==========
+    def submit(
+        self,
+        key: str,
+        callback: Callable,
+        *args: Any,
+        exchange_time: Any = None,
+        lossless: bool = False,
+    ) -> None:
+        """콜백 실행 예약 (수신 루프에서 호출, 블로킹 없음)
+
+        Args:
+            key: 순서를 보장할 단위 (종목코드 등)
+            callback: 실행할 함수
+            *args: 콜백 인자
+            exchange_time: 거래소 체결시간 (HHMMSS, 지연 통계용)
+            lossless: True면 큐 크기와 정책에 관계없이 버리지 않음 (체결 통보)
+        """
+        item = (callback, args, time.monotonic(), _exchange_seconds(exchange_time))
+        with self._cond:
+            queue = self._pending.get(key)
+            if queue is None:
+                queue = self._pending[key] = deque()
+            if not lossless:
+                while len(queue) >= self.queue_size:
+                    queue.popleft()
+                    self.dropped += 1
+            queue.append(item)
+            self.submitted += 1
+            if len(queue) > self.max_depth:
+                self.max_depth = len(queue)
+            if key not in self._scheduled:
+                self._scheduled.add(key)
+                self._ready.append(key)
+                self._cond.notify()
+
+    # ========== 통계 ==========
+    @property
+    def depth(self) -> int:
+        """전체 대기 항목 수"""
+        with self._cond:
+            return sum(len(q) for q in self._pending.values())
+
+    def get_stats(self) -> Dict[str, Any]:
+        """큐 깊이/드롭/지연 통계"""
+        with self._cond:
+            depths = {key: len(q) for key, q in self._pending.items() if q}
+            return {
+                "policy": self.policy,
+                "workers": self.workers,
+                "submitted": self.submitted,
+                "delivered": self.delivered,
+                "dropped": self.dropped,
+                "errors": self.errors,
+                "queue_depth": sum(depths.values()),
+                "max_depth": self.max_depth,
+                "busiest": sorted(depths.items(), key=lambda kv: kv[1], reverse=True)[:5],
+                "queue_latency": self._queue_latency.to_dict(),
+                "exchange_latency": self._exchange_latency.to_dict(),
+                "handler_time": self._handler_time.to_dict(),
+            }
+
+    # ========== 내부 ==========
+    def _worker(self) -> None:
+        while True:
+            with self._cond:
+                while not self._ready and self._running:
+                    self._cond.wait()
+                if not self._ready:
+                    return  # 종료 (drain 완료)
+                key = self._ready.popleft()
+                callback, args, enqueued_at, exchange_seconds = self._pending[key].popleft()
+
+            started = time.monotonic()
+            exchange_latency = None
+            if exchange_seconds is not None:
+                now = datetime.now()
+                exchange_latency = now.hour * 3600 + now.minute * 60 + now.second + now.microsecond / 1e6 - exchange_seconds
+            failed = False
+            try:
+                callback(*args)
+            except Exception as e:
+                failed = True
+                logger.error(f"콜백 오류 ({key}): {e}")
+            finished = time.monotonic()
+
+            with self._cond:
+                self.delivered += 1
+                if failed:
+                    self.errors += 1
+                self._queue_latency.add(started - enqueued_at)
+                self._handler_time.add(finished - started)
+                if exchange_latency is not None:
+                    self._exchange_latency.add(exchange_latency)
+                if self._pending[key]:
+                    self._ready.append(key)
+                    self._cond.notify()
+                else:
+                    self._scheduled.discard(key)
@@ -0,0 +1,104 @@
+"""실시간 WebSocket 메시지 고속 파서
+
+`^` 구분 본문을 DataFrame 없이 바로 레코드로 분할.
+
+KIS 실시간 데이터 형식:
+    {암호화(0/1)}|{TR ID}|{데이터 건수}|{필드1^필드2^...}
+
+여러 건이 한 메시지로 오면 필드가 건수 × 컬럼 수만큼 이어 붙어 있으므로
+컬럼 수 단위로 잘라 레코드를 만듭니다. TR ID별 컬럼→인덱스 맵은
+구독 시점에 한 번만 만들어 두고 메시지마다 재사용합니다.
+
+사용 예:
+    parser = WsRecordParser()
+    parser.register("H0STCNT0", PRICE_COLUMNS)
+    for record in parser.parse("H0STCNT0", body, count=2):
+        print(record["STCK_PRPR"])
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+
+class WsRecord:
+    """실시간 데이터 1건 (필드 리스트 + 공유 컬럼 인덱스)
+
+    `get()`/`[]`는 pandas 행(Series)과 같은 방식으로 컬럼명 조회를 지원합니다.
+    값은 모두 원본 문자열입니다.
+    """
+
+    __slots__ = ("tr_id", "_fields", "_index")
+
+    def __init__(self, tr_id: str, fields: List[str], index: Dict[str, int]):
+        self.tr_id = tr_id
+        self._fields = fields
+        self._index = index
+
+    def __getitem__(self, column: str) -> str:
+        return self._fields[self._index[column]]
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def get(self, column: str, default=None):
+        """컬럼 값 (없으면 default)"""
+        i = self._index.get(column)
+        if i is None or i >= len(self._fields):
+            return default
+        return self._fields[i]
+
+    def to_dict(self) -> Dict[str, str]:
+        """{컬럼: 값} 딕셔너리"""
+        return {
+            column: self._fields[i]
+            for column, i in self._index.items()
+            if i < len(self._fields)
+        }
+
+    def __repr__(self) -> str:
+        return f"WsRecord({self.tr_id}, {len(self._fields)} fields)"
+
+
+class WsRecordParser:
+    """TR ID별 컬럼 스키마를 등록해 두고 실시간 본문을 WsRecord 리스트로 분할"""
+
+    def __init__(self):
+        self._schemas: Dict[str, Tuple[Tuple[str, ...], Dict[str, int]]] = {}
+
+    def register(self, tr_id: str, columns: Sequence[str]) -> None:
+        """TR ID 컬럼 등록 (같은 컬럼이면 기존 인덱스 맵 재사용)"""
+        columns = tuple(columns)
+        schema = self._schemas.get(tr_id)
+        if schema is not None and schema[0] == columns:
+            return
+        self._schemas[tr_id] = (columns, {column: i for i, column in enumerate(columns)})
+
+    def has(self, tr_id: str) -> bool:
+        """등록 여부"""
+        return tr_id in self._schemas
+
+    def columns(self, tr_id: str) -> Optional[Tuple[str, ...]]:
+        """등록된 컬럼 (미등록이면 None)"""
+        schema = self._schemas.get(tr_id)
+        return schema[0] if schema else None
+
+    def parse(self, tr_id: str, data: str, count: int = 1) -> List[WsRecord]:
+        """`^` 구분 본문 → 레코드 리스트
+
+        Args:
+            tr_id: TR ID (등록되지 않았으면 KeyError)
+            data: 복호화된 본문
+            count: 데이터 건수 (메시지의 세 번째 필드)
+        """
+        columns, index = self._schemas[tr_id]
+        fields = data.split("^")
+        if count <= 1:
+            return [WsRecord(tr_id, fields, index)]
+
+        # 건수 × 컬럼 수가 맞지 않으면(컬럼 추가 등) 균등 분할
+        width = len(columns)
+        if width * count != len(fields):
+            width = len(fields) // count
+        return [
+            WsRecord(tr_id, fields[i * width:(i + 1) * width], index)
+            for i in range(count)
+        ]
@@ -0,0 +1,536 @@
+"""한국투자증권 WebSocket 다중 연결 세션 관리자
+
+연결 하나당 구독 한도(40건)를 넘는 종목을 여러 접속키/연결(샤드)에 나눠 구독.
+
+- 구독 추가 시 가장 여유 있는 샤드에 배정, 해제 후 샤드 간 편차가 커지면 재분배
+- 샤드별로 독립 재연결 (지수 백오프) 후 배정된 구독만 다시 등록
+- 모든 샤드의 메시지를 수신 순서대로 하나의 큐/콜백으로 병합
+- 샤드별 메시지 수, 재연결 수, 마지막 수신 경과, 큐 대기(lag) 통계 제공
+
+사용 예:
+    from kis_backtest.providers.kis import KISAuth
+    from kis_backtest.providers.kis.ws_session import KISWebSocketSessionManager, ShardCredential
+
+    auth = KISAuth.from_env()
+    manager = KISWebSocketSessionManager.from_auth(
+        auth,
+        extra_credentials=[ShardCredential(app_key="...", app_secret="...")],
+    )
+
+    async def main():
+        await manager.subscribe_price(symbols)       # 300+ 종목
+        await manager.subscribe_orderbook(symbols[:30])
+        await manager.start()
+        async for msg in manager.stream():
+            for record in msg.records:
+                print(msg.tr_id, record["MKSC_SHRN_ISCD"])
+"""
+
+import asyncio
+import json
+import logging
+import random
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import websockets
+
+from .websocket import (
+    ORDERBOOK_COLUMNS,
+    PRICE_COLUMNS,
+    WsTrId,
+    aes_cbc_base64_dec,
+    parse_system_response,
+)
+from .ws_parser import WsRecord, WsRecordParser
+
+import kis_auth as ka  # .websocket이 backtester 루트를 sys.path에 추가
+
+logger = logging.getLogger(__name__)
+
+# 연결 하나당 최대 구독 수 (KIS 제한)
+MAX_SUBSCRIPTIONS_PER_CONNECTION = 40
+
+# 해제 후 샤드 간 구독 수 차이가 이보다 크면 재분배
+REBALANCE_SLACK = 5
+
+# 재연결 백오프 (초)
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+
+SubscriptionKey = Tuple[str, str]  # (tr_id, tr_key)
+
+
+@dataclass
+class ShardCredential:
+    """샤드 접속 자격 (앱키별로 접속키 발급)"""
+    app_key: str
+    app_secret: str
+    approval_key: Optional[str] = None
+
+
+@dataclass
+class WsMessage:
+    """병합 스트림 메시지"""
+    seq: int                 # 전체 수신 순번
+    shard: int               # 수신 샤드 번호
+    tr_id: str               # TR ID
+    records: List[WsRecord]  # 파싱된 레코드 (다건 메시지는 여러 개)
+    received_at: float       # 수신 시각 (time.monotonic)
+
+
+@dataclass
+class _Shard:
+    """연결 하나의 상태"""
+    index: int
+    credential: ShardCredential
+    subscriptions: Set[SubscriptionKey] = field(default_factory=set)
+    active: Set[SubscriptionKey] = field(default_factory=set)  # 현재 연결에 등록된 구독
+    ws: Optional[object] = None
+    task: Optional[asyncio.Task] = None
+    wake: Optional[asyncio.Event] = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    keys: Dict[str, Tuple[str, str]] = field(default_factory=dict)  # tr_id → (key, iv)
+
+    # 통계
+    messages: int = 0
+    reconnects: int = 0
+    last_message_at: Optional[float] = None
+    lag_total: float = 0.0
+    lag_max: float = 0.0
+    lag_count: int = 0
+
+    @property
+    def state(self) -> str:
+        if self.ws is not None:
+            return "connected"
+        if self.subscriptions:
+            return "connecting"
+        return "idle"
+
+
+class KISWebSocketSessionManager:
+    """여러 WebSocket 연결에 구독을 나눠 관리하는 세션 관리자
+
+    샤드 수 = 자격(앱키) 수 × connections_per_key, 전체 구독 한도 = 샤드 수 × 40.
+    """
+
+    def __init__(
+        self,
+        credentials: Sequence[ShardCredential],
+        is_paper: bool = True,
+        connections_per_key: int = 1,
+        on_message: Optional[Callable[[WsMessage], None]] = None,
+        queue_size: int = 10000,
+        ws_url: Optional[str] = None,
+    ):
+        """
+        Args:
+            credentials: 앱키 자격 목록 (1개 이상)
+            is_paper: 모의투자 여부
+            connections_per_key: 앱키당 연결 수
+            on_message: 병합 메시지 콜백 (None이면 stream()으로 직접 소비)
+            queue_size: 병합 큐 크기 (가득 차면 수신 루프가 대기)
+            ws_url: WebSocket URL (None이면 kis_auth 설정)
+        """
+        if not credentials:
+            raise ValueError("자격(앱키)이 최소 1개 필요합니다.")
+
+        self.is_paper = is_paper
+        self.on_message = on_message
+        self.queue_size = queue_size
+        self._ws_url = ws_url or ka.getTREnv().my_url_ws
+
+        self._shards: List[_Shard] = [
+            _Shard(index=i * connections_per_key + j, credential=credential)
+            for i, credential in enumerate(credentials)
+            for j in range(max(1, connections_per_key))
+        ]
+        self._assignment: Dict[SubscriptionKey, int] = {}
+
+        self._parser = WsRecordParser()
+        self._parser.register(WsTrId.REALTIME_PRICE, PRICE_COLUMNS)
+        self._parser.register(WsTrId.REALTIME_QUOTE, ORDERBOOK_COLUMNS)
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._dispatcher: Optional[asyncio.Task] = None
+        self._running = False
+        self._seq = 0
+
+    @classmethod
+    def from_auth(
+        cls,
+        auth: "KISAuth",  # type: ignore
+        extra_credentials: Optional[Iterable[ShardCredential]] = None,
+        **kwargs,
+    ) -> "KISWebSocketSessionManager":
+        """kis_devlp.yaml 앱키 + 추가 앱키로 초기화
+
+        Args:
+            auth: KISAuth 인스턴스 (실전/모의 구분)
+            extra_credentials: 추가 앱키 (샤드 확장용)
+        """
+        env = ka.getEnv()
+        if auth.is_paper:
+            base = ShardCredential(env.get("paper_app", ""), env.get("paper_sec", ""))
+        else:
+            base = ShardCredential(env.get("my_app", ""), env.get("my_sec", ""))
+        base.approval_key = ka._getBaseHeader_ws().get("approval_key") or None
+        credentials = [base, *(extra_credentials or [])]
+        return cls(credentials, is_paper=auth.is_paper, **kwargs)
+
+    # ========================================
+    # 구독 관리
+    # ========================================
+
+    @property
+    def capacity(self) -> int:
+        """전체 구독 한도"""
+        return len(self._shards) * MAX_SUBSCRIPTIONS_PER_CONNECTION
+
+    @property
+    def subscriptions(self) -> List[SubscriptionKey]:
+        """전체 구독 목록"""
+        return list(self._assignment)
+
+    def register_columns(self, tr_id: str, columns: Sequence[str]) -> None:
+        """TR ID 컬럼 등록 (체결가/호가 외 TR 구독 시)"""
+        self._parser.register(tr_id, columns)
+
+    async def subscribe(self, tr_id: str, tr_keys: Iterable[str]) -> None:
+        """구독 추가 (가장 여유 있는 샤드에 배정)
+
+        Raises:
+            ValueError: 전체 구독 한도 초과 또는 컬럼 미등록 TR
+        """
+        if not self._parser.has(tr_id):
+            raise ValueError(f"컬럼이 등록되지 않은 TR: {tr_id} (register_columns 필요)")
+
+        new_keys = [(tr_id, k) for k in dict.fromkeys(tr_keys) if (tr_id, k) not in self._assignment]
+        if len(self._assignment) + len(new_keys) > self.capacity:
+            raise ValueError(
+                f"구독 한도 초과: {len(self._assignment) + len(new_keys)} > {self.capacity} "
+                f"(샤드 {len(self._shards)}개 × {MAX_SUBSCRIPTIONS_PER_CONNECTION})"
+            )
+
+        for key in new_keys:
+            shard = min(self._shards, key=lambda s: (len(s.subscriptions), s.index))
+            await self._assign(key, shard)
+
+    async def unsubscribe(self, tr_id: str, tr_keys: Iterable[str]) -> None:
+        """구독 해제 (필요 시 재분배)"""
+        for tr_key in tr_keys:
+            key = (tr_id, tr_key)
+            index = self._assignment.pop(key, None)
+            if index is None:
+                continue
+            shard = self._shards[index]
+            shard.subscriptions.discard(key)
+            await self._sync_shard(shard)
+
+        await self.rebalance()
+
+    async def subscribe_price(self, symbols: Iterable[str]) -> None:
+        """실시간 체결가 구독"""
+        await self.subscribe(WsTrId.REALTIME_PRICE, symbols)
+
+    async def subscribe_orderbook(self, symbols: Iterable[str]) -> None:
+        """실시간 호가 구독"""
+        await self.subscribe(WsTrId.REALTIME_QUOTE, symbols)
+
+    async def rebalance(self) -> int:
+        """샤드 간 구독 수 편차가 REBALANCE_SLACK을 넘으면 재분배
+
+        옮겨지는 구독은 해제 후 새 샤드에서 다시 등록되므로 잠깐 수신이 끊길 수 있습니다.
+
+        Returns:
+            이동한 구독 수
+        """
+        moved = 0
+        while True:
+            fullest = max(self._shards, key=lambda s: len(s.subscriptions))
+            emptiest = min(self._shards, key=lambda s: len(s.subscriptions))
+            gap = len(fullest.subscriptions) - len(emptiest.subscriptions)
+            if gap <= (REBALANCE_SLACK if moved == 0 else 1):
+                break
+            key = next(iter(fullest.subscriptions))
+            fullest.subscriptions.discard(key)
+            await self._sync_shard(fullest)
+            await self._assign(key, emptiest)
+            moved += 1
+
+        if moved:
+            logger.info(f"[WsSession] 재분배: {moved}건 이동")
+        return moved
+
+    async def _assign(self, key: SubscriptionKey, shard: _Shard) -> None:
+        self._assignment[key] = shard.index
+        shard.subscriptions.add(key)
+        if shard.wake is not None:
+            shard.wake.set()
+        await self._sync_shard(shard)
+
+    async def _sync_shard(self, shard: _Shard) -> None:
+        """연결된 샤드의 등록 상태를 배정 목록과 일치시킴"""
+        ws = shard.ws
+        if ws is None:
+            return  # 연결 시 전체 등록
+        try:
+            async with shard.lock:
+                await self._register(shard, ws)
+        except Exception as e:
+            # 연결 오류는 수신 루프에서 재연결 처리
+            logger.warning(f"[WsSession] 샤드 {shard.index} 구독 동기화 실패: {e}")
+
+    # ========================================
+    # 연결
+    # ========================================
+
+    def _issue_approval_key(self, credential: ShardCredential) -> str:
+        """앱키별 WebSocket 접속키 발급"""
+        svr = "vps" if self.is_paper else "prod"
+        ka.rate_limiter.acquire(svr, "approval")
+        res = ka._session.post(
+            f"{ka.getEnv()[svr]}/oauth2/Approval",
+            data=json.dumps({
+                "grant_type": "client_credentials",
+                "appkey": credential.app_key,
+                "secretkey": credential.app_secret,
+            }),
+            headers={"content-type": "application/json"},
+        )
+        if res.status_code != 200:
+            raise RuntimeError(f"접속키 발급 실패 (HTTP {res.status_code})")
+        return res.json()["approval_key"]
+
+    async def _send(self, shard: _Shard, ws, key: SubscriptionKey, tr_type: str) -> None:
+        tr_id, tr_key = key
+        msg = {
+            "header": {
+                "approval_key": shard.credential.approval_key,
+                "custtype": "P",
+                "tr_type": tr_type,
+                "content-type": "utf-8",
+            },
+            "body": {"input": {"tr_id": tr_id, "tr_key": tr_key}},
+        }
+        await ka.rate_limiter.acquire_async("vps" if self.is_paper else "prod", "ws")
+        await ws.send(json.dumps(msg))
+
+    async def _register(self, shard: _Shard, ws) -> None:
+        """배정 목록과 등록 상태의 차이만 등록/해제 (전송 중 변경분까지 반영)"""
+        while shard.subscriptions != shard.active:
+            for key in list(shard.subscriptions - shard.active):
+                await self._send(shard, ws, key, "1")
+                shard.active.add(key)
+            for key in list(shard.active - shard.subscriptions):
+                await self._send(shard, ws, key, "2")
+                shard.active.discard(key)
+
+    async def _run_shard(self, shard: _Shard) -> None:
+        """샤드 연결 유지 루프 (독립 재연결)"""
+        attempt = 0
+        while self._running:
+            if not shard.subscriptions:
+                shard.wake.clear()
+                await shard.wake.wait()
+                continue
+
+            try:
+                if not shard.credential.approval_key:
+                    shard.credential.approval_key = await asyncio.to_thread(
+                        self._issue_approval_key, shard.credential
+                    )
+
+                async with websockets.connect(self._ws_url, ping_interval=30, ping_timeout=10) as ws:
+                    # 배정된 구독 전체 등록
+                    async with shard.lock:
+                        shard.active.clear()
+                        await self._register(shard, ws)
+                        shard.ws = ws
+                    attempt = 0
+                    logger.info(f"[WsSession] 샤드 {shard.index} 연결: 구독 {len(shard.active)}건")
+
+                    async for raw in ws:
+                        await self._on_raw(shard, ws, raw)
+
+                    raise ConnectionError("서버가 연결을 종료했습니다.")
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                shard.ws = None
+                shard.active.clear()
+                if not self._running:
+                    break
+                shard.reconnects += 1
+                delay = min(BACKOFF_MAX, BACKOFF_BASE * (2 ** attempt)) * random.uniform(0.5, 1.0)
+                attempt += 1
+                logger.warning(
+                    f"[WsSession] 샤드 {shard.index} 연결 오류: {e} - {delay:.1f}초 후 재연결"
+                )
+                await asyncio.sleep(delay)
+            finally:
+                shard.ws = None
+
+    async def _on_raw(self, shard: _Shard, ws, raw: str) -> None:
+        """수신 메시지 처리 (실시간 데이터는 병합 큐로)"""
+        received_at = time.monotonic()
+
+        if raw[0] in ("0", "1"):
+            parts = raw.split("|", 3)
+            if len(parts) < 4:
+                return
+            tr_id = parts[1]
+            data = parts[3]
+            if parts[0] == "1":
+                key_iv = shard.keys.get(tr_id)
+                if key_iv is None:
+                    return
+                data = aes_cbc_base64_dec(key_iv[0], key_iv[1], data)
+            if not self._parser.has(tr_id):
+                return
+
+            count = int(parts[2]) if parts[2].isdigit() else 1
+            shard.messages += 1
+            shard.last_message_at = received_at
+            self._seq += 1
+            await self._queue.put(WsMessage(
+                seq=self._seq,
+                shard=shard.index,
+                tr_id=tr_id,
+                records=self._parser.parse(tr_id, data, count),
+                received_at=received_at,
+            ))
+            return
+
+        rsp = parse_system_response(raw)
+        if rsp["is_pingpong"]:
+            await ws.pong(raw)
+            return
+        if rsp["iv"] and rsp["ekey"]:
+            shard.keys[rsp["tr_id"]] = (rsp["ekey"], rsp["iv"])
+        if not rsp["is_ok"] and not rsp["is_unsub"]:
+            logger.warning(f"[WsSession] 샤드 {shard.index} 구독 응답: {rsp['tr_id']} {rsp['tr_key']} - {rsp['tr_msg']}")
+
+    # ========================================
+    # 병합 스트림
+    # ========================================
+
+    async def stream(self) -> AsyncIterator[WsMessage]:
+        """모든 샤드 메시지를 수신 순서대로 반환 (소비자 1개)"""
+        while self._running or (self._queue is not None and not self._queue.empty()):
+            msg = await self._queue.get()
+            if msg is None:  # stop() 신호
+                break
+            lag = time.monotonic() - msg.received_at
+            shard = self._shards[msg.shard]
+            shard.lag_total += lag
+            shard.lag_count += 1
+            shard.lag_max = max(shard.lag_max, lag)
+            yield msg
+
+    async def _dispatch(self) -> None:
+        async for msg in self.stream():
+            try:
+                self.on_message(msg)
+            except Exception as e:
+                logger.error(f"[WsSession] 콜백 오류: {e}")
+
+    # ========================================
+    # 실행
+    # ========================================
+
+    async def start(self) -> None:
+        """샤드 연결 시작 (현재 이벤트 루프)"""
+        if self._running:
+            return
+        self._running = True
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        for shard in self._shards:
+            shard.wake = asyncio.Event()
+            if shard.subscriptions:
+                shard.wake.set()
+            shard.task = asyncio.create_task(self._run_shard(shard))
+        if self.on_message is not None:
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        logger.info(
+            f"[WsSession] 시작: 샤드 {len(self._shards)}개, 구독 {len(self._assignment)}/{self.capacity}"
+        )
+
+    async def stop(self) -> None:
+        """모든 연결 종료"""
+        self._running = False
+        for shard in self._shards:
+            if shard.ws is not None:
+                try:
+                    await shard.ws.close()
+                except Exception:
+                    pass
+        tasks = [s.task for s in self._shards if s.task is not None]
+        if self._dispatcher is not None:
+            tasks.append(self._dispatcher)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._queue is not None:
+            try:
+                self._queue.put_nowait(None)  # stream() 소비자 종료
+            except asyncio.QueueFull:
+                pass
+        for shard in self._shards:
+            shard.task = None
+            shard.ws = None
+            shard.active.clear()
+        self._dispatcher = None
+        logger.info("[WsSession] 종료")
+
+    def run(self, timeout: Optional[float] = None) -> None:
+        """블로킹 실행 (on_message 콜백 필요)
+
+        Args:
+            timeout: 실행 시간 제한 (초). None이면 무한 실행
+        """
+        if self.on_message is None:
+            raise ValueError("run()은 on_message 콜백이 필요합니다. 비동기 사용 시 stream()을 사용하세요.")
+
+        async def main():
+            await self.start()
+            try:
+                await asyncio.sleep(timeout) if timeout else await asyncio.Event().wait()
+            finally:
+                await self.stop()
+
+        try:
+            asyncio.run(main())
+        except KeyboardInterrupt:
+            logger.info("사용자 중단 (Ctrl+C)")
+
+    # ========================================
+    # 통계
+    # ========================================
+
+    def get_metrics(self) -> Dict:
+        """샤드별 상태/지연 통계"""
+        now = time.monotonic()
+        shards = []
+        for s in self._shards:
+            shards.append({
+                "shard": s.index,
+                "state": s.state,
+                "subscriptions": len(s.subscriptions),
+                "messages": s.messages,
+                "reconnects": s.reconnects,
+                "last_message_age_seconds": (now - s.last_message_at) if s.last_message_at else None,
+                "avg_lag_ms": (s.lag_total / s.lag_count * 1000) if s.lag_count else 0.0,
+                "max_lag_ms": s.lag_max * 1000,
+            })
+        return {
+            "shards": shards,
+            "subscriptions": len(self._assignment),
+            "capacity": self.capacity,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "messages": sum(s.messages for s in self._shards),
+        }
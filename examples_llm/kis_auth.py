@@ -3,7 +3,6 @@
 # ====|  API 호출 공통 함수 포함                                  |=====================
 
 import asyncio
-import copy
 import json
 import logging
 import os
@@ -29,6 +28,14 @@ from Crypto.Cipher import AES
 # pip install pycryptodome
 from Crypto.Util.Padding import unpad
 
+# pip install orjson (선택, 설치되어 있으면 응답 JSON 디코딩에 사용)
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 clearConsole = lambda: os.system("cls" if os.name in ("nt", "dos") else "clear")
 
 key_bytes = 32
@@ -64,6 +71,15 @@ _base_headers = {
     "User-Agent": _cfg["my_agent"],
 }
 
+# HTTP 연결 재사용 (keep-alive: 호출마다 TCP/TLS 핸드셰이크 방지)
+_session = requests.Session()
+_session.mount(
+    "https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=20)
+)
+
+# 메모리 토큰 캐시 (토큰값, 만료일시) - 토큰 파일 YAML 재파싱 방지
+_token_cache = None
+
 
 # 토큰 발급 받아 저장 (토큰값, 토큰 유효시간,1일, 6시간 이내 발급신청시는 기존 토큰값과 동일, 발급시 알림톡 발송)
 def save_token(my_token, my_expired):
@@ -74,9 +90,21 @@ def save_token(my_token, my_expired):
         f.write(f"token: {my_token}\n")
         f.write(f"valid-date: {valid_date}\n")
 
+    global _token_cache
+    _token_cache = (my_token, valid_date)
+
 
 # 토큰 확인 (토큰값, 토큰 유효시간_1일, 6시간 이내 발급신청시는 기존 토큰값과 동일, 발급시 알림톡 발송)
 def read_token():
+    global _token_cache
+    # 메모리 캐시 우선 (만료 전이면 파일을 읽지 않음)
+    if _token_cache is not None:
+        token, valid_date = _token_cache
+        if valid_date > datetime.now():
+            return token
+        _token_cache = None
+        return None
+
     try:
         # 토큰이 저장된 파일 읽기
         with open(token_tmp, encoding="UTF-8") as f:
@@ -90,6 +118,7 @@ def read_token():
         # print('expire dt: ', exp_dt, ' vs now dt:', now_dt)
         # 저장된 토큰 만료일자 체크 (만료일시 > 현재일시 인경우 보관 토큰 리턴)
         if exp_dt > now_dt:
+            _token_cache = (tkg_tmp["token"], tkg_tmp["valid-date"])
             return tkg_tmp["token"]
         else:
             # print('Need new token: ', tkg_tmp['valid-date'])
@@ -103,7 +132,7 @@ def read_token():
 def _getBaseHeader():
     if _autoReAuth:
         reAuth()
-    return copy.deepcopy(_base_headers)
+    return dict(_base_headers)  # 값이 모두 문자열이므로 얕은 복사로 충분
 
 
 # 가져오기 : 앱키, 앱시크리트, 종합계좌번호(계좌번호 중 숫자8자리), 계좌상품코드(계좌번호 중 숫자2자리), 토큰, 도메인
@@ -183,10 +212,44 @@ def changeTREnv(token_key, svr="prod", product=_cfg["my_prod"]):
     _setTRENV(cfg)
 
 
-def _getResultObject(json_data):
-    _tc_ = namedtuple("res", json_data.keys())
+# 응답 필드 접근 객체: 파싱한 dict 하나를 감싸 속성으로 조회 (응답마다 namedtuple 클래스를 만들지 않음)
+# namedtuple처럼 body.output, body._fields, body._asdict(), 순회/인덱스 접근을 지원
+class APIRespData:
+    __slots__ = ("_data",)
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getattr__(self, name):
+        if name == "_data" or name.startswith("__"):
+            raise AttributeError(name)
+        try:
+            return self._data[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    @property
+    def _fields(self):
+        return tuple(self._data)
+
+    def _asdict(self):
+        return dict(self._data)
 
-    return _tc_(**json_data)
+    def __iter__(self):
+        return iter(self._data.values())
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, index):
+        return tuple(self._data.values())[index]
+
+    def __repr__(self):
+        return f"APIRespData({self._data!r})"
+
+
+def _getResultObject(json_data):
+    return APIRespData(json_data)
 
 
 # Token 발급, 유효기간 1일, 6시간 이내 발급시 기존 token값 유지, 발급시 알림톡 무조건 발송
@@ -213,7 +276,7 @@ def auth(svr="prod", product=_cfg["my_prod"], url=None):
     # print("saved_token: ", saved_token)
     if saved_token is None:  # 기존 발급 토큰 확인이 안되면 발급처리
         url = f"{_cfg[svr]}/oauth2/tokenP"
-        res = requests.post(
+        res = _session.post(
             url, data=json.dumps(p), headers=_getBaseHeader()
         )  # 토큰 발급
         rescode = res.status_code
@@ -273,7 +336,7 @@ def getTREnv():
 def set_order_hash_key(h, p):
     url = f"{getTREnv().my_url}/uapi/hashkey"  # hashkey 발급 API URL
 
-    res = requests.post(url, data=json.dumps(p), headers=h)
+    res = _session.post(url, data=json.dumps(p), headers=h)
     rescode = res.status_code
     if rescode == 200:
         h["hashkey"] = _getResultObject(res.json()).HASH
@@ -286,34 +349,52 @@ class APIResp:
     def __init__(self, resp):
         self._rescode = resp.status_code
         self._resp = resp
-        self._header = self._setHeader()
-        self._body = self._setBody()
-        self._err_code = self._body.msg_cd
-        self._err_message = self._body.msg1
+        # header/body는 처음 조회할 때 한 번만 만듦
+        self._header = None
+        self._body = None
 
     def getResCode(self):
         return self._rescode
 
     def _setHeader(self):
         fld = dict()
-        for x in self._resp.headers.keys():
+        for x, value in self._resp.headers.items():
             if x.islower():
-                fld[x] = self._resp.headers.get(x)
-        _th_ = namedtuple("header", fld.keys())
+                fld[x] = value
 
-        return _th_(**fld)
+        return APIRespData(fld)
 
     def _setBody(self):
-        _tb_ = namedtuple("body", self._resp.json().keys())
-
-        return _tb_(**self._resp.json())
+        return APIRespData(_json_loads(self._resp.content))
 
     def getHeader(self):
+        if self._header is None:
+            self._header = self._setHeader()
         return self._header
 
     def getBody(self):
+        if self._body is None:
+            self._body = self._setBody()
         return self._body
 
+    def getFrame(self, output="output", numeric=None):
+        """body의 output 필드 → DataFrame (단건 dict는 1행)
+
+        Args:
+            output: body 필드명 (output, output1, output2 등)
+            numeric: 숫자로 변환할 컬럼 목록 (가격/수량 등 문자열로 오는 값, 변환 불가 값은 NaN)
+        """
+        rows = getattr(self.getBody(), output, None)
+        if not rows:
+            return pd.DataFrame()
+        if isinstance(rows, dict):
+            rows = [rows]
+        df = pd.DataFrame(rows)
+        for column in numeric or ():
+            if column in df.columns:
+                df[column] = pd.to_numeric(df[column], errors="coerce")
+        return df
+
     def getResponse(self):
         return self._resp
 
@@ -327,10 +408,10 @@ class APIResp:
             return False
 
     def getErrorCode(self):
-        return self._err_code
+        return getattr(self.getBody(), "msg_cd", "")
 
     def getErrorMessage(self):
-        return self._err_message
+        return getattr(self.getBody(), "msg1", "")
 
     def printAll(self):
         print("<Header>")
@@ -440,9 +521,9 @@ def _url_fetch(
 
     if postFlag:
         # if (hashFlag): set_order_hash_key(headers, params)
-        res = requests.post(url, headers=headers, data=json.dumps(params))
+        res = _session.post(url, headers=headers, data=json.dumps(params))
     else:
-        res = requests.get(url, headers=headers, params=params)
+        res = _session.get(url, headers=headers, params=params)
 
     if res.status_code == 200:
         ar = APIResp(res)
@@ -458,6 +539,15 @@ def _url_fetch(
 # print("Pass through the end of the line")
 
 
+async def _url_fetch_async(
+        api_url, ptr_id, tr_cont, params, appendHeaders=None, postFlag=False, hashFlag=True
+):
+    """_url_fetch의 asyncio 버전 (세션 연결 풀을 쓰는 작업 스레드에서 실행)"""
+    return await asyncio.to_thread(
+        _url_fetch, api_url, ptr_id, tr_cont, params, appendHeaders, postFlag, hashFlag
+    )
+
+
 ########### New - websocket 대응
 
 _base_headers_ws = {
@@ -469,7 +559,7 @@ def _getBaseHeader_ws():
     if _autoReAuth:
         reAuth_ws()
 
-    return copy.deepcopy(_base_headers_ws)
+    return dict(_base_headers_ws)
 
 
 def auth_ws(svr="prod", product=_cfg["my_prod"]):
@@ -485,7 +575,7 @@ def auth_ws(svr="prod", product=_cfg["my_prod"]):
     p["secretkey"] = _cfg[ak2]
 
     url = f"{_cfg[svr]}/oauth2/Approval"
-    res = requests.post(url, data=json.dumps(p), headers=_getBaseHeader())  # 토큰 발급
+    res = _session.post(url, data=json.dumps(p), headers=_getBaseHeader())  # 토큰 발급
     rescode = res.status_code
     if rescode == 200:  # 토큰 정상 발급
         approval_key = _getResultObject(res.json()).approval_key
@@ -116,50 +116,16 @@ def after_hour_balance(
         "fid_input_price_2": fid_input_price_2,
     }
 
-    # API 호출
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    # API 호출 성공 시 데이터 처리
-    if res.isOK():
-        if hasattr(res.getBody(), 'output'):
-            current_data = pd.DataFrame(res.getBody().output)
-        else:
-            current_data = pd.DataFrame()
-
-        # 기존 데이터프레임과 병합
-        if dataframe is not None:
-            dataframe = pd.concat([dataframe, current_data], ignore_index=True)
-        else:
-            dataframe = current_data
+    # 연속조회 페이지를 모아 마지막에 한 번 DataFrame으로 변환
+    current_data = ka.fetch_pages(api_url, tr_id, params, tr_cont=tr_cont, max_pages=max_depth - depth)
+    if current_data is None:
+        return pd.DataFrame()
 
-        # 연속 거래 여부 확인
-        tr_cont = res.getHeader().tr_cont
+    if dataframe is not None:
+        current_data = pd.concat([dataframe, current_data], ignore_index=True)
 
-        # 다음 페이지 호출
-        if tr_cont == "M":
-            logger.info("Calling next page...")
-            ka.smart_sleep()
-            return after_hour_balance(
-                fid_input_price_1,
-                fid_cond_mrkt_div_code,
-                fid_cond_scr_div_code,
-                fid_rank_sort_cls_code,
-                fid_div_cls_code,
-                fid_input_iscd,
-                fid_trgt_exls_cls_code,
-                fid_trgt_cls_code,
-                fid_vol_cnt,
-                fid_input_price_2,
-                "N", dataframe, depth + 1, max_depth
-            )
-        else:
-            logger.info("Data fetch complete.")
-            return dataframe
-    else:
-        # API 호출 실패 시 에러 로그 출력
-        logger.error("API call failed: %s - %s", res.getErrorCode(), res.getErrorMessage())
-        res.printError(api_url)
-        return pd.DataFrame()
+    logger.info("Data fetch complete.")
+    return current_data
 
 
 ##############################################################################################
@@ -3787,41 +3753,22 @@ def inquire_balance(
         "CTX_AREA_NK100": NK100
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # output1 처리
-        current_data1 = pd.DataFrame(res.getBody().output1)
-        if dataframe1 is not None:
-            dataframe1 = pd.concat([dataframe1, current_data1], ignore_index=True)
-        else:
-            dataframe1 = current_data1
-
-        # output2 처리
-        current_data2 = pd.DataFrame(res.getBody().output2)
-        if dataframe2 is not None:
-            dataframe2 = pd.concat([dataframe2, current_data2], ignore_index=True)
-        else:
-            dataframe2 = current_data2
+    # 연속조회 페이지를 모아 마지막에 한 번 DataFrame으로 변환 (CTX_AREA_* 연속키 자동 처리)
+    result = ka.fetch_pages(
+        api_url, tr_id, params, outputs=("output1", "output2"),
+        tr_cont=tr_cont, max_pages=max_depth - depth + 1
+    )
+    if result is None:
+        return pd.DataFrame(), pd.DataFrame()
 
-        tr_cont = res.getHeader().tr_cont
-        FK100 = res.getBody().ctx_area_fk100
-        NK100 = res.getBody().ctx_area_nk100
+    current_data1, current_data2 = result
+    if dataframe1 is not None:
+        current_data1 = pd.concat([dataframe1, current_data1], ignore_index=True)
+    if dataframe2 is not None:
+        current_data2 = pd.concat([dataframe2, current_data2], ignore_index=True)
 
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return inquire_balance(
-                env_dv, cano, acnt_prdt_cd, afhr_flpr_yn, inqr_dvsn, unpr_dvsn,
-                fund_sttl_icld_yn, fncg_amt_auto_rdpt_yn, prcs_dvsn, FK100, NK100,
-                "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logging.info("Data fetch complete.")
-            return dataframe1, dataframe2
-    else:
-        res.printError(url=api_url)
-        return pd.DataFrame(), pd.DataFrame()
+    logging.info("Data fetch complete.")
+    return current_data1, current_data2
 
 
 ##############################################################################################
@@ -4269,42 +4216,22 @@ def inquire_daily_ccld(
     if excg_id_dvsn_cd is not None:
         params["EXCG_ID_DVSN_CD"] = excg_id_dvsn_cd
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        # output1 (array) 처리
-        current_data1 = pd.DataFrame(res.getBody().output1)
-        if dataframe1 is not None:
-            dataframe1 = pd.concat([dataframe1, current_data1], ignore_index=True)
-        else:
-            dataframe1 = current_data1
-
-        # output2 (object) 처리
-        current_data2 = pd.DataFrame([res.getBody().output2])
-        if dataframe2 is not None:
-            dataframe2 = pd.concat([dataframe2, current_data2], ignore_index=True)
-        else:
-            dataframe2 = current_data2
+    # 연속조회 페이지를 모아 마지막에 한 번 DataFrame으로 변환 (CTX_AREA_* 연속키 자동 처리)
+    result = ka.fetch_pages(
+        api_url, tr_id, params, outputs=("output1", "output2"),
+        tr_cont=tr_cont, max_pages=max_depth - depth + 1
+    )
+    if result is None:
+        return pd.DataFrame(), pd.DataFrame()
 
-        tr_cont = res.getHeader().tr_cont
-        FK100 = res.getBody().ctx_area_fk100
-        NK100 = res.getBody().ctx_area_nk100
+    current_data1, current_data2 = result
+    if dataframe1 is not None:
+        current_data1 = pd.concat([dataframe1, current_data1], ignore_index=True)
+    if dataframe2 is not None:
+        current_data2 = pd.concat([dataframe2, current_data2], ignore_index=True)
 
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return inquire_daily_ccld(
-                env_dv, pd_dv, cano, acnt_prdt_cd, inqr_strt_dt, inqr_end_dt,
-                sll_buy_dvsn_cd, pdno, ccld_dvsn, inqr_dvsn, inqr_dvsn_3,
-                ord_gno_brno, odno, inqr_dvsn_1, FK100, NK100, "N",
-                excg_id_dvsn_cd, dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logging.info("Data fetch complete.")
-            return dataframe1, dataframe2
-    else:
-        res.printError(url=api_url)
-        return pd.DataFrame(), pd.DataFrame()
+    logging.info("Data fetch complete.")
+    return current_data1, current_data2
 
 
 ##############################################################################################
@@ -5929,40 +5856,22 @@ def inquire_period_profit(
         "CTX_AREA_NK100": NK100
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
+    # 연속조회 페이지를 모아 마지막에 한 번 DataFrame으로 변환 (CTX_AREA_* 연속키 자동 처리)
+    result = ka.fetch_pages(
+        api_url, tr_id, params, outputs=("output1", "output2"),
+        tr_cont=tr_cont, max_pages=max_depth - depth + 1
+    )
+    if result is None:
+        return pd.DataFrame(), pd.DataFrame()
 
-    if res.isOK():
-        # output1 처리 (array)
-        current_data1 = pd.DataFrame(res.getBody().output1)
-        if dataframe1 is not None:
-            dataframe1 = pd.concat([dataframe1, current_data1], ignore_index=True)
-        else:
-            dataframe1 = current_data1
+    current_data1, current_data2 = result
+    if dataframe1 is not None:
+        current_data1 = pd.concat([dataframe1, current_data1], ignore_index=True)
+    if dataframe2 is not None:
+        current_data2 = pd.concat([dataframe2, current_data2], ignore_index=True)
 
-        # output2 처리 (object)
-        current_data2 = pd.DataFrame(res.getBody().output2, index=[0])
-        if dataframe2 is not None:
-            dataframe2 = pd.concat([dataframe2, current_data2], ignore_index=True)
-        else:
-            dataframe2 = current_data2
-
-        tr_cont = res.getHeader().tr_cont
-        FK100 = res.getBody().ctx_area_fk100
-        NK100 = res.getBody().ctx_area_nk100
-
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return inquire_period_profit(
-                cano, acnt_prdt_cd, inqr_strt_dt, inqr_end_dt, sort_dvsn, inqr_dvsn, cblc_dvsn,
-                pdno, NK100, FK100, "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logging.info("Data fetch complete.")
-            return dataframe1, dataframe2
-    else:
-        res.printError(url=api_url)
-        return pd.DataFrame(), pd.DataFrame()
+    logging.info("Data fetch complete.")
+    return current_data1, current_data2
 
 
 ##############################################################################################
@@ -6055,39 +5964,22 @@ def inquire_period_trade_profit(
         "CTX_AREA_NK100": NK100  # 연속조회키100
     }
 
-    res = ka._url_fetch(api_url, tr_id, tr_cont, params)
-
-    if res.isOK():
-        current_data1 = pd.DataFrame(res.getBody().output1)
-        current_data2 = pd.DataFrame(res.getBody().output2, index=[0])
-
-        if dataframe1 is not None:
-            dataframe1 = pd.concat([dataframe1, current_data1], ignore_index=True)
-        else:
-            dataframe1 = current_data1
-
-        if dataframe2 is not None:
-            dataframe2 = pd.concat([dataframe2, current_data2], ignore_index=True)
-        else:
-            dataframe2 = current_data2
+    # 연속조회 페이지를 모아 마지막에 한 번 DataFrame으로 변환 (CTX_AREA_* 연속키 자동 처리)
+    result = ka.fetch_pages(
+        api_url, tr_id, params, outputs=("output1", "output2"),
+        tr_cont=tr_cont, max_pages=max_depth - depth + 1
+    )
+    if result is None:
+        return pd.DataFrame(), pd.DataFrame()
 
-        tr_cont = res.getHeader().tr_cont
-        FK100 = res.getBody().ctx_area_fk100
-        NK100 = res.getBody().ctx_area_nk100
+    current_data1, current_data2 = result
+    if dataframe1 is not None:
+        current_data1 = pd.concat([dataframe1, current_data1], ignore_index=True)
+    if dataframe2 is not None:
+        current_data2 = pd.concat([dataframe2, current_data2], ignore_index=True)
 
-        if tr_cont in ["M", "F"]:  # 다음 페이지 존재
-            logging.info("Call Next page...")
-            ka.smart_sleep()  # 시스템 안정적 운영을 위한 지연
-            return inquire_period_trade_profit(
-                cano, acnt_prdt_cd, sort_dvsn, inqr_strt_dt, inqr_end_dt, cblc_dvsn,
-                pdno, NK100, FK100, "N", dataframe1, dataframe2, depth + 1, max_depth
-            )
-        else:
-            logging.info("Data fetch complete.")
-            return dataframe1, dataframe2
-    else:
-        res.printError(url=api_url)
-        return pd.DataFrame(), pd.DataFrame()
+    logging.info("Data fetch complete.")
+    return current_data1, current_data2
 
 
 ##############################################################################################
@@ -7,6 +7,7 @@ import logging
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
 
 from core import data_fetcher
+from core.history_cache import history_cache
 from core.websocket_manager import get_ws_manager
 from backend import authenticate, is_authenticated
 
@@ -138,11 +139,48 @@ async def get_current_price(
         }
 
 
+@router.get("/cache")
+async def get_history_cache_status():
+    """
+    일봉 히스토리 캐시 상태 조회
+
+    Returns:
+        {
+            "status": "success",
+            "data": {
+                "hits": int, "misses": int, "stale": int,   # 조회 결과별 횟수
+                "live_patches": int,                        # 장중 당일 봉 갱신 횟수
+                "evictions": int,                           # LRU 제거 횟수
+                "hit_rate": float,
+                "entries": int, "bytes": int, "memory_budget": int,
+                "market_open": bool, "last_close": str
+            }
+        }
+    """
+    return {
+        "status": "success",
+        "data": history_cache.stats()
+    }
+
+
+@router.delete("/cache")
+async def clear_history_cache():
+    """일봉 히스토리 캐시 비우기"""
+    history_cache.clear()
+    return {
+        "status": "success",
+        "data": history_cache.stats()
+    }
+
+
 @router.websocket("/ws/{stock_code}")
 async def websocket_orderbook(websocket: WebSocket, stock_code: str):
     """
     실시간 호가 웹소켓
 
+    KIS 실시간 호가(H0UNASP0/H0STASP0)를 종목당 1회 구독해 모든 클라이언트에 공유하며,
+    클라이언트별로 최신 호가만 일정 간격으로 전송합니다.
+
     Args:
         websocket: WebSocket 연결
         stock_code: 종목코드
@@ -158,7 +196,9 @@ async def websocket_orderbook(websocket: WebSocket, stock_code: str):
                 "bid_prices": list[int],
                 "bid_volumes": list[int],
                 "total_ask_volume": int,
-                "total_bid_volume": int
+                "total_bid_volume": int,
+                "expected_price": int,
+                "expected_volume": int
             }
         }
     """
@@ -4,23 +4,27 @@
 strategy_core 모듈을 사용하여 전략 조회/실행/빌드를 처리합니다.
 """
 
+import asyncio
 import time
 import logging
 import datetime
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from strategy_core import StrategyRegistry
 import strategy_core.preset  # 10개 전략 자동 등록
 from strategy_core.name_utils import sanitize_strategy_name
 from strategy_core.executor import (
+    EXECUTION_MODES,
     execute_with_class,
     execute_from_builder_state,
     execute_custom_file,
 )
 from backend import authenticate, is_authenticated, get_current_mode
+from backend.jobs import Job, JobCancelled, JobQueueFull, job_manager
 import kis_auth as ka
 from strategy_core.dsl.codegen import StrategyCodeGenerator, generate_strategy_file
 from strategy_core.dsl.parser import parse_strategy, StrategyDSLParser
@@ -45,18 +49,13 @@ def _api_sleep():
 def get_stock_name(code: str) -> str:
     """종목코드로 종목명 조회
 
-    symbols 모듈의 마스터파일 캐시를 사용하여 종목명을 반환합니다.
+    symbols 모듈의 종목 검색 인덱스(종목코드 → 종목)를 사용하여 종목명을 반환합니다.
     캐시에 없는 경우 종목코드를 그대로 반환합니다.
     """
-    from backend.routers.symbols import _get_all_symbols, FALLBACK_STOCKS
+    from backend.routers.symbols import get_symbol_by_code
 
-    all_symbols = _get_all_symbols() or FALLBACK_STOCKS
-
-    for stock in all_symbols:
-        if stock["code"] == code:
-            return stock["name"]
-
-    return code
+    stock = get_symbol_by_code(code)
+    return stock["name"] if stock else code
 
 
 # ============================================
@@ -68,6 +67,7 @@ class ExecuteRequest(BaseModel):
     stocks: List[str]
     params: Dict[str, Any] = {}
     builder_state: Optional[Dict[str, Any]] = None
+    mode: str = "sequential"  # sequential | batch (전 종목 패널 일괄 계산)
 
 
 class BuildRequest(BaseModel):
@@ -196,12 +196,16 @@ async def list_indicators():
     }
 
 
-@router.post("/execute", response_model=ExecuteResponse)
-async def execute_strategy(request: ExecuteRequest):
-    """전략 실행"""
+def _run_execute(job: Job, request: ExecuteRequest) -> ExecuteResponse:
+    """전략 실행 (job_manager 작업 스레드에서 실행)
+
+    종목 사이 호출 간격 대기(_api_sleep)에서 진행률을 기록하고 취소 요청을 확인합니다.
+    배치 모드는 일괄 조회라 실행 전에만 취소를 확인합니다.
+    """
     strategy_id = request.strategy_id
     stocks = request.stocks
     params = request.params
+    mode = request.mode
     logs = []
 
     def log(msg_type: str, message: str):
@@ -210,6 +214,20 @@ async def execute_strategy(request: ExecuteRequest):
             message=message,
             timestamp=datetime.datetime.now().strftime("%H:%M:%S"),
         ))
+        job.report(message, level=msg_type)
+
+    done = 0
+
+    def api_sleep():
+        nonlocal done
+        done += 1
+        job.report(f"{done}/{len(stocks)} 종목 완료", done / max(len(stocks), 1))
+        job.check_cancelled()
+        _api_sleep()
+
+    if mode not in EXECUTION_MODES:
+        log("error", f"지원하지 않는 실행 모드: {mode}")
+        return ExecuteResponse(status='error', logs=logs, message=f'지원하지 않는 실행 모드: {mode}')
 
     # 인증 확인
     if not is_authenticated():
@@ -233,7 +251,7 @@ async def execute_strategy(request: ExecuteRequest):
 
             results = execute_from_builder_state(
                 request.builder_state, strategy_name, stocks,
-                log, get_stock_name, _api_sleep,
+                log, get_stock_name, api_sleep, mode,
             )
             log("success", "로컬 전략 실행 완료")
             return ExecuteResponse(
@@ -255,7 +273,7 @@ async def execute_strategy(request: ExecuteRequest):
             strategy_dir = os.path.join(os.path.dirname(__file__), "..", "..", "strategy")
             results = execute_custom_file(
                 custom_name, strategy_dir, stocks,
-                log, get_stock_name, _api_sleep,
+                log, get_stock_name, api_sleep, mode,
             )
             log("success", "전략 실행 완료")
             return ExecuteResponse(
@@ -283,7 +301,7 @@ async def execute_strategy(request: ExecuteRequest):
 
             results = execute_from_builder_state(
                 builder_state, strategy_name, stocks,
-                log, get_stock_name, _api_sleep,
+                log, get_stock_name, api_sleep, mode,
             )
             log("success", "빌더 전략 실행 완료")
             return ExecuteResponse(
@@ -295,7 +313,7 @@ async def execute_strategy(request: ExecuteRequest):
         # 3b) 기본 전략 (strategy_class 사용)
         results = execute_with_class(
             schema['strategy_class'], schema['param_map'], params, stocks,
-            strategy_id, log, get_stock_name, _api_sleep,
+            strategy_id, log, get_stock_name, api_sleep, mode,
         )
         log("success", "전략 실행 완료")
         return ExecuteResponse(
@@ -304,11 +322,80 @@ async def execute_strategy(request: ExecuteRequest):
             logs=logs,
         )
 
+    except JobCancelled:
+        raise
     except Exception as e:
         log("error", f"전략 실행 오류: {str(e)}")
         return ExecuteResponse(status='error', logs=logs, message=str(e))
 
 
+def _get_job(job_id: str) -> Job:
+    job = job_manager.get(job_id)
+    if job is None or job.kind != "execute":
+        raise HTTPException(404, f"작업을 찾을 수 없습니다: {job_id}")
+    return job
+
+
+@router.post("/execute", response_model=ExecuteResponse)
+async def execute_strategy(request: ExecuteRequest):
+    """전략 실행 (완료까지 대기)
+
+    작업 스레드에서 실행되므로 대기 중에도 다른 요청은 처리됩니다.
+    진행률 조회/취소가 필요하면 POST /execute/jobs를 사용합니다.
+    """
+    try:
+        job = job_manager.submit("execute", _run_execute, request)
+    except JobQueueFull as e:
+        return ExecuteResponse(status='error', message=str(e))
+
+    try:
+        return await job_manager.wait(job)
+    except (JobCancelled, asyncio.CancelledError):
+        if job.status != "cancelled":
+            raise
+        return ExecuteResponse(status='error', message=f'전략 실행이 취소되었습니다 (job_id={job.id})')
+
+
+@router.post("/execute/jobs", status_code=202)
+async def create_execute_job(request: ExecuteRequest):
+    """전략 실행 작업 등록 → GET /execute/jobs/{job_id} 또는 /events로 진행 확인"""
+    try:
+        job = job_manager.submit("execute", _run_execute, request)
+    except JobQueueFull as e:
+        raise HTTPException(429, str(e))
+    return job.to_dict(include_result=False)
+
+
+@router.get("/execute/jobs")
+async def list_execute_jobs():
+    """최근 전략 실행 작업 목록 (결과 제외)"""
+    return [job.to_dict(include_result=False) for job in job_manager.list() if job.kind == "execute"]
+
+
+@router.get("/execute/jobs/{job_id}")
+async def get_execute_job(job_id: str):
+    """작업 상태/진행률 (완료 시 result에 ExecuteResponse 포함)"""
+    return _get_job(job_id).to_dict()
+
+
+@router.get("/execute/jobs/{job_id}/events")
+async def stream_execute_job(job_id: str):
+    """진행 이벤트(로그, 진행률)를 Server-Sent Events로 전달 (작업이 끝나면 종료)"""
+    job = _get_job(job_id)
+    return StreamingResponse(
+        job_manager.stream(job),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+@router.delete("/execute/jobs/{job_id}")
+async def cancel_execute_job(job_id: str):
+    """대기 중이면 즉시, 실행 중이면 다음 종목 전에 취소"""
+    _get_job(job_id)
+    return job_manager.cancel(job_id).to_dict(include_result=False)
+
+
 @router.post("/build")
 async def build_strategy(request: BuildRequest):
     """커스텀 전략 생성"""
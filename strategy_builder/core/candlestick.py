@@ -3,11 +3,15 @@
 
 OHLC DataFrame → 패턴 탐지 → +1(bullish) / -1(bearish) / 0(없음)
 
+- detect_pattern: 최근 봉 1개에 대한 판정 (스칼라)
+- detect_patterns: 전체 히스토리를 배열 연산으로 한 번에 판정 (패턴별 컬럼)
+
 pandas 기반 직접 구현. 외부 의존성 없음.
 """
 
-from typing import Optional
+from typing import List, Optional
 
+import numpy as np
 import pandas as pd
 
 
@@ -753,3 +757,525 @@ PATTERN_DETECTORS = {
     "upside_tasuki_gap": _upside_tasuki_gap,
     "side_by_side_white_lines": _side_by_side_white_lines,
 }
+
+
+# =============================================================================
+# Vectorized Detection (전체 히스토리)
+# =============================================================================
+#
+# detect_patterns(df)[pattern_id].iloc[i] == detect_pattern(df.iloc[:i + 1], pattern_id)
+# 위 관계가 성립하도록 스칼라 탐지기와 같은 조건을 배열 연산으로 계산합니다.
+# 접미사 1/2/3은 스칼라 탐지기의 (-3, -2, -1) 또는 (-2, -1) 봉 순서와 같습니다.
+
+
+class _Bars:
+    """패턴 계산용 OHLC 배열 (lag(x, k): k봉 전 값)"""
+
+    def __init__(self, df: pd.DataFrame):
+        self.o = df["open"].to_numpy(dtype=float)
+        self.h = df["high"].to_numpy(dtype=float)
+        self.l = df["low"].to_numpy(dtype=float)
+        self.c = df["close"].to_numpy(dtype=float)
+        self.body = np.abs(self.c - self.o)
+        self.rng = self.h - self.l
+        self.upper = self.h - np.maximum(self.o, self.c)
+        self.lower = np.minimum(self.o, self.c) - self.l
+        self.bull = self.c > self.o
+        self.bear = self.c < self.o
+        # _avg_body: 최근 10봉(현재 포함) 몸통 평균
+        self.avg_body = pd.Series(self.body).rolling(10, min_periods=1).mean().to_numpy()
+
+    @staticmethod
+    def lag(x: np.ndarray, k: int) -> np.ndarray:
+        out = np.full_like(x, False if x.dtype == bool else np.nan)
+        if k < len(x):
+            out[k:] = x[:len(x) - k]
+        return out
+
+
+def _signal(bull: Optional[np.ndarray] = None, bear: Optional[np.ndarray] = None) -> np.ndarray:
+    """bull → +1, (bull이 아닌 곳의) bear → -1, 나머지 0"""
+    shape = (bull if bull is not None else bear).shape
+    out = np.zeros(shape, dtype=np.int8)
+    if bear is not None:
+        out[bear] = -1
+    if bull is not None:
+        out[bull] = 1
+    return out
+
+
+def _prev(b: _Bars, k: int):
+    """k봉 전 (o, h, l, c, body, rng, bull, bear)"""
+    lag = b.lag
+    return (lag(b.o, k), lag(b.h, k), lag(b.l, k), lag(b.c, k),
+            lag(b.body, k), lag(b.rng, k), lag(b.bull, k), lag(b.bear, k))
+
+
+# --- Single ---------------------------------------------------------------
+
+
+def _v_doji(b):
+    return _signal((b.rng != 0) & (b.body / b.rng < 0.1))
+
+
+def _v_dragonfly_doji(b):
+    r = b.rng
+    return _signal((r != 0) & (b.body / r < 0.1) & (b.lower / r > 0.6) & (b.upper / r < 0.1))
+
+
+def _v_gravestone_doji(b):
+    r = b.rng
+    return _signal(bear=(r != 0) & (b.body / r < 0.1) & (b.upper / r > 0.6) & (b.lower / r < 0.1))
+
+
+def _v_long_legged_doji(b):
+    r = b.rng
+    return _signal((r != 0) & (b.body / r < 0.1) & (b.upper / r > 0.3) & (b.lower / r > 0.3))
+
+
+def _hammer_shape(b):
+    return (b.rng != 0) & (b.body != 0) & (b.lower >= 2 * b.body) & (b.upper <= b.body * 0.3)
+
+
+def _v_hammer(b):
+    return _signal(_hammer_shape(b))
+
+
+def _v_hanging_man(b):
+    return _signal(bear=_hammer_shape(b))
+
+
+def _inverted_hammer_shape(b):
+    return (b.body != 0) & (b.upper >= 2 * b.body) & (b.lower <= b.body * 0.3)
+
+
+def _v_inverted_hammer(b):
+    return _signal(_inverted_hammer_shape(b))
+
+
+def _v_shooting_star(b):
+    return _signal(bear=_inverted_hammer_shape(b))
+
+
+def _v_marubozu(b):
+    r = b.rng
+    hit = (r != 0) & (b.upper / r < 0.05) & (b.lower / r < 0.05)
+    return _signal(hit & b.bull, hit & ~b.bull)
+
+
+def _v_closing_marubozu(b):
+    r = b.rng
+    ok = r != 0
+    return _signal(ok & b.bull & (b.upper / r < 0.05), ok & b.bear & (b.lower / r < 0.05))
+
+
+def _v_opening_marubozu(b):
+    r = b.rng
+    ok = r != 0
+    return _signal(ok & b.bull & (b.lower / r < 0.05), ok & b.bear & (b.upper / r < 0.05))
+
+
+def _v_spinning_top(b):
+    r = b.rng
+    return _signal((r != 0) & (b.body / r < 0.3) & (b.upper > b.body) & (b.lower > b.body))
+
+
+def _v_belt_hold(b):
+    big = b.body > b.avg_body * 1.5
+    return _signal(
+        big & b.bull & (b.lower < b.body * 0.05),
+        big & b.bear & (b.upper < b.body * 0.05),
+    )
+
+
+def _v_high_wave(b):
+    r = b.rng
+    return _signal((r != 0) & (b.body / r < 0.15) & (b.upper / r > 0.3) & (b.lower / r > 0.3))
+
+
+# --- Double ---------------------------------------------------------------
+
+
+def _v_engulfing(b):
+    o1, _, _, c1, _, _, bull1, bear1 = _prev(b, 1)
+    o2, c2 = b.o, b.c
+    return _signal(
+        bear1 & b.bull & (o2 <= c1) & (c2 >= o1),
+        bull1 & b.bear & (o2 >= c1) & (c2 <= o1),
+    )
+
+
+def _v_harami(b):
+    o1, _, _, c1, b1, _, bull1, bear1 = _prev(b, 1)
+    o2, c2 = b.o, b.c
+    inside = (b1 > 0) & (b.body < b1)
+    return _signal(
+        inside & bear1 & b.bull & (o2 >= c1) & (c2 <= o1),
+        inside & bull1 & b.bear & (o2 <= c1) & (c2 >= o1),
+    )
+
+
+def _v_harami_cross(b):
+    o1, _, _, c1, b1, _, _, bear1 = _prev(b, 1)
+    r2 = b.rng
+    hit = (
+        (b1 > 0) & (r2 > 0) & (b.body / r2 < 0.1)
+        & (np.minimum(b.o, b.c) >= np.minimum(o1, c1))
+        & (np.maximum(b.o, b.c) <= np.maximum(o1, c1))
+    )
+    return _signal(hit & bear1, hit & ~bear1)
+
+
+def _v_piercing(b):
+    o1, _, _, c1, _, _, _, bear1 = _prev(b, 1)
+    mid1 = (o1 + c1) / 2
+    return _signal(bear1 & b.bull & (b.o < c1) & (b.c > mid1) & (b.c < o1))
+
+
+def _v_dark_cloud_cover(b):
+    o1, _, _, c1, _, _, bull1, _ = _prev(b, 1)
+    mid1 = (o1 + c1) / 2
+    return _signal(bear=bull1 & b.bear & (b.o > c1) & (b.c < mid1) & (b.c > o1))
+
+
+def _v_counterattack(b):
+    _, _, _, c1, _, _, bull1, bear1 = _prev(b, 1)
+    near = np.abs(b.c - c1) < b.avg_body * 0.05
+    return _signal(bear1 & b.bull & near, bull1 & b.bear & near)
+
+
+def _v_tweezer_top(b):
+    _, h1, _, _, _, _, bull1, _ = _prev(b, 1)
+    return _signal(bear=(np.abs(h1 - b.h) < b.avg_body * 0.05) & bull1 & b.bear)
+
+
+def _v_tweezer_bottom(b):
+    _, _, l1, _, _, _, _, bear1 = _prev(b, 1)
+    return _signal((np.abs(l1 - b.l) < b.avg_body * 0.05) & bear1 & b.bull)
+
+
+def _v_on_neck(b):
+    _, _, l1, _, _, _, _, bear1 = _prev(b, 1)
+    return _signal(bear=bear1 & b.bull & (np.abs(b.c - l1) < b.avg_body * 0.05))
+
+
+def _v_in_neck(b):
+    _, _, _, c1, _, _, _, bear1 = _prev(b, 1)
+    return _signal(bear=bear1 & b.bull & (np.abs(b.c - c1) < b.avg_body * 0.05))
+
+
+def _v_thrusting(b):
+    o1, _, _, c1, _, _, _, bear1 = _prev(b, 1)
+    mid1 = (o1 + c1) / 2
+    return _signal(bear=bear1 & b.bull & (b.c > c1) & (b.c < mid1))
+
+
+def _v_separating_lines(b):
+    o1, _, _, _, _, _, bull1, bear1 = _prev(b, 1)
+    near = np.abs(o1 - b.o) < b.avg_body * 0.05
+    return _signal(bear1 & b.bull & near, bull1 & b.bear & near)
+
+
+def _v_meeting_lines(b):
+    _, _, _, c1, _, _, bull1, bear1 = _prev(b, 1)
+    near = np.abs(c1 - b.c) < b.avg_body * 0.05
+    return _signal(bear1 & b.bull & near, bull1 & b.bear & near)
+
+
+def _v_kicking(b):
+    o1, _, _, _, b1, r1, bull1, bear1 = _prev(b, 1)
+    r2 = b.rng
+    both = (r1 != 0) & (r2 != 0) & (b1 / r1 > 0.9) & (b.body / r2 > 0.9)
+    return _signal(
+        both & bear1 & b.bull & (b.o > o1),
+        both & bull1 & b.bear & (b.o < o1),
+    )
+
+
+def _v_matching_low(b):
+    _, _, _, c1, _, _, _, bear1 = _prev(b, 1)
+    return _signal(bear1 & b.bear & (np.abs(c1 - b.c) < b.avg_body * 0.03))
+
+
+def _v_matching_high(b):
+    _, _, _, c1, _, _, bull1, _ = _prev(b, 1)
+    return _signal(bear=bull1 & b.bull & (np.abs(c1 - b.c) < b.avg_body * 0.03))
+
+
+def _v_gap_side_by_side_white(b):
+    o1, _, _, _, _, _, bull1, _ = _prev(b, 1)
+    return _signal(bull1 & b.bull & (np.abs(o1 - b.o) < b.avg_body * 0.1))
+
+
+def _v_homing_pigeon(b):
+    o1, _, _, c1, b1, _, _, bear1 = _prev(b, 1)
+    return _signal(bear1 & b.bear & (b.o < o1) & (b.c > c1) & (b.body < b1))
+
+
+def _v_dojistar(b):
+    _, _, _, c1, _, _, bull1, bear1 = _prev(b, 1)
+    r2 = b.rng
+    star = (r2 > 0) & (b.body / r2 < 0.1)
+    return _signal(star & bear1 & (b.o < c1), star & bull1 & (b.o > c1))
+
+
+# --- Triple+ --------------------------------------------------------------
+
+
+def _v_morning_star(b):
+    o1, _, _, c1, b1, _, _, bear1 = _prev(b, 2)
+    b2 = b.lag(b.body, 1)
+    return _signal(bear1 & (b2 < b1 * 0.3) & b.bull & (b.c > (o1 + c1) / 2))
+
+
+def _v_morning_doji_star(b):
+    o1, _, _, c1, _, _, _, bear1 = _prev(b, 2)
+    b2, r2 = b.lag(b.body, 1), b.lag(b.rng, 1)
+    return _signal(bear1 & (r2 > 0) & (b2 / r2 < 0.1) & b.bull & (b.c > (o1 + c1) / 2))
+
+
+def _v_evening_star(b):
+    o1, _, _, c1, b1, _, bull1, _ = _prev(b, 2)
+    b2 = b.lag(b.body, 1)
+    return _signal(bear=bull1 & (b2 < b1 * 0.3) & b.bear & (b.c < (o1 + c1) / 2))
+
+
+def _v_evening_doji_star(b):
+    o1, _, _, c1, _, _, bull1, _ = _prev(b, 2)
+    b2, r2 = b.lag(b.body, 1), b.lag(b.rng, 1)
+    return _signal(bear=bull1 & (r2 > 0) & (b2 / r2 < 0.1) & b.bear & (b.c < (o1 + c1) / 2))
+
+
+def _v_three_white_soldiers(b):
+    c1, c2 = b.lag(b.c, 2), b.lag(b.c, 1)
+    bulls = b.lag(b.bull, 2) & b.lag(b.bull, 1) & b.bull
+    return _signal(bulls & (c2 > c1) & (b.c > c2))
+
+
+def _v_three_black_crows(b):
+    c1, c2 = b.lag(b.c, 2), b.lag(b.c, 1)
+    bears = b.lag(b.bear, 2) & b.lag(b.bear, 1) & b.bear
+    return _signal(bear=bears & (c2 < c1) & (b.c < c2))
+
+
+def _v_three_inside(b):
+    h = b.lag(_v_harami(b), 1)
+    c1 = b.lag(b.c, 2)
+    return _signal((h == 1) & (b.c > c1), (h == -1) & (b.c < c1))
+
+
+def _v_three_outside(b):
+    e = b.lag(_v_engulfing(b), 1)
+    c2 = b.lag(b.c, 1)
+    return _signal((e == 1) & (b.c > c2), (e == -1) & (b.c < c2))
+
+
+def _v_abandoned_baby(b):
+    _, h1, l1, _, _, _, bull1, bear1 = _prev(b, 2)
+    _, h2, l2, _, b2, r2, _, _ = _prev(b, 1)
+    is_doji = (r2 != 0) & (b2 / r2 < 0.1)
+    return _signal(
+        bear1 & is_doji & (h2 < l1) & (l2 < b.l) & b.bull,
+        bull1 & is_doji & (l2 > h1) & (h2 > b.h) & b.bear,
+    )
+
+
+def _v_simple_triple_bullish(b):
+    c1 = b.lag(b.c, 2)
+    return _signal(b.lag(b.bear, 2) & b.lag(b.bear, 1) & b.bull & (b.c > c1))
+
+
+def _v_simple_triple_bearish(b):
+    c1 = b.lag(b.c, 2)
+    return _signal(bear=b.lag(b.bull, 2) & b.lag(b.bull, 1) & b.bear & (b.c < c1))
+
+
+def _v_tasuki_gap(b):
+    c1 = b.lag(b.c, 2)
+    o2 = b.lag(b.o, 1)
+    bull1, bear1 = b.lag(b.bull, 2), b.lag(b.bear, 2)
+    bull2, bear2 = b.lag(b.bull, 1), b.lag(b.bear, 1)
+    return _signal(
+        bull1 & bull2 & (o2 > c1) & b.bear,
+        bear1 & bear2 & (o2 < c1) & b.bull,
+    )
+
+
+def _v_upside_gap_two_crows(b):
+    c1, bull1 = b.lag(b.c, 2), b.lag(b.bull, 2)
+    o2, c2, bear2 = b.lag(b.o, 1), b.lag(b.c, 1), b.lag(b.bear, 1)
+    return _signal(bear=bull1 & bear2 & (o2 > c1) & b.bear & (b.o > o2) & (b.c < c2))
+
+
+def _v_three_line_strike(b):
+    oa, ca = b.lag(b.o, 3), b.lag(b.c, 3)
+    cb, cc = b.lag(b.c, 2), b.lag(b.c, 1)
+    bears = b.lag(b.bear, 3) & b.lag(b.bear, 2) & b.lag(b.bear, 1)
+    bulls = b.lag(b.bull, 3) & b.lag(b.bull, 2) & b.lag(b.bull, 1)
+    return _signal(
+        bears & (cb < ca) & (cc < cb) & b.bull & (b.c > oa),
+        bulls & (cb > ca) & (cc > cb) & b.bear & (b.c < oa),
+    )
+
+
+def _v_stick_sandwich(b):
+    c1, bear1 = b.lag(b.c, 2), b.lag(b.bear, 2)
+    bull2 = b.lag(b.bull, 1)
+    return _signal(bear1 & bull2 & b.bear & (np.abs(c1 - b.c) < b.avg_body * 0.03))
+
+
+def _v_tristar(b):
+    # 스칼라 버전은 "r == 0 or body/r >= 0.1"이면 중단하므로 같은 형태로 판정
+    doji = (b.rng != 0) & ~(b.body / b.rng >= 0.1)
+    all_doji = b.lag(doji, 2) & b.lag(doji, 1) & doji
+    l1, l2 = b.lag(b.l, 2), b.lag(b.l, 1)
+    h1, h2 = b.lag(b.h, 2), b.lag(b.h, 1)
+    return _signal(
+        all_doji & (l2 < l1) & (l2 < b.l),
+        all_doji & (h2 > h1) & (h2 > b.h),
+    )
+
+
+def _v_identical_three_crows(b):
+    c1, c2, o2 = b.lag(b.c, 2), b.lag(b.c, 1), b.lag(b.o, 1)
+    bears = b.lag(b.bear, 2) & b.lag(b.bear, 1) & b.bear
+    tol = b.avg_body * 0.03
+    return _signal(bear=bears & (np.abs(o2 - c1) < tol) & (np.abs(b.o - c2) < tol))
+
+
+def _v_two_crows(b):
+    c1, bull1 = b.lag(b.c, 2), b.lag(b.bull, 2)
+    o2, bear2 = b.lag(b.o, 1), b.lag(b.bear, 1)
+    return _signal(bear=bull1 & bear2 & (o2 > c1) & b.bear & (b.c < c1))
+
+
+def _v_downside_tasuki_gap(b):
+    t = _v_tasuki_gap(b)
+    return np.where(t == -1, t, 0).astype(np.int8)
+
+
+def _v_upside_tasuki_gap(b):
+    t = _v_tasuki_gap(b)
+    return np.where(t == 1, t, 0).astype(np.int8)
+
+
+VECTOR_DETECTORS = {
+    # Single
+    "doji": _v_doji,
+    "dragonfly_doji": _v_dragonfly_doji,
+    "gravestone_doji": _v_gravestone_doji,
+    "long_legged_doji": _v_long_legged_doji,
+    "hammer": _v_hammer,
+    "hanging_man": _v_hanging_man,
+    "inverted_hammer": _v_inverted_hammer,
+    "shooting_star": _v_shooting_star,
+    "marubozu": _v_marubozu,
+    "closing_marubozu": _v_closing_marubozu,
+    "opening_marubozu": _v_opening_marubozu,
+    "spinning_top": _v_spinning_top,
+    "belt_hold": _v_belt_hold,
+    "high_wave": _v_high_wave,
+    "rickshaw_man": _v_long_legged_doji,
+    # Double
+    "engulfing": _v_engulfing,
+    "harami": _v_harami,
+    "harami_cross": _v_harami_cross,
+    "piercing": _v_piercing,
+    "dark_cloud_cover": _v_dark_cloud_cover,
+    "counterattack": _v_counterattack,
+    "tweezer_top": _v_tweezer_top,
+    "tweezer_bottom": _v_tweezer_bottom,
+    "on_neck": _v_on_neck,
+    "in_neck": _v_in_neck,
+    "thrusting": _v_thrusting,
+    "separating_lines": _v_separating_lines,
+    "meeting_lines": _v_meeting_lines,
+    "kicking": _v_kicking,
+    "kicking_by_length": _v_kicking,
+    "matching_low": _v_matching_low,
+    "matching_high": _v_matching_high,
+    "gap_side_by_side_white": _v_gap_side_by_side_white,
+    "homing_pigeon": _v_homing_pigeon,
+    "dojistar": _v_dojistar,
+    # Triple+
+    "morning_star": _v_morning_star,
+    "morning_doji_star": _v_morning_doji_star,
+    "evening_star": _v_evening_star,
+    "evening_doji_star": _v_evening_doji_star,
+    "three_white_soldiers": _v_three_white_soldiers,
+    "three_black_crows": _v_three_black_crows,
+    "three_inside": _v_three_inside,
+    "three_outside": _v_three_outside,
+    "abandoned_baby": _v_abandoned_baby,
+    "three_stars_in_south": _v_simple_triple_bullish,
+    "advance_block": _v_simple_triple_bearish,
+    "stalled_pattern": _v_simple_triple_bearish,
+    "deliberation": _v_simple_triple_bearish,
+    "tasuki_gap": _v_tasuki_gap,
+    "upside_gap_two_crows": _v_upside_gap_two_crows,
+    "three_line_strike": _v_three_line_strike,
+    "unique_three_river": _v_simple_triple_bullish,
+    "breakaway": _v_simple_triple_bullish,
+    "mat_hold": _v_simple_triple_bullish,
+    "rising_three_methods": _v_simple_triple_bullish,
+    "falling_three_methods": _v_simple_triple_bearish,
+    "ladder_bottom": _v_simple_triple_bullish,
+    "concealing_baby_swallow": _v_simple_triple_bullish,
+    "stick_sandwich": _v_stick_sandwich,
+    "tristar": _v_tristar,
+    "identical_three_crows": _v_identical_three_crows,
+    "two_crows": _v_two_crows,
+    "up_down_gap_three_methods": _v_tasuki_gap,
+    "downside_tasuki_gap": _v_downside_tasuki_gap,
+    "upside_tasuki_gap": _v_upside_tasuki_gap,
+    "side_by_side_white_lines": _v_gap_side_by_side_white,
+}
+
+
+def detect_patterns(df: pd.DataFrame, pattern_ids: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    전체 히스토리에 대해 패턴 탐지 (봉마다 detect_pattern을 호출한 것과 같은 결과)
+
+    Args:
+        df: OHLC DataFrame (open, high, low, close)
+        pattern_ids: 패턴 ID 리스트 (None이면 전체 패턴)
+
+    Returns:
+        df.index와 같은 인덱스, 패턴별 +1/-1/0 int8 컬럼 DataFrame
+        (처음 4봉과 알 수 없는 패턴 ID는 0)
+    """
+    ids = list(VECTOR_DETECTORS) if pattern_ids is None else list(pattern_ids)
+    columns = {}
+    if df.empty:
+        return pd.DataFrame({pid: pd.Series(dtype=np.int8) for pid in ids}, index=df.index)
+
+    bars = _Bars(df)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for pid in ids:
+            detector = VECTOR_DETECTORS.get(pid)
+            values = detector(bars) if detector else np.zeros(len(df), dtype=np.int8)
+            values[:4] = 0  # detect_pattern은 5봉 미만이면 0
+            columns[pid] = values
+
+    return pd.DataFrame(columns, index=df.index)
+
+
+def detect_recent_pattern(df: pd.DataFrame, pattern_id: str, bars: int = 5) -> int:
+    """
+    최근 N봉 안에서 가장 최근에 나타난 패턴 신호
+
+    Args:
+        df: OHLC DataFrame
+        pattern_id: 패턴 ID
+        bars: 조회할 최근 봉 수
+
+    Returns:
+        +1 (bullish), -1 (bearish), 0 (미감지)
+    """
+    if df.empty or len(df) < 5:
+        return 0
+    bars = max(1, bars)
+    # 판정에 필요한 이전 봉(평균 몸통 10봉 창)까지만 잘라서 계산
+    recent = detect_patterns(df.tail(bars + 9), [pattern_id])[pattern_id].to_numpy()[-bars:]
+    hits = recent[recent != 0]
+    return int(hits[-1]) if len(hits) else 0
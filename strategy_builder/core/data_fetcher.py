@@ -9,11 +9,14 @@ Applied Skills: skills/investment-strategy-framework.md
 import logging
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
 
 import pandas as pd
 
 import kis_auth as ka
+from core.history_cache import history_cache, is_market_open, now_kst, patch_live_bar
 
 logging.basicConfig(level=logging.INFO)
 
@@ -114,18 +117,31 @@ def clear_balance_cache():
 # 일봉 데이터 조회
 # =============================================================================
 
+def _env_key(env_dv: str) -> str:
+    """캐시 키용 환경 정규화 (real/prod → real, demo/vps → demo)"""
+    return "real" if env_dv in ("real", "prod") else "demo"
+
+
 def get_daily_prices(
     stock_code: str,
     days: int = 100,
-    env_dv: str = "real"
+    env_dv: str = "real",
+    adjusted: bool = True,
+    use_cache: bool = True,
 ) -> pd.DataFrame:
     """
     일봉 데이터를 조회하여 정규화된 DataFrame 반환
 
+    같은 종목을 반복 조회하지 않도록 history_cache를 사용합니다.
+    장중에는 캐시된 과거 봉에 현재가 시세로 당일 봉만 갱신하고,
+    장 마감 후 첫 조회에서 한 번 새로 받습니다 (core.history_cache 참고).
+
     Args:
         stock_code: 종목코드 (6자리)
         days: 조회 기간 (일)
         env_dv: 환경 구분 (real/demo)
+        adjusted: 수정주가 여부 (False면 원주가)
+        use_cache: False면 캐시를 거치지 않고 새로 조회
 
     Returns:
         DataFrame with columns:
@@ -139,6 +155,138 @@ def get_daily_prices(
     Note:
         skill: API 실패 시 빈 DataFrame 반환
     """
+    key = (stock_code, _env_key(env_dv), adjusted)
+
+    if use_cache:
+        cached = history_cache.get(key, days)
+        if cached is not None:
+            if is_market_open():
+                cached = _patch_today(cached, stock_code, env_dv)
+            return cached.tail(days).reset_index(drop=True)
+
+    df = _fetch_daily_prices(stock_code, days, env_dv, adjusted)
+    if df.empty:
+        return df
+
+    if use_cache:
+        history_cache.put(key, df, days)
+    return df.tail(days).reset_index(drop=True)
+
+
+def _patch_today(df: pd.DataFrame, stock_code: str, env_dv: str) -> pd.DataFrame:
+    """장중 캐시 일봉의 당일 봉을 현재가 시세로 갱신
+
+    오늘이 개장일로 확인되지 않거나 시세가 직전 거래일 것이면 그대로 반환합니다.
+    (평일 공휴일/장 시작 전 시세는 직전 거래일 값이므로 당일 봉을 만들지 않음)
+    """
+    today = now_kst().strftime("%Y%m%d")
+    if is_session_day(today, env_dv) is False:
+        return df
+
+    env = _env_key(env_dv)
+    quote = history_cache.get_quote(stock_code, env)
+    if quote is None:
+        quote = get_current_price(stock_code, env_dv)
+        if not quote or not quote.get("price"):
+            return df
+        history_cache.put_quote(stock_code, env, quote)
+
+    if not quote.get("volume") or _is_previous_session_quote(df, quote, today):
+        return df
+
+    history_cache.record_live_patch()
+    return patch_live_bar(df, quote, today)
+
+
+def _is_previous_session_quote(df: pd.DataFrame, quote: dict, today: str) -> bool:
+    """시세가 캐시의 마지막(직전 거래일) 봉과 같은지 (당일 체결이 없는 시세)"""
+    if df.empty or df["date"].iloc[-1] >= today:
+        return False
+    last = df.iloc[-1]
+    try:
+        return (
+            float(last["close"]) == float(quote["price"])
+            and float(last["high"]) == float(quote["high"])
+            and float(last["low"]) == float(quote["low"])
+            and float(last["volume"]) == float(quote["volume"])
+        )
+    except (KeyError, TypeError, ValueError):
+        return False
+
+
+# =============================================================================
+# 개장일 확인 (국내휴장일조회, 날짜별 1회 캐시)
+# =============================================================================
+
+_SESSION_DAY_RETRY = 1800  # 조회 실패 후 같은 날짜 재조회까지 대기 (초)
+
+_session_days_lock = threading.Lock()
+_session_days: Dict[str, bool] = {}
+_session_day_attempts: Dict[str, float] = {}  # 확인되지 않은 날짜의 마지막 조회 시각 (monotonic)
+
+
+def is_session_day(day: Optional[str] = None, env_dv: str = "real") -> Optional[bool]:
+    """
+    개장일 여부 조회 (국내휴장일조회 CTCA0903R)
+
+    Args:
+        day: 조회일 (YYYYMMDD, 기본: 오늘)
+        env_dv: 환경 구분 (real/demo)
+
+    Returns:
+        개장일이면 True, 휴장일이면 False, 확인할 수 없으면 None (모의투자 미지원, 조회 실패)
+
+    Note:
+        원장 서비스 부하로 하루 1회 조회 권장 API이므로 날짜별 결과를 프로세스에 캐시합니다.
+        조회가 실패하면 _SESSION_DAY_RETRY초 동안 같은 날짜를 다시 조회하지 않고 None을 반환합니다
+        (동시에 들어온 호출도 한 번만 조회).
+    """
+    day = day or now_kst().strftime("%Y%m%d")
+    if env_dv not in ("real", "prod"):
+        return None
+
+    with _session_days_lock:
+        if day in _session_days:
+            return _session_days[day]
+        attempted = _session_day_attempts.get(day)
+        if attempted is not None and time.monotonic() - attempted < _SESSION_DAY_RETRY:
+            return None
+        _session_day_attempts[day] = time.monotonic()
+
+    if not _assert_trenv_ready(f"휴장일 조회 {day}"):
+        return None
+
+    try:
+        res = ka._url_fetch(
+            "/uapi/domestic-stock/v1/quotations/chk-holiday",
+            "CTCA0903R", "", {"BASS_DT": day, "CTX_AREA_FK": "", "CTX_AREA_NK": ""}
+        )
+        if not res.isOK():
+            logging.warning(f"휴장일 조회 실패: {day}")
+            return None
+        rows = res.getBody().output
+        if isinstance(rows, dict):
+            rows = [rows]
+        found = None
+        with _session_days_lock:
+            for row in rows or []:
+                is_open = row.get("opnd_yn") == "Y"
+                _session_days[row.get("bass_dt", "")] = is_open
+                if row.get("bass_dt") == day:
+                    found = is_open
+        return found
+    except Exception as e:
+        logging.warning(f"휴장일 조회 오류: {day} - {e}")
+        return None
+
+
+def _fetch_daily_prices(
+    stock_code: str,
+    days: int,
+    env_dv: str,
+    adjusted: bool,
+) -> pd.DataFrame:
+    """일봉 API 조회 후 정규화 (날짜 오름차순 전체, 실패 시 빈 DataFrame)"""
     if not _assert_trenv_ready(f"일봉 조회 {stock_code}"):
         return pd.DataFrame()
 
@@ -155,7 +303,7 @@ def get_daily_prices(
             "FID_INPUT_DATE_1": start_date,
             "FID_INPUT_DATE_2": end_date,
             "FID_PERIOD_DIV_CODE": "D",
-            "FID_ORG_ADJ_PRC": "0"  # 수정주가
+            "FID_ORG_ADJ_PRC": "0" if adjusted else "1"  # 0: 수정주가, 1: 원주가
         }
 
         res = ka._url_fetch(
@@ -191,16 +339,54 @@ def get_daily_prices(
             df[col] = pd.to_numeric(df[col], errors="coerce")
 
         # 날짜순 정렬 (과거 → 최근)
-        df = df.sort_values("date").reset_index(drop=True)
-
-        # 요청한 일수만큼만 반환
-        return df.tail(days).reset_index(drop=True)
+        return df.sort_values("date").reset_index(drop=True)
 
     except Exception as e:
         logging.error(f"데이터 조회 에러 ({stock_code}): {e}")
         return pd.DataFrame()
 
 
+def get_daily_prices_many(
+    stock_codes: List[str],
+    days: int = 100,
+    env_dv: str = "real",
+    max_workers: int = 4,
+    on_result: Optional[Callable[[str, pd.DataFrame], None]] = None,
+) -> Dict[str, pd.DataFrame]:
+    """
+    여러 종목의 일봉을 동시에 조회 (배치 스크리닝용)
+
+    호출 간격은 kis_auth._url_fetch의 rate limiter가 전역으로 보장하므로
+    작업 스레드를 여러 개 두어도 초당 제한을 넘지 않고, 응답 대기 시간만 겹쳐집니다.
+
+    Args:
+        stock_codes: 종목코드 리스트
+        days: 종목별 조회 기간 (일)
+        env_dv: 환경 구분 (real/demo)
+        max_workers: 동시 조회 스레드 수
+        on_result: 종목별 조회 완료 콜백 (code, df) - 진행 상황 표시용
+
+    Returns:
+        {종목코드: DataFrame} (입력 순서 유지, 실패 종목은 빈 DataFrame)
+    """
+    codes = list(dict.fromkeys(stock_codes))
+    frames: Dict[str, pd.DataFrame] = {}
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        futures = {
+            pool.submit(get_daily_prices, code, days, env_dv): code
+            for code in codes
+        }
+        for future in as_completed(futures):
+            code = futures[future]
+            df = future.result()  # get_daily_prices는 예외 대신 빈 DataFrame 반환
+            frames[code] = df
+            if on_result is not None:
+                on_result(code, df)
+
+    return {code: frames[code] for code in codes}
+
+
 # =============================================================================
 # 현재가 조회
 # =============================================================================
@@ -219,6 +405,7 @@ def get_current_price(
     Returns:
         dict with keys:
         - price: 현재가
+        - open: 시가
         - change: 전일대비
         - change_rate: 전일대비율
         - high: 고가
@@ -254,6 +441,7 @@ def get_current_price(
 
         return {
             "price": int(output.get("stck_prpr", 0)),
+            "open": int(output.get("stck_oprc", 0)),
             "change": int(output.get("prdy_vrss", 0)),
             "change_rate": float(output.get("prdy_ctrt", 0)),
             "high": int(output.get("stck_hgpr", 0)),
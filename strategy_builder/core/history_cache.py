@@ -0,0 +1,231 @@
+"""
+일봉 히스토리 캐시
+
+여러 전략/엔드포인트가 같은 종목 일봉을 반복 조회하지 않도록
+프로세스 전역에서 공유하는 캐시입니다.
+
+- 키: (종목코드, 환경, 수정주가 여부)
+- 유효 기간은 장 운영 시간 기준:
+    * 마지막 장 마감(평일 15:40) 이후에 조회한 데이터는 다음 장 마감 전까지 유효
+    * 장중에는 캐시된 과거 봉 + 현재가 시세로 당일 봉만 갱신 (시세도 짧게 캐시)
+    * 장 마감 후 첫 조회에서 한 번만 새로 받아 당일 봉을 확정
+- 메모리 예산 초과 시 가장 오래 사용하지 않은 종목부터 제거 (LRU)
+- hit/miss 등 카운터는 stats()로 조회 (/api/market/cache)
+
+휴장일은 구분하지 않으므로 공휴일에는 마감 시각 이후 한 번 더 조회할 수 있습니다.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, time as dtime, timedelta, timezone
+from typing import Any, Dict, Optional, Tuple
+
+import pandas as pd
+
+# 한국 표준시 (서머타임 없음)
+KST = timezone(timedelta(hours=9))
+
+MARKET_OPEN = dtime(9, 0)
+# 정규장 15:30 종료 후 종가 확정 여유
+MARKET_CLOSE = dtime(15, 40)
+
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024  # 64MB
+DEFAULT_QUOTE_TTL = 3.0  # 장중 현재가 시세 캐시 (초)
+
+CacheKey = Tuple[str, str, bool]
+
+
+def now_kst() -> datetime:
+    """현재 한국 시각"""
+    return datetime.now(KST)
+
+
+def is_market_open(now: Optional[datetime] = None) -> bool:
+    """정규장 시간 여부 (평일 09:00 ~ 15:40)"""
+    now = now or now_kst()
+    return now.weekday() < 5 and MARKET_OPEN <= now.time() < MARKET_CLOSE
+
+
+def last_close(now: Optional[datetime] = None) -> datetime:
+    """now 이전 가장 최근 장 마감 시각 (평일 15:40)"""
+    now = now or now_kst()
+    day = now.date()
+    if now.time() < MARKET_CLOSE:
+        day -= timedelta(days=1)
+    while day.weekday() >= 5:
+        day -= timedelta(days=1)
+    return datetime.combine(day, MARKET_CLOSE, tzinfo=KST)
+
+
+@dataclass
+class _Entry:
+    frame: pd.DataFrame
+    days: int
+    fetched_at: datetime
+    nbytes: int
+
+
+class HistoryCache:
+    """
+    일봉 히스토리 LRU 캐시 (메모리 예산 기반)
+
+    Args:
+        memory_budget: 캐시 최대 메모리 (bytes)
+        quote_ttl: 장중 당일 봉 갱신용 현재가 시세 캐시 시간 (초)
+    """
+
+    def __init__(
+        self,
+        memory_budget: int = DEFAULT_MEMORY_BUDGET,
+        quote_ttl: float = DEFAULT_QUOTE_TTL,
+    ):
+        self.memory_budget = memory_budget
+        self.quote_ttl = quote_ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._quotes: Dict[Tuple[str, str], Tuple[float, dict]] = {}
+        self._bytes = 0
+        self._counters = {
+            "hits": 0,
+            "misses": 0,
+            "stale": 0,
+            "live_patches": 0,
+            "evictions": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # 일봉
+    # ------------------------------------------------------------------
+
+    def get(
+        self,
+        key: CacheKey,
+        days: int,
+        now: Optional[datetime] = None,
+    ) -> Optional[pd.DataFrame]:
+        """
+        캐시된 일봉 조회
+
+        Returns:
+            유효하고 days 이상을 담고 있으면 전체 DataFrame 복사본, 아니면 None
+            (장중 당일 봉 갱신은 호출자가 patch_live_bar로 처리)
+        """
+        now = now or now_kst()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.days < days:
+                self._counters["misses"] += 1
+                return None
+            if entry.fetched_at < last_close(now):
+                # 마지막 장 마감 이전 데이터 → 새로 조회 (마감 후 1회 갱신)
+                self._counters["stale"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+            return entry.frame.copy()
+
+    def put(
+        self,
+        key: CacheKey,
+        frame: pd.DataFrame,
+        days: int,
+        now: Optional[datetime] = None,
+    ) -> None:
+        """일봉 저장 (메모리 예산 초과 시 LRU 제거)"""
+        nbytes = int(frame.memory_usage(index=True, deep=True).sum())
+        entry = _Entry(frame=frame.copy(), days=days, fetched_at=now or now_kst(), nbytes=nbytes)
+
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old.nbytes
+            if nbytes > self.memory_budget:
+                return
+            self._entries[key] = entry
+            self._bytes += nbytes
+            while self._bytes > self.memory_budget and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+                self._counters["evictions"] += 1
+
+    # ------------------------------------------------------------------
+    # 장중 현재가 시세
+    # ------------------------------------------------------------------
+
+    def get_quote(self, stock_code: str, env: str) -> Optional[dict]:
+        """quote_ttl 이내에 받은 현재가 시세"""
+        with self._lock:
+            cached = self._quotes.get((stock_code, env))
+            if cached is None or time.monotonic() - cached[0] >= self.quote_ttl:
+                return None
+            return cached[1]
+
+    def put_quote(self, stock_code: str, env: str, quote: dict) -> None:
+        """현재가 시세 저장"""
+        with self._lock:
+            self._quotes[(stock_code, env)] = (time.monotonic(), quote)
+
+    def record_live_patch(self) -> None:
+        """장중 당일 봉 갱신 횟수 기록"""
+        with self._lock:
+            self._counters["live_patches"] += 1
+
+    # ------------------------------------------------------------------
+    # 관리
+    # ------------------------------------------------------------------
+
+    def clear(self) -> None:
+        """캐시 전체 삭제 (카운터는 유지)"""
+        with self._lock:
+            self._entries.clear()
+            self._quotes.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 상태 및 hit/miss 카운터"""
+        with self._lock:
+            lookups = self._counters["hits"] + self._counters["misses"] + self._counters["stale"]
+            return {
+                **self._counters,
+                "hit_rate": round(self._counters["hits"] / lookups, 4) if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "memory_budget": self.memory_budget,
+                "market_open": is_market_open(),
+                "last_close": last_close().isoformat(),
+            }
+
+
+def patch_live_bar(frame: pd.DataFrame, quote: dict, today: str) -> pd.DataFrame:
+    """
+    장중 현재가 시세로 당일 봉 갱신
+
+    Args:
+        frame: 일봉 DataFrame (date 오름차순)
+        quote: data_fetcher.get_current_price 결과
+        today: 당일 (YYYYMMDD)
+
+    Returns:
+        당일 봉이 갱신(또는 추가)된 DataFrame
+    """
+    bar = {
+        "close": quote["price"],
+        "high": quote["high"],
+        "low": quote["low"],
+        "volume": quote["volume"],
+    }
+    if not frame.empty and frame["date"].iloc[-1] == today:
+        frame = frame.copy()
+        last = frame.index[-1]
+        for col, value in bar.items():
+            frame.loc[last, col] = value
+        return frame
+
+    row = pd.DataFrame([{"date": today, "open": quote.get("open", quote["price"]), **bar}])
+    return pd.concat([frame, row[frame.columns]], ignore_index=True)
+
+
+# 프로세스 전역 캐시
+history_cache = HistoryCache()
@@ -6,10 +6,65 @@ Applied Skills: skills/investment-strategy-framework.md
 - 기간 부족 시 None 반환 (에러 발생 금지)
 """
 
-from typing import Optional
+from typing import Callable, Optional
 
 import numpy as np
 import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+# pip install numba (선택, 설치되어 있으면 재귀형 지표(SAR/KAMA/FRAMA/VIDYA)를 컴파일 커널로 계산)
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# 윈도우 일괄 연산 시 한 번에 처리할 윈도우 수 (메모리 상한: 청크 × period × 8바이트)
+_WINDOW_CHUNK = 65536
+
+
+def _rolling_reduce(
+    values: np.ndarray, period: int, func: Callable[[np.ndarray], np.ndarray]
+) -> np.ndarray:
+    """rolling(period).apply(f, raw=True)와 같은 결과를 윈도우 뷰 일괄 연산으로 계산
+
+    Args:
+        values: 1차원 배열
+        period: 윈도우 크기
+        func: (윈도우 수, period) 배열 → (윈도우 수,) 배열. 행 단위로 f와 같은 연산이어야 함
+
+    NaN이 포함된 윈도우는 rolling.apply처럼 NaN이 됩니다 (func가 NaN을 전파하는 연산일 때).
+    """
+    out = np.full(len(values), np.nan)
+    if len(values) < period:
+        return out
+    windows = sliding_window_view(values, period)
+    for start in range(0, len(windows), _WINDOW_CHUNK):
+        chunk = windows[start:start + _WINDOW_CHUNK]
+        out[period - 1 + start:period - 1 + start + len(chunk)] = func(chunk)
+    return out
+
+
+def _recursive_kernel(func: Callable) -> Callable[..., np.ndarray]:
+    """직전 값에 의존하는 재귀식 커널 등록
+
+    func(out, *args)는 out(NaN으로 채운 길이 n)을 앞에서부터 채웁니다.
+    재귀식은 시점마다 계수가 달라 벡터화하면 결과가 달라지므로,
+    numba가 있으면 컴파일 커널(배열)로, 없으면 float 리스트 순회로 같은 식을 실행합니다.
+    반환 함수는 run(n, *args) → 길이 n의 float 배열입니다.
+    """
+
+    def run(length: int, *args) -> np.ndarray:
+        if run.compiled is not None:
+            out = np.full(length, np.nan)
+            run.compiled(out, *args)
+            return out
+        out = [np.nan] * length
+        func(out, *(arg.tolist() if isinstance(arg, np.ndarray) else arg for arg in args))
+        return np.array(out, dtype=float)
+
+    run.compiled = njit(cache=True)(func) if njit is not None else None
+    run.python = func
+    return run
 
 
 def calc_ma(df: pd.DataFrame, period: int, column: str = "close") -> pd.Series:
@@ -580,8 +635,15 @@ def calc_cci(df: pd.DataFrame, period: int = 20) -> pd.Series:
     # SMA of TP
     tp_sma = tp.rolling(window=period).mean()
 
-    # Mean Deviation
-    mean_dev = tp.rolling(window=period).apply(lambda x: abs(x - x.mean()).mean(), raw=True)
+    # Mean Deviation (윈도우별 |x - mean(x)|의 평균)
+    mean_dev = pd.Series(
+        _rolling_reduce(
+            tp.to_numpy(dtype=float),
+            period,
+            lambda w: np.abs(w - w.mean(axis=1, keepdims=True)).mean(axis=1),
+        ),
+        index=tp.index,
+    )
 
     # CCI
     cci = (tp - tp_sma) / (0.015 * mean_dev)
@@ -626,18 +688,16 @@ def calc_obv(df: pd.DataFrame) -> pd.Series:
     if df.empty or len(df) < 2:
         return pd.Series(dtype=float)
 
-    obv = pd.Series(index=df.index, dtype=float)
-    obv.iloc[0] = df["volume"].iloc[0]
+    close = df["close"].to_numpy(dtype=float)
+    volume = df["volume"].to_numpy(dtype=float)
 
-    for i in range(1, len(df)):
-        if df["close"].iloc[i] > df["close"].iloc[i - 1]:
-            obv.iloc[i] = obv.iloc[i - 1] + df["volume"].iloc[i]
-        elif df["close"].iloc[i] < df["close"].iloc[i - 1]:
-            obv.iloc[i] = obv.iloc[i - 1] - df["volume"].iloc[i]
-        else:
-            obv.iloc[i] = obv.iloc[i - 1]
+    # 상승일 +거래량, 하락일 -거래량, 보합(또는 비교 불가)일 0을 누적
+    diff = close[1:] - close[:-1]
+    signed = np.empty(len(df))
+    signed[0] = volume[0]
+    signed[1:] = np.where(diff > 0, volume[1:], np.where(diff < 0, -volume[1:], 0.0))
 
-    return obv
+    return pd.Series(np.cumsum(signed), index=df.index)
 
 
 def calc_volume_ma(df: pd.DataFrame, period: int = 20) -> pd.Series:
@@ -805,24 +865,22 @@ def calc_aroon_up(df: pd.DataFrame, period: int = 25) -> pd.Series:
     """아룬 업"""
     if df.empty or len(df) < period + 1:
         return pd.Series(dtype=float)
-    result = pd.Series(index=df.index, dtype=float)
-    for i in range(period, len(df)):
-        window = df["high"].iloc[i - period : i + 1]
-        days_since_high = period - window.values.argmax()
-        result.iloc[i] = ((period - days_since_high) / period) * 100
-    return result
+    result = np.full(len(df), np.nan)
+    # 윈도우(period+1개)별 최고가 위치 (동률이면 첫 위치)
+    days_since_high = period - sliding_window_view(df["high"].to_numpy(dtype=float), period + 1).argmax(axis=1)
+    result[period:] = ((period - days_since_high) / period) * 100
+    return pd.Series(result, index=df.index)
 
 
 def calc_aroon_down(df: pd.DataFrame, period: int = 25) -> pd.Series:
     """아룬 다운"""
     if df.empty or len(df) < period + 1:
         return pd.Series(dtype=float)
-    result = pd.Series(index=df.index, dtype=float)
-    for i in range(period, len(df)):
-        window = df["low"].iloc[i - period : i + 1]
-        days_since_low = period - window.values.argmin()
-        result.iloc[i] = ((period - days_since_low) / period) * 100
-    return result
+    result = np.full(len(df), np.nan)
+    # 윈도우(period+1개)별 최저가 위치 (동률이면 첫 위치)
+    days_since_low = period - sliding_window_view(df["low"].to_numpy(dtype=float), period + 1).argmin(axis=1)
+    result[period:] = ((period - days_since_low) / period) * 100
+    return pd.Series(result, index=df.index)
 
 
 def calc_natr(df: pd.DataFrame, period: int = 14) -> pd.Series:
@@ -880,17 +938,14 @@ def calc_supertrend(
     hl2 = (df["high"] + df["low"]) / 2
     upper = hl2 + (multiplier * atr)
     lower = hl2 - (multiplier * atr)
-    direction = pd.Series(1, index=df.index, dtype=float)
+    # 전일 밴드 돌파 시점에만 방향을 정하고 나머지는 직전 방향 유지
+    close = df["close"].to_numpy(dtype=float)
+    prev_upper = upper.shift(1).to_numpy(dtype=float)
+    prev_lower = lower.shift(1).to_numpy(dtype=float)
+    signal = np.where(close > prev_upper, 1.0, np.where(close < prev_lower, -1.0, np.nan))
+    signal[0] = 1.0
 
-    for i in range(1, len(df)):
-        if df["close"].iloc[i] > upper.iloc[i - 1]:
-            direction.iloc[i] = 1
-        elif df["close"].iloc[i] < lower.iloc[i - 1]:
-            direction.iloc[i] = -1
-        else:
-            direction.iloc[i] = direction.iloc[i - 1]
-
-    return direction
+    return pd.Series(signal, index=df.index).ffill()
 
 
 def calc_sar(
@@ -900,21 +955,31 @@ def calc_sar(
     if df.empty or len(df) < 2:
         return pd.Series(dtype=float)
 
-    high = df["high"].values
-    low = df["low"].values
-    sar = pd.Series(index=df.index, dtype=float)
+    sar = _sar_kernel(
+        len(df),
+        df["high"].to_numpy(dtype=float),
+        df["low"].to_numpy(dtype=float),
+        float(af_start),
+        float(af_max),
+    )
+    return pd.Series(sar, index=df.index)
+
+
+@_recursive_kernel
+def _sar_kernel(out, high, low, af_start, af_max):
+    """파라볼릭 SAR 재귀식 (추세/극값/가속계수가 경로 의존)"""
     trend = 1
     ep = high[0]
     af = af_start
-    sar.iloc[0] = low[0]
+    out[0] = low[0]
 
-    for i in range(1, len(df)):
-        sar.iloc[i] = sar.iloc[i - 1] + af * (ep - sar.iloc[i - 1])
+    for i in range(1, len(high)):
+        s = out[i - 1] + af * (ep - out[i - 1])
 
         if trend == 1:
-            if low[i] < sar.iloc[i]:
+            if low[i] < s:
                 trend = -1
-                sar.iloc[i] = ep
+                s = ep
                 ep = low[i]
                 af = af_start
             else:
@@ -922,17 +987,16 @@ def calc_sar(
                     ep = high[i]
                     af = min(af + af_start, af_max)
         else:
-            if high[i] > sar.iloc[i]:
+            if high[i] > s:
                 trend = 1
-                sar.iloc[i] = ep
+                s = ep
                 ep = high[i]
                 af = af_start
             else:
                 if low[i] < ep:
                     ep = low[i]
                     af = min(af + af_start, af_max)
-
-    return sar
+        out[i] = s
 
 
 def calc_ichimoku_tenkan(df: pd.DataFrame, period: int = 9) -> pd.Series:
@@ -997,6 +1061,36 @@ def calc_tema(df: pd.DataFrame, period: int = 20) -> pd.Series:
     return 3 * ema1 - 3 * ema2 + ema3
 
 
+@_recursive_kernel
+def _adaptive_kernel(out, x, k, start):
+    """y[start] = x[start], y[i] = y[i-1] + k[i] * (x[i] - y[i-1])"""
+    y = x[start]
+    out[start] = y
+    for i in range(start + 1, len(x)):
+        y = y + k[i] * (x[i] - y)
+        out[i] = y
+
+
+@_recursive_kernel
+def _weighted_kernel(out, x, a, start):
+    """y[start] = x[start], y[i] = a[i] * x[i] + (1 - a[i]) * y[i-1]"""
+    y = x[start]
+    out[start] = y
+    for i in range(start + 1, len(x)):
+        y = a[i] * x[i] + (1 - a[i]) * y
+        out[i] = y
+
+
+def _adaptive_smooth(values: np.ndarray, sc: np.ndarray, start: int) -> np.ndarray:
+    """KAMA형 적응 평활 (계수 sc가 시점마다 다른 1차 재귀식)"""
+    return _adaptive_kernel(len(values), values, sc, start)
+
+
+def _weighted_smooth(values: np.ndarray, alpha: np.ndarray, start: int) -> np.ndarray:
+    """FRAMA/VIDYA형 가중 평활 (가중치 alpha가 시점마다 다른 1차 재귀식)"""
+    return _weighted_kernel(len(values), values, alpha, start)
+
+
 def calc_kama(df: pd.DataFrame, period: int = 20) -> pd.Series:
     """카우프만 적응형 이동평균 (Kaufman Adaptive MA)"""
     if df.empty or len(df) < period:
@@ -1007,11 +1101,10 @@ def calc_kama(df: pd.DataFrame, period: int = 20) -> pd.Series:
     er = direction / volatility.replace(0, np.nan)
     fast_sc, slow_sc = 2 / 3, 2 / 31
     sc = (er * (fast_sc - slow_sc) + slow_sc) ** 2
-    kama = pd.Series(np.nan, index=close.index)
-    kama.iloc[period - 1] = close.iloc[period - 1]
-    for i in range(period, len(close)):
-        kama.iloc[i] = kama.iloc[i - 1] + sc.iloc[i] * (close.iloc[i] - kama.iloc[i - 1])
-    return kama
+    return pd.Series(
+        _adaptive_smooth(close.to_numpy(dtype=float), sc.to_numpy(dtype=float), period - 1),
+        index=close.index,
+    )
 
 
 def calc_alma(df: pd.DataFrame, period: int = 20, sigma: float = 6.0, offset: float = 0.85) -> pd.Series:
@@ -1095,13 +1188,11 @@ def calc_frama(df: pd.DataFrame, period: int = 20) -> pd.Series:
     n3 = (h_all - l_all) / period
     d = (np.log(n1 + n2) - np.log(n3)) / np.log(2)
     alpha = np.exp(-4.6 * (d - 1)).clip(0.01, 1.0)
-    frama = pd.Series(np.nan, index=close.index)
-    start = period - 1
-    frama.iloc[start] = close.iloc[start]
-    for i in range(start + 1, len(close)):
-        a = alpha.iloc[i] if not np.isnan(alpha.iloc[i]) else 0.5
-        frama.iloc[i] = a * close.iloc[i] + (1 - a) * frama.iloc[i - 1]
-    return frama
+    alpha = alpha.fillna(0.5)
+    return pd.Series(
+        _weighted_smooth(close.to_numpy(dtype=float), alpha.to_numpy(dtype=float), period - 1),
+        index=close.index,
+    )
 
 
 def calc_vidya(df: pd.DataFrame, period: int = 20) -> pd.Series:
@@ -1111,12 +1202,11 @@ def calc_vidya(df: pd.DataFrame, period: int = 20) -> pd.Series:
     close = df["close"]
     cmo_abs = calc_cmo(df, period).abs() / 100
     sc = 2 / (period + 1)
-    vidya = pd.Series(np.nan, index=close.index)
-    vidya.iloc[period - 1] = close.iloc[period - 1]
-    for i in range(period, len(close)):
-        k = sc * cmo_abs.iloc[i] if not np.isnan(cmo_abs.iloc[i]) else 0
-        vidya.iloc[i] = k * close.iloc[i] + (1 - k) * vidya.iloc[i - 1]
-    return vidya
+    k = (sc * cmo_abs).fillna(0)
+    return pd.Series(
+        _weighted_smooth(close.to_numpy(dtype=float), k.to_numpy(dtype=float), period - 1),
+        index=close.index,
+    )
 
 
 # ── 오실레이터 (11개) ───────────────────────────────────────
@@ -1473,9 +1563,10 @@ def calc_regression_slope(df: pd.DataFrame, period: int = 20) -> pd.Series:
     x = np.arange(period, dtype=float)
     x_mean = x.mean()
     x_var = ((x - x_mean) ** 2).sum()
-    def _slope(y):
-        return np.sum((x - x_mean) * (y - y.mean())) / x_var
-    return df["close"].rolling(window=period).apply(_slope, raw=True)
+    def _slope(w):
+        return np.sum((x - x_mean) * (w - w.mean(axis=1, keepdims=True)), axis=1) / x_var
+    close = df["close"]
+    return pd.Series(_rolling_reduce(close.to_numpy(dtype=float), period, _slope), index=close.index)
 
 
 def calc_regression_intercept(df: pd.DataFrame, period: int = 20) -> pd.Series:
@@ -1485,10 +1576,12 @@ def calc_regression_intercept(df: pd.DataFrame, period: int = 20) -> pd.Series:
     x = np.arange(period, dtype=float)
     x_mean = x.mean()
     x_var = ((x - x_mean) ** 2).sum()
-    def _intercept(y):
-        slope = np.sum((x - x_mean) * (y - y.mean())) / x_var
-        return y.mean() - slope * x_mean
-    return df["close"].rolling(window=period).apply(_intercept, raw=True)
+    def _intercept(w):
+        y_mean = w.mean(axis=1)
+        slope = np.sum((x - x_mean) * (w - y_mean[:, None]), axis=1) / x_var
+        return y_mean - slope * x_mean
+    close = df["close"]
+    return pd.Series(_rolling_reduce(close.to_numpy(dtype=float), period, _intercept), index=close.index)
 
 
 def calc_pivot(df: pd.DataFrame) -> pd.Series:
@@ -0,0 +1,135 @@
+"""
+가격 패널 (종목 × 일자 2차원 데이터)
+
+여러 종목의 일봉을 필드별(open/high/low/close/volume) DataFrame 하나로 모아
+지표와 조건을 종목 전체에 대해 컬럼 단위로 한 번에 계산할 수 있게 합니다.
+
+- 행: 각 종목의 최근 봉 기준 위치 (마지막 행 = 각 종목의 최신 봉)
+- 열: 종목코드
+- 상장 기간이 짧아 봉 수가 부족한 종목은 위쪽(과거)이 NaN으로 채워집니다
+
+종목별 DataFrame의 iloc[-1], iloc[-2], rolling(...) 결과가
+패널 컬럼의 같은 위치 값과 일치하도록 끝(최신 봉) 기준으로 정렬합니다.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+PANEL_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+@dataclass(frozen=True)
+class PricePanel:
+    """
+    종목 × 일자 OHLCV 패널
+
+    Attributes:
+        open/high/low/close/volume: 행=봉 위치, 열=종목코드 DataFrame
+        lengths: 종목별 유효 봉 수 (데이터 부족 판정용)
+        last_dates: 종목별 최신 봉 일자 (YYYYMMDD)
+    """
+    open: pd.DataFrame
+    high: pd.DataFrame
+    low: pd.DataFrame
+    close: pd.DataFrame
+    volume: pd.DataFrame
+    lengths: pd.Series
+    last_dates: pd.Series
+
+    @classmethod
+    def from_frames(
+        cls,
+        frames: Dict[str, pd.DataFrame],
+        days: Optional[int] = None,
+    ) -> "PricePanel":
+        """
+        종목별 일봉 DataFrame(data_fetcher.get_daily_prices 형식)으로 패널 생성
+
+        Args:
+            frames: {종목코드: OHLCV DataFrame} (빈 DataFrame은 봉 0개로 처리)
+            days: 종목별 최근 N봉만 사용 (None이면 전체)
+
+        Returns:
+            PricePanel
+        """
+        codes = list(frames.keys())
+        columns = list(PANEL_FIELDS)
+
+        # 종목별 (필드 수, 봉 수) 배열
+        values = {}
+        last_dates = {}
+        for code, df in frames.items():
+            if df.empty:
+                values[code] = np.empty((len(columns), 0))
+                last_dates[code] = None
+                continue
+            arr = np.array([df[field].to_numpy(dtype=float) for field in columns])
+            values[code] = arr[:, -days:] if days is not None else arr
+            last_dates[code] = df["date"].iat[-1] if "date" in df.columns else None
+
+        lengths = {code: arr.shape[1] for code, arr in values.items()}
+        rows = max(lengths.values(), default=0)
+
+        stacked = np.full((len(columns), rows, len(codes)), np.nan)
+        for j, code in enumerate(codes):
+            n = lengths[code]
+            if n:
+                stacked[:, rows - n:, j] = values[code]
+
+        index = pd.RangeIndex(rows)
+        return cls(
+            **{
+                field: pd.DataFrame(stacked[k], index=index, columns=codes)
+                for k, field in enumerate(columns)
+            },
+            lengths=pd.Series(lengths, index=codes, dtype=int),
+            last_dates=pd.Series(last_dates, index=codes, dtype=object),
+        )
+
+    @property
+    def codes(self) -> List[str]:
+        """종목코드 목록"""
+        return list(self.close.columns)
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    def tail(self, n: int) -> "PricePanel":
+        """종목별 최근 N봉만 남긴 패널"""
+        if n >= len(self):
+            return self
+        rows = slice(len(self) - n, None)
+        return PricePanel(
+            **{
+                field: getattr(self, field).iloc[rows].reset_index(drop=True)
+                for field in PANEL_FIELDS
+            },
+            lengths=self.lengths.clip(upper=n),
+            last_dates=self.last_dates,
+        )
+
+
+def rolling_mean(frame: pd.DataFrame, window: int) -> pd.DataFrame:
+    """
+    frame.rolling(window).mean()을 전 종목(컬럼)에 대해 한 번에 계산
+
+    pandas의 DataFrame.rolling은 컬럼별로 반복 계산하므로, 종목 수가 많으면
+    윈도우 합을 2차원 배열 연산으로 직접 구합니다.
+    원 단위 정수 가격에서는 합이 정확하므로 pandas 결과와 비트 단위로 같습니다.
+
+    Args:
+        frame: 패널 필드 (행=봉 위치, 열=종목)
+        window: 기간
+
+    Returns:
+        이동평균 DataFrame (윈도우에 NaN이 있거나 기간 부족 시 NaN)
+    """
+    values = frame.to_numpy(dtype=float)
+    result = np.full(values.shape, np.nan)
+    if len(values) >= window:
+        result[window - 1:] = sliding_window_view(values, window, axis=0).sum(axis=-1) / window
+    return pd.DataFrame(result, index=frame.index, columns=frame.columns)
@@ -1,53 +1,209 @@
 """
 실시간 호가 웹소켓 관리 모듈
 
-Note: 현재 KIS WebSocket 완전 연동은 추가 구현 필요
-      REST API 호가 조회는 정상 작동
+KIS 실시간 호가(H0UNASP0 통합 / H0STASP0 KRX)를 웹소켓 연결 하나로 구독하고
+여러 프론트엔드 클라이언트에 나눠 보냅니다.
+
+- 종목당 업스트림 구독은 1개 (클라이언트 수와 무관, 마지막 클라이언트가 나가면 해제)
+- 클라이언트별 송신 태스크가 CLIENT_SEND_INTERVAL 간격으로 최신 호가만 전송
+  (느린 브라우저 소켓은 중간 스냅샷을 버리고 쌓아두지 않음)
+- 업스트림 연결이 끊기면 재연결 후 구독 중인 종목을 다시 등록
 """
 
 import asyncio
+import json
 import logging
 from datetime import datetime
-from typing import Dict, Set
+from typing import Any, Dict, List, Optional, Set
+
+import websockets
 
-from core import data_fetcher
+import kis_auth as ka
 
 logging.basicConfig(level=logging.INFO)
 
+# 실시간 호가 TR (모의투자는 KRX 호가만 제공)
+TR_ORDERBOOK_TOTAL = "H0UNASP0"  # 국내주식 실시간호가 (통합)
+TR_ORDERBOOK_KRX = "H0STASP0"  # 국내주식 실시간호가 (KRX)
+
+# 실시간 호가 컬럼 (H0STASP0, H0UNASP0는 뒤에 중간가 컬럼이 추가됨)
+ORDERBOOK_COLUMNS = [
+    "MKSC_SHRN_ISCD", "BSOP_HOUR", "HOUR_CLS_CODE",
+    "ASKP1", "ASKP2", "ASKP3", "ASKP4", "ASKP5",
+    "ASKP6", "ASKP7", "ASKP8", "ASKP9", "ASKP10",
+    "BIDP1", "BIDP2", "BIDP3", "BIDP4", "BIDP5",
+    "BIDP6", "BIDP7", "BIDP8", "BIDP9", "BIDP10",
+    "ASKP_RSQN1", "ASKP_RSQN2", "ASKP_RSQN3", "ASKP_RSQN4", "ASKP_RSQN5",
+    "ASKP_RSQN6", "ASKP_RSQN7", "ASKP_RSQN8", "ASKP_RSQN9", "ASKP_RSQN10",
+    "BIDP_RSQN1", "BIDP_RSQN2", "BIDP_RSQN3", "BIDP_RSQN4", "BIDP_RSQN5",
+    "BIDP_RSQN6", "BIDP_RSQN7", "BIDP_RSQN8", "BIDP_RSQN9", "BIDP_RSQN10",
+    "TOTAL_ASKP_RSQN", "TOTAL_BIDP_RSQN", "OVTM_TOTAL_ASKP_RSQN", "OVTM_TOTAL_BIDP_RSQN",
+    "ANTC_CNPR", "ANTC_CNQN", "ANTC_VOL", "ANTC_CNTG_VRSS", "ANTC_CNTG_VRSS_SIGN",
+    "ANTC_CNTG_PRDY_CTRT", "ACML_VOL", "TOTAL_ASKP_RSQN_ICDC", "TOTAL_BIDP_RSQN_ICDC",
+    "OVTM_TOTAL_ASKP_ICDC", "OVTM_TOTAL_BIDP_ICDC", "STCK_DEAL_CLS_CODE",
+]
+ORDERBOOK_TOTAL_COLUMNS = ORDERBOOK_COLUMNS + [
+    "KMID_PRC", "KMID_TOTAL_RSQN", "KMID_CLS_CODE",
+    "NMID_PRC", "NMID_TOTAL_RSQN", "NMID_CLS_CODE",
+]
+
+# 웹소켓 세션당 실시간 등록 한도
+MAX_SUBSCRIPTIONS = 40
+
+# 클라이언트별 최소 송신 간격 (초) - 그 사이 들어온 호가는 최신 것만 전송
+CLIENT_SEND_INTERVAL = 0.2
+
+# 업스트림 재연결 대기 (초, 실패할 때마다 2배, 최대값까지)
+RECONNECT_DELAY = 1.0
+MAX_RECONNECT_DELAY = 30.0
+
+
+def _to_int(value: str) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
+
+
+def parse_orderbook(tr_id: str, body: str) -> List[dict]:
+    """
+    실시간 호가 데이터부 파싱
+
+    Args:
+        tr_id: H0UNASP0 또는 H0STASP0
+        body: "^" 구분 레코드 (여러 건이면 이어 붙어 있음)
+
+    Returns:
+        프론트엔드 호가 형식 dict 목록 (REST get_orderbook과 같은 키)
+    """
+    columns = ORDERBOOK_TOTAL_COLUMNS if tr_id == TR_ORDERBOOK_TOTAL else ORDERBOOK_COLUMNS
+    fields = body.split("^")
+    width = len(columns)
+
+    orderbooks = []
+    for start in range(0, len(fields) - width + 1, width):
+        row = dict(zip(columns, fields[start:start + width]))
+        orderbooks.append({
+            "stock_code": row["MKSC_SHRN_ISCD"],
+            "time": row["BSOP_HOUR"],
+            "ask_prices": [_to_int(row[f"ASKP{i}"]) for i in range(1, 11)],
+            "ask_volumes": [_to_int(row[f"ASKP_RSQN{i}"]) for i in range(1, 11)],
+            "bid_prices": [_to_int(row[f"BIDP{i}"]) for i in range(1, 11)],
+            "bid_volumes": [_to_int(row[f"BIDP_RSQN{i}"]) for i in range(1, 11)],
+            "total_ask_volume": _to_int(row["TOTAL_ASKP_RSQN"]),
+            "total_bid_volume": _to_int(row["TOTAL_BIDP_RSQN"]),
+            "expected_price": _to_int(row["ANTC_CNPR"]),
+            "expected_volume": _to_int(row["ANTC_CNQN"]),
+        })
+    return orderbooks
+
+
+def _issue_approval_key(svr: str) -> str:
+    """
+    웹소켓 접속키 발급 (블로킹, 작업 스레드에서 호출)
+
+    ka.auth_ws()는 changeTREnv로 REST 토큰을 비우므로 접속키만 직접 발급합니다.
+    """
+    ak1, ak2 = ("my_app", "my_sec") if svr == "prod" else ("paper_app", "paper_sec")
+    body = {
+        "grant_type": "client_credentials",
+        "appkey": ka._cfg[ak1],
+        "secretkey": ka._cfg[ak2],
+    }
+    res = ka._session.post(
+        f"{ka._cfg[svr]}/oauth2/Approval",
+        data=json.dumps(body),
+        headers=ka._getBaseHeader(),
+    )
+    res.raise_for_status()
+    return res.json()["approval_key"]
+
+
+class _ClientStream:
+    """
+    클라이언트 웹소켓 하나의 송신 상태
+
+    종목별로 아직 보내지 않은 최신 메시지만 보관하고, 송신 태스크가
+    interval 간격으로 꺼내 보냅니다. 송신이 밀리면 중간 스냅샷은 덮어써집니다.
+    """
+
+    def __init__(self, client_ws, interval: float):
+        self.client_ws = client_ws
+        self.interval = interval
+        self.pending: Dict[str, str] = {}  # {stock_code: JSON 메시지}
+        self.wakeup = asyncio.Event()
+        self.sent = 0
+        self.dropped = 0
+        self.task: Optional[asyncio.Task] = None
+
+    def offer(self, stock_code: str, message: str):
+        """최신 호가 등록 (이전 미전송 호가는 버림)"""
+        if stock_code in self.pending:
+            self.dropped += 1
+        self.pending[stock_code] = message
+        self.wakeup.set()
+
+    async def run(self):
+        """송신 루프 (전송 실패 시 예외로 종료)"""
+        while True:
+            await self.wakeup.wait()
+            self.wakeup.clear()
+            pending, self.pending = self.pending, {}
+            for message in pending.values():
+                await self.client_ws.send_text(message)
+                self.sent += 1
+            await asyncio.sleep(self.interval)
+
 
 class OrderbookWebSocketManager:
     """
     실시간 호가 웹소켓 관리자
 
-    현재는 폴링(polling) 방식으로 REST API를 주기적으로 호출하여
-    실시간 호가를 시뮬레이션합니다.
+    KIS 웹소켓 연결 하나에 종목별 호가를 한 번씩 구독하고,
+    같은 종목을 보는 모든 클라이언트에 최신 호가를 전달합니다.
 
-    TODO: KIS WebSocket (H0UNASP0) 완전 연동
+    Args:
+        send_interval: 클라이언트별 최소 송신 간격 (초)
     """
 
-    def __init__(self):
+    def __init__(self, send_interval: float = CLIENT_SEND_INTERVAL):
+        self.send_interval = send_interval
         self.subscriptions: Dict[str, Set] = {}  # {stock_code: {client_websockets}}
+        self.clients: Dict[Any, _ClientStream] = {}  # {client_websocket: 송신 상태}
+        self.last_orderbook: Dict[str, str] = {}  # {stock_code: 마지막 호가 JSON}
         self.running = False
-        self.polling_tasks: Dict[str, asyncio.Task] = {}  # {stock_code: polling_task}
+
+        self._upstream_task: Optional[asyncio.Task] = None
+        self._upstream = None
+        self._upstream_codes: Set[str] = set()  # 업스트림에 등록된 종목
+        self._sync_lock = asyncio.Lock()
+        self._svr: Optional[str] = None
+        self._tr_id: Optional[str] = None
+        self._approval_key: Optional[str] = None
 
     async def start(self):
-        """웹소켓 매니저 시작"""
+        """웹소켓 매니저 시작 (업스트림 연결은 첫 구독 시)"""
         if self.running:
             return
 
         self.running = True
-        logging.info("Orderbook WebSocket Manager 시작 (polling mode)")
+        logging.info("Orderbook WebSocket Manager 시작")
 
     async def stop(self):
         """웹소켓 매니저 종료"""
         self.running = False
 
-        # 모든 폴링 태스크 취소
-        for task in self.polling_tasks.values():
-            task.cancel()
+        if self._upstream_task is not None:
+            self._upstream_task.cancel()
+            self._upstream_task = None
+        for stream in self.clients.values():
+            if stream.task is not None:
+                stream.task.cancel()
 
-        self.polling_tasks.clear()
+        self.clients.clear()
         self.subscriptions.clear()
+        self.last_orderbook.clear()
+        self._upstream_codes.clear()
         logging.info("Orderbook WebSocket Manager 종료")
 
     async def subscribe_orderbook(self, stock_code: str, client_ws):
@@ -57,20 +213,34 @@ class OrderbookWebSocketManager:
         Args:
             stock_code: 종목코드
             client_ws: 클라이언트 웹소켓
+
+        Raises:
+            RuntimeError: KIS API 미인증
+            ValueError: 구독 종목 수 한도 초과
         """
+        if not getattr(ka.getTREnv(), "my_url", None):
+            raise RuntimeError("KIS API 미인증: 재인증이 필요합니다.")
+
         if stock_code not in self.subscriptions:
+            if len(self.subscriptions) >= MAX_SUBSCRIPTIONS:
+                raise ValueError(f"실시간 호가 구독 한도 초과 (최대 {MAX_SUBSCRIPTIONS}종목)")
             self.subscriptions[stock_code] = set()
+            logging.info(f"호가 구독 시작: {stock_code}")
 
-            # 폴링 태스크 시작 (1초마다 호가 조회)
-            task = asyncio.create_task(
-                self._polling_loop(stock_code)
-            )
-            self.polling_tasks[stock_code] = task
-            logging.info(f"호가 구독 시작 (polling): {stock_code}")
-
-        # 클라이언트 추가
         self.subscriptions[stock_code].add(client_ws)
+
+        stream = self.clients.get(client_ws)
+        if stream is None:
+            stream = _ClientStream(client_ws, self.send_interval)
+            stream.task = asyncio.create_task(self._client_loop(stream))
+            self.clients[client_ws] = stream
+
+        # 이미 받은 호가가 있으면 바로 전달
+        if stock_code in self.last_orderbook:
+            stream.offer(stock_code, self.last_orderbook[stock_code])
+
         logging.info(f"클라이언트 추가: {stock_code} (총 {len(self.subscriptions[stock_code])}명)")
+        await self._ensure_upstream()
 
     async def unsubscribe_orderbook(self, stock_code: str, client_ws):
         """
@@ -80,69 +250,157 @@ class OrderbookWebSocketManager:
             stock_code: 종목코드
             client_ws: 클라이언트 웹소켓
         """
-        if stock_code not in self.subscriptions:
-            return
-
-        # 클라이언트 제거
-        self.subscriptions[stock_code].discard(client_ws)
-        logging.info(f"클라이언트 제거: {stock_code} (남은 {len(self.subscriptions[stock_code])}명)")
-
-        # 구독자가 없으면 폴링 중단
-        if len(self.subscriptions[stock_code]) == 0:
-            if stock_code in self.polling_tasks:
-                self.polling_tasks[stock_code].cancel()
-                del self.polling_tasks[stock_code]
+        clients = self.subscriptions.get(stock_code)
+        if clients is not None:
+            clients.discard(client_ws)
+            logging.info(f"클라이언트 제거: {stock_code} (남은 {len(clients)}명)")
+            if not clients:
+                del self.subscriptions[stock_code]
+                self.last_orderbook.pop(stock_code, None)
                 logging.info(f"호가 구독 해제: {stock_code}")
 
-            del self.subscriptions[stock_code]
-
-    async def _polling_loop(self, stock_code: str):
-        """
-        호가 폴링 루프 (REST API 주기 호출)
+        if not any(client_ws in c for c in self.subscriptions.values()):
+            stream = self.clients.pop(client_ws, None)
+            if stream is not None:
+                if stream.task is not None and stream.task is not asyncio.current_task():
+                    stream.task.cancel()
+                logging.debug(f"클라이언트 송신 종료 (전송 {stream.sent}, 생략 {stream.dropped})")
+
+        if not self.subscriptions and self._upstream_task is not None:
+            # 구독 종목이 없으면 업스트림 연결 종료
+            self._upstream_task.cancel()
+            self._upstream_task = None
+        else:
+            await self._sync_upstream()
+
+    # ------------------------------------------------------------------
+    # 클라이언트 송신
+    # ------------------------------------------------------------------
+
+    async def _client_loop(self, stream: _ClientStream):
+        try:
+            await stream.run()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logging.error(f"클라이언트 전송 실패: {e}")
+            # 연결이 끊긴 클라이언트의 구독 전체 해제
+            codes = [code for code, c in self.subscriptions.items() if stream.client_ws in c]
+            for code in codes:
+                await self.unsubscribe_orderbook(code, stream.client_ws)
+
+    def _dispatch(self, orderbook: dict):
+        """업스트림 호가 1건을 구독 클라이언트에 전달 (JSON 인코딩은 1회)"""
+        stock_code = orderbook["stock_code"]
+        clients = self.subscriptions.get(stock_code)
+        if not clients:
+            return
 
-        Args:
-            stock_code: 종목코드
-        """
-        while self.running and stock_code in self.subscriptions:
+        message = json.dumps({
+            "type": "orderbook",
+            "stock_code": stock_code,
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "data": orderbook,
+        }, ensure_ascii=False)
+        self.last_orderbook[stock_code] = message
+
+        for client_ws in clients:
+            stream = self.clients.get(client_ws)
+            if stream is not None:
+                stream.offer(stock_code, message)
+
+    # ------------------------------------------------------------------
+    # 업스트림 (KIS 웹소켓)
+    # ------------------------------------------------------------------
+
+    async def _ensure_upstream(self):
+        """업스트림 연결 태스크 시작 또는 구독 목록 동기화"""
+        if self._upstream_task is None or self._upstream_task.done():
+            self._upstream_task = asyncio.create_task(self._upstream_loop())
+        else:
+            await self._sync_upstream()
+
+    def _request(self, tr_type: str, stock_code: str) -> str:
+        """실시간 등록("1")/해제("2") 요청 메시지"""
+        return json.dumps({
+            "header": {
+                "approval_key": self._approval_key,
+                "custtype": "P",
+                "tr_type": tr_type,
+                "content-type": "utf-8",
+            },
+            "body": {"input": {"tr_id": self._tr_id, "tr_key": stock_code}},
+        })
+
+    async def _sync_upstream(self):
+        """업스트림 등록 종목을 현재 구독 목록과 맞춤"""
+        async with self._sync_lock:
+            ws = self._upstream
+            if ws is None:
+                return
+            wanted = set(self.subscriptions)
+            for code in sorted(wanted - self._upstream_codes):
+                await ws.send(self._request("1", code))
+                self._upstream_codes.add(code)
+            for code in sorted(self._upstream_codes - wanted):
+                await ws.send(self._request("2", code))
+                self._upstream_codes.discard(code)
+
+    async def _upstream_loop(self):
+        """KIS 웹소켓 연결 유지 (끊기면 재연결 후 재구독)"""
+        delay = RECONNECT_DELAY
+        while self.running and self.subscriptions:
             try:
-                # REST API로 호가 조회
-                orderbook = data_fetcher.get_orderbook(stock_code, env_dv="vps")
-
-                if orderbook:
-                    # 클라이언트에게 전달
-                    orderbook_data = {
-                        "type": "orderbook",
-                        "stock_code": stock_code,
-                        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                        "data": {
-                            "current_price": orderbook.get("current_price"),
-                            "ask_prices": orderbook["ask_prices"],
-                            "ask_volumes": orderbook["ask_volumes"],
-                            "bid_prices": orderbook["bid_prices"],
-                            "bid_volumes": orderbook["bid_volumes"],
-                            "total_ask_volume": orderbook["total_ask_volume"],
-                            "total_bid_volume": orderbook["total_bid_volume"],
-                        }
-                    }
-
-                    # 모든 구독 클라이언트에게 전달
-                    clients = list(self.subscriptions.get(stock_code, []))
-                    for client_ws in clients:
-                        try:
-                            await client_ws.send_json(orderbook_data)
-                        except Exception as e:
-                            logging.error(f"클라이언트 전송 실패: {e}")
-                            # 연결이 끊긴 클라이언트 제거
-                            await self.unsubscribe_orderbook(stock_code, client_ws)
-
-                # 1초 대기
-                await asyncio.sleep(1)
+                svr = "vps" if ka.isPaperTrading() else "prod"
+                if self._approval_key is None or svr != self._svr:
+                    self._approval_key = await asyncio.to_thread(_issue_approval_key, svr)
+                    self._svr = svr
+                self._tr_id = TR_ORDERBOOK_KRX if svr == "vps" else TR_ORDERBOOK_TOTAL
+
+                url = f"{ka._cfg['ops' if svr == 'prod' else 'vops']}/tryitout"
+                async with websockets.connect(url) as ws:
+                    logging.info(f"KIS 호가 웹소켓 연결 ({self._tr_id})")
+                    self._upstream = ws
+                    self._upstream_codes.clear()
+                    await self._sync_upstream()
+                    delay = RECONNECT_DELAY
+
+                    async for raw in ws:
+                        await self._on_upstream_message(ws, raw)
 
             except asyncio.CancelledError:
                 break
             except Exception as e:
-                logging.error(f"폴링 에러 ({stock_code}): {e}")
-                await asyncio.sleep(1)
+                logging.error(f"KIS 호가 웹소켓 오류: {e} ({delay:.0f}초 후 재연결)")
+                # 핸드셰이크 거절(만료된 접속키 등)이면 접속키 재발급.
+                # websockets>=14는 InvalidStatus, 11~13(legacy 클라이언트)은 InvalidStatusCode를
+                # 발생시키며 둘 다 InvalidHandshake의 하위 클래스
+                if isinstance(e, websockets.InvalidHandshake):
+                    self._approval_key = None
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, MAX_RECONNECT_DELAY)
+            finally:
+                self._upstream = None
+                self._upstream_codes.clear()
+
+    async def _on_upstream_message(self, ws, raw: str):
+        """업스트림 메시지 처리 (실시간 데이터 / 시스템 응답)"""
+        if raw[0] in ("0", "1"):
+            # 호가 TR은 암호화되지 않음 ("1"은 체결통보 등 암호화 TR)
+            parts = raw.split("|", 3)
+            if raw[0] == "1":
+                return
+            if len(parts) < 4 or parts[1] not in (TR_ORDERBOOK_TOTAL, TR_ORDERBOOK_KRX):
+                return
+            for orderbook in parse_orderbook(parts[1], parts[3]):
+                self._dispatch(orderbook)
+            return
+
+        rsp = ka.system_resp(raw)
+        if rsp.isPingPong:
+            await ws.pong(raw)
+        elif not rsp.isOk and rsp.tr_msg:
+            logging.warning(f"호가 구독 응답 ({rsp.tr_key}): {rsp.tr_msg}")
 
 
 # 글로벌 웹소켓 매니저 인스턴스
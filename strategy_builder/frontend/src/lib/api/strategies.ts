@@ -3,7 +3,7 @@
  */
 
 import { apiGet, apiPost, type ApiResponse, type LogEntry } from "./client";
-import type { Signal, ExecuteRequest, ExecuteResponse, StrategyInfo } from "@/types/signal";
+import type { Signal, ExecuteMode, ExecuteRequest, ExecuteResponse, StrategyInfo } from "@/types/signal";
 import type { BuilderState } from "@/types/builder";
 
 export interface StrategiesListResponse {
@@ -22,13 +22,15 @@ export async function executeStrategy(
   strategyId: string,
   stocks: string[],
   params: Record<string, number> = {},
-  builderState?: BuilderState
+  builderState?: BuilderState,
+  mode?: ExecuteMode
 ): Promise<ExecuteResponse> {
   const request: ExecuteRequest = {
     strategy_id: strategyId,
     stocks,
     params,
     builder_state: builderState,
+    mode,
   };
   return apiPost<ExecuteResponse>("/api/strategies/execute", request);
 }
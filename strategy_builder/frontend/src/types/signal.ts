@@ -49,8 +49,11 @@ export interface ExecuteRequest {
   stocks: string[];
   params: Record<string, number>;
   builder_state?: BuilderState;  // Local strategy builder state
+  mode?: ExecuteMode;  // 기본 sequential, 대량 종목 스크리닝은 batch
 }
 
+export type ExecuteMode = "sequential" | "batch";
+
 export interface ExecuteResponse {
   status: "success" | "error";
   results: SignalResult[];
@@ -7,7 +7,9 @@ Applied Skills: skills/investment-strategy-framework.md
 """
 
 from abc import ABC, abstractmethod
+from typing import Dict, List
 
+from core.panel import PricePanel
 from core.signal import Signal
 
 
@@ -35,6 +37,27 @@ class BaseStrategy(ABC):
         """
         pass
 
+    # generate_signals(패널 일괄 계산)를 구현한 전략만 True
+    supports_batch: bool = False
+
+    def generate_signals(self, panel: PricePanel, stock_names: Dict[str, str]) -> List[Signal]:
+        """
+        패널의 전체 종목에 대한 시그널 일괄 생성 (배치 스크리닝)
+
+        지표와 조건을 종목 × 일자 패널에서 컬럼 단위로 한 번에 계산합니다.
+        결과는 종목별 generate_signal과 같아야 합니다.
+        기본 구현은 종목마다 generate_signal을 호출하므로(종목별 재조회),
+        패널 계산을 구현한 전략은 재정의하고 supports_batch = True로 표시합니다.
+
+        Args:
+            panel: required_days 이상 조회된 일봉 패널
+            stock_names: {종목코드: 종목명}
+
+        Returns:
+            panel.codes 순서의 Signal 리스트
+        """
+        return [self.generate_signal(code, stock_names.get(code, code)) for code in panel.codes]
+
     @property
     @abstractmethod
     def name(self) -> str:
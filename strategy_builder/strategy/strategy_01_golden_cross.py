@@ -5,7 +5,10 @@ Strategy 01: 골든크로스 (Golden Cross)
 매도 조건: MA(5) < MA(20) 하향 돌파 (데드크로스)
 """
 
+from typing import Dict, List
+
 from core import data_fetcher, indicators
+from core.panel import PricePanel, rolling_mean
 from core.signal import Action, Signal
 from strategy.base_strategy import BaseStrategy
 
@@ -13,6 +16,8 @@ from strategy.base_strategy import BaseStrategy
 class GoldenCrossStrategy(BaseStrategy):
     """골든크로스 전략"""
 
+    supports_batch = True
+
     def __init__(self, short_period: int = 5, long_period: int = 20):
         """
         Args:
@@ -84,3 +89,45 @@ class GoldenCrossStrategy(BaseStrategy):
             reason="크로스 조건 미충족"
         )
 
+    def generate_signals(self, panel: PricePanel, stock_names: Dict[str, str]) -> List[Signal]:
+        """
+        골든크로스/데드크로스 시그널 일괄 생성 (패널 컬럼 단위 계산)
+        """
+        panel = panel.tail(self.required_days)
+        enough = panel.lengths >= self.long_period + 1
+        if not enough.any():
+            return [
+                Signal(stock_code=code, stock_name=stock_names.get(code, code),
+                       action=Action.HOLD, strength=0.0, reason="데이터 부족")
+                for code in panel.codes
+            ]
+
+        # 이동평균 계산 (전 종목)
+        ma_short = rolling_mean(panel.close, self.short_period)
+        ma_long = rolling_mean(panel.close, self.long_period)
+
+        prev_short, curr_short = ma_short.iloc[-2], ma_short.iloc[-1]
+        prev_long, curr_long = ma_long.iloc[-2], ma_long.iloc[-1]
+        golden = (prev_short < prev_long) & (curr_short > curr_long)
+        dead = (prev_short > prev_long) & (curr_short < curr_long)
+
+        signals = []
+        for code in panel.codes:
+            if not enough[code]:
+                action, strength, reason = Action.HOLD, 0.0, "데이터 부족"
+            elif golden[code]:
+                action, strength = Action.BUY, 0.7
+                reason = f"골든크로스 발생 (MA{self.short_period} > MA{self.long_period})"
+            elif dead[code]:
+                action, strength = Action.SELL, 0.7
+                reason = f"데드크로스 발생 (MA{self.short_period} < MA{self.long_period})"
+            else:
+                action, strength, reason = Action.HOLD, 0.0, "크로스 조건 미충족"
+            signals.append(Signal(
+                stock_code=code,
+                stock_name=stock_names.get(code, code),
+                action=action,
+                strength=strength,
+                reason=reason
+            ))
+        return signals
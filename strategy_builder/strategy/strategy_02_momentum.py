@@ -5,7 +5,10 @@ Strategy 02: 모멘텀 (Momentum)
 매도 조건: 60일 수익률 하위 (-20% 이하 하락)
 """
 
+from typing import Dict, List
+
 from core import data_fetcher, indicators
+from core.panel import PricePanel
 from core.signal import Action, Signal
 from strategy.base_strategy import BaseStrategy
 
@@ -13,6 +16,8 @@ from strategy.base_strategy import BaseStrategy
 class MomentumStrategy(BaseStrategy):
     """모멘텀 전략"""
 
+    supports_batch = True
+
     def __init__(
         self,
         lookback_days: int = 60,
@@ -85,3 +90,44 @@ class MomentumStrategy(BaseStrategy):
             reason=f"중립 구간 ({latest_return*100:.1f}%)"
         )
 
+    def generate_signals(self, panel: PricePanel, stock_names: Dict[str, str]) -> List[Signal]:
+        """
+        모멘텀 시그널 일괄 생성 (패널 컬럼 단위 계산)
+        """
+        panel = panel.tail(self.required_days)
+        enough = panel.lengths >= self.lookback_days
+        if not enough.any():
+            return [
+                Signal(stock_code=code, stock_name=stock_names.get(code, code),
+                       action=Action.HOLD, strength=0.0, reason="데이터 부족")
+                for code in panel.codes
+            ]
+
+        # 수익률 계산 (pct_change 기본 동작과 같게 직전 값으로 채운 뒤 계산)
+        latest_returns = (
+            panel.close.ffill().pct_change(periods=self.lookback_days, fill_method=None).iloc[-1]
+        )
+
+        signals = []
+        for code in panel.codes:
+            if not enough[code]:
+                action, strength, reason = Action.HOLD, 0.0, "데이터 부족"
+            else:
+                latest_return = latest_returns[code]
+                if latest_return >= self.buy_threshold:
+                    action, strength = Action.BUY, min(1.0, 0.5 + latest_return)
+                    reason = f"{self.lookback_days}일 수익률 +{latest_return*100:.1f}%"
+                elif latest_return <= self.sell_threshold:
+                    action, strength = Action.SELL, 0.8
+                    reason = f"{self.lookback_days}일 수익률 {latest_return*100:.1f}%"
+                else:
+                    action, strength = Action.HOLD, 0.0
+                    reason = f"중립 구간 ({latest_return*100:.1f}%)"
+            signals.append(Signal(
+                stock_code=code,
+                stock_name=stock_names.get(code, code),
+                action=action,
+                strength=strength,
+                reason=reason
+            ))
+        return signals
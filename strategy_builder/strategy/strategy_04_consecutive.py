@@ -5,7 +5,10 @@ Strategy 04: 연속 상승/하락 (Consecutive)
 매도 조건: N일 연속 하락
 """
 
+from typing import Dict, List
+
 from core import data_fetcher, indicators
+from core.panel import PricePanel
 from core.signal import Action, Signal
 from strategy.base_strategy import BaseStrategy
 
@@ -13,6 +16,8 @@ from strategy.base_strategy import BaseStrategy
 class ConsecutiveStrategy(BaseStrategy):
     """연속 상승/하락 전략"""
 
+    supports_batch = True
+
     def __init__(self, buy_days: int = 5, sell_days: int = 5):
         """
         Args:
@@ -78,3 +83,45 @@ class ConsecutiveStrategy(BaseStrategy):
             reason=f"연속 조건 미충족 (상승: {up_days}일, 하락: {down_days}일)"
         )
 
+    def generate_signals(self, panel: PricePanel, stock_names: Dict[str, str]) -> List[Signal]:
+        """
+        연속 상승/하락 시그널 일괄 생성 (패널 컬럼 단위 계산)
+        """
+        panel = panel.tail(self.required_days)
+        enough = panel.lengths >= self.required_days
+        if not enough.any():
+            return [
+                Signal(stock_code=code, stock_name=stock_names.get(code, code),
+                       action=Action.HOLD, strength=0.0, reason="데이터 부족")
+                for code in panel.codes
+            ]
+
+        # 최근 봉부터 역순으로 조건이 끊기기 전까지의 개수 (첫 봉은 diff가 NaN이라 항상 중단)
+        changes = panel.close.diff()
+        up_counts = (changes > 0).astype(int).iloc[::-1].cummin().sum()
+        down_counts = (changes < 0).astype(int).iloc[::-1].cummin().sum()
+
+        signals = []
+        for code in panel.codes:
+            if not enough[code]:
+                action, strength, reason = Action.HOLD, 0.0, "데이터 부족"
+            else:
+                up_days = int(up_counts[code])
+                down_days = int(down_counts[code])
+                if up_days >= self.buy_days:
+                    action, strength = Action.BUY, min(0.9, 0.5 + up_days * 0.08)
+                    reason = f"{up_days}일 연속 상승"
+                elif down_days >= self.sell_days:
+                    action, strength = Action.SELL, min(0.9, 0.5 + down_days * 0.08)
+                    reason = f"{down_days}일 연속 하락"
+                else:
+                    action, strength = Action.HOLD, 0.0
+                    reason = f"연속 조건 미충족 (상승: {up_days}일, 하락: {down_days}일)"
+            signals.append(Signal(
+                stock_code=code,
+                stock_name=stock_names.get(code, code),
+                action=action,
+                strength=strength,
+                reason=reason
+            ))
+        return signals
@@ -5,7 +5,10 @@ Strategy 05: 이격도 (Disparity)
 매도 조건: 이격도 > 110 (과매수)
 """
 
+from typing import Dict, List
+
 from core import data_fetcher, indicators
+from core.panel import PricePanel, rolling_mean
 from core.signal import Action, Signal
 from strategy.base_strategy import BaseStrategy
 
@@ -13,6 +16,8 @@ from strategy.base_strategy import BaseStrategy
 class DisparityStrategy(BaseStrategy):
     """이격도 전략"""
 
+    supports_batch = True
+
     def __init__(
         self,
         period: int = 20,
@@ -85,3 +90,44 @@ class DisparityStrategy(BaseStrategy):
             reason=f"이격도 {current_disparity:.1f} (중립)"
         )
 
+    def generate_signals(self, panel: PricePanel, stock_names: Dict[str, str]) -> List[Signal]:
+        """
+        이격도 시그널 일괄 생성 (패널 컬럼 단위 계산)
+        """
+        panel = panel.tail(self.required_days)
+        enough = panel.lengths >= self.period
+        if not enough.any():
+            return [
+                Signal(stock_code=code, stock_name=stock_names.get(code, code),
+                       action=Action.HOLD, strength=0.0, reason="데이터 부족")
+                for code in panel.codes
+            ]
+
+        ma = rolling_mean(panel.close, self.period)
+        disparity = ((panel.close / ma) * 100).iloc[-1]
+
+        signals = []
+        for code in panel.codes:
+            if not enough[code]:
+                action, strength, reason = Action.HOLD, 0.0, "데이터 부족"
+            else:
+                current_disparity = disparity[code]
+                if current_disparity < self.oversold_threshold:
+                    action = Action.BUY
+                    strength = min(1.0, (self.oversold_threshold - current_disparity) / 20 + 0.5)
+                    reason = f"이격도 {current_disparity:.1f} (과매도)"
+                elif current_disparity > self.overbought_threshold:
+                    action = Action.SELL
+                    strength = min(1.0, (current_disparity - self.overbought_threshold) / 20 + 0.5)
+                    reason = f"이격도 {current_disparity:.1f} (과매수)"
+                else:
+                    action, strength = Action.HOLD, 0.0
+                    reason = f"이격도 {current_disparity:.1f} (중립)"
+            signals.append(Signal(
+                stock_code=code,
+                stock_name=stock_names.get(code, code),
+                action=action,
+                strength=strength,
+                reason=reason
+            ))
+        return signals
@@ -5,7 +5,10 @@ Strategy 06: 돌파 실패 (Breakout Fail)
 매도 조건: 전고점 돌파 후 N일 내 하락
 """
 
+from typing import Dict, List
+
 from core import data_fetcher, indicators
+from core.panel import PricePanel
 from core.signal import Action, Signal
 from strategy.base_strategy import BaseStrategy
 
@@ -13,6 +16,8 @@ from strategy.base_strategy import BaseStrategy
 class BreakoutFailStrategy(BaseStrategy):
     """돌파 실패 전략 (매도 전용)"""
 
+    supports_batch = True
+
     def __init__(
         self,
         lookback_days: int = 20,
@@ -93,3 +98,40 @@ class BreakoutFailStrategy(BaseStrategy):
             reason="돌파 실패 조건 미충족"
         )
 
+    def generate_signals(self, panel: PricePanel, stock_names: Dict[str, str]) -> List[Signal]:
+        """
+        돌파 실패 시그널 일괄 생성 (패널 컬럼 단위 계산)
+        """
+        panel = panel.tail(self.required_days)
+        enough = panel.lengths >= self.required_days
+        if not enough.any():
+            return [
+                Signal(stock_code=code, stock_name=stock_names.get(code, code),
+                       action=Action.HOLD, strength=0.0, reason="데이터 부족")
+                for code in panel.codes
+            ]
+
+        # 최근 N일 고가 / 이전 기간 고가 (전 종목)
+        recent_high = panel.high.iloc[-self.fail_within_days:].max()
+        prev_high = panel.high.iloc[:-self.fail_within_days].max()
+        current_close = panel.close.iloc[-1]
+
+        signals = []
+        for code in panel.codes:
+            action, strength, reason = Action.HOLD, 0.0, "돌파 실패 조건 미충족"
+            if not enough[code]:
+                reason = "데이터 부족"
+            elif recent_high[code] > prev_high[code]:
+                # 고점 대비 하락률
+                change_from_high = (int(current_close[code]) - recent_high[code]) / recent_high[code]
+                if change_from_high <= self.fail_threshold:
+                    action, strength = Action.SELL, 0.9
+                    reason = f"돌파 실패: 고점 대비 {change_from_high*100:.1f}%"
+            signals.append(Signal(
+                stock_code=code,
+                stock_name=stock_names.get(code, code),
+                action=action,
+                strength=strength,
+                reason=reason
+            ))
+        return signals
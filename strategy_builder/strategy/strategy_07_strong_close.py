@@ -9,7 +9,10 @@ Note:
     - 장중에는 고가/저가/종가가 확정되지 않아 신호가 부정확할 수 있음
 """
 
+from typing import Dict, List
+
 from core import data_fetcher, indicators
+from core.panel import PricePanel
 from core.signal import Action, Signal
 from strategy.base_strategy import BaseStrategy
 
@@ -17,6 +20,8 @@ from strategy.base_strategy import BaseStrategy
 class StrongCloseStrategy(BaseStrategy):
     """강한 종가 전략 (장마감 후 실행 권장)"""
 
+    supports_batch = True
+
     def __init__(self, min_close_ratio: float = 0.8):
         """
         Args:
@@ -80,3 +85,42 @@ class StrongCloseStrategy(BaseStrategy):
             reason=f"종가 위치 {close_ratio*100:.0f}% (기준: {self.min_close_ratio*100:.0f}%)"
         )
 
+    def generate_signals(self, panel: PricePanel, stock_names: Dict[str, str]) -> List[Signal]:
+        """
+        강한 종가 시그널 일괄 생성 (패널 컬럼 단위 계산)
+        """
+        panel = panel.tail(self.required_days)
+        enough = panel.lengths >= 1
+        if not enough.any():
+            return [
+                Signal(stock_code=code, stock_name=stock_names.get(code, code),
+                       action=Action.HOLD, strength=0.0, reason="데이터 부족")
+                for code in panel.codes
+            ]
+
+        high = panel.high.iloc[-1]
+        low = panel.low.iloc[-1]
+        close = panel.close.iloc[-1]
+        # 고가 = 저가인 경우 (변동 없음) 0.5
+        close_ratios = ((close - low) / (high - low)).where(high != low, 0.5)
+
+        signals = []
+        for code in panel.codes:
+            if not enough[code]:
+                action, strength, reason = Action.HOLD, 0.0, "데이터 부족"
+            else:
+                close_ratio = close_ratios[code]
+                if close_ratio >= self.min_close_ratio:
+                    action, strength = Action.BUY, min(1.0, 0.5 + close_ratio * 0.4)
+                    reason = f"강한 종가 비율 {close_ratio*100:.0f}% (고가 근처 마감)"
+                else:
+                    action, strength = Action.HOLD, 0.0
+                    reason = f"종가 위치 {close_ratio*100:.0f}% (기준: {self.min_close_ratio*100:.0f}%)"
+            signals.append(Signal(
+                stock_code=code,
+                stock_name=stock_names.get(code, code),
+                action=action,
+                strength=strength,
+                reason=reason
+            ))
+        return signals
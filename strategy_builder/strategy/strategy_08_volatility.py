@@ -5,7 +5,10 @@ Strategy 08: 변동성 확장 (Volatility Expansion)
 매도 조건: 없음
 """
 
+from typing import Dict, List
+
 from core import data_fetcher, indicators
+from core.panel import PricePanel
 from core.signal import Action, Signal
 from strategy.base_strategy import BaseStrategy
 
@@ -13,6 +16,8 @@ from strategy.base_strategy import BaseStrategy
 class VolatilityStrategy(BaseStrategy):
     """변동성 확장 전략"""
 
+    supports_batch = True
+
     def __init__(self, lookback_days: int = 10, breakout_pct: float = 3.0):
         """
         Args:
@@ -80,3 +85,44 @@ class VolatilityStrategy(BaseStrategy):
             reason="변동성 확장 조건 미충족"
         )
 
+    def generate_signals(self, panel: PricePanel, stock_names: Dict[str, str]) -> List[Signal]:
+        """
+        변동성 확장 시그널 일괄 생성 (패널 컬럼 단위 계산)
+        """
+        panel = panel.tail(self.required_days)
+        enough = panel.lengths >= self.lookback_days + 1
+        if not enough.any():
+            return [
+                Signal(stock_code=code, stock_name=stock_names.get(code, code),
+                       action=Action.HOLD, strength=0.0, reason="데이터 부족")
+                for code in panel.codes
+            ]
+
+        # 일간 수익률 표준편차 (pct_change 기본 동작과 같게 직전 값으로 채운 뒤 계산)
+        daily_returns = panel.close.ffill().pct_change(fill_method=None)
+        volatility = daily_returns.rolling(window=self.lookback_days).std()
+        current_vol = volatility.iloc[-1]
+        min_vol = volatility.iloc[-self.lookback_days:].min()
+
+        prev_close = panel.close.iloc[-2]
+        curr_close = panel.close.iloc[-1]
+
+        signals = []
+        for code in panel.codes:
+            action, strength, reason = Action.HOLD, 0.0, "변동성 확장 조건 미충족"
+            if not enough[code]:
+                reason = "데이터 부족"
+            elif current_vol[code] <= min_vol[code] * 1.1 and prev_close[code] != 0:
+                # 변동성 최저 상태에서 당일 등락률 확인
+                change_pct = (curr_close[code] - prev_close[code]) / prev_close[code] * 100
+                if change_pct >= self.breakout_pct:
+                    action, strength = Action.BUY, 0.75
+                    reason = f"변동성 확장 돌파 +{change_pct:.1f}%"
+            signals.append(Signal(
+                stock_code=code,
+                stock_name=stock_names.get(code, code),
+                action=action,
+                strength=strength,
+                reason=reason
+            ))
+        return signals
@@ -5,7 +5,10 @@ Strategy 09: 평균회귀 (Mean Reversion)
 매도 조건: N일 평균 대비 +M% 이상
 """
 
+from typing import Dict, List
+
 from core import data_fetcher, indicators
+from core.panel import PricePanel, rolling_mean
 from core.signal import Action, Signal
 from strategy.base_strategy import BaseStrategy
 
@@ -13,6 +16,8 @@ from strategy.base_strategy import BaseStrategy
 class MeanReversionStrategy(BaseStrategy):
     """평균회귀 전략"""
 
+    supports_batch = True
+
     def __init__(
         self,
         period: int = 5,
@@ -97,3 +102,45 @@ class MeanReversionStrategy(BaseStrategy):
             reason=f"평균 대비 {deviation:.1f}% (중립)"
         )
 
+    def generate_signals(self, panel: PricePanel, stock_names: Dict[str, str]) -> List[Signal]:
+        """
+        평균회귀 시그널 일괄 생성 (패널 컬럼 단위 계산)
+        """
+        panel = panel.tail(self.required_days)
+        enough = panel.lengths >= self.period
+        if not enough.any():
+            return [
+                Signal(stock_code=code, stock_name=stock_names.get(code, code),
+                       action=Action.HOLD, strength=0.0, reason="데이터 부족")
+                for code in panel.codes
+            ]
+
+        ma_values = rolling_mean(panel.close, self.period).iloc[-1]
+        closes = panel.close.iloc[-1]
+
+        signals = []
+        for code in panel.codes:
+            if not enough[code]:
+                action, strength, reason = Action.HOLD, 0.0, "데이터 부족"
+            elif ma_values[code] == 0:
+                action, strength, reason = Action.HOLD, 0.0, "지표 계산 실패"
+            else:
+                ma_value = ma_values[code]
+                deviation = (int(closes[code]) - ma_value) / ma_value * 100
+                if deviation <= self.buy_threshold:
+                    action, strength = Action.BUY, min(1.0, 0.5 + abs(deviation) / 10)
+                    reason = f"평균 대비 {deviation:.1f}% 이탈 (매수)"
+                elif deviation >= self.sell_threshold:
+                    action, strength = Action.SELL, min(1.0, 0.5 + deviation / 10)
+                    reason = f"평균 대비 +{deviation:.1f}% 이탈 (매도)"
+                else:
+                    action, strength = Action.HOLD, 0.0
+                    reason = f"평균 대비 {deviation:.1f}% (중립)"
+            signals.append(Signal(
+                stock_code=code,
+                stock_name=stock_names.get(code, code),
+                action=action,
+                strength=strength,
+                reason=reason
+            ))
+        return signals
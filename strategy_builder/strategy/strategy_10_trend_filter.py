@@ -5,7 +5,10 @@ Strategy 10: 추세 필터 (Trend Filter)
 매도 조건: 종가 < MA(60) AND 전일 대비 하락
 """
 
+from typing import Dict, List
+
 from core import data_fetcher, indicators
+from core.panel import PricePanel, rolling_mean
 from core.signal import Action, Signal
 from strategy.base_strategy import BaseStrategy
 
@@ -13,6 +16,8 @@ from strategy.base_strategy import BaseStrategy
 class TrendFilterStrategy(BaseStrategy):
     """추세 필터 전략"""
 
+    supports_batch = True
+
     def __init__(self, ma_period: int = 60):
         """
         Args:
@@ -88,3 +93,48 @@ class TrendFilterStrategy(BaseStrategy):
             reason="추세 조건 미충족"
         )
 
+    def generate_signals(self, panel: PricePanel, stock_names: Dict[str, str]) -> List[Signal]:
+        """
+        추세 필터 시그널 일괄 생성 (패널 컬럼 단위 계산)
+        """
+        panel = panel.tail(self.required_days)
+        enough = panel.lengths >= self.ma_period
+        if not enough.any():
+            return [
+                Signal(stock_code=code, stock_name=stock_names.get(code, code),
+                       action=Action.HOLD, strength=0.0, reason="데이터 부족")
+                for code in panel.codes
+            ]
+
+        ma_values = rolling_mean(panel.close, self.ma_period).iloc[-1]
+        closes = panel.close.iloc[-1]
+        prev_closes = panel.close.iloc[-2] if len(panel) >= 2 else None
+
+        signals = []
+        for code in panel.codes:
+            if not enough[code]:
+                action, strength, reason = Action.HOLD, 0.0, "데이터 부족"
+            elif panel.lengths[code] < 2:
+                action, strength, reason = Action.HOLD, 0.0, "지표 계산 실패"
+            else:
+                current_close = int(closes[code])
+                ma_value = ma_values[code]
+                above_ma = current_close > ma_value
+                daily_up = current_close > int(prev_closes[code])
+
+                if above_ma and daily_up:
+                    action, strength = Action.BUY, 0.65
+                    reason = f"추세 상승: MA{self.ma_period}({ma_value:,.0f}) 위 + 상승"
+                elif not above_ma and not daily_up:
+                    action, strength = Action.SELL, 0.65
+                    reason = f"추세 하락: MA{self.ma_period}({ma_value:,.0f}) 아래 + 하락"
+                else:
+                    action, strength, reason = Action.HOLD, 0.0, "추세 조건 미충족"
+            signals.append(Signal(
+                stock_code=code,
+                stock_name=stock_names.get(code, code),
+                action=action,
+                strength=strength,
+                reason=reason
+            ))
+        return signals
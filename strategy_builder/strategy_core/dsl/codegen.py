@@ -480,6 +480,10 @@ class {class_name}(BaseStrategy):
             from core.candlestick import PATTERN_DETECTORS
             if name in PATTERN_DETECTORS or name.rstrip("_0123456789") in PATTERN_DETECTORS:
                 pattern_id = name.rstrip("_0123456789") if name not in PATTERN_DETECTORS else name
+                # hammer(5): 최근 5봉 안의 패턴 (detect_patterns 배열 연산)
+                lookback = int(params[0]) if params else 1
+                if lookback > 1:
+                    return f"candlestick.detect_recent_pattern(df, '{pattern_id}', {lookback})"
                 return f"candlestick.detect_pattern(df, '{pattern_id}')"
             logging.warning(f"미지원 지표: {name} → 0으로 대체")
             return "0"
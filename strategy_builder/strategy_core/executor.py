@@ -9,6 +9,11 @@
 
 모든 경로는 (code, name) → Signal → SignalResult로 변환되며,
 결과를 log 콜백에 기록합니다.
+
+실행 모드:
+- sequential: 종목별 generate_signal 순차 호출 (종목마다 일봉 조회 + api_sleep)
+- batch: 전 종목 일봉을 동시 조회해 패널 1개로 만든 뒤 generate_signals로 일괄 계산
+  (batch 미지원 전략은 sequential로 대체 실행)
 """
 
 import importlib.util
@@ -18,11 +23,18 @@ import tempfile
 from pathlib import Path
 from typing import Any, Callable, Dict, List
 
+from core import data_fetcher
+from core.panel import PricePanel
 from strategy_core.dsl.converter import builder_state_to_dsl
 from strategy_core.dsl.parser import parse_strategy
 from strategy_core.dsl.codegen import StrategyCodeGenerator
 from strategy_core.name_utils import sanitize_strategy_name
 
+EXECUTION_MODES = ("sequential", "batch")
+
+# 배치 모드 일봉 동시 조회 스레드 수 (호출 간격은 kis_auth rate limiter가 보장)
+BATCH_FETCH_WORKERS = 4
+
 
 def execute_with_class(
     strategy_class,
@@ -33,6 +45,7 @@ def execute_with_class(
     log: Callable,
     get_stock_name: Callable,
     api_sleep: Callable,
+    mode: str = "sequential",
 ) -> List[Dict]:
     """프리셋 전략 실행 (strategy_class가 있는 전략)
 
@@ -52,7 +65,7 @@ def execute_with_class(
     log("info", f"파라미터: {converted_params}")
 
     strategy = strategy_class(**converted_params)
-    return _run_strategy_on_stocks(strategy, stocks, log, get_stock_name, api_sleep)
+    return _run_strategy(strategy, stocks, log, get_stock_name, api_sleep, mode)
 
 
 def execute_from_builder_state(
@@ -62,6 +75,7 @@ def execute_from_builder_state(
     log: Callable,
     get_stock_name: Callable,
     api_sleep: Callable,
+    mode: str = "sequential",
 ) -> List[Dict]:
     """BuilderState에서 전략 실행 (local_ 전략 및 builder-only 전략)
 
@@ -93,7 +107,7 @@ def execute_from_builder_state(
     code = generator.generate(strategy_def)
 
     strategy_instance = _load_strategy_from_code(code, name_snake)
-    results = _run_strategy_on_stocks(strategy_instance, stocks, log, get_stock_name, api_sleep)
+    results = _run_strategy(strategy_instance, stocks, log, get_stock_name, api_sleep, mode)
 
     log("success", "빌더 전략 실행 완료")
     return results
@@ -106,6 +120,7 @@ def execute_custom_file(
     log: Callable,
     get_stock_name: Callable,
     api_sleep: Callable,
+    mode: str = "sequential",
 ) -> List[Dict]:
     """커스텀 전략 실행 (사용자가 만든 .py 파일)
 
@@ -137,7 +152,7 @@ def execute_custom_file(
         raise ValueError("전략 클래스를 찾을 수 없습니다")
 
     strategy = strategy_class()
-    results = _run_strategy_on_stocks(strategy, stocks, log, get_stock_name, api_sleep)
+    results = _run_strategy(strategy, stocks, log, get_stock_name, api_sleep, mode)
 
     log("success", "전략 실행 완료")
     return results
@@ -172,6 +187,95 @@ def _find_strategy_class(module):
     return None
 
 
+def _run_strategy(
+    strategy,
+    stocks: List[str],
+    log: Callable,
+    get_stock_name: Callable,
+    api_sleep: Callable,
+    mode: str = "sequential",
+) -> List[Dict]:
+    """실행 모드에 따라 순차/배치 실행 선택"""
+    if mode not in EXECUTION_MODES:
+        raise ValueError(f"지원하지 않는 실행 모드: {mode!r} (sequential/batch)")
+
+    if mode == "batch":
+        if getattr(strategy, 'supports_batch', False):
+            return _run_strategy_batch(strategy, stocks, log, get_stock_name)
+        log("warning", "배치 실행을 지원하지 않는 전략입니다 - 순차 실행으로 진행합니다")
+
+    return _run_strategy_on_stocks(strategy, stocks, log, get_stock_name, api_sleep)
+
+
+def _signal_to_result(signal, code: str, name: str) -> Dict:
+    """Signal → SignalResult dict"""
+    return {
+        'code': code,
+        'name': name,
+        'action': signal.action.value.upper(),
+        'strength': signal.strength,
+        'reason': signal.reason,
+        'target_price': getattr(signal, 'target_price', None),
+    }
+
+
+def _log_result(log: Callable, result: Dict) -> None:
+    """시그널 결과 1건 로그"""
+    action_icon = {"BUY": "▲", "SELL": "▼", "HOLD": "─"}
+    action_type = {"BUY": "success", "SELL": "error", "HOLD": "info"}
+    log(
+        action_type.get(result['action'], "info"),
+        f"  {action_icon.get(result['action'], '─')} {result['action']} | 강도: {result['strength']:.2f} | {result['reason']}"
+    )
+
+
+def _run_strategy_batch(
+    strategy,
+    stocks: List[str],
+    log: Callable,
+    get_stock_name: Callable,
+) -> List[Dict]:
+    """전략을 종목 전체 패널에 대해 일괄 실행하고 결과 반환
+
+    1) 전 종목 일봉을 한 번에 동시 조회 (종목 간 api_sleep 없음)
+    2) 종목 × 일자 패널 생성
+    3) strategy.generate_signals로 지표/조건을 컬럼 단위로 일괄 계산
+
+    종목 수가 많으므로 HOLD는 개별 로그를 남기지 않고 BUY/SELL과 요약만 기록합니다.
+    """
+    names = {code: get_stock_name(code) for code in stocks}
+    log("info", f"배치 실행: {len(names)}개 종목 일봉 조회 중 ({strategy.required_days}일)")
+
+    failed = []
+
+    def on_result(code, df):
+        if df.empty:
+            failed.append(code)
+
+    frames = data_fetcher.get_daily_prices_many(
+        list(names), strategy.required_days,
+        max_workers=BATCH_FETCH_WORKERS, on_result=on_result,
+    )
+    if failed:
+        log("warning", f"일봉 조회 실패/데이터 없음: {len(failed)}개 종목")
+
+    panel = PricePanel.from_frames(frames, days=strategy.required_days)
+    signals = strategy.generate_signals(panel, names)
+
+    results = []
+    counts = {"BUY": 0, "SELL": 0, "HOLD": 0}
+    for code, signal in zip(panel.codes, signals):
+        result = _signal_to_result(signal, code, names[code])
+        results.append(result)
+        counts[result['action']] = counts.get(result['action'], 0) + 1
+        if result['action'] != "HOLD":
+            log("info", f"{result['name']} ({code})")
+            _log_result(log, result)
+
+    log("info", f"배치 결과: 매수 {counts['BUY']} / 매도 {counts['SELL']} / 관망 {counts['HOLD']}")
+    return results
+
+
 def _run_strategy_on_stocks(
     strategy,
     stocks: List[str],
@@ -188,22 +292,9 @@ def _run_strategy_on_stocks(
 
         try:
             signal = strategy.generate_signal(code, name)
-            result = {
-                'code': code,
-                'name': name,
-                'action': signal.action.value.upper(),
-                'strength': signal.strength,
-                'reason': signal.reason,
-                'target_price': getattr(signal, 'target_price', None),
-            }
+            result = _signal_to_result(signal, code, name)
             results.append(result)
-
-            action_icon = {"BUY": "▲", "SELL": "▼", "HOLD": "─"}
-            action_type = {"BUY": "success", "SELL": "error", "HOLD": "info"}
-            log(
-                action_type.get(result['action'], "info"),
-                f"  {action_icon.get(result['action'], '─')} {result['action']} | 강도: {result['strength']:.2f} | {result['reason']}"
-            )
+            _log_result(log, result)
         except Exception as e:
             log("error", f"  오류: {str(e)}")
             results.append({
@@ -0,0 +1,310 @@
+"""
+core.indicators 벡터화/커널 구현 ↔ 기존 루프 구현 동일성 테스트
+
+기존 .iloc 루프 / rolling.apply 구현을 참조 구현으로 보관하고,
+NaN 입력 · 짧은 입력 · 동률(같은 가격 반복) 데이터에서 결과가 비트 단위로 같은지 확인합니다.
+재귀형 지표(SAR/KAMA/FRAMA/VIDYA)는 numba 컴파일 커널과 float 리스트 순회 양쪽을 모두 검사합니다.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core import indicators
+from core.indicators import calc_atr, calc_cmo
+
+
+# ── 참조 구현 (벡터화 이전 코드) ─────────────────────────────
+
+def ref_cci(df: pd.DataFrame, period: int = 20) -> pd.Series:
+    if df.empty or len(df) < period:
+        return pd.Series(dtype=float)
+    tp = (df["high"] + df["low"] + df["close"]) / 3
+    tp_sma = tp.rolling(window=period).mean()
+    mean_dev = tp.rolling(window=period).apply(lambda x: abs(x - x.mean()).mean(), raw=True)
+    return (tp - tp_sma) / (0.015 * mean_dev)
+
+
+def ref_obv(df: pd.DataFrame) -> pd.Series:
+    if df.empty or len(df) < 2:
+        return pd.Series(dtype=float)
+    obv = pd.Series(index=df.index, dtype=float)
+    obv.iloc[0] = df["volume"].iloc[0]
+    for i in range(1, len(df)):
+        if df["close"].iloc[i] > df["close"].iloc[i - 1]:
+            obv.iloc[i] = obv.iloc[i - 1] + df["volume"].iloc[i]
+        elif df["close"].iloc[i] < df["close"].iloc[i - 1]:
+            obv.iloc[i] = obv.iloc[i - 1] - df["volume"].iloc[i]
+        else:
+            obv.iloc[i] = obv.iloc[i - 1]
+    return obv
+
+
+def ref_aroon_up(df: pd.DataFrame, period: int = 25) -> pd.Series:
+    if df.empty or len(df) < period + 1:
+        return pd.Series(dtype=float)
+    result = pd.Series(index=df.index, dtype=float)
+    for i in range(period, len(df)):
+        window = df["high"].iloc[i - period : i + 1]
+        days_since_high = period - window.values.argmax()
+        result.iloc[i] = ((period - days_since_high) / period) * 100
+    return result
+
+
+def ref_aroon_down(df: pd.DataFrame, period: int = 25) -> pd.Series:
+    if df.empty or len(df) < period + 1:
+        return pd.Series(dtype=float)
+    result = pd.Series(index=df.index, dtype=float)
+    for i in range(period, len(df)):
+        window = df["low"].iloc[i - period : i + 1]
+        days_since_low = period - window.values.argmin()
+        result.iloc[i] = ((period - days_since_low) / period) * 100
+    return result
+
+
+def ref_supertrend(df: pd.DataFrame, period: int = 10, multiplier: float = 3.0) -> pd.Series:
+    atr = calc_atr(df, period)
+    if atr.empty:
+        return pd.Series(dtype=float)
+    hl2 = (df["high"] + df["low"]) / 2
+    upper = hl2 + (multiplier * atr)
+    lower = hl2 - (multiplier * atr)
+    direction = pd.Series(1, index=df.index, dtype=float)
+    for i in range(1, len(df)):
+        if df["close"].iloc[i] > upper.iloc[i - 1]:
+            direction.iloc[i] = 1
+        elif df["close"].iloc[i] < lower.iloc[i - 1]:
+            direction.iloc[i] = -1
+        else:
+            direction.iloc[i] = direction.iloc[i - 1]
+    return direction
+
+
+def ref_sar(df: pd.DataFrame, af_start: float = 0.02, af_max: float = 0.2) -> pd.Series:
+    if df.empty or len(df) < 2:
+        return pd.Series(dtype=float)
+    high = df["high"].values
+    low = df["low"].values
+    sar = pd.Series(index=df.index, dtype=float)
+    trend = 1
+    ep = high[0]
+    af = af_start
+    sar.iloc[0] = low[0]
+    for i in range(1, len(df)):
+        sar.iloc[i] = sar.iloc[i - 1] + af * (ep - sar.iloc[i - 1])
+        if trend == 1:
+            if low[i] < sar.iloc[i]:
+                trend = -1
+                sar.iloc[i] = ep
+                ep = low[i]
+                af = af_start
+            else:
+                if high[i] > ep:
+                    ep = high[i]
+                    af = min(af + af_start, af_max)
+        else:
+            if high[i] > sar.iloc[i]:
+                trend = 1
+                sar.iloc[i] = ep
+                ep = high[i]
+                af = af_start
+            else:
+                if low[i] < ep:
+                    ep = low[i]
+                    af = min(af + af_start, af_max)
+    return sar
+
+
+def ref_kama(df: pd.DataFrame, period: int = 20) -> pd.Series:
+    if df.empty or len(df) < period:
+        return pd.Series(dtype=float)
+    close = df["close"]
+    direction = (close - close.shift(period)).abs()
+    volatility = close.diff().abs().rolling(window=period).sum()
+    er = direction / volatility.replace(0, np.nan)
+    fast_sc, slow_sc = 2 / 3, 2 / 31
+    sc = (er * (fast_sc - slow_sc) + slow_sc) ** 2
+    kama = pd.Series(np.nan, index=close.index)
+    kama.iloc[period - 1] = close.iloc[period - 1]
+    for i in range(period, len(close)):
+        kama.iloc[i] = kama.iloc[i - 1] + sc.iloc[i] * (close.iloc[i] - kama.iloc[i - 1])
+    return kama
+
+
+def ref_frama(df: pd.DataFrame, period: int = 20) -> pd.Series:
+    if df.empty or len(df) < period:
+        return pd.Series(dtype=float)
+    close = df["close"]
+    half = period // 2
+    h1 = close.rolling(half).max()
+    l1 = close.rolling(half).min()
+    h2 = close.shift(half).rolling(half).max()
+    l2 = close.shift(half).rolling(half).min()
+    h_all = close.rolling(period).max()
+    l_all = close.rolling(period).min()
+    n1 = (h1 - l1) / half
+    n2 = (h2 - l2) / half
+    n3 = (h_all - l_all) / period
+    d = (np.log(n1 + n2) - np.log(n3)) / np.log(2)
+    alpha = np.exp(-4.6 * (d - 1)).clip(0.01, 1.0)
+    frama = pd.Series(np.nan, index=close.index)
+    start = period - 1
+    frama.iloc[start] = close.iloc[start]
+    for i in range(start + 1, len(close)):
+        a = alpha.iloc[i] if not np.isnan(alpha.iloc[i]) else 0.5
+        frama.iloc[i] = a * close.iloc[i] + (1 - a) * frama.iloc[i - 1]
+    return frama
+
+
+def ref_vidya(df: pd.DataFrame, period: int = 20) -> pd.Series:
+    if df.empty or len(df) < period:
+        return pd.Series(dtype=float)
+    close = df["close"]
+    cmo_abs = calc_cmo(df, period).abs() / 100
+    sc = 2 / (period + 1)
+    vidya = pd.Series(np.nan, index=close.index)
+    vidya.iloc[period - 1] = close.iloc[period - 1]
+    for i in range(period, len(close)):
+        k = sc * cmo_abs.iloc[i] if not np.isnan(cmo_abs.iloc[i]) else 0
+        vidya.iloc[i] = k * close.iloc[i] + (1 - k) * vidya.iloc[i - 1]
+    return vidya
+
+
+def ref_regression_slope(df: pd.DataFrame, period: int = 20) -> pd.Series:
+    if df.empty or len(df) < period:
+        return pd.Series(dtype=float)
+    x = np.arange(period, dtype=float)
+    x_mean = x.mean()
+    x_var = ((x - x_mean) ** 2).sum()
+    def _slope(y):
+        return np.sum((x - x_mean) * (y - y.mean())) / x_var
+    return df["close"].rolling(window=period).apply(_slope, raw=True)
+
+
+def ref_regression_intercept(df: pd.DataFrame, period: int = 20) -> pd.Series:
+    if df.empty or len(df) < period:
+        return pd.Series(dtype=float)
+    x = np.arange(period, dtype=float)
+    x_mean = x.mean()
+    x_var = ((x - x_mean) ** 2).sum()
+    def _intercept(y):
+        slope = np.sum((x - x_mean) * (y - y.mean())) / x_var
+        return y.mean() - slope * x_mean
+    return df["close"].rolling(window=period).apply(_intercept, raw=True)
+
+
+# (이름, 현재 구현, 참조 구현, 기간) — 기간은 짧은 입력 길이 계산용
+CASES = [
+    ("cci", indicators.calc_cci, ref_cci, 20),
+    ("obv", indicators.calc_obv, ref_obv, 2),
+    ("aroon_up", indicators.calc_aroon_up, ref_aroon_up, 26),
+    ("aroon_down", indicators.calc_aroon_down, ref_aroon_down, 26),
+    ("supertrend", indicators.calc_supertrend, ref_supertrend, 10),
+    ("sar", indicators.calc_sar, ref_sar, 2),
+    ("kama", indicators.calc_kama, ref_kama, 20),
+    ("frama", indicators.calc_frama, ref_frama, 20),
+    ("vidya", indicators.calc_vidya, ref_vidya, 20),
+    ("regression_slope", indicators.calc_regression_slope, ref_regression_slope, 20),
+    ("regression_intercept", indicators.calc_regression_intercept, ref_regression_intercept, 20),
+]
+
+KERNELS = [indicators._sar_kernel, indicators._adaptive_kernel, indicators._weighted_kernel]
+
+
+# ── 테스트 데이터 ─────────────────────────────────────────
+
+def _ohlcv(close: np.ndarray, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    spread = np.abs(rng.normal(0, 1, len(close))) * 0.01 * np.abs(close)
+    return pd.DataFrame(
+        {
+            "open": close + rng.normal(0, 0.5, len(close)),
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.integers(1_000, 100_000, len(close)).astype(float),
+        },
+        index=pd.date_range("2024-01-01", periods=len(close), freq="D"),
+    )
+
+
+def _random_walk(n: int = 600, seed: int = 1) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return _ohlcv(10_000 + np.cumsum(rng.normal(0, 50, n)), seed)
+
+
+def _with_nans(seed: int = 2) -> pd.DataFrame:
+    df = _random_walk(400, seed)
+    rng = np.random.default_rng(seed)
+    for column in ("high", "low", "close", "volume"):
+        df.loc[df.index[rng.choice(len(df), 12, replace=False)], column] = np.nan
+    return df
+
+
+def _with_ties(seed: int = 3) -> pd.DataFrame:
+    """정수 호가 + 작은 변동: 같은 종가/고가/저가가 자주 반복"""
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.integers(-1, 2, 400)).astype(float)
+    df = _ohlcv(close, seed)
+    df["high"] = np.round(df["high"])
+    df["low"] = np.round(df["low"])
+    return df
+
+
+def _flat(n: int = 80) -> pd.DataFrame:
+    """가격 변화 없음 (변동성 0 → 0 나눗셈 경로)"""
+    close = np.full(n, 5_000.0)
+    df = _ohlcv(close)
+    df["high"] = close
+    df["low"] = close
+    return df
+
+
+DATASETS = {
+    "random_walk": _random_walk,
+    "nan_inputs": _with_nans,
+    "ties": _with_ties,
+    "flat": _flat,
+}
+
+
+@pytest.fixture(params=["compiled", "python"])
+def kernel_mode(request, monkeypatch):
+    """재귀형 지표 커널 실행 경로 선택 (numba 컴파일 / float 리스트 순회)"""
+    if request.param == "compiled":
+        if indicators.njit is None:
+            pytest.skip("numba 미설치")
+    else:
+        for kernel in KERNELS:
+            monkeypatch.setattr(kernel, "compiled", None)
+    return request.param
+
+
+def _assert_same(actual: pd.Series, expected: pd.Series) -> None:
+    assert len(actual) == len(expected)
+    assert actual.index.equals(expected.index)
+    assert np.array_equal(
+        actual.to_numpy(dtype=float), expected.to_numpy(dtype=float), equal_nan=True
+    )
+
+
+@pytest.mark.parametrize("dataset", list(DATASETS))
+@pytest.mark.parametrize("name,func,ref,period", CASES, ids=[c[0] for c in CASES])
+def test_matches_reference(kernel_mode, dataset, name, func, ref, period):
+    df = DATASETS[dataset]()
+    _assert_same(func(df), ref(df))
+
+
+@pytest.mark.parametrize("name,func,ref,period", CASES, ids=[c[0] for c in CASES])
+def test_short_inputs(kernel_mode, name, func, ref, period):
+    df = _random_walk(60, seed=4)
+    for length in sorted({0, 1, 2, period - 1, period, period + 1}):
+        if length < 0:
+            continue
+        _assert_same(func(df.iloc[:length]), ref(df.iloc[:length]))
+
+
+def test_sar_integer_acceleration(kernel_mode):
+    """정수 가속계수도 float 커널로 같은 결과"""
+    df = _with_ties()
+    _assert_same(indicators.calc_sar(df, af_start=1, af_max=1), ref_sar(df, af_start=1, af_max=1))